@@ -6,9 +6,9 @@ locals {
   db_name = var.firestore_database
 }
 
-# TTL: payloads a 24h (fail-safe de privacidad); controles terminales +
-# receipts al horizonte de retención; rate windows. NO sobre controles no
-# terminales ni contadores activos.
+# TTL: payloads y checkpoints por inquiry a 24h (fail-safe de privacidad);
+# controles terminales + receipts al horizonte de retención; rate windows.
+# NO sobre controles no terminales ni contadores activos.
 resource "google_firestore_field" "payload_ttl" {
   project    = var.project_id
   database   = local.db_name
@@ -17,6 +17,14 @@ resource "google_firestore_field" "payload_ttl" {
   ttl_config {}
 }
 
+resource "google_firestore_field" "inquiry_ttl" {
+  project    = var.project_id
+  database   = local.db_name
+  collection = "ticket_job_inquiries"
+  field      = "expires_at"
+  ttl_config {}
+}
+
 resource "google_firestore_field" "control_ttl" {
   project    = var.project_id
   database   = local.db_name
@@ -105,6 +113,24 @@ resource "google_firestore_index" "jobs_state_created_at" {
   }
 }
 
+# Consultas "vencidos primero" del reconciliador (scan_reconcile_candidates):
+# deadline absoluto vencido por estado y outbox pending de jobs QUEUED en
+# orden FIFO. jobs_state_lease cubre los leases vencidos.
+resource "google_firestore_index" "jobs_state_deadline" {
+  project    = var.project_id
+  database   = local.db_name
+  collection = "ticket_jobs"
+
+  fields {
+    field_path = "state"
+    order      = "ASCENDING"
+  }
+  fields {
+    field_path = "job_deadline_at"
+    order      = "ASCENDING"
+  }
+}
+
 resource "google_firestore_index" "jobs_outbox" {
   project    = var.project_id
   database   = local.db_name
@@ -114,6 +140,10 @@ resource "google_firestore_index" "jobs_outbox" {
     field_path = "enqueue_state"
     order      = "ASCENDING"
   }
+  fields {
+    field_path = "state"
+    order      = "ASCENDING"
+  }
   fields {
     field_path = "created_at"
     order      = "ASCENDING"
@@ -20,6 +20,7 @@ from data_pipeline.llm_router import (
     parse_llm_pricing_json,
     required_pricing_keys,
 )
+from data_pipeline.payload_codec import SUPPORTED_CODECS, codec_available
 
 logger = logging.getLogger(__name__)
 
@@ -134,7 +135,24 @@ class Settings(BaseSettings):
     FORUSBOTS_MAX_WAIT_S: float = 200.0
     FORUSBOTS_HTTP_READ_TIMEOUT_S: float = 15.0
     FORUSBOTS_MAX_INFLIGHT: int = 2
+    # Concurrencia adaptativa (AIMD) por instancia: FORUSBOTS_MAX_INFLIGHT es
+    # la ventana inicial; crece hasta el ceiling mientras los submits vuelven
+    # con queuePosition <= target y latencia <= target, y se reduce a la
+    # mitad ante 429, cola upstream o submits lentos. Ceiling 0 = sin
+    # crecimiento (la ventana sólo puede bajar y recuperarse hasta el inicial).
+    FORUSBOTS_MAX_INFLIGHT_CEILING: int = 0
+    FORUSBOTS_TARGET_QUEUE_POSITION: int = 1
+    FORUSBOTS_SUBMIT_LATENCY_TARGET_S: float = 5.0
     FORUSBOTS_RESULT_CACHE_TTL_S: int = 180
+    # Modo de completado: "poll" (default) mantiene al worker sondeando el
+    # job; "callback" registra en el submit un callback firmado hacia el
+    # producer (FORUSBOTS_CALLBACK_BASE_URL), estaciona el ticket job tras el
+    # receipt durable y libera el task. El callback —o el reconciliador pasado
+    # FORUSBOTS_CALLBACK_RESUME_AFTER_S— lo reanuda vía resume_job.
+    FORUSBOTS_COMPLETION_MODE: str = "poll"
+    FORUSBOTS_CALLBACK_BASE_URL: str = ""
+    FORUSBOTS_CALLBACK_SECRET: str = ""
+    FORUSBOTS_CALLBACK_RESUME_AFTER_S: float = 300.0
 
     # Ticket handler orchestrator rollout flag. Mirrors ROUTER_MODE:
     #   disabled        → endpoint returns 503
@@ -160,6 +178,11 @@ class Settings(BaseSettings):
     TICKET_WORKER_HEARTBEAT_S: float = 30.0
     TICKET_TASK_DISPATCH_DEADLINE_S: int = 540
     TICKET_ADMISSION_QUEUE_DELAY_CEILING_S: int = 300
+    # Admisión lee un snapshot de la demora de Cloud Tasks refrescado en
+    # background (sin GetQueue por request) y falla cerrada sólo si el último
+    # refresh exitoso tiene más de TICKET_QUEUE_DELAY_MAX_AGE_S.
+    TICKET_QUEUE_DELAY_REFRESH_S: float = 10.0
+    TICKET_QUEUE_DELAY_MAX_AGE_S: float = 60.0
 
     # Fault injection SÓLO staging (plan Tarea 7 Paso 7a). Producción rechaza
     # tanto el header de test como el fault_plan. APP_ENV distingue el entorno
@@ -194,6 +217,23 @@ class Settings(BaseSettings):
     # v1 adapter: espera corta para poder responder 200 inline en rutas rápidas
     # ya terminadas; si el job sigue vivo al vencer, responde 202 + poll.
     TICKET_V1_INLINE_WAIT_S: float = 3.0
+    # La espera inline se despierta por push: commits locales vía notifier
+    # in-process y, con Firestore, snapshot listener sobre el control doc
+    # (jobs ejecutados en otra instancia). Desactivado → sólo poll de
+    # respaldo con backoff.
+    FIRESTORE_TICKET_SNAPSHOT_LISTENERS: bool = True
+    # Long-poll de GET /tickets/{id} y /ticket-jobs/{id} (``?wait=``): tope
+    # server-side por debajo de los timeouts HTTP típicos del cliente (30s).
+    TICKET_POLL_MAX_WAIT_S: float = 25.0
+    # Codec de los documentos de payload/inquiry: none | zlib | zstd (zstd
+    # requiere el paquete ``zstandard``). Los documentos sin tag se siguen
+    # leyendo, así que cambiarlo no requiere migración.
+    TICKET_PAYLOAD_CODEC: str = "none"
+    # Shards de los contadores de cuota/ventana por principal: cada shard
+    # lleva 1/N del cap y la admisión toca sólo el suyo. Subirlo reparte las
+    # escrituras de principals muy activos; NUNCA bajarlo con jobs vivos
+    # (los shards altos dejarían de contarse).
+    TICKET_COUNTER_SHARDS: int = 1
 
     # Identidad de clientes: principal ESTABLE → una o varias API keys. La
     # lista permite rotación solapada sin cambiar owner/idempotencia/polling;
@@ -248,6 +288,10 @@ class Settings(BaseSettings):
     # Rate Limiting (requests per minute)
     RATE_LIMIT_REQUIRED_DATA: int = 60
     RATE_LIMIT_GENERATE_RESPONSE: int = 30
+    # Token bucket in-process (api/rate_limit.py): ráfaga = límite * factor;
+    # overrides por principal como JSON {"principal": [sustained, burst]}.
+    RATE_LIMIT_BURST_FACTOR: float = 1.0
+    RATE_LIMIT_PRINCIPAL_LIMITS: dict[str, tuple[int, int]] = {}
 
     # GCP
     GCP_PROJECT: str = ""
@@ -291,7 +335,10 @@ def validate_settings() -> bool:
         "TICKET_ADMISSION_QUEUE_DELAY_CEILING_S": (
             settings.TICKET_ADMISSION_QUEUE_DELAY_CEILING_S
         ),
+        "TICKET_QUEUE_DELAY_REFRESH_S": settings.TICKET_QUEUE_DELAY_REFRESH_S,
+        "TICKET_QUEUE_DELAY_MAX_AGE_S": settings.TICKET_QUEUE_DELAY_MAX_AGE_S,
         "TICKET_V1_INLINE_WAIT_S": settings.TICKET_V1_INLINE_WAIT_S,
+        "TICKET_POLL_MAX_WAIT_S": settings.TICKET_POLL_MAX_WAIT_S,
         "PARTICIPANT_PLAN_TIMEOUT_S": settings.PARTICIPANT_PLAN_TIMEOUT_S,
         "FORUSBOTS_POLL_INTERVAL_S": settings.FORUSBOTS_POLL_INTERVAL_S,
         "FORUSBOTS_POLL_BACKOFF": settings.FORUSBOTS_POLL_BACKOFF,
@@ -300,6 +347,12 @@ def validate_settings() -> bool:
         "FORUSBOTS_HTTP_READ_TIMEOUT_S": settings.FORUSBOTS_HTTP_READ_TIMEOUT_S,
         "FORUSBOTS_RESULT_CACHE_TTL_S": settings.FORUSBOTS_RESULT_CACHE_TTL_S,
         "FORUSBOTS_MAX_INFLIGHT": settings.FORUSBOTS_MAX_INFLIGHT,
+        "FORUSBOTS_SUBMIT_LATENCY_TARGET_S": (
+            settings.FORUSBOTS_SUBMIT_LATENCY_TARGET_S
+        ),
+        "FORUSBOTS_CALLBACK_RESUME_AFTER_S": (
+            settings.FORUSBOTS_CALLBACK_RESUME_AFTER_S
+        ),
     }
     invalid_timings = [
         name for name, value in positive_timings.items()
@@ -321,6 +374,9 @@ def validate_settings() -> bool:
             settings.TICKET_TASK_DISPATCH_DEADLINE_S,
         ):
             errors.append("job deadline debe superar attempt y dispatch")
+        if settings.TICKET_QUEUE_DELAY_MAX_AGE_S <= \
+                settings.TICKET_QUEUE_DELAY_REFRESH_S:
+            errors.append("queue delay max age debe superar el refresh")
         if settings.TICKET_TOTAL_BUDGET_S > settings.TICKET_ATTEMPT_BUDGET_S:
             errors.append("total budget debe caber en attempt budget")
         if settings.TICKET_INQUIRY_BUDGET_S > settings.TICKET_TOTAL_BUDGET_S:
@@ -336,6 +392,62 @@ def validate_settings() -> bool:
             errors.append("ForUsBots max wait debe caber en inquiry budget")
         if settings.FORUSBOTS_POLL_BACKOFF < 1:
             errors.append("ForUsBots poll backoff debe ser >= 1")
+        if settings.FORUSBOTS_MAX_INFLIGHT_CEILING and \
+                settings.FORUSBOTS_MAX_INFLIGHT_CEILING < \
+                settings.FORUSBOTS_MAX_INFLIGHT:
+            errors.append(
+                "ForUsBots max inflight ceiling debe ser 0 o >= max inflight"
+            )
+        if settings.FORUSBOTS_MAX_INFLIGHT_CEILING < 0 \
+                or settings.FORUSBOTS_TARGET_QUEUE_POSITION < 0:
+            errors.append(
+                "ForUsBots inflight ceiling y target queue position "
+                "deben ser >= 0"
+            )
+        if settings.FORUSBOTS_CALLBACK_RESUME_AFTER_S >= \
+                settings.TICKET_JOB_DEADLINE_S:
+            errors.append(
+                "ForUsBots callback resume-after debe caber en job deadline"
+            )
+
+    if not _finite_positive(settings.RATE_LIMIT_BURST_FACTOR) \
+            or settings.RATE_LIMIT_BURST_FACTOR < 1:
+        errors.append("RATE_LIMIT_BURST_FACTOR debe ser >= 1")
+    if any(
+        sustained < 1 or burst < 1
+        for sustained, burst in settings.RATE_LIMIT_PRINCIPAL_LIMITS.values()
+    ):
+        errors.append("RATE_LIMIT_PRINCIPAL_LIMITS exige sustained/burst >= 1")
+
+    if settings.FORUSBOTS_COMPLETION_MODE not in {"poll", "callback"}:
+        errors.append(
+            f"FORUSBOTS_COMPLETION_MODE={settings.FORUSBOTS_COMPLETION_MODE} "
+            "inválido (se esperaba poll|callback)"
+        )
+    elif settings.FORUSBOTS_COMPLETION_MODE == "callback":
+        if not _is_canonical_https_origin(settings.FORUSBOTS_CALLBACK_BASE_URL):
+            errors.append(
+                "FORUSBOTS_COMPLETION_MODE=callback requiere "
+                "FORUSBOTS_CALLBACK_BASE_URL como origen HTTPS canónico"
+            )
+        if len(settings.FORUSBOTS_CALLBACK_SECRET) < 32:
+            errors.append(
+                "FORUSBOTS_COMPLETION_MODE=callback requiere "
+                "FORUSBOTS_CALLBACK_SECRET de al menos 32 caracteres"
+            )
+
+    if settings.TICKET_PAYLOAD_CODEC not in SUPPORTED_CODECS:
+        errors.append(
+            f"TICKET_PAYLOAD_CODEC={settings.TICKET_PAYLOAD_CODEC} inválido "
+            "(se esperaba none|zlib|zstd)"
+        )
+    elif not codec_available(settings.TICKET_PAYLOAD_CODEC):
+        errors.append(
+            "TICKET_PAYLOAD_CODEC=zstd requiere el paquete zstandard"
+        )
+
+    if not 1 <= settings.TICKET_COUNTER_SHARDS <= 32:
+        errors.append("TICKET_COUNTER_SHARDS debe estar entre 1 y 32")
 
     valid_environments = {"development", "staging", "production"}
     if settings.ENVIRONMENT not in valid_environments:
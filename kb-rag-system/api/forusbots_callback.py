@@ -0,0 +1,121 @@
+"""
+Callback de completado ForusBots (``FORUSBOTS_COMPLETION_MODE=callback``).
+
+El worker registra en cada submit una URL firmada por ticket job::
+
+    {FORUSBOTS_CALLBACK_BASE_URL}/api/v2/forusbots/callbacks/{job_id}?sig=...
+
+y, una vez durable el receipt del job upstream, estaciona el ticket job y
+libera el task de Cloud Tasks. ForusBots invoca la URL al terminar: el
+producer verifica la firma HMAC, despierta el job con una generación de
+outbox nueva y lo encola. El worker reanuda desde el receipt vía
+``resume_job``, cuyo poll sigue siendo la ÚNICA fuente de verdad del
+resultado. El body del callback se ignora: datos upstream no autenticados
+nunca se confían ni se loguean. Si el callback no llega, el reconciliador
+despierta el job pasado ``FORUSBOTS_CALLBACK_RESUME_AFTER_S``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import re
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from api import metrics as ticket_metrics
+from api.config import settings
+from data_pipeline.ticket_job_repository import TicketJobRepository
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+CALLBACK_PATH_PREFIX = "/api/v2/forusbots/callbacks"
+_TICKET_JOB_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_SIGNATURE_CONTEXT = "forusbots-callback-v1"
+
+
+def _emit_callback_metric(code: str) -> None:
+    try:
+        ticket_metrics.emit("ticket_forusbots_callback_count", 1, code=code)
+    except (TypeError, ValueError):
+        logger.warning("ForusBots callback metric rejected by telemetry schema")
+
+
+def sign_callback(job_id: str, secret: str) -> str:
+    """HMAC-SHA256 del job id; la firma es la única credencial del callback."""
+    return hmac.new(
+        secret.encode("utf-8"),
+        f"{_SIGNATURE_CONTEXT}|{job_id}".encode("utf-8"),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def build_callback_url(job_id: str) -> Optional[str]:
+    """URL de callback del job, o None si el modo callback está desactivado.
+
+    Determinística por job: un resubmit con la misma idempotency key upstream
+    envía el mismo payload y ForusBots no lo trata como conflicto.
+    """
+    if settings.FORUSBOTS_COMPLETION_MODE != "callback":
+        return None
+    base = settings.FORUSBOTS_CALLBACK_BASE_URL.rstrip("/")
+    signature = sign_callback(job_id, settings.FORUSBOTS_CALLBACK_SECRET)
+    return f"{base}{CALLBACK_PATH_PREFIX}/{job_id}?sig={signature}"
+
+
+def verify_callback_signature(job_id: str, signature: str) -> bool:
+    secret = settings.FORUSBOTS_CALLBACK_SECRET
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign_callback(job_id, secret), signature)
+
+
+@router.post(CALLBACK_PATH_PREFIX + "/{ticket_job_id}", include_in_schema=False)
+async def forusbots_completion_callback(
+    ticket_job_id: str, request: Request, sig: str = "",
+) -> Response:
+    """Despierta un job estacionado. Respuestas:
+
+    - 204: job despertado y encolado, o callback benigno sin efecto (job no
+      estacionado, terminal o desconocido — anotado si aún corre)
+    - 403: firma inválida (no revela si el job existe)
+    - 404: callback mode desactivado
+    """
+    if settings.FORUSBOTS_COMPLETION_MODE != "callback":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if _TICKET_JOB_ID_RE.fullmatch(ticket_job_id) is None \
+            or not verify_callback_signature(ticket_job_id, sig):
+        _emit_callback_metric("rejected")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "INVALID_CALLBACK_SIGNATURE"},
+        )
+
+    repo: TicketJobRepository = request.app.state.ticket_repo
+    generation = await repo.wake_parked_job(ticket_job_id, from_callback=True)
+    if generation is None:
+        _emit_callback_metric("ignored")
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    queue = getattr(request.app.state, "ticket_queue", None)
+    try:
+        if queue is None:
+            raise RuntimeError("ticket queue no disponible en este rol")
+        task_name = await queue.ensure_enqueued(ticket_job_id, generation)
+        await repo.mark_enqueued(
+            ticket_job_id, task_name, expected_generation=generation,
+        )
+    except Exception as exc:  # noqa: BLE001 - el outbox pending es durable
+        # La generación nueva quedó ``pending``: el reconciliador la encola.
+        # Un non-2xx sólo provocaría reintentos upstream sin valor añadido.
+        logger.warning(
+            "ForusBots callback: enqueue diferido al reconciliador "
+            "(error_type=%s)",
+            type(exc).__name__,
+        )
+    _emit_callback_metric("woken")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -18,8 +18,8 @@ import math
 import re
 import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Tuple
-from fastapi import FastAPI, Header, Request, HTTPException, status, Depends, Security
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from fastapi import FastAPI, Header, Query, Request, HTTPException, status, Depends, Security
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -62,6 +62,7 @@ from data_pipeline.ticket_orchestrator import (
     TicketOrchestrator,
 )
 from data_pipeline.ticket_job_models import (
+    PARKED_ENQUEUE_STATE,
     TERMINAL_STATES,
     CreateOrGetOutcome,
     NextAction,
@@ -83,6 +84,7 @@ from data_pipeline.ticket_job_repository import (
 from data_pipeline.ticket_task_queue import (
     CloudTasksTicketQueue,
     InlineTicketQueue,
+    QueueDelayEstimator,
 )
 from data_pipeline.staging_fault_injection import (
     FAULT_TEST_HEADER,
@@ -357,6 +359,12 @@ def _make_coverage_pack_builder(rag_engine: RAGEngine):
 async def _close_runtime_resources(app: FastAPI) -> None:
     """Close every process-owned client without skipping later resources."""
     logger.info("Shutting down API...")
+    estimator = getattr(app.state, "queue_delay_estimator", None)
+    if estimator is not None:
+        try:
+            await estimator.aclose()
+        except Exception:
+            logger.error("Error stopping queue delay refresher")
     queue = getattr(app.state, "ticket_queue", None)
     if queue is not None:
         try:
@@ -474,6 +482,8 @@ async def lifespan(app: FastAPI):
                 retention_days=settings.TICKET_IDEMPOTENCY_RETENTION_DAYS,
                 max_outstanding=settings.TICKET_MAX_OUTSTANDING_JOBS,
                 rate_limit_per_minute=settings.RATE_LIMIT_HANDLE_TICKET,
+                payload_codec=settings.TICKET_PAYLOAD_CODEC,
+                counter_shards=settings.TICKET_COUNTER_SHARDS,
             )
 
         # ForusBots y el orchestrator pertenecen exclusivamente al worker.
@@ -488,6 +498,11 @@ async def lifespan(app: FastAPI):
         # debe requerir permisos ni configuración de la cola.
         if needs_ticket_queue:
             app.state.ticket_queue = _build_ticket_queue(app)
+        if role == "producer" and ticket_active \
+                and isinstance(app.state.ticket_queue, CloudTasksTicketQueue):
+            app.state.queue_delay_estimator = await _start_queue_delay_estimator(
+                app.state.ticket_queue
+            )
 
         if role == "producer" and ticket_active:
             # La autorización participant-plan ocurre sólo en admission. El
@@ -531,6 +546,7 @@ def _build_ticket_job_backend():
             project=settings.GCP_PROJECT or None,
             collection_prefix=settings.FIRESTORE_TICKET_COLLECTION_PREFIX,
             database=settings.FIRESTORE_DATABASE,
+            snapshot_listeners=settings.FIRESTORE_TICKET_SNAPSHOT_LISTENERS,
         )
     return InMemoryTicketJobBackend()
 
@@ -547,6 +563,31 @@ def _build_orchestrator_from_state(app: FastAPI) -> TicketOrchestrator:
     return TicketOrchestrator(deps, settings)
 
 
+async def _start_queue_delay_estimator(
+    queue: CloudTasksTicketQueue,
+) -> QueueDelayEstimator:
+    """Snapshot de demora para admisión. El primer refresh es best-effort:
+    si GetQueue falla al arrancar, admisión responde 503 hasta que el
+    refresher en background obtenga una lectura."""
+    estimator = QueueDelayEstimator(
+        queue,
+        refresh_interval_s=settings.TICKET_QUEUE_DELAY_REFRESH_S,
+        max_age_s=settings.TICKET_QUEUE_DELAY_MAX_AGE_S,
+    )
+    try:
+        await estimator.refresh()
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.warning(
+            "initial queue delay refresh failed (error_type=%s)",
+            type(exc).__name__,
+        )
+    # Ya hubo un intento: el refresher no repite GetQueue enseguida.
+    estimator.start(refresh_now=False)
+    return estimator
+
+
 def _build_ticket_queue(app: FastAPI):
     """cloudtasks (producción) | inline (dev/tests, mismo worker durable)."""
     if settings.TICKET_TASK_QUEUE == "cloudtasks":
@@ -641,6 +682,10 @@ app.middleware("http")(handle_errors)
 from api.ticket_worker import router as _ticket_worker_router  # noqa: E402
 app.include_router(_ticket_worker_router)
 
+# Callback de completado ForusBots (callback mode; firma HMAC, sin API key)
+from api.forusbots_callback import router as _forusbots_callback_router  # noqa: E402
+app.include_router(_forusbots_callback_router)
+
 
 def _custom_openapi():
     """Document the deployed n8n authentication contract.
@@ -1765,8 +1810,9 @@ async def _accept_ticket_job(
         if peek_outcome == "replay" and peeked is not None:
             ticket_metrics.increment("ticket_jobs_replayed")
             record = peeked
-            if record.enqueue_state != "enqueued" \
-                    and record.state not in TERMINAL_STATES:
+            if record.enqueue_state not in {
+                "enqueued", PARKED_ENQUEUE_STATE,
+            } and record.state not in TERMINAL_STATES:
                 queue = http_request.app.state.ticket_queue
                 task_name = await queue.ensure_enqueued(
                     record.job_id, record.enqueue_generation)
@@ -1775,9 +1821,15 @@ async def _accept_ticket_job(
 
     # Admission applies only to a NEW logical job. Replays have already paid
     # admission and must retain their durable recovery semantics.
+    # Con Cloud Tasks el snapshot refrescado en background evita un GetQueue
+    # por request; sin refresher (cola inline/tests) se lee en vivo.
     queue = http_request.app.state.ticket_queue
+    estimator = getattr(http_request.app.state, "queue_delay_estimator", None)
     try:
-        estimated_delay_s = float(await queue.estimated_queue_delay_s())
+        if estimator is not None:
+            estimated_delay_s = float(estimator.current())
+        else:
+            estimated_delay_s = float(await queue.estimated_queue_delay_s())
     except asyncio.CancelledError:
         raise
     except Exception as exc:
@@ -1886,7 +1938,10 @@ async def _accept_ticket_job(
     # Cerrar la ventana record/task: un crash entre create_or_get y enqueue se
     # repara en el retry (task name determinístico). Un job ya terminal no se
     # re-encola (el claim lo rechazaría igualmente, pero no gastamos el task).
-    if record.enqueue_state != "enqueued" and record.state not in TERMINAL_STATES:
+    # Un job estacionado en callback mode tampoco: lo despierta el callback
+    # ForusBots o el reconciliador.
+    if record.enqueue_state not in {"enqueued", PARKED_ENQUEUE_STATE} \
+            and record.state not in TERMINAL_STATES:
         queue = http_request.app.state.ticket_queue
         task_name = await queue.ensure_enqueued(
             record.job_id, record.enqueue_generation)
@@ -1895,21 +1950,6 @@ async def _accept_ticket_job(
     return record, replayed
 
 
-async def _wait_for_terminal(
-    repo: TicketJobRepository, job_id: str, budget_s: float
-) -> Optional[TicketJobRecord]:
-    """Espera corta del adapter v1 para responder 200 inline en rutas rápidas
-    ya terminadas. Nunca bloquea más allá del budget."""
-    deadline = time.monotonic() + max(budget_s, 0.0)
-    while True:
-        record = await repo.get(job_id)
-        if record is not None and record.state in TERMINAL_STATES:
-            return record
-        if time.monotonic() >= deadline:
-            return record
-        await asyncio.sleep(0.05)
-
-
 def _record_results(record: TicketJobRecord) -> List[InquiryResult]:
     return [
         InquiryResult.model_validate(e["result"])
@@ -1933,6 +1973,167 @@ def _record_elapsed_s(record: TicketJobRecord) -> Optional[float]:
     return round((utcnow() - record.created_at).total_seconds(), 2)
 
 
+_POLL_WAIT_QUERY = Query(
+    ge=0.0,
+    le=60.0,
+    description="Long-poll opcional (s): espera hasta que el job cambie; "
+                "acotado por TICKET_POLL_MAX_WAIT_S.",
+)
+_IF_NONE_MATCH_HEADER = Header(alias="If-None-Match")
+# Destino de los headers en llamadas directas al endpoint (tests); FastAPI
+# siempre inyecta su propio Response, así que éste nunca se envía.
+_DETACHED_RESPONSE = Response()
+
+
+def _ticket_status_etag(record: TicketJobRecord, representation: str) -> str:
+    """ETag débil del poll, derivado SÓLO de lo que el cliente ve y de
+    campos del control doc: los campos públicos del control más
+    ``public_version``, que bumpean sólo las escrituras que cambian la parte
+    pública del payload. ``updated_at`` queda fuera: los heartbeats y demás
+    escrituras internas no cambian el ETag ni despiertan a un long-poll.
+    Débil porque ``elapsed_s`` corre en vivo mientras el job no es terminal."""
+    basis = "|".join(str(part) for part in (
+        representation,
+        record.job_id,
+        record.state.value,
+        record.next_action.value,
+        record.total_inquiries,
+        record.processed_inquiries,
+        record.unprocessed_inquiries,
+        record.public_error_code,
+        record.retryable,
+        record.trace_id,
+        record.started_at.isoformat() if record.started_at else None,
+        record.completed_at.isoformat() if record.completed_at else None,
+        record.public_version,
+    ))
+    return f'W/"{hashlib.sha256(basis.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _if_none_match_hits(header: Optional[str], etag: str) -> bool:
+    """Comparación débil (RFC 9110 §13.1.2) contra la lista del cliente."""
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == opaque
+        for candidate in (part.strip() for part in header.split(","))
+    )
+
+
+def _poll_cache_headers(etag: str) -> Dict[str, str]:
+    # private: el resultado puede contener PII; no-cache: revalidar siempre.
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=_poll_cache_headers(etag),
+    )
+
+
+def _should_long_poll(
+    record: TicketJobRecord,
+    wait_s: float,
+    if_none_match: Optional[str],
+    etag: str,
+) -> bool:
+    """Sólo se espera si el cliente ya tiene la versión actual (o no envió
+    ninguna) y el job aún puede cambiar; un cliente atrasado responde ya."""
+    if wait_s <= 0 or record.state in TERMINAL_STATES:
+        return False
+    return not if_none_match or _if_none_match_hits(if_none_match, etag)
+
+
+async def _await_poll_change(
+    repo: TicketJobRepository,
+    record: TicketJobRecord,
+    wait_s: float,
+    etag: str,
+    representation: str,
+) -> None:
+    # El ETag sale del control doc: cada despertar relee sólo el control.
+    await repo.wait_until(
+        record.job_id,
+        min(wait_s, settings.TICKET_POLL_MAX_WAIT_S),
+        lambda current: current is None
+        or current.state in TERMINAL_STATES
+        or _ticket_status_etag(current, representation) != etag,
+        control_only=True,
+    )
+
+
+async def _current_poll_control(
+    repo: TicketJobRepository,
+    ticket_job_id: str,
+    http_request: Request,
+    if_none_match: Optional[str],
+    representation: str,
+) -> Optional[TicketJobRecord]:
+    """El record de control si, leyendo SÓLO el control doc, se prueba que
+    la copia del cliente sigue vigente (→ 304). None si no se puede probar:
+    sin ``If-None-Match``, ID/owner que no cuadran, payload sin vigencia
+    espejada o vencida (410), deadline vencido (terminalización lazy) o
+    ETag distinto; el caller sigue entonces por la lectura completa, que es
+    la que responde los errores."""
+    if not if_none_match or _TICKET_JOB_ID_RE.fullmatch(ticket_job_id) is None:
+        return None
+    control = await repo.get_control(ticket_job_id)
+    if control is None or not _poll_owner_matches(control, http_request):
+        return None
+    now = utcnow()
+    if control.payload_expires_at is None or control.payload_expires_at <= now:
+        return None
+    if control.state not in TERMINAL_STATES and control.job_deadline_at is not None \
+            and control.job_deadline_at <= now:
+        return None
+    if not _if_none_match_hits(
+        if_none_match, _ticket_status_etag(control, representation)
+    ):
+        return None
+    return control
+
+
+async def _load_conditional_poll_record(
+    repo: TicketJobRepository,
+    ticket_job_id: str,
+    http_request: Request,
+    *,
+    wait: float,
+    if_none_match: Optional[str],
+    representation: str,
+    load: Callable[[TicketJobRepository, str, Request], Awaitable[TicketJobRecord]],
+) -> Tuple[TicketJobRecord, str]:
+    """(record, etag) del poll, con el long-poll ya resuelto.
+
+    Si el control doc prueba que el cliente está al día, el record devuelto
+    es SÓLO el control y su ETag coincide con ``If-None-Match``: el caller
+    responde 304 sin leer payload ni inquiries. Si no, ``load`` lee el
+    record completo (y responde 404/403/410)."""
+    current = await _current_poll_control(
+        repo, ticket_job_id, http_request, if_none_match, representation
+    )
+    if current is not None:
+        etag = _ticket_status_etag(current, representation)
+        if not _should_long_poll(current, wait, if_none_match, etag):
+            return current, etag
+        await _await_poll_change(repo, current, wait, etag, representation)
+        again = await _current_poll_control(
+            repo, ticket_job_id, http_request, if_none_match, representation
+        )
+        if again is not None:
+            return again, _ticket_status_etag(again, representation)
+        wait = 0.0
+    record = await load(repo, ticket_job_id, http_request)
+    etag = _ticket_status_etag(record, representation)
+    if _should_long_poll(record, wait, if_none_match, etag):
+        await _await_poll_change(repo, record, wait, etag, representation)
+        record = await load(repo, ticket_job_id, http_request)
+        etag = _ticket_status_etag(record, representation)
+    return record, etag
+
+
 def _job_handle_response(record: TicketJobRecord, replayed: bool) -> JSONResponse:
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
@@ -1987,8 +2188,10 @@ async def handle_ticket_endpoint(
         request, http_request, repo, api_version="v1"
     )
 
-    record = await _wait_for_terminal(
-        repo, record.job_id, settings.TICKET_V1_INLINE_WAIT_S
+    # Espera push (notifier in-process / snapshot listener) con poll de
+    # respaldo: 200 inline sólo en rutas rápidas ya terminadas.
+    record = await repo.wait_for_terminal(
+        record.job_id, settings.TICKET_V1_INLINE_WAIT_S
     ) or record
 
     # Un 200 inline de v1 SÓLO es válido cuando el resultado es publicable
@@ -2033,10 +2236,52 @@ async def get_ticket_status(
     ticket_job_id: str,
     http_request: Request,
     repo: TicketJobRepository = Depends(get_ticket_repo),
+    wait: Annotated[float, _POLL_WAIT_QUERY] = 0.0,
+    if_none_match: Annotated[Optional[str], _IF_NONE_MATCH_HEADER] = None,
+    *,
+    response: Response = _DETACHED_RESPONSE,
 ):
     """Poll de un ticket job. ``404`` = ID inexistente; ``410`` = el
     control/tombstone sigue vigente pero el payload expiró (no reintentar);
-    ``403`` = job de otro principal (invariante 10)."""
+    ``403`` = job de otro principal (invariante 10).
+
+    Condicional: responde ``ETag``; con ``If-None-Match`` vigente devuelve
+    ``304`` sin cuerpo. ``wait`` (s) mantiene el request hasta que el job
+    cambie o venza la espera (acotada por ``TICKET_POLL_MAX_WAIT_S``). El
+    304 se decide leyendo sólo el control doc."""
+    record, etag = await _load_conditional_poll_record(
+        repo, ticket_job_id, http_request, wait=wait,
+        if_none_match=if_none_match, representation="v1",
+        load=_load_v1_poll_record,
+    )
+    _emit_ticket_metric(
+        "ticket_n8n_poll_count", 1, state=record.state.value
+    )
+    if _if_none_match_hits(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers.update(_poll_cache_headers(etag))
+    results = _record_results(record)
+    primary = results[0] if results else None
+    return TicketStatusResponse(
+        ticket_job_id=record.job_id,
+        state=record.state.value,
+        route_taken=primary.route if primary else None,
+        primary=primary,
+        related=results[1:] if results else [],
+        total_inquiries_in_ticket=record.total_inquiries,
+        forusbots_job_ids=record.forusbots_job_ids,
+        elapsed_s=_record_elapsed_s(record),
+        error=record.public_error_code,
+        # metadata visible también en el poll: un job shadow (fallback=true)
+        # nunca debe parecer publicable aunque llegue por 202+poll (HT-11)
+        metadata=(record.public_result or {}).get("metadata", {}),
+        next_action=record.next_action.value,
+    )
+
+
+async def _load_v1_poll_record(
+    repo: TicketJobRepository, ticket_job_id: str, http_request: Request
+) -> TicketJobRecord:
     if _TICKET_JOB_ID_RE.fullmatch(ticket_job_id) is None:
         ticket_metrics.increment("ticket_poll_not_found")
         raise HTTPException(
@@ -2074,26 +2319,7 @@ async def get_ticket_status(
                     "message": "el resultado expiró; el receipt impide "
                                "recrear el job con la misma key"},
         )
-    _emit_ticket_metric(
-        "ticket_n8n_poll_count", 1, state=record.state.value
-    )
-    results = _record_results(record)
-    primary = results[0] if results else None
-    return TicketStatusResponse(
-        ticket_job_id=record.job_id,
-        state=record.state.value,
-        route_taken=primary.route if primary else None,
-        primary=primary,
-        related=results[1:] if results else [],
-        total_inquiries_in_ticket=record.total_inquiries,
-        forusbots_job_ids=record.forusbots_job_ids,
-        elapsed_s=_record_elapsed_s(record),
-        error=record.public_error_code,
-        # metadata visible también en el poll: un job shadow (fallback=true)
-        # nunca debe parecer publicable aunque llegue por 202+poll (HT-11)
-        metadata=(record.public_result or {}).get("metadata", {}),
-        next_action=record.next_action.value,
-    )
+    return record
 
 
 # ============================================================================
@@ -2193,41 +2419,24 @@ async def get_ticket_job_v2(
     ticket_job_id: str,
     http_request: Request,
     repo: TicketJobRepository = Depends(get_ticket_repo),
+    wait: Annotated[float, _POLL_WAIT_QUERY] = 0.0,
+    if_none_match: Annotated[Optional[str], _IF_NONE_MATCH_HEADER] = None,
+    *,
+    response: Response = _DETACHED_RESPONSE,
 ):
-    if _TICKET_JOB_ID_RE.fullmatch(ticket_job_id) is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "TICKET_JOB_NOT_FOUND"},
-        )
-    record, payload_present = await repo.get_with_payload_state(ticket_job_id)
-    if record is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "TICKET_JOB_NOT_FOUND"},
-        )
-    if not _poll_owner_matches(record, http_request):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={"code": "TICKET_JOB_FORBIDDEN"},
-        )
-    record, payload_present = await _lazy_terminalize_poll_record(
-        repo, record, payload_present
+    """Poll v2. Mismo contrato condicional/long-poll que v1: ``ETag`` +
+    ``If-None-Match`` → ``304``; ``wait`` espera un cambio acotado."""
+    record, etag = await _load_conditional_poll_record(
+        repo, ticket_job_id, http_request, wait=wait,
+        if_none_match=if_none_match, representation="v2",
+        load=_load_v2_poll_record,
     )
-    if record is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"code": "TICKET_JOB_NOT_FOUND"},
-        )
-    if not payload_present:
-        raise HTTPException(
-            status_code=status.HTTP_410_GONE,
-            detail={"code": "TICKET_JOB_EXPIRED",
-                    "message": "el resultado expiró; el receipt impide "
-                               "recrear el job con la misma key"},
-        )
     _emit_ticket_metric(
         "ticket_n8n_poll_count", 1, state=record.state.value
     )
+    if _if_none_match_hits(if_none_match, etag):
+        return _not_modified(etag)
+    response.headers.update(_poll_cache_headers(etag))
     inquiries = [
         InquiryStatusV2(
             index=e.get("index", i),
@@ -2262,6 +2471,43 @@ async def get_ticket_job_v2(
     )
 
 
+async def _load_v2_poll_record(
+    repo: TicketJobRepository, ticket_job_id: str, http_request: Request
+) -> TicketJobRecord:
+    if _TICKET_JOB_ID_RE.fullmatch(ticket_job_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "TICKET_JOB_NOT_FOUND"},
+        )
+    record, payload_present = await repo.get_with_payload_state(ticket_job_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "TICKET_JOB_NOT_FOUND"},
+        )
+    if not _poll_owner_matches(record, http_request):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": "TICKET_JOB_FORBIDDEN"},
+        )
+    record, payload_present = await _lazy_terminalize_poll_record(
+        repo, record, payload_present
+    )
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "TICKET_JOB_NOT_FOUND"},
+        )
+    if not payload_present:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail={"code": "TICKET_JOB_EXPIRED",
+                    "message": "el resultado expiró; el receipt impide "
+                               "recrear el job con la misma key"},
+        )
+    return record
+
+
 @app.post(
     "/api/v1/chunks",
     response_model=ListChunksResponse,
@@ -115,6 +115,8 @@ _METRIC_SPECS: Mapping[str, _MetricSpec] = {
                 "deadline_terminalized",
                 "payload_expired",
                 "skipped_locked",
+                "resumed_parked",
+                "deferred",
                 "errors",
             )
         },
@@ -160,11 +162,35 @@ _METRIC_SPECS: Mapping[str, _MetricSpec] = {
         {
             "step": _values("participant", "plan"),
             "code": _values(
-                "submit_success", "poll_success", "ambiguous", "failure", "timeout"
+                "submit_success",
+                "poll_success",
+                "ambiguous",
+                "failure",
+                "timeout",
+                "deferred",
             ),
         },
         True,
     ),
+    "ticket_forusbots_callback_count": _MetricSpec(
+        _COUNT_MAX, {"code": _values("woken", "ignored", "rejected")}, True
+    ),
+    "ticket_forusbots_concurrency_count": _MetricSpec(
+        _COUNT_MAX,
+        {
+            "reason": _values(
+                "increase", "queue_backlog", "slow_submit", "rate_limited"
+            )
+        },
+        True,
+    ),
+    "ticket_forusbots_concurrency_limit": _MetricSpec(1_000.0, {}, True),
+    "ticket_payload_raw_bytes": _MetricSpec(
+        16_777_216.0, {"codec": _values("zlib", "zstd")}, True
+    ),
+    "ticket_payload_stored_bytes": _MetricSpec(
+        16_777_216.0, {"codec": _values("zlib", "zstd")}, True
+    ),
     "ticket_forusbots_circuit_count": _MetricSpec(
         _COUNT_MAX, {"state": _values("open", "half_open", "closed")}, True
     ),
@@ -210,6 +236,31 @@ _METRIC_SPECS: Mapping[str, _MetricSpec] = {
     "ticket_manual_reconciliation_required": _MetricSpec(
         _COUNT_MAX, {"code": _values("manual_reconciliation")}, True
     ),
+    "ticket_export_rows": _MetricSpec(
+        _COUNT_MAX, {"format": _values("csv", "ndjson")}, True
+    ),
+    "ticket_export_bytes": _MetricSpec(
+        _COUNT_MAX, {"format": _values("csv", "ndjson")}, True
+    ),
+    "ticket_retention_documents": _MetricSpec(
+        _COUNT_MAX,
+        {
+            "phase": _values(
+                "product_documents",
+                "tombstoned",
+                "ledger_events",
+                "parents",
+                "disposable",
+            )
+        },
+        True,
+    ),
+    "ticket_retention_duration_seconds": _MetricSpec(3_600.0, {}),
+    "ticket_devrev_sync_tickets": _MetricSpec(
+        _COUNT_MAX,
+        {"outcome": _values("added", "updated", "unchanged", "skipped")},
+        True,
+    ),
 }
 
 _COUNTER_SPECS: Mapping[str, Mapping[str, frozenset[str]]] = {
@@ -235,6 +286,17 @@ _COUNTER_SPECS: Mapping[str, Mapping[str, frozenset[str]]] = {
 _COUNTER_SPECS = {
     **_COUNTER_SPECS,
     "ticket_jobs_terminal": {"state": _TERMINAL_STATES},
+    "ticket_rate_limit_checks": {"outcome": _values("accepted", "rejected")},
+    "ticket_devrev_cache_lookups": {
+        "kind": _values("ticket", "timeline"),
+        "outcome": _values("fresh", "stale", "miss", "coalesced"),
+    },
+    "ticket_devrev_cache_revalidations": {
+        "outcome": _values("unchanged", "changed", "failed"),
+    },
+    "ticket_devrev_cache_writes": {
+        "outcome": _values("oversize", "failed"),
+    },
 }
 
 
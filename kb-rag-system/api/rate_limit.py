@@ -1,41 +1,134 @@
 """
 Rate limiting por principal (Task 6 del plan, HT-06 / OWASP API4).
 
-Ventana fija en memoria de proceso: mitiga abuso/DoS por instancia. El
+Token bucket en memoria de proceso: mitiga abuso/DoS por instancia. El
 límite GLOBAL de ejecución lo impone la cola de Cloud Tasks (dispatch/rate
 configurados según la capacidad real de ForusBots y cuotas LLM); este
 limiter protege el endpoint productor, no lo sustituye.
+
+A diferencia de la ventana fija previa, el bucket no deja pasar 2x ``limit``
+en el borde entre dos ventanas: la ráfaga máxima es ``burst`` y el ritmo
+sostenido ``limit`` por ventana. Los buckets viven en un ``OrderedDict`` en
+orden de último uso; la expiración saca sólo buckets de la cabeza, así que
+cada ``check`` hace trabajo O(1) amortizado aunque haya muchas claves.
+
+Ningún endpoint lo construye hoy: la admisión de tickets usa sólo la
+ventana durable del repositorio (``RATE_LIMIT_HANDLE_TICKET``), sin precheck
+in-memory. Quien lo necesite lo arma con ``from_settings`` para que ráfaga
+y overrides por principal salgan de la configuración desplegada.
 """
 
 from __future__ import annotations
 
+import math
 import time
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from api import metrics as ticket_metrics
 
+# (tokens restantes, monotonic del último refill)
+_Bucket = Tuple[float, float]
 
-class FixedWindowRateLimiter:
-    """Contador por (clave, ventana). Devuelve (permitido, retry_after_s)."""
 
-    def __init__(self, window_s: float = 60.0, max_keys: int = 10_000):
+class TokenBucketRateLimiter:
+    """Bucket por clave. Devuelve (permitido, retry_after_s).
+
+    ``check(key, limit)`` mantiene el contrato de las call sites: ``limit``
+    es el ritmo sostenido por ``window_s``. La ráfaga es ``limit *
+    burst_factor`` salvo que ``principal_limits`` fije ``(sustained, burst)``
+    para el principal (``key[0]``).
+    """
+
+    def __init__(
+        self,
+        window_s: float = 60.0,
+        max_keys: int = 10_000,
+        *,
+        burst_factor: float = 1.0,
+        principal_limits: Optional[Mapping[str, Tuple[int, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window_s <= 0 or max_keys < 1 or burst_factor < 1:
+            raise ValueError("window_s/max_keys/burst_factor inválidos")
         self._window_s = window_s
         self._max_keys = max_keys
-        self._windows: Dict[Tuple[str, ...], Tuple[float, int]] = {}
+        self._burst_factor = burst_factor
+        self._principal_limits: Dict[str, Tuple[int, int]] = dict(
+            principal_limits or {}
+        )
+        if any(sustained < 1 or burst < 1
+               for sustained, burst in self._principal_limits.values()):
+            raise ValueError("principal_limits exige sustained/burst >= 1")
+        # Tiempo ocioso tras el cual CUALQUIER bucket volvió a estar lleno.
+        self._idle_s = window_s * max([burst_factor] + [
+            burst / sustained
+            for sustained, burst in self._principal_limits.values()
+        ] + [1.0])
+        self._clock = clock
+        self._buckets: "OrderedDict[Tuple[str, ...], _Bucket]" = OrderedDict()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Any, window_s: float = 60.0
+    ) -> "TokenBucketRateLimiter":
+        """Limiter con ``RATE_LIMIT_BURST_FACTOR`` y
+        ``RATE_LIMIT_PRINCIPAL_LIMITS`` de las Settings."""
+        return cls(
+            window_s,
+            burst_factor=settings.RATE_LIMIT_BURST_FACTOR,
+            principal_limits=settings.RATE_LIMIT_PRINCIPAL_LIMITS,
+        )
+
+    def _rates(self, key: Tuple[str, ...], limit: int) -> Tuple[float, float]:
+        override = self._principal_limits.get(key[0]) if key else None
+        if override is not None:
+            sustained, burst = override
+        else:
+            sustained = limit
+            burst = max(1, math.ceil(limit * self._burst_factor))
+        return sustained / self._window_s, float(max(burst, 1))
 
     def check(self, key: Tuple[str, ...], limit: int) -> Tuple[bool, int]:
-        now = time.monotonic()
-        start, count = self._windows.get(key, (now, 0))
-        if now - start >= self._window_s:
-            start, count = now, 0
-        count += 1
-        self._windows[key] = (start, count)
-        if len(self._windows) > self._max_keys:
-            self._prune(now)
-        if limit > 0 and count > limit:
-            return False, max(1, int(self._window_s - (now - start)) + 1)
-        return True, 0
-
-    def _prune(self, now: float) -> None:
-        expired = [k for k, (start, _c) in self._windows.items()
-                   if now - start >= self._window_s]
-        for k in expired:
-            self._windows.pop(k, None)
+        now = self._clock()
+        self._expire(now)
+        override = key[0] in self._principal_limits if key else False
+        if limit <= 0 and not override:
+            self._record(True)
+            return True, 0
+        rate, capacity = self._rates(key, limit)
+        tokens, updated = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            # LRU: la clave más vieja pierde su historial (vuelve llena).
+            self._buckets.popitem(last=False)
+        self._record(allowed)
+        if allowed:
+            return True, 0
+        return False, max(1, math.ceil((1.0 - tokens) / rate))
+
+    def _expire(self, now: float) -> None:
+        """Descarta buckets ociosos más de ``_idle_s``: ya se rellenaron a
+        capacidad, así que olvidarlos no cambia decisiones. Sólo mira la
+        cabeza (orden de último uso)."""
+        while self._buckets:
+            key, (_tokens, updated) = next(iter(self._buckets.items()))
+            if now - updated < self._idle_s:
+                return
+            del self._buckets[key]
+
+    @staticmethod
+    def _record(allowed: bool) -> None:
+        ticket_metrics.increment(
+            "ticket_rate_limit_checks",
+            outcome="accepted" if allowed else "rejected",
+        )
+
+
+# Nombre histórico: las call sites/tests existentes construyen el limiter
+# por este nombre; la semántica es ahora token bucket.
+FixedWindowRateLimiter = TokenBucketRateLimiter
@@ -67,6 +67,8 @@ DEVREV_CONNECT_TIMEOUT_S = 5.0
 DEVREV_READ_TIMEOUT_S = 20.0
 DEVREV_MAX_RETRIES = 3
 DEVREV_RETRY_AFTER_CAP_S = 60
+DEVREV_TIMELINE_CONCURRENCY = 8
+DEVREV_REQUESTS_PER_SECOND = 10.0
 
 # Cache, idempotency, and retention windows (seconds unless named *_DAYS).
 CACHE_TTL_S = 15 * 60
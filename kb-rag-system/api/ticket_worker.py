@@ -50,7 +50,9 @@ from data_pipeline.ticket_job_models import (
     TicketJobState,
 )
 from data_pipeline.durable_document import DurableDocumentValidationError
+from data_pipeline.forusbots_client import ForusBotsDeferred
 from data_pipeline.forusbots_contract import FORUSBOTS_IDEMPOTENCY_CONTRACT
+from api.forusbots_callback import build_callback_url
 from data_pipeline.ticket_job_repository import (
     StaleEnqueueGeneration,
     StaleLeaseEpoch,
@@ -86,6 +88,27 @@ _HEARTBEAT_RENEW_TIMEOUT_CAP_S = 10.0
 _HEARTBEAT_RETRY_DELAY_CAP_S = 5.0
 _HEARTBEAT_MIN_STEP_S = 0.001
 
+
+class _LeaseRenewals:
+    """Último renew confirmado del lease de ESTE intento (reloj monotónico).
+
+    Checkpoints y updates fenced renuevan el lease en su propia transacción;
+    el heartbeat sólo escribe cuando ninguna lo hizo dentro del intervalo.
+    """
+
+    def __init__(self) -> None:
+        self.last_renewed_at = time.monotonic()
+        self.renewed = asyncio.Event()
+
+    def mark(self, started_at: float) -> None:
+        # ``started_at`` es previo a la transacción: cota conservadora del
+        # ``now`` con el que el repositorio fijó ``lease_expires_at``.
+        self.last_renewed_at = max(self.last_renewed_at, started_at)
+        self.renewed.set()
+
+    def due_in(self, interval_s: float) -> float:
+        return self.last_renewed_at + interval_s - time.monotonic()
+
 _SAFE_EXCEPTION_TYPES = frozenset({
     "AssertionError",
     "AttributeError",
@@ -252,8 +275,12 @@ def _install_forusbots_intent_guard(
     lease_epoch: int,
     route: str,
     job_request_fingerprint: str,
+    callback_url: Optional[str] = None,
 ) -> None:
-    """Liga el hook del orquestador al CAS durable del job actual."""
+    """Liga el hook del orquestador al CAS durable del job actual.
+
+    ``callback_url`` (callback mode) hace que un submit nuevo difiera su
+    completado: el worker estaciona el job tras el receipt durable."""
     operation_setter = getattr(
         orchestrator, "set_forusbots_operation_hooks", None
     )
@@ -292,9 +319,15 @@ def _install_forusbots_intent_guard(
                 "forusbots-dedupe-v1"
             ).encode("utf-8")
         ).hexdigest()
-        operation_setter(
-            _prepare, _submitted, dedupe_scope=stable_scope,
-        )
+        if callback_url is not None:
+            operation_setter(
+                _prepare, _submitted, dedupe_scope=stable_scope,
+                callback_url=callback_url,
+            )
+        else:
+            operation_setter(
+                _prepare, _submitted, dedupe_scope=stable_scope,
+            )
         return
 
     setter = getattr(orchestrator, "set_forusbots_intent_guard", None)
@@ -759,8 +792,9 @@ async def run_ticket_job(app: Any, job_id: str,
     fenced por lease_epoch (Tarea 6 Paso 4a): un intento viejo que despierta
     después de perder su lease no puede enviar, guardar ni publicar.
 
-    Devuelve el record final, o None si el claim no procede (duplicado) o si
-    este intento quedó fenced."""
+    Devuelve el record final (o el record estacionado en callback mode
+    ForusBots), o None si el claim no procede (duplicado) o si este intento
+    quedó fenced."""
     repo: TicketJobRepository = app.state.ticket_repo
     worker_id = worker_id or f"worker-{uuid.uuid4().hex[:12]}"
 
@@ -781,15 +815,18 @@ async def run_ticket_job(app: Any, job_id: str,
     owner_task = asyncio.current_task()
     if owner_task is None:  # pragma: no cover - asyncio siempre crea un Task
         raise RuntimeError("ticket worker ejecutado fuera de un asyncio.Task")
+    renewals = _LeaseRenewals()
     heartbeat = asyncio.create_task(
         _heartbeat_loop(
             repo, job_id, worker_id, lease_epoch, owner_task=owner_task,
+            renewals=renewals,
         ),
         name=f"ticket-heartbeat:{lease_epoch}",
     )
     try:
         with ticket_metrics.ticket_execution_scope():
-            final = await _execute(app, repo, job_id, worker_id, lease_epoch)
+            final = await _execute(app, repo, job_id, worker_id, lease_epoch,
+                                   renewals=renewals)
         _emit_terminal_metric(final)
         return final
     except StaleLeaseEpoch:
@@ -802,6 +839,23 @@ async def run_ticket_job(app: Any, job_id: str,
         # delivery.  The durable checkpoint remains intact and the next
         # attempt skips that completed inquiry, making the fault one-shot.
         raise
+    except ForusBotsDeferred:
+        # Callback mode: el receipt del job upstream ya es durable. Estacionar
+        # libera el task; el callback firmado o el reconciliador reanudan el
+        # job desde el receipt (resume_job). Si el park falla, el lease vence
+        # y el reconciliador fencea+re-encola como en cualquier crash.
+        try:
+            return await repo.park_for_forusbots_callback(
+                job_id,
+                lease_epoch=lease_epoch,
+                resume_after_s=settings.FORUSBOTS_CALLBACK_RESUME_AFTER_S,
+            )
+        except StaleLeaseEpoch:
+            logger.info("ticket job fenced antes de estacionar (epoch=%d)",
+                        lease_epoch)
+        except Exception:  # noqa: BLE001
+            logger.error("no se pudo estacionar el ticket job diferido")
+        return None
     except asyncio.CancelledError:
         # Deadline del task / shutdown: dejar el job retryable, nunca en
         # running eterno. La escritura es condicional al epoch: si otro
@@ -853,13 +907,16 @@ async def run_ticket_job(app: Any, job_id: str,
 
 async def _heartbeat_loop(repo: TicketJobRepository, job_id: str,
                           worker_id: str, lease_epoch: int, *,
-                          owner_task: asyncio.Task[Any]) -> None:
+                          owner_task: asyncio.Task[Any],
+                          renewals: Optional[_LeaseRenewals] = None) -> None:
     """Renueva el lease y cancela el intento cuando deja de ser demostrable.
 
-    Una excepción/timeout transitorio recibe un retry corto. Dos fallos
-    consecutivos, o un ``False`` definitivo, cancelan ``owner_task``: su
-    manejador existente de ``CancelledError`` re-encola sólo si aún posee el
-    epoch; si ya fue fenced, la escritura condicional no pisa al nuevo owner.
+    Sólo escribe si ningún checkpoint/update fenced renovó el lease dentro
+    del intervalo (``renewals``). Una excepción/timeout transitorio recibe
+    un retry corto. Dos fallos consecutivos, o un ``False`` definitivo,
+    cancelan ``owner_task``: su manejador existente de ``CancelledError``
+    re-encola sólo si aún posee el epoch; si ya fue fenced, la escritura
+    condicional no pisa al nuevo owner.
     """
     interval_s = max(
         _HEARTBEAT_MIN_STEP_S,
@@ -873,6 +930,7 @@ async def _heartbeat_loop(repo: TicketJobRepository, job_id: str,
         _HEARTBEAT_MIN_STEP_S,
         min(_HEARTBEAT_RETRY_DELAY_CAP_S, interval_s / 6),
     )
+    renewals = renewals or _LeaseRenewals()
     consecutive_failures = 0
 
     def _cancel_owner(reason: str) -> None:
@@ -886,8 +944,24 @@ async def _heartbeat_loop(repo: TicketJobRepository, job_id: str,
         owner_task.cancel(f"ticket heartbeat: {reason}")
 
     try:
-        await asyncio.sleep(interval_s)
         while True:
+            if consecutive_failures == 0:
+                wait_s = renewals.due_in(interval_s)
+                if wait_s > 0:
+                    # una escritura que renueva el lease reprograma el turno.
+                    # asyncio.wait (no wait_for): en 3.11 wait_for puede
+                    # tragarse el cancel si el evento llega a la vez.
+                    renewals.renewed.clear()
+                    woken = asyncio.ensure_future(renewals.renewed.wait())
+                    try:
+                        await asyncio.wait(
+                            {woken},
+                            timeout=max(_HEARTBEAT_MIN_STEP_S, wait_s),
+                        )
+                    finally:
+                        woken.cancel()
+                    continue
+            renew_started = time.monotonic()
             try:
                 renewed = await asyncio.wait_for(
                     repo.renew_lease(
@@ -932,7 +1006,7 @@ async def _heartbeat_loop(repo: TicketJobRepository, job_id: str,
                 _cancel_owner("lease_lost")
                 return
             consecutive_failures = 0
-            await asyncio.sleep(interval_s)
+            renewals.mark(renew_started)
     except asyncio.CancelledError:
         return
     except Exception:  # noqa: BLE001 - el supervisor siempre falla cerrado
@@ -1055,7 +1129,9 @@ def _rehydrate_plan(
 
 
 async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
-                   worker_id: str, lease_epoch: int) -> TicketJobRecord:
+                   worker_id: str, lease_epoch: int, *,
+                   renewals: Optional[_LeaseRenewals] = None,
+                   ) -> TicketJobRecord:
     record = await repo.get(job_id)
     assert record is not None
     fault_plan = None
@@ -1096,17 +1172,35 @@ async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
             ) from None
         _emit_phase("persist_inquiry_result")
         try:
-            return await repo.record_inquiry_result(
+            write_started = time.monotonic()
+            checkpointed = await repo.record_inquiry_result(
                 job_id,
                 inquiry_index,
                 entry,
                 lease_epoch=lease_epoch,
+                renew_lease_s=settings.TICKET_WORKER_LEASE_S,
             )
+            if renewals is not None:
+                renewals.mark(write_started)
+            return checkpointed
         except StaleLeaseEpoch:
             raise
         except Exception as exc:
             raise _InquiryPhaseFailure("persist_inquiry_result", exc) from None
 
+    async def _renewing_update(**changes: Any) -> TicketJobRecord:
+        # update fenced NO terminal: renueva el lease en la misma escritura
+        write_started = time.monotonic()
+        updated = await repo.update(
+            job_id,
+            expected_lease_epoch=lease_epoch,
+            renew_lease_s=settings.TICKET_WORKER_LEASE_S,
+            **changes,
+        )
+        if renewals is not None:
+            renewals.mark(write_started)
+        return updated
+
     # Presupuesto del intento: min(TICKET_ATTEMPT_BUDGET_S, lo que reste del
     # deadline ABSOLUTO del job). Un intento no inicia un efecto que no cabe.
     budget = settings.TICKET_ATTEMPT_BUDGET_S
@@ -1133,8 +1227,7 @@ async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
         unprocessed = record.execution_plan["unprocessed_inquiries"]
     else:
         validate_started = time.monotonic()
-        await repo.update(job_id, current_step="extracting",
-                          expected_lease_epoch=lease_epoch)
+        await _renewing_update(current_step="extracting")
         try:
             extracted = await orchestrator.extract_inquiries(req)
         except ExtractionUnavailable:
@@ -1209,9 +1302,7 @@ async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
             apply_ticket_handler_mode(getattr(c, "route", "needs_more_info"), mode)
             for c in classifications
         ]
-        await repo.update(
-            job_id,
-            expected_lease_epoch=lease_epoch,
+        await _renewing_update(
             execution_plan=_build_execution_plan(
                 capped, classifications, gated, total, unprocessed),
             total_inquiries=total,
@@ -1456,6 +1547,7 @@ async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
                 lease_epoch=lease_epoch,
                 route=getattr(cls, "route", "needs_more_info"),
                 job_request_fingerprint=record.request_fingerprint,
+                callback_url=build_callback_url(job_id),
             )
             for fault_point in (
                 "lease_lost", "timeout_reset", "dependency_down",
@@ -1546,6 +1638,9 @@ async def _execute(app: Any, repo: TicketJobRepository, job_id: str,
             raise
         except StaleLeaseEpoch:
             raise
+        except ForusBotsDeferred:
+            # callback mode: receipt durable, el intento se libera entero
+            raise
         except (FaultInjectionRejected, InjectedFault):
             raise
         except Exception as exc:  # noqa: BLE001
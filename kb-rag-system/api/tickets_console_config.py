@@ -47,6 +47,8 @@ from api.ticket_review_models import (
     DEVREV_MAX_RESPONSE_BYTES,
     DEVREV_MAX_RETRIES,
     DEVREV_READ_TIMEOUT_S,
+    DEVREV_REQUESTS_PER_SECOND,
+    DEVREV_TIMELINE_CONCURRENCY,
     EVIDENCE_BROKER_MAX_RESPONSE_BYTES,
     IDEMPOTENCY_TTL_S,
     IMPORT_STAGING_TTL_S,
@@ -273,6 +275,10 @@ class TicketConsoleSettings(BaseSettings):
     DEVREV_MAX_RESPONSE_BYTES: int = DEVREV_MAX_RESPONSE_BYTES
     DEVREV_MAX_PAGES: int = DEVREV_MAX_PAGES
     DEVREV_PAGE_SIZE: int = DEFAULT_PAGE_SIZE
+    # One token bucket per client paces every request; batch timeline loads
+    # share it across at most DEVREV_TIMELINE_CONCURRENCY tickets at once.
+    DEVREV_REQUESTS_PER_SECOND: float = DEVREV_REQUESTS_PER_SECOND
+    DEVREV_TIMELINE_CONCURRENCY: int = DEVREV_TIMELINE_CONCURRENCY
 
     # Caches, TTLs, and retention.
     CACHE_TTL_S: int = CACHE_TTL_S
@@ -467,6 +473,16 @@ def _canonical_bound_errors(settings: TicketConsoleSettings) -> list[str]:
         ("DEVREV_PAGE_SIZE", settings.DEVREV_PAGE_SIZE, MAX_PAGE_SIZE),
         ("DEVREV_MAX_PAGES", settings.DEVREV_MAX_PAGES, DEVREV_MAX_PAGES),
         ("DEVREV_MAX_RETRIES", settings.DEVREV_MAX_RETRIES, DEVREV_MAX_RETRIES),
+        (
+            "DEVREV_REQUESTS_PER_SECOND",
+            settings.DEVREV_REQUESTS_PER_SECOND,
+            DEVREV_REQUESTS_PER_SECOND,
+        ),
+        (
+            "DEVREV_TIMELINE_CONCURRENCY",
+            settings.DEVREV_TIMELINE_CONCURRENCY,
+            DEVREV_TIMELINE_CONCURRENCY,
+        ),
         (
             "DEVREV_MAX_RESPONSE_BYTES",
             settings.DEVREV_MAX_RESPONSE_BYTES,
@@ -7,14 +7,124 @@ Divide artículos en chunks semánticos con metadata enriquecida.
 Estrategia:
 - Modo A (required_data): Chunks específicos para recolección de datos
 - Modo B (generate_response): Chunks priorizados por tier
+
+Re-indexado diferencial: cada chunk lleva en metadata ``chunk_hash``, un
+sha256 estable de su contenido y metadata. ``plan_chunk_diff`` lo compara con
+los hashes ya indexados (metadata de Pinecone o un manifest local) y separa
+lo nuevo/cambiado, lo intacto y los IDs que desaparecieron.
 """
 
-from typing import Dict, Any, List
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Mapping, Optional
+import json
 import logging
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Campo de metadata con el fingerprint del chunk (ver chunk_fingerprint).
+CHUNK_HASH_FIELD = "chunk_hash"
+
+
+def chunk_fingerprint(content: str, metadata: Dict[str, Any]) -> str:
+    """
+    Hash estable de lo que se indexaría para un chunk.
+
+    Cubre el contenido y toda la metadata (salvo el propio hash) serializados
+    en JSON canónico: un cambio de título, tags o tier también obliga a
+    re-subir el chunk, no sólo un cambio de texto.
+    """
+    payload = {
+        "content": content,
+        "metadata": {k: v for k, v in metadata.items() if k != CHUNK_HASH_FIELD},
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ChunkDiff:
+    """Resultado de comparar los chunks nuevos con lo ya indexado."""
+
+    upsert: List[Dict[str, Any]]
+    added: int
+    changed: int
+    unchanged: int
+    delete_ids: List[str]
+
+    @property
+    def has_writes(self) -> bool:
+        return bool(self.upsert or self.delete_ids)
+
+
+def plan_chunk_diff(
+    chunks: List[Dict[str, Any]],
+    stored_hashes: Mapping[str, Optional[str]],
+    force: bool = False,
+) -> ChunkDiff:
+    """
+    Decide qué chunks subir y qué IDs borrar.
+
+    Args:
+        chunks: Chunks recién generados (con ``chunk_hash`` en metadata)
+        stored_hashes: ID -> hash ya indexado; ``None`` si el vector existe
+            pero no tiene hash (subido antes del re-indexado diferencial)
+        force: Si True, sube todos los chunks aunque el hash coincida
+
+    Returns:
+        ChunkDiff con los chunks a subir (en orden) y los IDs desaparecidos
+    """
+    upsert: List[Dict[str, Any]] = []
+    added = changed = unchanged = 0
+    current_ids = set()
+    for chunk in chunks:
+        chunk_id = chunk["id"]
+        current_ids.add(chunk_id)
+        new_hash = chunk["metadata"].get(CHUNK_HASH_FIELD) or chunk_fingerprint(
+            chunk["content"], chunk["metadata"]
+        )
+        if chunk_id not in stored_hashes:
+            added += 1
+            upsert.append(chunk)
+        elif force or stored_hashes[chunk_id] != new_hash:
+            changed += 1
+            upsert.append(chunk)
+        else:
+            unchanged += 1
+    delete_ids = sorted(chunk_id for chunk_id in stored_hashes if chunk_id not in current_ids)
+    return ChunkDiff(
+        upsert=upsert,
+        added=added,
+        changed=changed,
+        unchanged=unchanged,
+        delete_ids=delete_ids,
+    )
+
+
+def merge_chunk_diffs(diffs: Iterable[ChunkDiff]) -> ChunkDiff:
+    """
+    Une los diffs de varios artículos en uno, para subir todo el corpus en un
+    único upload pipelined en lugar de un upload serial por artículo.
+    """
+    upsert: List[Dict[str, Any]] = []
+    delete_ids: List[str] = []
+    added = changed = unchanged = 0
+    for diff in diffs:
+        upsert.extend(diff.upsert)
+        delete_ids.extend(diff.delete_ids)
+        added += diff.added
+        changed += diff.changed
+        unchanged += diff.unchanged
+    return ChunkDiff(
+        upsert=upsert,
+        added=added,
+        changed=changed,
+        unchanged=unchanged,
+        delete_ids=delete_ids,
+    )
+
 
 class KBChunker:
     """Genera chunks semánticos de artículos KB."""
@@ -141,6 +251,7 @@ class KBChunker:
         
         # Strip remaining None values (e.g. description, optional fields).
         metadata = {k: v for k, v in metadata.items() if v is not None}
+        metadata[CHUNK_HASH_FIELD] = chunk_fingerprint(content, metadata)
         
         return {
             "id": chunk_id,
@@ -0,0 +1,269 @@
+"""
+Corpus Manifest Module
+
+Chunking en bloque de todo el corpus de artículos (árbol PA/) y manifest
+determinista de lo generado.
+
+- ``build_corpus`` descubre los artículos, los valida y los chunkea en un
+  pool de procesos (el chunking es CPU puro: con threads no escalaría).
+- ``CorpusBuild.manifest()`` describe el resultado: por artículo, el hash del
+  JSON fuente y, por chunk, su ID, ``chunk_hash`` y tokens. No lleva tiempos
+  ni fechas: el mismo corpus produce el mismo manifest byte a byte.
+- ``manifest_chunk_hashes`` convierte un manifest en el ID -> hash que
+  ``plan_chunk_diff`` / ``PineconeUploader.plan_article_reindex`` aceptan como
+  hashes ya indexados, así un re-indexado puede partir del manifest anterior
+  en vez de leer Pinecone. Sólo sirve de baseline un manifest marcado
+  ``indexed`` (el que escribe ``reindex_corpus.py --manifest-out`` tras un
+  upload completo): uno de un simple build describe lo chunkeado, no lo que
+  hay en Pinecone, y contra él los artículos editados saldrían ``unchanged``.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import time
+
+from data_pipeline.article_processor import ArticleProcessor
+from data_pipeline.chunking import CHUNK_HASH_FIELD, generate_chunks_from_article
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Errores de artículo: valores cerrados, nunca el contenido del archivo.
+ERROR_INVALID_JSON = "invalid_json"
+ERROR_INVALID_ARTICLE = "invalid_article"
+ERROR_CHUNKING_FAILED = "chunking_failed"
+ERROR_DUPLICATE_ARTICLE_ID = "duplicate_article_id"
+
+TokenCounter = Callable[[str], int]
+
+# Token counter por proceso worker (tiktoken se inicializa una sola vez).
+_worker_token_counter: Optional[TokenCounter] = None
+
+
+@dataclass(frozen=True)
+class ArticleChunks:
+    """Resultado del chunking de un archivo del corpus."""
+
+    path: str
+    source_sha256: str
+    article_id: Optional[str] = None
+    chunks: List[Dict[str, Any]] = field(default_factory=list)
+    tokens: List[int] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class CorpusBuild:
+    """Todos los artículos del corpus chunkeados, en orden de path."""
+
+    articles: List[ArticleChunks]
+    timings: Dict[str, float]
+
+    @property
+    def valid(self) -> List[ArticleChunks]:
+        return [article for article in self.articles if article.error is None]
+
+    @property
+    def invalid(self) -> List[ArticleChunks]:
+        return [article for article in self.articles if article.error is not None]
+
+    def manifest(self, *, indexed: bool = False) -> Dict[str, Any]:
+        """Manifest determinista (ver módulo).
+
+        ``indexed=True`` sólo tras subir a Pinecone todo lo que describe.
+        """
+        articles = [
+            {
+                "path": article.path,
+                "article_id": article.article_id,
+                "source_sha256": article.source_sha256,
+                "chunks": [
+                    {
+                        "id": chunk["id"],
+                        "chunk_hash": chunk["metadata"][CHUNK_HASH_FIELD],
+                        "tokens": tokens,
+                    }
+                    for chunk, tokens in zip(article.chunks, article.tokens, strict=True)
+                ],
+            }
+            for article in self.valid
+        ]
+        invalid = [{"path": article.path, "error": article.error} for article in self.invalid]
+        corpus_sha256 = hashlib.sha256(
+            _canonical_json({"articles": articles, "invalid": invalid}).encode("utf-8")
+        ).hexdigest()
+        return {
+            "version": MANIFEST_VERSION,
+            "indexed": indexed,
+            "corpus_sha256": corpus_sha256,
+            "article_count": len(articles),
+            "chunk_count": sum(len(article["chunks"]) for article in articles),
+            "token_count": sum(
+                chunk["tokens"] for article in articles for chunk in article["chunks"]
+            ),
+            "articles": articles,
+            "invalid": invalid,
+        }
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def discover_articles(corpus_dir: Path) -> List[Path]:
+    """Todos los JSON bajo ``corpus_dir``, en orden estable."""
+    return sorted(path for path in corpus_dir.rglob("*.json") if path.is_file())
+
+
+def _default_token_counter() -> TokenCounter:
+    global _worker_token_counter
+    if _worker_token_counter is None:
+        # Import perezoso: tiktoken sólo se carga en los procesos que cuentan.
+        from data_pipeline.token_manager import get_token_manager
+
+        _worker_token_counter = get_token_manager().count_tokens
+    return _worker_token_counter
+
+
+def _chunk_article_file(
+    job: tuple[str, str, Optional[TokenCounter]],
+) -> ArticleChunks:
+    """Lee, valida y chunkea un archivo. Corre dentro de un worker del pool."""
+    path, relative, token_counter = job
+    raw = Path(path).read_bytes()
+    source_sha256 = hashlib.sha256(raw).hexdigest()
+    try:
+        article = json.loads(raw)
+    except ValueError:
+        return ArticleChunks(path=relative, source_sha256=source_sha256, error=ERROR_INVALID_JSON)
+    if not isinstance(article, dict) or not ArticleProcessor().validate_article(article):
+        return ArticleChunks(
+            path=relative, source_sha256=source_sha256, error=ERROR_INVALID_ARTICLE
+        )
+    article_id = article["metadata"]["article_id"]
+    try:
+        chunks = generate_chunks_from_article(article)
+    except Exception as exc:  # noqa: BLE001 - un artículo roto no frena el corpus
+        logger.error(
+            "Chunking falló (path=%s, error_type=%s)", relative, type(exc).__name__
+        )
+        return ArticleChunks(
+            path=relative,
+            source_sha256=source_sha256,
+            article_id=article_id,
+            error=ERROR_CHUNKING_FAILED,
+        )
+    count = token_counter or _default_token_counter()
+    return ArticleChunks(
+        path=relative,
+        source_sha256=source_sha256,
+        article_id=article_id,
+        chunks=chunks,
+        tokens=[count(chunk["content"]) for chunk in chunks],
+    )
+
+
+def build_corpus(
+    corpus_dir: Path,
+    workers: Optional[int] = None,
+    token_counter: Optional[TokenCounter] = None,
+) -> CorpusBuild:
+    """
+    Descubre, valida y chunkea todo el corpus en un pool de procesos.
+
+    Args:
+        corpus_dir: Directorio raíz del corpus (se recorre recursivamente)
+        workers: Procesos del pool (default: CPUs; 1 = en el proceso actual)
+        token_counter: Función picklable texto -> tokens (default: tiktoken
+            vía TokenManager, inicializado una vez por worker)
+
+    Returns:
+        CorpusBuild con los artículos en orden de path y los tiempos por etapa
+        (``discover_s``, ``chunk_s``)
+    """
+    started = time.monotonic()
+    paths = discover_articles(corpus_dir)
+    jobs = [
+        (str(path), path.relative_to(corpus_dir).as_posix(), token_counter) for path in paths
+    ]
+    discover_s = time.monotonic() - started
+
+    started = time.monotonic()
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    if workers <= 1:
+        articles = [_chunk_article_file(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map conserva el orden de entrada: el resultado es determinista
+            # aunque los workers terminen en cualquier orden.
+            articles = list(pool.map(_chunk_article_file, jobs, chunksize=4))
+    chunk_s = time.monotonic() - started
+
+    # Un article_id repetido pisaría chunk por chunk al otro: gana el primer
+    # path en orden y el resto se marca inválido.
+    seen: set[str] = set()
+    for index, article in enumerate(articles):
+        if article.error is not None or article.article_id is None:
+            continue
+        if article.article_id in seen:
+            articles[index] = ArticleChunks(
+                path=article.path,
+                source_sha256=article.source_sha256,
+                article_id=article.article_id,
+                error=ERROR_DUPLICATE_ARTICLE_ID,
+            )
+        seen.add(article.article_id)
+
+    return CorpusBuild(
+        articles=articles,
+        timings={"discover_s": discover_s, "chunk_s": chunk_s},
+    )
+
+
+def write_manifest(manifest: Dict[str, Any], path: Path) -> None:
+    """Escribe el manifest de forma atómica (tmp + rename)."""
+    text = json.dumps(manifest, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_manifest(path: Path, *, baseline: bool = False) -> Dict[str, Any]:
+    """
+    Lee un manifest y rechaza versiones desconocidas.
+
+    Con ``baseline=True`` rechaza además los manifests no marcados
+    ``indexed``: no describen lo que hay en Pinecone.
+    """
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Manifest con versión no soportada: {path}")
+    if baseline and manifest.get("indexed") is not True:
+        raise ValueError(
+            f"Manifest sin marca 'indexed' (usa el de reindex_corpus.py --manifest-out): {path}"
+        )
+    return manifest
+
+
+def manifest_chunk_hashes(
+    manifest: Dict[str, Any],
+    article_id: Optional[str] = None,
+) -> Dict[str, Optional[str]]:
+    """
+    ID -> chunk_hash del manifest, opcionalmente de un solo artículo.
+
+    El resultado se usa como ``stored_hashes`` de un re-indexado diferencial.
+    """
+    return {
+        chunk["id"]: chunk["chunk_hash"]
+        for article in manifest["articles"]
+        if article_id is None or article["article_id"] == article_id
+        for chunk in article["chunks"]
+    }
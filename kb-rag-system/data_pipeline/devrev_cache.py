@@ -0,0 +1,291 @@
+"""Read-through cache in front of :class:`DevRevClient` ticket reads.
+
+:class:`CachingDevRevClient` wraps a client and the console cache
+(``ticket_console_cache``, via :class:`TicketReviewRepository`). It serves
+``get_ticket`` and ``list_timeline_page`` from cache and falls through to
+DevRev only when needed.
+
+Rules:
+
+1. **Fresh, stale, absent.** An entry younger than ``fresh_s`` is served as
+   is. An older one that is still inside the console cache TTL is served
+   immediately while ONE background task revalidates it. An absent or elapsed
+   entry is fetched before returning.
+2. **One fetch per key.** Concurrent misses and revalidations of the same key
+   share one in-flight DevRev call. A waiter that is cancelled never cancels
+   the shared call.
+3. **Validators.** A ticket's ``object_version`` and ``modified_at`` are its
+   validator. A cached timeline page records the validator of the ticket it
+   belongs to; once a refreshed ticket carries another one, the page is a
+   miss instead of a stale hit. A revalidation that finds the same validator
+   is counted ``unchanged``.
+4. **Scope is part of the key.** Keys carry
+   :attr:`DevRevClient.scope_fingerprint`, so narrowing the allowlists never
+   serves something the new scope would refuse.
+5. **Counts only.** Hit ratios leave as ``ticket_devrev_cache_lookups``
+   (``kind`` x ``outcome``) and ``ticket_devrev_cache_revalidations``; no id,
+   cursor, or title reaches a metric or a log line.
+6. **Writes never fail a read.** A value that DevRev returned is returned
+   even if caching it fails. An entry over the Firestore document limit (a
+   timeline page of long bodies) is not cached; it and any failed write are
+   counted in ``ticket_devrev_cache_writes``.
+
+Every other attribute is delegated to the wrapped client unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from api import metrics as ticket_metrics
+from api.ticket_review_models import (
+    DevRevTicketDetail,
+    DevRevTicketSummary,
+    TimelinePage,
+    utc_now,
+)
+from data_pipeline.devrev_client import DevRevClient
+from data_pipeline.ticket_review_repository import (
+    CacheEntryTooLarge,
+    ConsoleCacheEntry,
+    TicketReviewRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+DEVREV_CACHE_FRESH_S = 30
+_CACHE_KEY_VERSION = "v1"
+_PAYLOAD_MODEL = "model"
+_PAYLOAD_FETCHED_AT = "fetched_at"
+_PAYLOAD_VALIDATOR = "validator"
+_PAYLOAD_TICKET_VALIDATOR = "ticket_validator"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+__all__ = [
+    "DEVREV_CACHE_FRESH_S",
+    "CachingDevRevClient",
+    "ticket_validator",
+]
+
+
+def ticket_validator(ticket: DevRevTicketSummary) -> str:
+    """The change token of one ticket snapshot."""
+    modified = ticket.modified_at.isoformat() if ticket.modified_at else ""
+    return f"{ticket.object_version}:{modified}"
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+class CachingDevRevClient:
+    """A drop-in :class:`DevRevClient` whose ticket reads go through cache."""
+
+    def __init__(
+        self,
+        client: DevRevClient,
+        repository: TicketReviewRepository,
+        *,
+        fresh_s: float = DEVREV_CACHE_FRESH_S,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        if fresh_s < 0:
+            raise ValueError("fresh_s must not be negative")
+        self._client = client
+        self._repository = repository
+        self._fresh = timedelta(seconds=fresh_s)
+        self._clock = clock
+        self._scope = client.scope_fingerprint[:16]
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def __aenter__(self) -> CachingDevRevClient:
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Let background revalidations finish, then close the client."""
+        await self.drain()
+        await self._client.aclose()
+
+    async def drain(self) -> None:
+        """Wait for every background revalidation started so far."""
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Cached reads
+    # ------------------------------------------------------------------
+
+    async def get_ticket(self, work_id: str) -> DevRevTicketDetail:
+        key = self._ticket_key(work_id)
+
+        async def _fetch() -> DevRevTicketDetail:
+            detail = await self._client.get_ticket(work_id)
+            validator = ticket_validator(detail)
+            payload = {_PAYLOAD_VALIDATOR: validator}
+            await self._store(key, detail, payload)
+            if detail.devrev_work_id != work_id:
+                # Timeline pages are keyed by DON: let them see this validator.
+                await self._store(self._ticket_key(detail.devrev_work_id), detail, payload)
+            return detail
+
+        cached = await self._lookup(key, DevRevTicketDetail)
+        if cached is None:
+            return await self._miss("ticket", key, _fetch)
+        detail, payload, fresh = cached
+        if fresh:
+            ticket_metrics.increment("ticket_devrev_cache_lookups", kind="ticket", outcome="fresh")
+            return detail
+        ticket_metrics.increment("ticket_devrev_cache_lookups", kind="ticket", outcome="stale")
+        previous = payload.get(_PAYLOAD_VALIDATOR)
+        self._revalidate(
+            key, _fetch, lambda fresh_detail: ticket_validator(fresh_detail) == previous
+        )
+        return detail
+
+    async def list_timeline_page(
+        self,
+        object_id: str,
+        *,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> TimelinePage:
+        key = self._key(
+            "timeline", f"{object_id}\x00{cursor or ''}\x00{'' if limit is None else limit}"
+        )
+        ticket_key = self._ticket_key(object_id)
+
+        async def _fetch() -> TimelinePage:
+            page = await self._client.list_timeline_page(object_id, cursor=cursor, limit=limit)
+            await self._store(
+                key, page, {_PAYLOAD_TICKET_VALIDATOR: await self._current_validator(ticket_key)}
+            )
+            return page
+
+        cached = await self._lookup(key, TimelinePage)
+        if cached is not None:
+            page, payload, fresh = cached
+            current = await self._current_validator(ticket_key)
+            if current == payload.get(_PAYLOAD_TICKET_VALIDATOR, ""):
+                outcome = "fresh" if fresh else "stale"
+                ticket_metrics.increment(
+                    "ticket_devrev_cache_lookups", kind="timeline", outcome=outcome
+                )
+                if not fresh:
+                    stored = page.model_dump_json()
+                    self._revalidate(
+                        key, _fetch, lambda fresh_page: fresh_page.model_dump_json() == stored
+                    )
+                return page
+        return await self._miss("timeline", key, _fetch)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _key(self, kind: str, identity: str) -> str:
+        return f"devrev:{_CACHE_KEY_VERSION}:{self._scope}:{kind}:{_digest(identity)}"
+
+    def _ticket_key(self, work_id: str) -> str:
+        return self._key("ticket", work_id)
+
+    async def _lookup(
+        self, key: str, model: type[ModelT]
+    ) -> Optional[tuple[ModelT, dict[str, str], bool]]:
+        entry = await self._repository.get_console_cache_entry(key)
+        if entry is None:
+            return None
+        try:
+            value = model.model_validate_json(entry.payload[_PAYLOAD_MODEL])
+            fetched_at = datetime.fromisoformat(entry.payload[_PAYLOAD_FETCHED_AT])
+        except (KeyError, ValueError, ValidationError):
+            # An unreadable entry (older layout, truncated write) is a miss.
+            return None
+        return value, entry.payload, self._clock() - fetched_at <= self._fresh
+
+    async def _current_validator(self, ticket_key: str) -> str:
+        entry = await self._repository.get_console_cache_entry(ticket_key)
+        return "" if entry is None else entry.payload.get(_PAYLOAD_VALIDATOR, "")
+
+    async def _store(self, key: str, value: BaseModel, payload: dict[str, str]) -> None:
+        try:
+            await self._repository.put_console_cache_entry(
+                ConsoleCacheEntry(
+                    cache_key=key,
+                    payload={
+                        **payload,
+                        _PAYLOAD_MODEL: value.model_dump_json(),
+                        _PAYLOAD_FETCHED_AT: self._clock().isoformat(),
+                    },
+                )
+            )
+        except asyncio.CancelledError:
+            raise
+        except CacheEntryTooLarge:
+            ticket_metrics.increment("ticket_devrev_cache_writes", outcome="oversize")
+        except Exception as error:  # noqa: BLE001 - the fetched value still serves
+            ticket_metrics.increment("ticket_devrev_cache_writes", outcome="failed")
+            logger.warning(
+                "devrev cache write failed",
+                extra={"error_type": type(error).__name__},
+            )
+
+    async def _miss(self, kind: str, key: str, fetch: Callable[[], Awaitable[ModelT]]) -> ModelT:
+        outcome = "coalesced" if key in self._inflight else "miss"
+        ticket_metrics.increment("ticket_devrev_cache_lookups", kind=kind, outcome=outcome)
+        result: ModelT = await asyncio.shield(self._shared(key, fetch))
+        return result
+
+    def _shared(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _done: self._inflight.pop(key, None))
+        return task
+
+    def _revalidate(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[ModelT]],
+        unchanged: Callable[[ModelT], bool],
+    ) -> None:
+        if key in self._inflight:
+            return
+        task = self._shared(key, fetch)
+
+        def _report(done: asyncio.Task[Any]) -> None:
+            self._background.discard(done)
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is not None:
+                # The stale copy keeps serving until the TTL; the next stale
+                # hit tries again. The client already logged the call.
+                ticket_metrics.increment("ticket_devrev_cache_revalidations", outcome="failed")
+                logger.warning(
+                    "devrev cache revalidation failed",
+                    extra={"error_type": type(error).__name__},
+                )
+                return
+            ticket_metrics.increment(
+                "ticket_devrev_cache_revalidations",
+                outcome="unchanged" if unchanged(done.result()) else "changed",
+            )
+
+        self._background.add(task)
+        task.add_done_callback(_report)
@@ -37,6 +37,12 @@ Design rules this module is required to hold, and where each one lives:
     An error body is read to at most 4 KiB purely so its size can be recorded.
     Its content is never retained, logged, or placed in an exception message.
 
+``One rate budget``
+    Every request draws on one per-client token bucket, and a 429
+    ``Retry-After`` pauses the whole client while it is waited out. Batch
+    timeline hydration (:meth:`DevRevClient.load_timelines`) fans out over the
+    shared HTTP client within that budget.
+
 ``Fail-closed scope``
     Every list request injects the configured ``applies_to_part`` DONs and
     ticket-visibility IDs and can only be narrowed, never cleared or widened.
@@ -74,11 +80,14 @@ Stage 4 service layer.
 from __future__ import annotations
 
 import asyncio
+import codecs
 import hashlib
 import json
 import logging
+import math
 import random
 import re
+import time
 from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -97,7 +106,9 @@ from api.ticket_review_models import (
     DEVREV_MAX_RESPONSE_BYTES,
     DEVREV_MAX_RETRIES,
     DEVREV_READ_TIMEOUT_S,
+    DEVREV_REQUESTS_PER_SECOND,
     DEVREV_RETRY_AFTER_CAP_S,
+    DEVREV_TIMELINE_CONCURRENCY,
     MAX_ATTACHMENTS,
     MAX_CURSOR_LENGTH,
     MAX_DISPLAY_ID_LENGTH,
@@ -137,6 +148,7 @@ __all__ = [
     "LIST_MODES",
     "NON_RETRYABLE_STATUS_CODES",
     "RETRYABLE_STATUS_CODES",
+    "SYNC_SORT_BY",
     "TIMELINE_LIST_MODE",
     "WORKS_LIST_ALLOWED_TICKET_KEYS",
     "WORKS_LIST_ALLOWED_TOP_LEVEL_KEYS",
@@ -155,6 +167,7 @@ __all__ = [
     "DevRevResourceLimitError",
     "DevRevScopeError",
     "DevRevTimelineHydration",
+    "DevRevTimelineOutcome",
     "DevRevTransientError",
     "cursor_digest",
     "sort_timeline_entries",
@@ -187,6 +200,8 @@ NON_RETRYABLE_STATUS_CODES = frozenset({400, 401, 403, 404, 409})
 #: ``works.list`` iterates in either direction; the timeline is forward-only.
 LIST_MODES = frozenset({"after", "before"})
 TIMELINE_LIST_MODE = "after"
+#: Incremental sync pages oldest change first so a stored watermark resumes it.
+SYNC_SORT_BY = ("modified_date:asc",)
 
 WORKS_LIST_ALLOWED_TOP_LEVEL_KEYS = frozenset(
     {
@@ -201,6 +216,7 @@ WORKS_LIST_ALLOWED_TOP_LEVEL_KEYS = frozenset(
         "created_date",
         "modified_date",
         "ticket",
+        "sort_by",
         "cursor",
         "mode",
         "limit",
@@ -450,6 +466,70 @@ class DevRevTimelineHydration:
     diagnostics: DevRevCallDiagnostics
 
 
+@dataclass(frozen=True, slots=True)
+class DevRevTimelineOutcome:
+    """One ticket's result within :meth:`DevRevClient.load_timelines`.
+
+    Exactly one of ``hydration`` and ``error`` is set. A DevRev failure on one
+    ticket is reported here rather than aborting its siblings.
+    """
+
+    work_id: str
+    hydration: Optional[DevRevTimelineHydration] = None
+    error: Optional[DevRevError] = None
+
+
+class _RequestPacer:
+    """One token bucket shared by every request a client sends.
+
+    Kept in its reservation (GCRA) form: each request is handed a send time
+    up front, so concurrent callers queue without polling and a burst of one
+    second's worth of requests goes out immediately. While any request waits
+    out a 429 ``Retry-After``, every other request's first attempt waits with
+    it, so a rate-limited client backs off as a whole.
+    """
+
+    __slots__ = ("_interval", "_tolerance", "_clock", "_theoretical", "_holds", "_open")
+
+    def __init__(
+        self, requests_per_second: Optional[float], clock: Callable[[], float]
+    ) -> None:
+        if requests_per_second is None:
+            self._interval = 0.0
+            self._tolerance = 0.0
+        else:
+            self._interval = 1.0 / requests_per_second
+            self._tolerance = self._interval * (math.ceil(requests_per_second) - 1)
+        self._clock = clock
+        self._theoretical = float("-inf")
+        self._holds = 0
+        self._open = asyncio.Event()
+        self._open.set()
+
+    async def acquire(self, sleep: Callable[[float], Any], *, honor_pause: bool) -> None:
+        if honor_pause:
+            await self._open.wait()
+        if not self._interval:
+            return
+        now = self._clock()
+        theoretical = max(self._theoretical, now)
+        self._theoretical = theoretical + self._interval
+        wait_s = theoretical - self._tolerance - now
+        if wait_s > 0:
+            await sleep(wait_s)
+
+    async def hold(self, sleep: Callable[[float], Any], delay_s: float) -> None:
+        """Sleep out one rate-limit delay with the whole client paused."""
+        self._holds += 1
+        self._open.clear()
+        try:
+            await sleep(delay_s)
+        finally:
+            self._holds -= 1
+            if not self._holds:
+                self._open.set()
+
+
 class _Accumulator:
     """Mutable per-call scratch space, frozen into diagnostics on demand."""
 
@@ -555,6 +635,303 @@ class _ResponseMeta:
     request_id: Optional[str] = None
 
 
+# =====================================================================
+# Streaming JSON: one top-level object, one array element at a time
+# =====================================================================
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_STRUCTURAL = re.compile(r'["{}\[\]]')
+_JSON_STRING_SPECIAL = re.compile(r'["\\]')
+_JSON_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+_JSON_VALUE_FIRST = frozenset('"{[-0123456789tfnNI')
+_JSON_DECODER = json.JSONDecoder()
+
+
+class _StreamedJSONError(ValueError):
+    """The streamed body is not one well-formed JSON object. Carries no text."""
+
+
+class _ValueScanner:
+    """Find where one JSON value ends without decoding it, across chunks.
+
+    Only structural characters are visited, and a scan that runs out of text
+    resumes where it stopped, so each character is looked at once however
+    the body is split. Positions are absolute in the parser's buffer and are
+    moved by :meth:`shift` when the buffer drops its consumed prefix.
+    """
+
+    __slots__ = ("start", "_pos", "_depth", "_in_string", "_scalar")
+
+    def __init__(self, text: str, start: int) -> None:
+        first = text[start]
+        if first not in _JSON_VALUE_FIRST:
+            # Reject at once rather than wait for a delimiter that may never come.
+            raise _StreamedJSONError("expected a JSON value")
+        self.start = start
+        self._pos = start + 1
+        self._scalar = first not in '"{['
+        self._in_string = first == '"'
+        self._depth = 1 if first in "{[" else 0
+
+    def shift(self, offset: int) -> None:
+        self.start -= offset
+        self._pos -= offset
+
+    def end(self, text: str) -> Optional[int]:
+        """The exclusive end index, or ``None`` while more text is needed."""
+        if self._scalar:
+            found = _JSON_SCALAR_END.search(text, self._pos)
+            if found is None:
+                self._pos = len(text)
+                return None
+            return found.start()
+        position = self._pos
+        while True:
+            pattern = _JSON_STRING_SPECIAL if self._in_string else _JSON_STRUCTURAL
+            found = pattern.search(text, position)
+            if found is None:
+                self._pos = len(text)
+                return None
+            char = found.group()
+            if char == "\\":
+                if found.end() >= len(text):
+                    # Resume on the backslash once the escaped character arrives.
+                    self._pos = found.start()
+                    return None
+                position = found.end() + 1
+                continue
+            position = found.end()
+            if char == '"':
+                self._in_string = not self._in_string
+                if not self._in_string and self._depth == 0:
+                    return position
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return position
+
+
+class _StreamedArray:
+    """One response array normalized element by element as it streams in.
+
+    State is per attempt: :meth:`begin` starts every attempt from nothing, and
+    only the attempt that returns is folded into the caller's accumulator.
+    ``seen`` is true only when the member arrived as an array; a repeated
+    member restarts it, as ``json.loads`` keeps the last occurrence.
+    """
+
+    __slots__ = ("key", "items", "count", "seen", "_normalize", "_overflow", "_scratch", "_meta")
+
+    def __init__(
+        self,
+        key: str,
+        normalize: Callable[[Any, _Accumulator], Any],
+        *,
+        endpoint: str,
+        overflow: str,
+    ) -> None:
+        self.key = key
+        self._normalize = normalize
+        self._overflow = overflow
+        self._meta: Optional[_ResponseMeta] = None
+        self.items: list[Any] = []
+        self.count = 0
+        self.seen = False
+        self._scratch = _Accumulator(endpoint)
+
+    def begin(self, meta: _ResponseMeta) -> None:
+        self._meta = meta
+        self.discard()
+
+    def discard(self) -> None:
+        self.restart()
+        self.seen = False
+
+    def restart(self) -> None:
+        self.items = []
+        self.count = 0
+        self.seen = True
+        self._scratch = _Accumulator(self._scratch.endpoint)
+
+    def feed(self, raw: Any) -> None:
+        self.count += 1
+        if self.count > MAX_PAGE_SIZE:
+            meta = self._meta
+            raise DevRevResourceLimitError(
+                self._overflow,
+                endpoint=self._scratch.endpoint,
+                status=None if meta is None else meta.status,
+                request_id=None if meta is None else meta.request_id,
+                attempts=0 if meta is None else meta.attempts,
+            )
+        item = self._normalize(raw, self._scratch)
+        if item is not None:
+            self.items.append(item)
+
+    def fold_into(self, accumulator: _Accumulator) -> None:
+        scratch = self._scratch
+        accumulator.dropped_out_of_scope += scratch.dropped_out_of_scope
+        accumulator.dropped_unidentified += scratch.dropped_unidentified
+        accumulator.dropped_undated += scratch.dropped_undated
+        accumulator.truncated = accumulator.truncated or scratch.truncated
+        accumulator.partial = accumulator.partial or scratch.partial
+        accumulator.extend_warnings(scratch.warnings)
+
+
+class _StreamingObjectParser:
+    """Incrementally parse one JSON object, streaming one array member.
+
+    Members are decoded whole as their last character arrives, except the
+    ``stream`` array: each of its elements goes to :meth:`_StreamedArray.feed`
+    and is dropped, so a page's raw bytes, decoded tree, and normalized models
+    never coexist. Consumed text is released on every :meth:`feed`. A body
+    that does not open as an object is buffered and decoded by :meth:`close`,
+    so a non-object still reaches the caller as a value. Whatever the chunk
+    boundaries, the result equals ``json.loads`` of the whole body.
+    """
+
+    def __init__(self, stream: Optional[_StreamedArray] = None) -> None:
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._text = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = ""
+        self._key_pending = False
+        self._scanner: Optional[_ValueScanner] = None
+        self._result: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        self._append(chunk, final=False)
+        self._advance()
+
+    def close(self) -> Any:
+        self._append(b"", final=True)
+        if self._state == "fallback":
+            try:
+                return json.loads(self._text)
+            except ValueError:
+                raise _StreamedJSONError("body is not valid JSON") from None
+        self._advance()
+        if self._state != "done" or self._text[self._pos :].strip(" \t\n\r"):
+            raise _StreamedJSONError("body is not valid JSON")
+        return self._result
+
+    def _append(self, chunk: bytes, *, final: bool) -> None:
+        try:
+            decoded = self._decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            raise _StreamedJSONError("body is not UTF-8") from None
+        if self._pos:
+            self._text = self._text[self._pos :]
+            if self._scanner is not None:
+                self._scanner.shift(self._pos)
+            self._pos = 0
+        self._text += decoded
+
+    def _advance(self) -> None:
+        # Each step consumes a prefix from `_pos` or returns for more text.
+        text = self._text
+        while self._state not in ("fallback", "done"):
+            if self._state in ("value", "element"):
+                if not self._take_value():
+                    return
+                continue
+            position = _JSON_WHITESPACE.match(text, self._pos).end()  # type: ignore[union-attr]
+            self._pos = position
+            if position >= len(text):
+                return
+            char = text[position]
+            state = self._state
+            if state == "start":
+                if char != "{":
+                    self._state = "fallback"
+                    return
+                self._step("first_key")
+            elif state in ("first_key", "key"):
+                if char == "}" and state == "first_key":
+                    self._step("done")
+                elif char == '"':
+                    self._state = "value"
+                    self._key_pending = True
+                else:
+                    raise _StreamedJSONError("expected an object key")
+            elif state == "colon":
+                if char != ":":
+                    raise _StreamedJSONError("expected ':'")
+                self._step("value_start")
+            elif state == "value_start":
+                stream = self._stream
+                if char == "[" and stream is not None and self._key == stream.key:
+                    stream.restart()
+                    self._result.pop(self._key, None)
+                    self._step("first_element")
+                else:
+                    self._state = "value"
+                    self._key_pending = False
+            elif state == "after_value":
+                if char == ",":
+                    self._step("key")
+                elif char == "}":
+                    self._step("done")
+                else:
+                    raise _StreamedJSONError("expected ',' or '}'")
+            elif state == "first_element":
+                if char == "]":
+                    self._step("after_value")
+                else:
+                    self._state = "element"
+            elif state == "next_element":
+                if char == "]":
+                    self._step("after_value")
+                elif char == ",":
+                    self._step("element_start")
+                else:
+                    raise _StreamedJSONError("expected ',' or ']'")
+            elif char == "]":
+                raise _StreamedJSONError("trailing comma in array")
+            else:
+                self._state = "element"
+
+    def _step(self, state: str) -> None:
+        self._pos += 1
+        self._state = state
+
+    def _take_value(self) -> bool:
+        text = self._text
+        if self._scanner is None:
+            self._scanner = _ValueScanner(text, self._pos)
+        end = self._scanner.end(text)
+        if end is None:
+            return False
+        start = self._scanner.start
+        self._scanner = None
+        try:
+            value, stop = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
+            raise _StreamedJSONError("body is not valid JSON") from None
+        if stop != end:
+            raise _StreamedJSONError("body is not valid JSON")
+        self._pos = end
+        if self._state == "element":
+            assert self._stream is not None
+            self._stream.feed(value)
+            self._state = "next_element"
+        elif self._key_pending:
+            if not isinstance(value, str):
+                raise _StreamedJSONError("expected an object key")
+            self._key = value
+            self._state = "colon"
+        else:
+            self._result[self._key] = value
+            if self._stream is not None and self._key == self._stream.key:
+                self._stream.discard()
+            self._state = "after_value"
+        return True
+
+
 # =====================================================================
 # Small pure helpers
 # =====================================================================
@@ -760,10 +1137,13 @@ class DevRevClient:
         timeout_s: float = DEVREV_READ_TIMEOUT_S,
         retry_after_cap_s: float = DEVREV_RETRY_AFTER_CAP_S,
         backoff_base_s: float = 0.5,
+        requests_per_second: Optional[float] = None,
+        timeline_concurrency: int = DEVREV_TIMELINE_CONCURRENCY,
         transport: Optional[httpx.AsyncBaseTransport] = None,
         sleep: Optional[Callable[[float], Any]] = None,
         jitter: Optional[Callable[[], float]] = None,
         clock: Optional[Callable[[], datetime]] = None,
+        monotonic: Optional[Callable[[], float]] = None,
     ) -> None:
         self._token = self._validated_token(token)
         self._api_version = self._validated_version(api_version)
@@ -792,6 +1172,17 @@ class DevRevClient:
         self._backoff_base_s = float(
             self._bounded_float("backoff_base_s", backoff_base_s, float("inf"))
         )
+        self._timeline_concurrency = self._bounded(
+            "timeline_concurrency", timeline_concurrency, 1, DEVREV_TIMELINE_CONCURRENCY
+        )
+        # None leaves requests unpaced; a 429 still pauses the whole client.
+        rate = (
+            None
+            if requests_per_second is None
+            else self._bounded_float(
+                "requests_per_second", requests_per_second, DEVREV_REQUESTS_PER_SECOND
+            )
+        )
         connect = self._bounded_float(
             "connect_timeout_s", connect_timeout_s, DEVREV_CONNECT_TIMEOUT_S
         )
@@ -807,6 +1198,7 @@ class DevRevClient:
             jitter or random.random  # noqa: S311 - backoff jitter, not crypto
         )
         self._clock: Callable[[], datetime] = clock or (lambda: datetime.now(timezone.utc))
+        self._pacer = _RequestPacer(rate, monotonic or time.monotonic)
         self._last_diagnostics: Optional[DevRevCallDiagnostics] = None
 
         self._client = httpx.AsyncClient(
@@ -835,6 +1227,7 @@ class DevRevClient:
         sleep: Optional[Callable[[float], Any]] = None,
         jitter: Optional[Callable[[], float]] = None,
         clock: Optional[Callable[[], datetime]] = None,
+        monotonic: Optional[Callable[[], float]] = None,
     ) -> "DevRevClient":
         """Build the adapter from the isolated console configuration."""
         return cls(
@@ -853,10 +1246,13 @@ class DevRevClient:
             max_response_bytes=settings.DEVREV_MAX_RESPONSE_BYTES,
             connect_timeout_s=settings.DEVREV_CONNECT_TIMEOUT_S,
             timeout_s=settings.DEVREV_TIMEOUT_S,
+            requests_per_second=settings.DEVREV_REQUESTS_PER_SECOND,
+            timeline_concurrency=settings.DEVREV_TIMELINE_CONCURRENCY,
             transport=transport,
             sleep=sleep,
             jitter=jitter,
             clock=clock,
+            monotonic=monotonic,
         )
 
     @staticmethod
@@ -1022,6 +1418,23 @@ class DevRevClient:
         """Diagnostics for the most recently completed logical call."""
         return self._last_diagnostics
 
+    @property
+    def scope_fingerprint(self) -> str:
+        """A digest of the configured part/visibility scope.
+
+        Anything cached from this client's reads is only valid under the same
+        scope; keying on this digest makes a narrowed allowlist a cache miss.
+        """
+        scope = json.dumps(
+            [
+                sorted(self._allowed_parts),
+                sorted(self._allowed_ticket_visibility),
+                sorted(item.value for item in self._allowed_timeline_visibility),
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(scope.encode("utf-8")).hexdigest()
+
     # ------------------------------------------------------------------
     # Public reads
     # ------------------------------------------------------------------
@@ -1046,16 +1459,67 @@ class DevRevClient:
         body = self._works_list_body(
             validated, cursor=self._validated_cursor(cursor), mode=mode, limit=effective_limit
         )
+        return await self._list_works_page(body, cursor=cursor, effective_limit=effective_limit)
+
+    async def list_tickets_modified_since(
+        self,
+        since: Optional[datetime],
+        *,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> CursorPage[DevRevTicketSummary]:
+        """List in-scope tickets modified after ``since``, oldest change first.
 
+        This is the incremental-sync read: ``modified_date`` becomes a range
+        filter and the page is sorted by ``modified_date`` ascending, so a
+        caller can persist the last row it stored as a watermark and resume
+        from it. ``since=None`` walks the whole scope in the same order. Scope
+        enforcement is exactly :meth:`list_tickets`'s.
+        """
+        self._require_open()
+        if since is not None and since.tzinfo is None:
+            raise DevRevRequestError("since must be timezone-aware")
+        effective_limit = self._effective_limit(limit)
+        body = self._works_list_body(
+            DevRevTicketFilters(),
+            cursor=self._validated_cursor(cursor),
+            mode=TIMELINE_LIST_MODE,
+            limit=effective_limit,
+        )
+        if since is not None:
+            body["modified_date"] = {
+                "type": "range",
+                "after": since.astimezone(timezone.utc).isoformat().replace("+00:00", "Z"),
+            }
+        body["sort_by"] = list(SYNC_SORT_BY)
+        return await self._list_works_page(body, cursor=cursor, effective_limit=effective_limit)
+
+    async def _list_works_page(
+        self,
+        body: dict[str, Any],
+        *,
+        cursor: Optional[str],
+        effective_limit: int,
+    ) -> CursorPage[DevRevTicketSummary]:
         accumulator = _Accumulator(ENDPOINT_WORKS_LIST)
         accumulator.cursor_digest = cursor_digest(cursor)
+        works = _StreamedArray(
+            "works",
+            lambda raw, scratch: self._normalize_summary(raw, scratch, detail=False),
+            endpoint=ENDPOINT_WORKS_LIST,
+            overflow=f"works.list returned more than the canonical maximum of {MAX_PAGE_SIZE} items",
+        )
         payload, meta = await self._request_json(
-            "POST", _PATH_WORKS_LIST, endpoint=ENDPOINT_WORKS_LIST, json_body=body, attempts_into=accumulator
+            "POST",
+            _PATH_WORKS_LIST,
+            endpoint=ENDPOINT_WORKS_LIST,
+            json_body=body,
+            attempts_into=accumulator,
+            stream=works,
         )
         accumulator.pages = 1
 
-        works = payload.get("works")
-        if not isinstance(works, list):
+        if not works.seen:
             raise DevRevProtocolError(
                 "works.list response did not carry a works array",
                 endpoint=ENDPOINT_WORKS_LIST,
@@ -1063,23 +1527,11 @@ class DevRevClient:
                 request_id=meta.request_id,
                 attempts=meta.attempts,
             )
-        if len(works) > MAX_PAGE_SIZE:
-            raise DevRevResourceLimitError(
-                f"works.list returned more than the canonical maximum of {MAX_PAGE_SIZE} items",
-                endpoint=ENDPOINT_WORKS_LIST,
-                status=meta.status,
-                request_id=meta.request_id,
-                attempts=meta.attempts,
-            )
-        if len(works) > effective_limit:
+        if works.count > effective_limit:
             accumulator.truncated = True
             accumulator.warn(WARNING_REMOTE_OVER_LIMIT)
-
-        items: list[DevRevTicketSummary] = []
-        for raw in works:
-            summary = self._normalize_summary(raw, accumulator, detail=False)
-            if summary is not None:
-                items.append(summary)
+        works.fold_into(accumulator)
+        items: list[DevRevTicketSummary] = works.items
         accumulator.items = len(items)
 
         page: CursorPage[DevRevTicketSummary] = CursorPage[DevRevTicketSummary](
@@ -1233,6 +1685,75 @@ class DevRevClient:
             diagnostics=diagnostics,
         )
 
+    async def load_timelines(
+        self,
+        work_ids: Iterable[str],
+        *,
+        concurrency: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        strict: bool = False,
+        sort: bool = False,
+    ) -> AsyncIterator[DevRevTimelineOutcome]:
+        """Hydrate many timelines concurrently, yielding each as it finishes.
+
+        Each ticket is one :meth:`load_timeline` over the shared HTTP client,
+        with its own diagnostics; at most ``concurrency`` run at once (default:
+        the configured ``timeline_concurrency``), and every request draws on
+        the client's one rate-limit budget. Duplicate ids are loaded once.
+        Results arrive in completion order, not input order. A
+        :class:`DevRevError` on one ticket becomes that ticket's outcome; any
+        other exception ends the stream. Every identifier is validated before
+        the first request is sent.
+        """
+        self._require_open()
+        lanes = (
+            self._timeline_concurrency
+            if concurrency is None
+            else self._bounded("concurrency", concurrency, 1, DEVREV_TIMELINE_CONCURRENCY)
+        )
+        pending = list(dict.fromkeys(work_ids))
+        for work_id in pending:
+            self._validated_work_identifier(work_id)
+        if not pending:
+            return
+
+        queue = iter(pending)
+        finished: asyncio.Queue[Union[DevRevTimelineOutcome, Exception]] = asyncio.Queue()
+
+        async def _lane() -> None:
+            try:
+                # One shared iterator: each lane pulls the next unclaimed id.
+                for work_id in queue:
+                    try:
+                        hydration = await self.load_timeline(
+                            work_id,
+                            max_pages=max_pages,
+                            max_entries=max_entries,
+                            strict=strict,
+                            sort=sort,
+                        )
+                    except DevRevError as exc:
+                        finished.put_nowait(DevRevTimelineOutcome(work_id=work_id, error=exc))
+                    else:
+                        finished.put_nowait(
+                            DevRevTimelineOutcome(work_id=work_id, hydration=hydration)
+                        )
+            except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+                finished.put_nowait(exc)
+
+        tasks = [asyncio.ensure_future(_lane()) for _ in range(min(lanes, len(pending)))]
+        try:
+            for _ in pending:
+                outcome = await finished.get()
+                if isinstance(outcome, Exception):
+                    raise outcome
+                yield outcome
+        finally:
+            # An abandoned or failed stream stops the lanes still in flight.
+            for task in tasks:
+                task.cancel()
+
     # ------------------------------------------------------------------
     # Pagination
     # ------------------------------------------------------------------
@@ -1334,17 +1855,26 @@ class DevRevClient:
         if validated_cursor is not None:
             params["cursor"] = validated_cursor
 
+        streamed = _StreamedArray(
+            "timeline_entries",
+            lambda raw, scratch: self._normalize_timeline_entry(raw, identifier, scratch),
+            endpoint=ENDPOINT_TIMELINE_LIST,
+            overflow=(
+                f"timeline-entries.list returned more than the canonical maximum of "
+                f"{MAX_PAGE_SIZE} entries"
+            ),
+        )
         payload, meta = await self._request_json(
             "GET",
             _PATH_TIMELINE_LIST,
             endpoint=ENDPOINT_TIMELINE_LIST,
             params=params,
             attempts_into=accumulator,
+            stream=streamed,
         )
         accumulator.pages += 1
 
-        raw_entries = payload.get("timeline_entries")
-        if not isinstance(raw_entries, list):
+        if not streamed.seen:
             raise DevRevProtocolError(
                 "timeline-entries.list response did not carry a timeline_entries array",
                 endpoint=ENDPOINT_TIMELINE_LIST,
@@ -1352,24 +1882,11 @@ class DevRevClient:
                 request_id=meta.request_id,
                 attempts=meta.attempts,
             )
-        if len(raw_entries) > MAX_PAGE_SIZE:
-            raise DevRevResourceLimitError(
-                f"timeline-entries.list returned more than the canonical maximum of "
-                f"{MAX_PAGE_SIZE} entries",
-                endpoint=ENDPOINT_TIMELINE_LIST,
-                status=meta.status,
-                request_id=meta.request_id,
-                attempts=meta.attempts,
-            )
-        if len(raw_entries) > effective_limit:
+        if streamed.count > effective_limit:
             accumulator.truncated = True
             accumulator.warn(WARNING_REMOTE_OVER_LIMIT)
-
-        entries: list[DevRevTimelineEntry] = []
-        for raw in raw_entries:
-            entry = self._normalize_timeline_entry(raw, identifier, accumulator)
-            if entry is not None:
-                entries.append(entry)
+        streamed.fold_into(accumulator)
+        entries: list[DevRevTimelineEntry] = streamed.items
 
         return TimelinePage(
             items=entries,
@@ -1839,15 +2356,21 @@ class DevRevClient:
         params: Optional[Mapping[str, Any]] = None,
         idempotent: bool = True,
         attempts_into: Optional[_Accumulator] = None,
+        stream: Optional[_StreamedArray] = None,
     ) -> tuple[dict[str, Any], _ResponseMeta]:
         """Issue one logical request with bounded retry and a bounded body.
 
         Only 429, 500, 503, and transport failures are retried, and only when
         the operation is idempotent. Every MVP endpoint is a read; the flag
         exists so a future non-read cannot inherit read semantics by accident.
+        With ``stream``, that array member is normalized while the body is
+        read and left out of the returned payload.
         """
         last: Optional[DevRevError] = None
         for attempt in range(1, self._max_retries + 1):
+            # A retry has already waited out its own delay; only a first attempt
+            # also waits for a pause another request's 429 put on the client.
+            await self._pacer.acquire(self._sleep, honor_pause=attempt == 1)
             try:
                 payload, meta = await self._send_once(
                     method,
@@ -1856,6 +2379,7 @@ class DevRevClient:
                     json_body=json_body,
                     params=params,
                     attempt=attempt,
+                    stream=stream,
                 )
             except asyncio.CancelledError:
                 # Cancellation is a control-flow signal, never a DevRev error.
@@ -1877,7 +2401,10 @@ class DevRevClient:
                         }
                     },
                 )
-                await self._sleep(delay)
+                if isinstance(exc, DevRevRateLimitError):
+                    await self._pacer.hold(self._sleep, delay)
+                else:
+                    await self._sleep(delay)
                 continue
 
             if attempts_into is not None:
@@ -1897,7 +2424,9 @@ class DevRevClient:
         json_body: Optional[Mapping[str, Any]],
         params: Optional[Mapping[str, Any]],
         attempt: int,
+        stream: Optional[_StreamedArray] = None,
     ) -> tuple[dict[str, Any], _ResponseMeta]:
+        parser = _StreamingObjectParser(stream)
         try:
             async with self._client.stream(
                 method, path, json=json_body, params=params
@@ -1933,7 +2462,10 @@ class DevRevClient:
                         attempts=attempt,
                     )
 
-                buffer = await self._read_capped(response, meta)
+                if stream is not None:
+                    stream.begin(meta)
+                await self._read_capped(response, meta, parser)
+                payload = parser.close()
         except asyncio.CancelledError:
             raise
         except httpx.TransportError:
@@ -1950,10 +2482,7 @@ class DevRevClient:
                 endpoint=endpoint,
                 attempts=attempt,
             ) from None
-
-        try:
-            payload = json.loads(buffer)
-        except ValueError as exc:
+        except _StreamedJSONError as exc:
             raise DevRevProtocolError(
                 f"{endpoint}: response body was not valid JSON",
                 endpoint=endpoint,
@@ -1961,6 +2490,7 @@ class DevRevClient:
                 request_id=meta.request_id,
                 attempts=attempt,
             ) from exc
+
         if not isinstance(payload, dict):
             raise DevRevProtocolError(
                 f"{endpoint}: response body was not a JSON object",
@@ -1971,13 +2501,19 @@ class DevRevClient:
             )
         return payload, meta
 
-    async def _read_capped(self, response: httpx.Response, meta: _ResponseMeta) -> bytes:
-        """Stream a success body, refusing anything past the canonical cap.
+    async def _read_capped(
+        self,
+        response: httpx.Response,
+        meta: _ResponseMeta,
+        parser: _StreamingObjectParser,
+    ) -> None:
+        """Stream a success body into ``parser``, refusing anything past the cap.
 
         A declared ``Content-Length`` over the cap is rejected before the first
         byte is read. Otherwise decoded bytes are tallied as they arrive, so a
         chunked body or a compressed body that expands past the cap aborts
-        immediately. JSON is parsed only from what this returns.
+        before the chunk that crosses it is parsed. The body is never held
+        whole: each chunk is parsed, and released, as it arrives.
         """
         cap = self._max_response_bytes
         declared = response.headers.get("content-length")
@@ -1997,13 +2533,12 @@ class DevRevClient:
                 # below is the real guard.
                 pass
 
-        buffer = bytearray()
+        received = 0
         async for chunk in response.aiter_bytes():
-            buffer.extend(chunk)
-            if len(buffer) > cap:
-                # Drop the buffer before raising so an oversized body is never
-                # retained, let alone logged.
-                buffer.clear()
+            received += len(chunk)
+            if received > cap:
+                # The crossing chunk is never parsed, so an oversized body is
+                # never retained, let alone logged.
                 raise DevRevResourceLimitError(
                     f"{meta.endpoint}: response body exceeds the {cap}-byte cap",
                     endpoint=meta.endpoint,
@@ -2011,7 +2546,7 @@ class DevRevClient:
                     request_id=meta.request_id,
                     attempts=meta.attempts,
                 )
-        return bytes(buffer)
+            parser.feed(chunk)
 
     @staticmethod
     async def _read_bounded(response: httpx.Response, cap: int) -> tuple[int, bool]:
@@ -7,13 +7,19 @@ reaches a terminal state (``succeeded`` / ``failed`` / ``canceled``). This clien
 encapsulates that contract with:
 
   * submit + poll with exponential backoff and jitter,
-  * a concurrency semaphore (the ForusBots service has a small global
-    ``maxConcurrency``, so we deliberately stay below it),
+  * an adaptive (AIMD) concurrency limit: the ForusBots service has a small
+    global ``maxConcurrency``, so the per-instance in-flight window grows
+    additively while submits come back un-queued and fast, and halves on a
+    ``429``, a ``queuePosition`` above target or a slow submit,
   * in-flight de-duplication so two callers asking for the same scrape share one
     job instead of enqueuing duplicates, plus a durable scoped idempotency key
     understood by the upstream service and a short TTL result cache,
   * bounded per-HTTP-call retry: scoped POSTs safely reuse their durable key,
-    while legacy unscoped POSTs keep the conservative no-resubmit policy.
+    while legacy unscoped POSTs keep the conservative no-resubmit policy,
+  * an optional completion-callback mode: the submit registers a callback URL,
+    the durable receipt is checkpointed and the caller is released with
+    ``ForusBotsDeferred`` instead of polling; a later attempt resumes the job
+    from the receipt via ``resume_job`` (polling stays the fallback).
 
 See ticket-handler-planning/stage-1-forusbots-client.md for the design notes.
 """
@@ -26,8 +32,9 @@ import json
 import logging
 import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, Dict, List, Optional, cast
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, cast
 from urllib.parse import quote, urlsplit
 
 import httpx
@@ -180,6 +187,26 @@ class ForusBotsCheckpointFailed(ForusBotsError):
         )
 
 
+class ForusBotsDeferred(ForusBotsError):
+    """The job was submitted in callback mode and its receipt checkpointed.
+
+    Not a failure: the caller releases its execution slot and resumes the
+    confirmed job later (callback or reconciler) through ``resume_job``.
+    """
+
+    code = "FORUSBOTS_DEFERRED"
+
+    def __init__(self, job_id: str, operation: str) -> None:
+        self.job_id = job_id
+        self.operation = operation if operation in {
+            "participant", "plan"
+        } else "unknown"
+        super().__init__(
+            "ForUsBots job deferred to completion callback "
+            f"({self.operation})"
+        )
+
+
 SubmittedJobObserver = Callable[[str, str], Awaitable[None]]
 
 
@@ -212,6 +239,127 @@ class _InflightScrape:
     waiters: int = 0
 
 
+class _AdaptiveSubmitLimiter:
+    """Semaphore whose window follows upstream congestion (AIMD).
+
+    Drop-in for the former fixed ``asyncio.Semaphore``: ``acquire``/``release``
+    and ``async with`` keep FIFO fairness. The window is a float in
+    ``[minimum, maximum]``; the integer part is the number of permits.
+
+    * additive increase: every un-congested submit adds ``1 / window``, i.e.
+      roughly one permit per window of healthy submits;
+    * multiplicative decrease: a ``429``, a ``queuePosition`` above target or
+      a submit slower than the latency target halves the window. Only signals
+      from requests started *after* the previous decrease count, so one burst
+      of congested responses shrinks the window once, not once per response.
+
+    Shrinking never revokes held permits; new acquires simply wait until the
+    in-flight count drops below the new limit.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        maximum: int,
+        minimum: int = 1,
+        target_queue_position: int = 1,
+        latency_target_s: float = 5.0,
+    ) -> None:
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._window = float(min(max(initial, self._minimum), self._maximum))
+        self._target_queue_position = max(0, target_queue_position)
+        self._latency_target_s = latency_target_s
+        self._inflight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease_at = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def locked(self) -> bool:
+        return self._inflight >= self.limit
+
+    async def acquire(self) -> bool:
+        if not self._waiters and self._inflight < self.limit:
+            self._inflight += 1
+            return True
+        waiter: "asyncio.Future[None]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted and cancelled in the same tick: hand it on.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return True
+
+    def release(self) -> None:
+        self._inflight -= 1
+        self._wake()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def _wake(self) -> None:
+        while self._waiters and self._inflight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._inflight += 1
+                waiter.set_result(None)
+
+    def observe_submit(
+        self,
+        *,
+        started_at: float,
+        latency_s: float,
+        queue_position: Optional[int],
+    ) -> Optional[str]:
+        """Feed one accepted submit; returns the adjustment reason, if any."""
+        if started_at < self._last_decrease_at:
+            return None
+        if (
+            isinstance(queue_position, int)
+            and not isinstance(queue_position, bool)
+            and queue_position > self._target_queue_position
+        ):
+            return self._decrease(started_at, "queue_backlog")
+        if latency_s > self._latency_target_s:
+            return self._decrease(started_at, "slow_submit")
+        previous = self.limit
+        self._window = min(
+            float(self._maximum), self._window + 1.0 / self._window
+        )
+        if self.limit == previous:
+            return None
+        self._wake()
+        return "increase"
+
+    def observe_rate_limited(self, *, started_at: float) -> Optional[str]:
+        return self._decrease(started_at, "rate_limited")
+
+    def _decrease(self, started_at: float, reason: str) -> Optional[str]:
+        if started_at < self._last_decrease_at:
+            return None
+        self._last_decrease_at = time.monotonic()
+        self._window = max(float(self._minimum), self._window / 2.0)
+        return reason
+
+
 # Transport errors proven safe to retry before the request reaches the wire.
 # Read/write timeouts remain excluded only for legacy unscoped POSTs.
 _PRESEND_SAFE = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
@@ -262,6 +410,34 @@ def validate_forusbots_base_url(base_url: str) -> str:
     return normalized
 
 
+def validate_forusbots_callback_url(callback_url: str) -> str:
+    """Return a reviewed HTTPS completion-callback URL.
+
+    The URL travels to ForUsBots inside the submit body and carries only our
+    opaque job handle plus its signature. Plaintext, credentials and
+    fragments are rejected; error text never echoes the value.
+    """
+    try:
+        parsed = urlsplit(callback_url)
+        _ = parsed.port
+    except (TypeError, ValueError):
+        raise ForusBotsError(
+            "ForusBots callback URL debe ser HTTPS canónica"
+        ) from None
+    if (
+        not isinstance(callback_url, str)
+        or callback_url != callback_url.strip()
+        or len(callback_url) > 2048
+        or parsed.scheme != "https"
+        or not parsed.hostname
+        or parsed.username is not None
+        or parsed.password is not None
+        or parsed.fragment
+    ):
+        raise ForusBotsError("ForusBots callback URL debe ser HTTPS canónica")
+    return callback_url
+
+
 # ============================================================================
 # Client
 # ============================================================================
@@ -281,6 +457,9 @@ class ForusBotsClient:
         http_read_timeout_s: float = 15.0,
         http_retries: int = 3,
         max_inflight: int = 2,
+        max_inflight_ceiling: Optional[int] = None,
+        target_queue_position: int = 1,
+        submit_latency_target_s: float = 5.0,
         result_cache_ttl_s: int = 180,
         circuit_failure_threshold: int = 3,
         circuit_reset_s: float = 30.0,
@@ -305,7 +484,14 @@ class ForusBotsClient:
             # para no depender del default de httpx.
             follow_redirects=False,
         )
-        self._semaphore = asyncio.Semaphore(max_inflight)
+        # ``max_inflight`` is the starting window; without a ceiling the
+        # window can shrink under congestion but never grows past it.
+        self._semaphore = _AdaptiveSubmitLimiter(
+            max_inflight,
+            maximum=max(max_inflight, max_inflight_ceiling or max_inflight),
+            target_queue_position=target_queue_position,
+            latency_target_s=submit_latency_target_s,
+        )
         self._inflight: Dict[str, _InflightScrape] = {}
         self._result_cache: TTLCache = TTLCache(maxsize=256, ttl=result_cache_ttl_s)
         self._circuit_failure_threshold = max(1, circuit_failure_threshold)
@@ -327,6 +513,9 @@ class ForusBotsClient:
             max_wait_s=settings.FORUSBOTS_MAX_WAIT_S,
             http_read_timeout_s=settings.FORUSBOTS_HTTP_READ_TIMEOUT_S,
             max_inflight=settings.FORUSBOTS_MAX_INFLIGHT,
+            max_inflight_ceiling=settings.FORUSBOTS_MAX_INFLIGHT_CEILING,
+            target_queue_position=settings.FORUSBOTS_TARGET_QUEUE_POSITION,
+            submit_latency_target_s=settings.FORUSBOTS_SUBMIT_LATENCY_TARGET_S,
             result_cache_ttl_s=settings.FORUSBOTS_RESULT_CACHE_TTL_S,
             client=client,
         )
@@ -357,6 +546,7 @@ class ForusBotsClient:
         return_: str = "data",
         dedupe_scope: Optional[str] = None,
         on_submitted: Optional[SubmittedJobObserver] = None,
+        callback_url: Optional[str] = None,
     ) -> ScrapeResult:
         payload: Dict[str, Any] = {
             "participantId": participant_id,
@@ -376,6 +566,7 @@ class ForusBotsClient:
             label="participant",
             upstream_idempotency_key=upstream_idempotency_key,
             on_submitted=on_submitted,
+            callback_url=callback_url,
         )
 
     async def scrape_plan(
@@ -387,6 +578,7 @@ class ForusBotsClient:
         return_: str = "data",
         dedupe_scope: Optional[str] = None,
         on_submitted: Optional[SubmittedJobObserver] = None,
+        callback_url: Optional[str] = None,
     ) -> ScrapeResult:
         payload: Dict[str, Any] = {
             "planId": plan_id,
@@ -405,6 +597,7 @@ class ForusBotsClient:
             idem, "/forusbot/scrape-plan", payload, label="plan",
             upstream_idempotency_key=upstream_idempotency_key,
             on_submitted=on_submitted,
+            callback_url=callback_url,
         )
 
     async def resume_job(self, job_id: str, *, operation: str) -> ScrapeResult:
@@ -493,7 +686,19 @@ class ForusBotsClient:
         label: str,
         upstream_idempotency_key: Optional[str] = None,
         on_submitted: Optional[SubmittedJobObserver] = None,
+        callback_url: Optional[str] = None,
     ) -> ScrapeResult:
+        if callback_url is not None:
+            # Deferring is only safe when the confirmed job ID survives this
+            # process: without a durable receipt nobody could resume it.
+            if on_submitted is None:
+                raise ForusBotsError(
+                    "ForUsBots callback mode requires a durable submit observer"
+                )
+            payload = {
+                **payload,
+                "callbackUrl": validate_forusbots_callback_url(callback_url),
+            }
         # A durable observer is fenced to one worker/lease. Never coalesce it
         # with another waiter: a new lease must get its own 202 callback even
         # when both POSTs resolve to the same upstream job through the stable
@@ -505,6 +710,7 @@ class ForusBotsClient:
                 label=label,
                 upstream_idempotency_key=upstream_idempotency_key,
                 on_submitted=on_submitted,
+                defer_after_submit=callback_url is not None,
             )
 
         # El cliente vive como singleton de proceso. Sin un scope explícito no
@@ -583,6 +789,7 @@ class ForusBotsClient:
         label: str,
         upstream_idempotency_key: Optional[str],
         on_submitted: SubmittedJobObserver,
+        defer_after_submit: bool = False,
     ) -> ScrapeResult:
         """Run one lease-owned submit without sharing its durable observer."""
         submit_boundary = _SubmitBoundary()
@@ -593,6 +800,7 @@ class ForusBotsClient:
             submit_boundary=submit_boundary,
             upstream_idempotency_key=upstream_idempotency_key,
             on_submitted=on_submitted,
+            defer_after_submit=defer_after_submit,
         ))
 
         def _retrieve_outcome(done: "asyncio.Task[ScrapeResult]") -> None:
@@ -626,6 +834,14 @@ class ForusBotsClient:
     def _emit_circuit_state(self, state: str) -> None:
         self._emit_metric("ticket_forusbots_circuit_count", state=state)
 
+    def _record_concurrency_adjustment(self, reason: Optional[str]) -> None:
+        if reason is None:
+            return
+        self._emit_metric("ticket_forusbots_concurrency_count", reason=reason)
+        self._emit_metric(
+            "ticket_forusbots_concurrency_limit", self._semaphore.limit
+        )
+
     def _before_circuit_request(self) -> None:
         if self._circuit_state == "closed":
             return
@@ -678,6 +894,7 @@ class ForusBotsClient:
         submit_boundary: Optional[_SubmitBoundary] = None,
         upstream_idempotency_key: Optional[str] = None,
         on_submitted: Optional[SubmittedJobObserver] = None,
+        defer_after_submit: bool = False,
     ) -> ScrapeResult:
         try:
             async with self._semaphore:
@@ -685,6 +902,7 @@ class ForusBotsClient:
                 # circuit. Re-check at the actual side-effect boundary so an
                 # admitted backlog cannot continue posting into an outage.
                 self._before_circuit_request()
+                submit_started = time.monotonic()
                 try:
                     job_id, queue_position, estimate = await self._submit(
                         path,
@@ -703,6 +921,13 @@ class ForusBotsClient:
                         "ticket_forusbots_count", step=label, code="failure"
                     )
                     raise
+                self._record_concurrency_adjustment(
+                    self._semaphore.observe_submit(
+                        started_at=submit_started,
+                        latency_s=time.monotonic() - submit_started,
+                        queue_position=queue_position,
+                    )
+                )
                 if on_submitted is not None:
                     observer = on_submitted
 
@@ -727,6 +952,13 @@ class ForusBotsClient:
                 self._emit_metric(
                     "ticket_forusbots_count", step=label, code="submit_success"
                 )
+                if defer_after_submit:
+                    # The receipt is durable: release the slot and let the
+                    # completion callback (or the reconciler) resume it.
+                    self._emit_metric(
+                        "ticket_forusbots_count", step=label, code="deferred"
+                    )
+                    raise ForusBotsDeferred(job_id, label)
                 try:
                     result = await self._poll(
                         job_id, queue_position, estimate, label=label
@@ -759,10 +991,12 @@ class ForusBotsClient:
         except asyncio.CancelledError:
             self._record_circuit_cancelled()
             raise
-        except (ForusBotsJobFailed, ForusBotsIdempotencyConflict):
-            # A terminal business/data outcome or durable-key conflict proves
-            # dependency availability. Neither should poison the global
-            # availability circuit for unrelated tickets.
+        except (
+            ForusBotsJobFailed, ForusBotsIdempotencyConflict, ForusBotsDeferred,
+        ):
+            # A terminal business/data outcome, a durable-key conflict or an
+            # accepted deferred submit proves dependency availability. None
+            # should poison the global availability circuit.
             self._record_circuit_success()
             raise
         except ForusBotsCheckpointFailed:
@@ -929,6 +1163,7 @@ class ForusBotsClient:
                 # treated as an ambiguous submit and the task is left running.
                 if not idempotent and submit_boundary is not None:
                     submit_boundary.crossed = True
+                attempt_started = time.monotonic()
                 resp = await self._client.request(
                     method, url, headers=request_headers, json=json
                 )
@@ -993,6 +1228,11 @@ class ForusBotsClient:
                     method, operation, resp.status_code
                 )
             elif resp.status_code == 429:
+                self._record_concurrency_adjustment(
+                    self._semaphore.observe_rate_limited(
+                        started_at=attempt_started
+                    )
+                )
                 if not idempotent and not keyed_submit:
                     raise ForusBotsAmbiguousSubmit(
                         method, operation, resp.status_code
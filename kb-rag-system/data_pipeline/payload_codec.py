@@ -0,0 +1,186 @@
+"""
+Codec opcional para la mitad PAYLOAD de los ticket jobs.
+
+Con el codec activo, los campos de un documento de payload (o de un
+checkpoint por inquiry) se serializan como JSON canónico comprimido en UN
+campo ``bytes``:
+
+    {"job_id": ..., "expires_at": <datetime>, "codec": "zlib-json-v1",
+     "blob": b"..."}
+
+Los campos de ``_PLAIN_FIELDS`` quedan planos: ``expires_at`` alimenta el TTL
+nativo de Firestore y ``job_id``/``index`` siguen siendo legibles sin
+decodificar. ``codec`` es el tag de versión; un documento sin tag es un map
+plano y se lee tal cual, así que activar/desactivar el codec no requiere
+migración.
+
+El documento lógico se valida con ``validate_durable_document`` ANTES de
+comprimirlo: un payload que no sería un map Firestore válido se rechaza igual
+que sin codec, y desactivar el codec nunca deja datos ilegibles.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import zlib
+from datetime import datetime
+from typing import Any, Optional
+
+from api import metrics as ticket_metrics
+from data_pipeline.durable_document import validate_durable_document
+
+try:
+    import zstandard
+except ImportError:  # dependencia opcional: sólo requerida con codec zstd
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+SUPPORTED_CODECS = frozenset({CODEC_NONE, CODEC_ZLIB, CODEC_ZSTD})
+
+CODEC_FIELD = "codec"
+BLOB_FIELD = "blob"
+_VERSION_TAGS = {
+    CODEC_ZLIB: "zlib-json-v1",
+    CODEC_ZSTD: "zstd-json-v1",
+}
+_PLAIN_FIELDS = frozenset({"job_id", "index", "expires_at"})
+
+# Claves reservadas por Firestore (``__x__``): validate_durable_document las
+# rechaza en el documento lógico, así que no colisionan con datos reales.
+_DATETIME_TAG = "__datetime__"
+_BYTES_TAG = "__bytes__"
+
+# Payloads chicos no compensan: la cabecera zlib y la pérdida de legibilidad
+# cuestan más que lo ahorrado.
+DEFAULT_MIN_SIZE_BYTES = 1024
+
+
+class PayloadCodecError(ValueError):
+    """Documento codificado ilegible (tag desconocido o blob corrupto)."""
+
+
+def codec_available(codec: str) -> bool:
+    if codec == CODEC_ZSTD:
+        return zstandard is not None
+    return codec in SUPPORTED_CODECS
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, bytes):
+        return {_BYTES_TAG: base64.b64encode(value).decode("ascii")}
+    raise TypeError("tipo no serializable en payload durable")
+
+
+def _json_object_hook(value: dict[str, Any]) -> Any:
+    if len(value) == 1:
+        if _DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        if _BYTES_TAG in value:
+            return base64.b64decode(value[_BYTES_TAG])
+    return value
+
+
+def _compress(codec: str, raw: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise PayloadCodecError("zstandard no está instalado")
+        return bytes(zstandard.ZstdCompressor(level=3).compress(raw))
+    return zlib.compress(raw, 6)
+
+
+def _decompress(tag: str, blob: bytes) -> bytes:
+    try:
+        if tag == _VERSION_TAGS[CODEC_ZLIB]:
+            return zlib.decompress(blob)
+        if tag == _VERSION_TAGS[CODEC_ZSTD] and zstandard is not None:
+            return bytes(zstandard.ZstdDecompressor().decompress(blob))
+    except Exception as exc:  # noqa: BLE001 - zlib.error / ZstdError
+        raise PayloadCodecError("payload comprimido corrupto") from exc
+    raise PayloadCodecError("codec de payload desconocido")
+
+
+def _emit_size(codec: str, raw_bytes: int, stored_bytes: int) -> None:
+    try:
+        ticket_metrics.emit(
+            "ticket_payload_raw_bytes", raw_bytes, codec=codec,
+        )
+        ticket_metrics.emit(
+            "ticket_payload_stored_bytes", stored_bytes, codec=codec,
+        )
+    except (TypeError, ValueError):
+        logger.warning("payload codec metric rejected by telemetry schema")
+
+
+def encode_document(
+    document: dict[str, Any],
+    codec: str,
+    *,
+    min_size_bytes: int = DEFAULT_MIN_SIZE_BYTES,
+) -> dict[str, Any]:
+    """Versión persistible de ``document`` según ``codec``.
+
+    Devuelve el map plano si el codec es ``none``, si el documento es más
+    chico que ``min_size_bytes`` o si la compresión no reduce su tamaño.
+    """
+    if codec == CODEC_NONE:
+        return document
+    if codec not in _VERSION_TAGS:
+        raise PayloadCodecError("codec de payload desconocido")
+    stats = validate_durable_document(document)
+    if stats.estimated_size_bytes < min_size_bytes:
+        return document
+    body = {k: v for k, v in document.items() if k not in _PLAIN_FIELDS}
+    try:
+        raw = json.dumps(
+            body,
+            default=_json_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            sort_keys=True,
+            allow_nan=False,
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        # Tipos Firestore sin representación JSON (GeoPoint, referencias):
+        # el map plano ya validado sigue siendo correcto.
+        return document
+    encoded = {k: v for k, v in document.items() if k in _PLAIN_FIELDS}
+    encoded[CODEC_FIELD] = _VERSION_TAGS[codec]
+    encoded[BLOB_FIELD] = _compress(codec, raw)
+    stored = validate_durable_document(encoded)
+    if stored.estimated_size_bytes >= stats.estimated_size_bytes:
+        return document
+    _emit_size(codec, stats.estimated_size_bytes, stored.estimated_size_bytes)
+    return encoded
+
+
+def decode_document(document: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Map lógico de un documento leído; los maps planos pasan intactos."""
+    if document is None or CODEC_FIELD not in document:
+        return document
+    blob = document.get(BLOB_FIELD)
+    tag = document.get(CODEC_FIELD)
+    if not isinstance(blob, (bytes, bytearray)) or not isinstance(tag, str):
+        raise PayloadCodecError("payload comprimido malformado")
+    try:
+        body = json.loads(
+            _decompress(tag, bytes(blob)).decode("utf-8"),
+            object_hook=_json_object_hook,
+        )
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise PayloadCodecError("payload comprimido corrupto") from exc
+    if not isinstance(body, dict):
+        raise PayloadCodecError("payload comprimido malformado")
+    decoded = {
+        k: v for k, v in document.items()
+        if k not in (CODEC_FIELD, BLOB_FIELD)
+    }
+    decoded.update(body)
+    return decoded
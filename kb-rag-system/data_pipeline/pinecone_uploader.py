@@ -14,7 +14,8 @@ import logging
 import inspect
 import secrets
 import threading
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
 
 import httpx
@@ -22,11 +23,16 @@ from pinecone import Pinecone, PineconeConnectionError
 from tqdm import tqdm
 from urllib3 import exceptions as urllib3_exceptions
 
+from data_pipeline.chunking import CHUNK_HASH_FIELD, ChunkDiff, plan_chunk_diff
 from data_pipeline.retrieval_privacy import sanitize_retrieval_query
 from api import metrics as ticket_metrics
 
 logger = logging.getLogger(__name__)
 
+# Límites del data plane: fetch acepta 100 IDs por llamada, delete 1000.
+_FETCH_BATCH_SIZE = 100
+_DELETE_BATCH_SIZE = 1000
+
 # The repository pins Pinecone 9.1.0, whose public ``Index`` constructor does
 # not expose ``RetryConfig`` for data-plane calls.  Its hidden default retries
 # 408 as well as 429/5xx and would multiply this module's reviewed three-attempt
@@ -220,6 +226,59 @@ class _CircuitBreaker:
             self._opened_at = time.monotonic()
             return None if was_open else "open"
 
+
+class _UploadWindow:
+    """Ventana AIMD de intentos de upsert en vuelo, compartida por los workers.
+
+    Un 429 reduce el límite a la mitad y pausa todo intento nuevo ``delay``
+    segundos; ``limit`` éxitos seguidos lo agrandan en uno hasta ``maximum``.
+    Así el upload converge al ritmo que Pinecone acepta en vez de reintentar
+    cada batch por su cuenta contra el mismo rate limit.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maximum = maximum
+        self.limit = maximum
+        self._clock = clock
+        self._in_flight = 0
+        self._streak = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                wait = self._paused_until - self._clock()
+                if wait > 0:
+                    self._cond.wait(wait)
+                elif self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                else:
+                    self._cond.wait()
+
+    def release(self, succeeded: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if succeeded:
+                self._streak += 1
+                if self._streak >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._streak = 0
+            self._cond.notify_all()
+
+    def throttle(self, delay: float) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self._streak = 0
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+            self._cond.notify_all()
+
+
 class PineconeCircuitOpen(RuntimeError):
     """El circuit breaker de Pinecone está abierto: falla rápido."""
 
@@ -278,7 +337,8 @@ class PineconeUploader:
         namespace: Optional[str] = None,
         batch_size: int = 96,
         max_retries: int = 3,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        max_in_flight: int = 4
     ):
         """
         Inicializa el uploader.
@@ -290,6 +350,8 @@ class PineconeUploader:
             batch_size: Tamaño de batch para uploads (default: 96)
             max_retries: Número máximo de reintentos (default: 3)
             retry_delay: Delay entre reintentos en segundos (default: 2)
+            max_in_flight: Batches de upsert concurrentes como máximo
+                (default: 4; 1 = secuencial)
         """
         self.api_key = api_key or os.getenv("PINECONE_API_KEY")
         self.index_name = index_name or os.getenv("INDEX_NAME", "kb-articles-production")
@@ -297,6 +359,7 @@ class PineconeUploader:
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_in_flight = max(1, max_in_flight)
         # Resiliencia de query en runtime (plan Tarea 8 Paso 1): retry acotado
         # sólo 429/5xx + circuit breaker por instancia.
         self._query_breaker = _CircuitBreaker(threshold=5, cooldown_s=30.0)
@@ -397,29 +460,47 @@ class PineconeUploader:
         # the exact moment of the violation — instead of silently degrading.
         self._assert_global_only_topic_invariant(chunks)
 
-        logger.info(f"📤 Subiendo {len(chunks)} chunks a Pinecone...")
-        logger.info(f"   Batch size: {self.batch_size}")
-        logger.info(f"   Namespace: {self.namespace}")
-
         # Dividir en batches
         batches = [
             chunks[i:i + self.batch_size]
             for i in range(0, len(chunks), self.batch_size)
         ]
+        workers = min(self.max_in_flight, len(batches))
+
+        logger.info(f"📤 Subiendo {len(chunks)} chunks a Pinecone...")
+        logger.info(f"   Batch size: {self.batch_size}")
+        logger.info(f"   Batches en vuelo: {workers}")
+        logger.info(f"   Namespace: {self.namespace}")
 
         success_count = 0
         failed_count = 0
+        progress = tqdm(total=len(batches), desc="Uploading") if show_progress else None
 
-        # Procesar batches con progress bar
-        iterator = tqdm(batches, desc="Uploading") if show_progress else batches
-
-        for batch in iterator:
-            success = self._upload_batch(batch)
+        if workers <= 1:
+            outcomes = (self._upload_batch(batch) for batch in batches)
+            pool = None
+        else:
+            # Pipeline: hasta `workers` batches en vuelo, acotados además por
+            # la ventana adaptativa. Los resultados se consumen en orden, así
+            # el progreso sólo avanza sobre el prefijo ya completo.
+            window = _UploadWindow(workers)
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pinecone-upsert")
+            futures = [pool.submit(self._upload_batch, batch, window) for batch in batches]
+            outcomes = (future.result() for future in futures)
 
-            if success:
-                success_count += len(batch)
-            else:
-                failed_count += len(batch)
+        try:
+            for batch, success in zip(batches, outcomes, strict=True):
+                if success:
+                    success_count += len(batch)
+                else:
+                    failed_count += len(batch)
+                if progress is not None:
+                    progress.update(1)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+            if progress is not None:
+                progress.close()
 
         logger.info("✅ Upload completado")
         logger.info(f"   Exitosos: {success_count}/{len(chunks)}")
@@ -463,7 +544,11 @@ class PineconeUploader:
                     f"but scope={scope!r} (expected 'global')."
                 )
 
-    def _upload_batch(self, batch: List[Dict[str, Any]]) -> bool:
+    def _upload_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        window: Optional[_UploadWindow] = None
+    ) -> bool:
         """
         Sube un batch de chunks con retry logic.
 
@@ -477,6 +562,8 @@ class PineconeUploader:
 
         Args:
             batch: Lista de chunks a subir
+            window: Ventana compartida del upload concurrente; cada intento
+                ocupa un lugar y un 429 la achica y la pausa para todos
 
         Returns:
             True si el batch se subió exitosamente, False otherwise
@@ -495,15 +582,21 @@ class PineconeUploader:
 
         # Intentar upload con retries
         for attempt in range(self.max_retries):
+            if window is not None:
+                window.acquire()
             try:
                 # Upsert usando upsert_records (para embeddings integrados)
                 self.index.upsert_records(
                     namespace=self.namespace,
                     records=records
                 )
+                if window is not None:
+                    window.release(succeeded=True)
                 return True
 
             except Exception as exc:
+                if window is not None:
+                    window.release(succeeded=False)
                 transient = _is_transient_pinecone_error(exc)
                 logger.warning(
                     "Upload attempt %d/%d failed (error_type=%s, "
@@ -518,7 +611,12 @@ class PineconeUploader:
                     logger.error("Batch upload failed with non-retryable error")
                     return False
                 if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    if window is not None and _pinecone_status_code(exc) == 429:
+                        # Backoff exponencial y compartido: el próximo
+                        # acquire espera la pausa junto con los demás batches.
+                        window.throttle(self.retry_delay * 2 ** (attempt + 1))
+                    else:
+                        time.sleep(self.retry_delay * (attempt + 1))
                 else:
                     logger.error(
                         "Batch falló después de %d intentos",
@@ -943,6 +1041,152 @@ class PineconeUploader:
             logger.error("Error in list_and_fetch_chunks")
             return []
 
+    @staticmethod
+    def article_chunk_prefix(article_id: str) -> str:
+        """Prefijo exacto de los IDs de un artículo (``<article_id>_chunk_``)."""
+        return f"{article_id}_chunk_"
+
+    def list_chunk_hashes(self, prefix: str) -> Dict[str, Optional[str]]:
+        """
+        Lista TODOS los IDs con ``prefix`` y su ``chunk_hash`` indexado.
+
+        A diferencia de list_and_fetch_chunks no hay límite ni se tragan
+        errores: un diff contra una lectura parcial borraría chunks vivos, así
+        que cualquier fallo de Pinecone se propaga. Un vector sin hash (subido
+        antes del re-indexado diferencial) o que fetch aún no devuelve queda
+        con ``None`` y se re-sube.
+
+        Args:
+            prefix: Prefijo de ID (ver article_chunk_prefix)
+
+        Returns:
+            Dict ID -> hash (o None)
+        """
+        hashes: Dict[str, Optional[str]] = {}
+        for page in self.index.list(prefix=prefix, namespace=self.namespace):
+            if hasattr(page, 'vectors'):
+                items = page.vectors
+            elif isinstance(page, list):
+                items = page
+            else:
+                items = list(page)
+            for item in items:
+                hashes[self._extract_vector_id(item)] = None
+
+        ids = list(hashes)
+        for i in range(0, len(ids), _FETCH_BATCH_SIZE):
+            fetch_result = self.index.fetch(
+                ids=ids[i:i + _FETCH_BATCH_SIZE], namespace=self.namespace
+            )
+            vectors = fetch_result.vectors if hasattr(fetch_result, 'vectors') else {}
+            for vec_id, vec in vectors.items():
+                metadata = getattr(vec, 'metadata', None) or {}
+                stored = metadata.get(CHUNK_HASH_FIELD)
+                if vec_id in hashes and isinstance(stored, str):
+                    hashes[vec_id] = stored
+        return hashes
+
+    def plan_article_reindex(
+        self,
+        article_id: str,
+        chunks: List[Dict[str, Any]],
+        stored_hashes: Optional[Dict[str, Optional[str]]] = None,
+        force: bool = False,
+    ) -> ChunkDiff:
+        """
+        Compara los chunks nuevos de un artículo con lo indexado.
+
+        Args:
+            article_id: ID del artículo
+            chunks: Chunks generados por KBChunker
+            stored_hashes: Hashes ya conocidos (p.ej. un manifest local); si
+                es None se leen de la metadata de Pinecone
+            force: Si True, re-sube todos los chunks (igual borra los que
+                desaparecieron)
+
+        Returns:
+            ChunkDiff listo para apply_chunk_diff
+        """
+        prefix = self.article_chunk_prefix(article_id)
+        foreign = [chunk["id"] for chunk in chunks if not chunk["id"].startswith(prefix)]
+        if foreign:
+            raise ValueError(
+                f"{len(foreign)} chunks no pertenecen al artículo {article_id!r}"
+            )
+        # Se valida el artículo completo, no sólo lo que cambió: un chunk
+        # intacto también debe cumplir el invariante vigente.
+        self._assert_global_only_topic_invariant(chunks)
+        if stored_hashes is None:
+            stored_hashes = self.list_chunk_hashes(prefix)
+        return plan_chunk_diff(chunks, stored_hashes, force=force)
+
+    def plan_articles_reindex(
+        self,
+        articles: List[Tuple[str, List[Dict[str, Any]], Optional[Dict[str, Optional[str]]]]],
+        force: bool = False,
+    ) -> List[ChunkDiff]:
+        """
+        ``plan_article_reindex`` de muchos artículos, con hasta
+        ``max_in_flight`` en vuelo (los list/fetch de cada uno son round trips
+        independientes).
+
+        Args:
+            articles: (article_id, chunks, stored_hashes) por artículo
+            force: Igual que en plan_article_reindex
+
+        Returns:
+            Un ChunkDiff por artículo, en el orden de entrada
+        """
+        workers = min(self.max_in_flight, len(articles))
+        if workers <= 1:
+            return [
+                self.plan_article_reindex(article_id, chunks, stored, force=force)
+                for article_id, chunks, stored in articles
+            ]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pinecone-plan") as pool:
+            futures = [
+                pool.submit(self.plan_article_reindex, article_id, chunks, stored, force)
+                for article_id, chunks, stored in articles
+            ]
+            return [future.result() for future in futures]
+
+    def apply_chunk_diff(
+        self,
+        diff: ChunkDiff,
+        show_progress: bool = True
+    ) -> Dict[str, int]:
+        """
+        Aplica un ChunkDiff: primero upsert de lo nuevo/cambiado, después
+        delete de los IDs desaparecidos.
+
+        Un upsert sobreescribe el vector con el mismo ID, así que el artículo
+        nunca queda sin vectores en producción. Si algún batch falla no se
+        borra nada: los IDs viejos siguen sirviendo hasta el próximo intento.
+
+        Returns:
+            Dict con: added, changed, unchanged, deleted, failed
+        """
+        stats = {
+            "added": diff.added,
+            "changed": diff.changed,
+            "unchanged": diff.unchanged,
+            "deleted": 0,
+            "failed": 0,
+        }
+        if diff.upsert:
+            result = self.upload_chunks(diff.upsert, show_progress=show_progress)
+            stats["failed"] = result["failed"]
+            if result["failed"] > 0:
+                logger.warning("Upsert incompleto: no se borran chunks desaparecidos")
+                return stats
+        for i in range(0, len(diff.delete_ids), _DELETE_BATCH_SIZE):
+            batch_ids = diff.delete_ids[i:i + _DELETE_BATCH_SIZE]
+            if not self.delete_chunks(chunk_ids=batch_ids):
+                stats["failed"] += len(diff.delete_ids) - stats["deleted"]
+                return stats
+            stats["deleted"] += len(batch_ids)
+        return stats
+
     def get_index_stats(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas del índice.
@@ -30,6 +30,10 @@ SCHEMA_VERSION = "2.0"
 # Retención por defecto: debe superar el máximo retry/poll de n8n con margen.
 DEFAULT_RETENTION_S = 24 * 3600
 
+# Outbox de un job QUEUED estacionado en callback mode ForusBots: no existe
+# task vivo y el admission replay NO debe re-encolarlo.
+PARKED_ENQUEUE_STATE = "awaiting_callback"
+
 
 class TicketJobState(str, Enum):
     QUEUED = "queued"
@@ -134,7 +138,20 @@ class TicketJobRecord(BaseModel):
     processed_inquiries: int = 0
     unprocessed_inquiries: int = 0
 
+    # Versión de la parte PÚBLICA que vive en el payload (checkpoints,
+    # ``public_result``, ``forusbots_job_ids``): sólo la bumpean las
+    # escrituras que la cambian. Con los campos públicos del control forma el
+    # ETag del poll, que así se responde leyendo sólo el control.
+    public_version: int = 0
+    # ``expires_at`` del payload vivo, espejado en el control para que el
+    # 304 sepa sin leer el payload que el 410 aún no corresponde. None =
+    # payload borrado o layout previo (el poll lee el payload).
+    payload_expires_at: Optional[datetime] = None
+
     per_inquiry_status: List[Dict[str, Any]] = Field(default_factory=list)
+    # Índices con subdocumento en ``ticket_job_inquiries`` (vive en control).
+    # None = layout previo: el payload aún embebe ``per_inquiry_status``.
+    inquiry_indexes: Optional[List[int]] = None
     public_result: Optional[Dict[str, Any]] = None
     private_diagnostics_ref: Optional[str] = None
     forusbots_job_ids: List[str] = Field(default_factory=list)
@@ -143,7 +160,7 @@ class TicketJobRecord(BaseModel):
     retryable: Optional[bool] = None
     trace_id: Optional[str] = None
 
-    enqueue_state: str = "pending"          # pending | enqueued
+    enqueue_state: str = "pending"          # pending | enqueued | awaiting_callback
     task_name: Optional[str] = None
     claimed_by: Optional[str] = None
     claimed_at: Optional[datetime] = None
@@ -159,12 +176,21 @@ class TicketJobRecord(BaseModel):
     # ticket-{job_id}-g{generation}; una tombstone fuerza generación nueva.
     enqueue_generation: int = 0
 
+    # Callback mode ForusBots: un job estacionado (enqueue_state
+    # ``awaiting_callback``) sin task vivo. El callback firmado lo despierta;
+    # el reconciliador lo hace pasado ``forusbots_resume_at``. Un callback que
+    # llega ANTES de estacionar queda anotado en ``forusbots_callback_at``.
+    forusbots_resume_at: Optional[datetime] = None
+    forusbots_callback_at: Optional[datetime] = None
+
     # Deadline ABSOLUTO del job (Tarea 7 Paso 1): accepted+2400s; worker,
     # reconciliador y GET terminalizan por CAS después de vencido.
     job_deadline_at: Optional[datetime] = None
 
     # Liberación exactamente-una-vez del slot de cuota (Tarea 5 Paso 2).
     active_slot_released: bool = False
+    # Shard del contador de activos que ocupó el job (None = shard 0).
+    active_slot_shard: Optional[int] = None
 
     # Lock de recuperación del reconciliador (Tarea 7 Paso 5) — separado del
     # lease de ejecución del worker.
@@ -10,15 +10,29 @@ Separación control/payload (privacidad + retención):
   timestamps, lease/outbox/cuota). No terminal: sin TTL; terminal: retiene
   ``TICKET_IDEMPOTENCY_RETENTION_DAYS`` junto con su receipt para que GET
   devuelva 410 durante todo el horizonte de replay.
-- ``ticket_job_payloads/{job_id}``   request, execution plan, checkpoints y
-  resultado (PII mínima); ``expires_at`` nativo a 24h como fail-safe.
+- ``ticket_job_payloads/{job_id}``   request, execution plan y resultado
+  (PII mínima); ``expires_at`` nativo a 24h como fail-safe.
+- ``ticket_job_inquiries/{job_id:index}``  un checkpoint de
+  ``per_inquiry_status`` por documento, mismo ``expires_at`` que el payload.
+  El control lista los índices (``inquiry_indexes``); un checkpoint escribe
+  control + UNA inquiry, nunca el record completo.
 - ``ticket_idempotency_receipts/{principal_hash:key_hash}``  fingerprint +
   job_id, sin PII, TTL = retención (default 90d, nunca menor al horizonte
   acordado en Tarea 1).
-- ``ticket_active_counters/{principal_hash}``  ``active_jobs`` SIN TTL
-  mientras sea positivo; se elimina sólo al volver atómicamente a cero.
-- ``ticket_rate_windows/{principal_hash:window}``  ventana fija durable con
-  TTL posterior al horizonte de retry/replay.
+- ``ticket_active_counters/{principal_hash}[:shard]``  ``active_jobs`` SIN
+  TTL mientras sea positivo; se elimina sólo al volver atómicamente a cero.
+- ``ticket_rate_windows/{principal_hash:window}[:shard]``  ventana fija
+  durable con TTL posterior al horizonte de retry/replay.
+
+Contadores sharded: con ``counter_shards`` > 1 el cap de activos y la
+ventana de tasa se reparten en cuotas por shard que suman exactamente el
+total. La admisión lee y escribe SÓLO su shard (derivado de la
+Idempotency-Key, o del job_id sin key); si está lleno prueba el siguiente,
+así que rechaza únicamente cuando todos están llenos. El shard del slot se
+persiste en ``active_slot_shard`` y la liberación toca sólo ése: admisiones
+y terminalizaciones en shards distintos no comparten documentos. El shard 0
+conserva el ID histórico (sin sufijo): pasar de 1 a N shards no requiere
+migración; reducir N sub-contaría slots vivos.
 
 Los timestamps se escriben SIEMPRE como ``datetime`` nativos (TTL de
 Firestore); ``.isoformat()`` está prohibido en este módulo.
@@ -27,15 +41,26 @@ Firestore); ``.isoformat()`` está prohibido en este módulo.
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
 import copy
 import hashlib
+import heapq
+import itertools
+import logging
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import (
     Any,
+    AsyncContextManager,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     Optional,
     Protocol,
     Tuple,
@@ -46,7 +71,15 @@ from typing import (
 from google.cloud.firestore_v1.base_query import FieldFilter
 
 from data_pipeline.durable_document import validate_durable_document
+from data_pipeline.payload_codec import (
+    CODEC_NONE,
+    SUPPORTED_CODECS,
+    decode_document,
+    encode_document,
+)
+from data_pipeline.ticket_memory_index import BucketIndex, clone_document
 from data_pipeline.ticket_job_models import (
+    PARKED_ENQUEUE_STATE,
     TERMINAL_STATES,
     VALID_TRANSITIONS,
     CreateOrGetOutcome,
@@ -60,8 +93,11 @@ from data_pipeline.ticket_job_models import (
 )
 from data_pipeline.forusbots_contract import FORUSBOTS_IDEMPOTENCY_CONTRACT
 
+logger = logging.getLogger(__name__)
+
 JOBS_COLLECTION = "ticket_jobs"
 PAYLOADS_COLLECTION = "ticket_job_payloads"
+INQUIRIES_COLLECTION = "ticket_job_inquiries"
 RECEIPTS_COLLECTION = "ticket_idempotency_receipts"
 COUNTERS_COLLECTION = "ticket_active_counters"
 RATE_WINDOWS_COLLECTION = "ticket_rate_windows"
@@ -69,17 +105,32 @@ RECONCILER_STATE_COLLECTION = "ticket_reconciler_state"
 
 _ACTIVE_SCAN_CURSOR_ID = "active_jobs"
 
+# Índices compuestos de ``ticket_jobs`` que consulta el reconciliador
+# (espejo de firestore.indexes.json): (campos de igualdad, campo de orden
+# ascendente). El backend in-memory mantiene un índice ordenado por cada uno
+# y rechaza, igual que Firestore, una consulta sin índice declarado.
+RECONCILE_INDEXES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("state",), "lease_expires_at"),
+    (("state",), "job_deadline_at"),
+    (("enqueue_state", "state"), "created_at"),
+)
+
 # Compat: nombre histórico usado por tests/tooling para localizar el índice
 # idempotente. La colección real es RECEIPTS_COLLECTION.
 IDEM_COLLECTION = RECEIPTS_COLLECTION
 
 # Campos del record que viven en el documento de PAYLOAD (PII / volumen).
+# ``per_inquiry_status`` es payload lógico, pero cada entry se persiste en su
+# propio subdocumento de INQUIRIES_COLLECTION (ver ``_stage_job_docs``).
 _PAYLOAD_FIELDS = frozenset({
     "request_payload", "execution_plan", "per_inquiry_status",
     "public_result", "private_diagnostics_ref", "tenant_id", "ticket_id",
     "forusbots_job_ids", "fault_plan",
 })
 
+# Campos del payload que el poll devuelve (además de ``per_inquiry_status``).
+_PUBLIC_PAYLOAD_FIELDS = ("public_result", "forusbots_job_ids")
+
 _RATE_WINDOW_S = 60
 _RATE_WINDOW_TTL = timedelta(hours=48)
 
@@ -94,6 +145,10 @@ class TransactionView(Protocol):
 
     async def get(self, collection: str, doc_id: str) -> Optional[Document]: ...
 
+    async def get_all(
+        self, keys: list[Tuple[str, str]]
+    ) -> list[Optional[Document]]: ...
+
     def set(self, collection: str, doc_id: str, value: Document) -> None: ...
 
     def delete(self, collection: str, doc_id: str) -> None: ...
@@ -111,6 +166,10 @@ class TicketJobBackend(Protocol):
         self, collection: str, doc_id: str
     ) -> Optional[Document]: ...
 
+    async def get_docs(
+        self, keys: list[Tuple[str, str]]
+    ) -> list[Optional[Document]]: ...
+
     async def scan_collection(
         self,
         collection: str,
@@ -124,6 +183,20 @@ class TicketJobBackend(Protocol):
         self, collection: str, states: list[str]
     ) -> tuple[int, Optional[datetime]]: ...
 
+    async def query_ordered(
+        self,
+        collection: str,
+        limit: int,
+        *,
+        equals: Dict[str, list[str]],
+        order_by: str,
+        before: Optional[datetime] = None,
+    ) -> ScanPage: ...
+
+    def watch_doc(
+        self, collection: str, doc_id: str
+    ) -> AsyncContextManager[asyncio.Event]: ...
+
 
 class TicketJobError(Exception):
     pass
@@ -182,6 +255,43 @@ def principal_hash(principal_id: str) -> str:
     return hashlib.sha256(principal_id.encode("utf-8")).hexdigest()[:32]
 
 
+def _counter_shard_id(p_hash: str, shard: int) -> str:
+    return p_hash if shard == 0 else f"{p_hash}:{shard}"
+
+
+def _window_shard_id(p_hash: str, window: int, shard: int) -> str:
+    base = f"{p_hash}:{window}"
+    return base if shard == 0 else f"{base}:{shard}"
+
+
+def _slot_shard(job_id: str, shards: int) -> int:
+    digest = hashlib.sha256(job_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % shards
+
+
+def _shard_quota(total: int, shards: int, shard: int) -> int:
+    """Parte de ``total`` que le toca a ``shard``; las partes suman ``total``."""
+    return total // shards + (1 if shard < total % shards else 0)
+
+
+async def _release_active_slot(
+    view: TransactionView, record: TicketJobRecord, now: datetime,
+) -> None:
+    """Decrementa el shard que ocupó el job (llamar una sola vez por job)."""
+    doc_id = _counter_shard_id(
+        principal_hash(record.principal_id), record.active_slot_shard or 0,
+    )
+    counter = await view.get(COUNTERS_COLLECTION, doc_id)
+    if counter is None:
+        return
+    counter["active_jobs"] = max(0, counter["active_jobs"] - 1)
+    counter["updated_at"] = now
+    if counter["active_jobs"] == 0:
+        view.delete(COUNTERS_COLLECTION, doc_id)
+    else:
+        view.set(COUNTERS_COLLECTION, doc_id, counter)
+
+
 def _canonical_tenant_hash(
     *, tenant_id: Optional[str], tenant_id_hash: Optional[str]
 ) -> Optional[str]:
@@ -218,9 +328,176 @@ def _assert_idempotency_tenant_binding(
         )
 
 
+class _DocChangeNotifier:
+    """Despertador in-process por documento.
+
+    Cada commit del backend avisa a los waiters de los documentos escritos,
+    así que la espera inline de v1 se entera del terminal escrito por el
+    ``InlineTicketQueue`` (o por cualquier request de la misma instancia) sin
+    releer. ``wake`` es thread-safe: los snapshot listeners de Firestore
+    corren en un hilo del SDK.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[
+            Tuple[str, str],
+            set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]],
+        ] = {}
+
+    @contextlib.contextmanager
+    def register(self, collection: str, doc_id: str) -> Iterator[asyncio.Event]:
+        key = (collection, doc_id)
+        entry = (asyncio.get_running_loop(), asyncio.Event())
+        self._waiters.setdefault(key, set()).add(entry)
+        try:
+            yield entry[1]
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(entry)
+                if not waiters:
+                    del self._waiters[key]
+
+    def notify(self, keys: Iterable[Tuple[str, str]]) -> None:
+        for key in keys:
+            for entry in tuple(self._waiters.get(key, ())):
+                self._wake(entry)
+
+    @staticmethod
+    def _wake(entry: Tuple[asyncio.AbstractEventLoop, asyncio.Event]) -> None:
+        loop, event = entry
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            pass  # loop cerrado: el waiter ya no existe
+
+
+class _IndexedCollection(Dict[str, Document]):
+    """Colección in-memory con índices secundarios exactos.
+
+    Los índices viven en el contenedor, no en la transacción: también los
+    mantiene una escritura directa ``backend._data[col][id] = doc`` (tests
+    que simulan otra instancia). Los documentos guardados son snapshots:
+    mutarlos en sitio salta los índices.
+
+    ``ordered`` replica índices compuestos Firestore (igualdad sobre
+    ``equality`` + orden ascendente por ``order_by``): bucket = tupla de
+    valores de igualdad, orden = el ``datetime`` de ``order_by``. Como en
+    Firestore, un doc sin timestamp en ``order_by`` no entra al índice.
+    """
+
+    INDEXED_FIELDS = ("state", "principal_id")
+
+    def __init__(
+        self, ordered: Iterable[Tuple[Tuple[str, ...], str]] = (),
+    ) -> None:
+        super().__init__()
+        self.ids: BucketIndex[str] = BucketIndex()
+        self.by_field: Dict[str, BucketIndex[str]] = {
+            field: BucketIndex() for field in self.INDEXED_FIELDS
+        }
+        self.ordered: Dict[Tuple[Tuple[str, ...], str], BucketIndex[str]] = {
+            declared: BucketIndex() for declared in ordered
+        }
+
+    def __setitem__(self, doc_id: str, doc: Document) -> None:
+        super().__setitem__(doc_id, doc)
+        self.ids.put(doc_id, None)
+        for field, index in self.by_field.items():
+            value = doc.get(field)
+            if isinstance(value, str):
+                index.put(doc_id, value)
+            else:
+                index.discard(doc_id)
+        for (equality, order_by), ordered in self.ordered.items():
+            value = doc.get(order_by)
+            if isinstance(value, datetime):
+                bucket = tuple(doc.get(field) for field in equality)
+                ordered.put(doc_id, bucket, value)
+            else:
+                ordered.discard(doc_id)
+
+    def __delitem__(self, doc_id: str) -> None:
+        super().__delitem__(doc_id)
+        self._unindex(doc_id)
+
+    def pop(self, doc_id: str, *default: Any) -> Any:
+        if doc_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(doc_id)
+        doc = super().pop(doc_id)
+        self._unindex(doc_id)
+        return doc
+
+    def clear(self) -> None:
+        super().clear()
+        self.ids.clear()
+        for index in (*self.by_field.values(), *self.ordered.values()):
+            index.clear()
+
+    def _unindex(self, doc_id: str) -> None:
+        self.ids.discard(doc_id)
+        for index in (*self.by_field.values(), *self.ordered.values()):
+            index.discard(doc_id)
+
+    def ids_after(
+        self, bucket: Tuple[str, Optional[str]], start_after: Optional[str],
+    ) -> list[Tuple[Any, str]]:
+        """Entradas ``((), id)`` de un bucket (``("", None)`` = todos los
+        ids) posteriores a ``start_after``, en orden de id."""
+        field, value = bucket
+        index = self.by_field[field] if field else self.ids
+        entries = index.entries(value)
+        if start_after is None:
+            return entries
+        return entries[bisect.bisect_right(entries, ((), start_after)):]
+
+    def ordered_ids(
+        self,
+        declared: Tuple[Tuple[str, ...], str],
+        equals: Dict[str, list[str]],
+        before: Optional[datetime],
+    ) -> Iterator[str]:
+        """Ids del índice compuesto ``declared`` con ``order_by < before``,
+        mezclando los buckets de ``equals`` en orden ascendente."""
+        index = self.ordered[declared]
+        runs = []
+        for key in itertools.product(*(equals[f] for f in declared[0])):
+            entries = index.entries(tuple(key))
+            end = (
+                bisect.bisect_left(entries, (before,))
+                if before is not None else len(entries)
+            )
+            runs.append(entries[:end])
+        for _order, doc_id in heapq.merge(*runs):
+            yield doc_id
+
+
+# Índices compuestos que replica cada colección in-memory.
+_ORDERED_INDEXES: Dict[str, Tuple[Tuple[Tuple[str, ...], str], ...]] = {
+    JOBS_COLLECTION: RECONCILE_INDEXES,
+}
+
+
+def _new_collection(name: str) -> _IndexedCollection:
+    return _IndexedCollection(_ORDERED_INDEXES.get(name, ()))
+
+
+def _collection_for_write(data: CollectionData, name: str) -> Dict[str, Document]:
+    docs = data.get(name)
+    if docs is None:
+        docs = data[name] = _new_collection(name)
+    return docs
+
+
 class _TxnView:
     """Vista de una transacción in-memory: reads del snapshot committed,
-    writes/deletes bufferizados que se aplican sólo si la función completa."""
+    writes/deletes bufferizados que se aplican sólo si la función completa.
+
+    Copy-on-write: el doc staged es un clon propio y ``apply`` lo instala
+    como snapshot nuevo; ningún doc committed se muta en sitio.
+    """
 
     def __init__(self, data: CollectionData):
         self._data = data
@@ -228,13 +505,18 @@ class _TxnView:
 
     async def get(self, collection: str, doc_id: str) -> Optional[Document]:
         if (collection, doc_id) in self._staged:
-            return copy.deepcopy(self._staged[(collection, doc_id)])
+            return clone_document(self._staged[(collection, doc_id)])
         doc = self._data.get(collection, {}).get(doc_id)
-        return copy.deepcopy(doc) if doc is not None else None
+        return clone_document(doc) if doc is not None else None
+
+    async def get_all(
+        self, keys: list[Tuple[str, str]]
+    ) -> list[Optional[Document]]:
+        return [await self.get(collection, doc_id) for collection, doc_id in keys]
 
     def set(self, collection: str, doc_id: str, value: Document) -> None:
         validate_durable_document(value)
-        self._staged[(collection, doc_id)] = copy.deepcopy(value)
+        self._staged[(collection, doc_id)] = clone_document(value)
 
     def delete(self, collection: str, doc_id: str) -> None:
         self._staged[(collection, doc_id)] = None
@@ -244,15 +526,26 @@ class _TxnView:
             if value is None:
                 self._data.get(collection, {}).pop(doc_id, None)
             else:
-                self._data.setdefault(collection, {})[doc_id] = value
+                _collection_for_write(self._data, collection)[doc_id] = value
+
+    def written_keys(self) -> list[Tuple[str, str]]:
+        return list(self._staged)
 
 
 class InMemoryTicketJobBackend:
-    """Backend transaccional en memoria (tests / desarrollo local)."""
+    """Backend transaccional en memoria (tests / desarrollo local).
+
+    Las transacciones se serializan con un lock (la lectura más estricta del
+    aislamiento serializable de Firestore). ``count_jobs``, ``scan_collection``,
+    ``active_job_stats`` y ``query_ordered`` recorren los índices de
+    :class:`_IndexedCollection` en vez de la colección entera; los docs
+    devueltos son clones baratos.
+    """
 
     def __init__(self) -> None:
         self._data: CollectionData = {}
         self._lock = asyncio.Lock()
+        self._notifier = _DocChangeNotifier()
 
     async def transact(
         self,
@@ -262,26 +555,60 @@ class InMemoryTicketJobBackend:
             view = _TxnView(self._data)
             result = await fn(view)
             view.apply()
-            return result
+        self._notifier.notify(view.written_keys())
+        return result
+
+    @contextlib.asynccontextmanager
+    async def watch_doc(
+        self, collection: str, doc_id: str
+    ) -> AsyncIterator[asyncio.Event]:
+        with self._notifier.register(collection, doc_id) as event:
+            yield event
 
     async def get_doc(
         self, collection: str, doc_id: str
     ) -> Optional[Document]:
         doc = self._data.get(collection, {}).get(doc_id)
-        return copy.deepcopy(doc) if doc is not None else None
+        return clone_document(doc) if doc is not None else None
+
+    async def get_docs(
+        self, keys: list[Tuple[str, str]]
+    ) -> list[Optional[Document]]:
+        return [await self.get_doc(collection, doc_id)
+                for collection, doc_id in keys]
+
+    def _indexed(self, collection: str) -> Optional[_IndexedCollection]:
+        docs = self._data.get(collection)
+        if docs is None:
+            return None
+        if not isinstance(docs, _IndexedCollection):
+            # Colección instalada a mano como dict plano: se re-indexa una vez.
+            indexed = _new_collection(collection)
+            for doc_id, doc in docs.items():
+                indexed[doc_id] = doc
+            self._data[collection] = docs = indexed
+        return docs
 
     async def count_jobs(
         self, collection: str, principal_id: str, states: list[str]
     ) -> int:
+        docs = self._indexed(collection)
+        if docs is None:
+            return 0
         wanted = set(states)
         return sum(
-            1 for doc in self._data.get(collection, {}).values()
-            if doc.get("principal_id") == principal_id
-            and doc.get("state") in wanted
+            1 for _order, doc_id
+            in docs.by_field["principal_id"].entries(principal_id)
+            if docs[doc_id].get("state") in wanted
         )
 
     async def dump_all(self) -> CollectionData:
-        return copy.deepcopy(self._data)
+        return {
+            collection: {
+                doc_id: clone_document(doc) for doc_id, doc in docs.items()
+            }
+            for collection, docs in self._data.items()
+        }
 
     async def scan_collection(
         self,
@@ -291,31 +618,81 @@ class InMemoryTicketJobBackend:
         states: Optional[list[str]] = None,
         start_after: Optional[str] = None,
     ) -> ScanPage:
-        docs = self._data.get(collection, {})
-        wanted = set(states) if states is not None else None
-        eligible = sorted(
-            (doc_id, doc) for doc_id, doc in docs.items()
-            if wanted is None or doc.get("state") in wanted
+        docs = self._indexed(collection)
+        if docs is None or limit <= 0:
+            return []
+        buckets: list[Tuple[str, Optional[str]]] = (
+            [("", None)] if states is None
+            else [("state", state) for state in dict.fromkeys(states)]
         )
-        if start_after is not None:
-            eligible = [item for item in eligible if item[0] > start_after]
-        return [(doc_id, copy.deepcopy(doc))
-                for doc_id, doc in eligible[:limit]]
+        runs = [docs.ids_after(bucket, start_after) for bucket in buckets]
+        return [
+            (doc_id, clone_document(docs[doc_id]))
+            for _order, doc_id in itertools.islice(heapq.merge(*runs), limit)
+        ]
 
     async def active_job_stats(
         self, collection: str, states: list[str]
     ) -> tuple[int, Optional[datetime]]:
-        wanted = set(states)
-        active = [
-            doc for doc in self._data.get(collection, {}).values()
-            if doc.get("state") in wanted
-        ]
-        created: list[datetime] = []
-        for document in active:
-            created_at = document.get("created_at")
-            if isinstance(created_at, datetime):
-                created.append(created_at)
-        return len(active), min(created) if created else None
+        docs = self._indexed(collection)
+        if docs is None:
+            return 0, None
+        active = 0
+        oldest: Optional[datetime] = None
+        for state in set(states):
+            for _order, doc_id in docs.by_field["state"].entries(state):
+                active += 1
+                created_at = docs[doc_id].get("created_at")
+                if isinstance(created_at, datetime) \
+                        and (oldest is None or created_at < oldest):
+                    oldest = created_at
+        return active, oldest
+
+    async def query_ordered(
+        self,
+        collection: str,
+        limit: int,
+        *,
+        equals: Dict[str, list[str]],
+        order_by: str,
+        before: Optional[datetime] = None,
+    ) -> ScanPage:
+        declared = (tuple(equals), order_by)
+        if declared not in _ORDERED_INDEXES.get(collection, ()):
+            raise ValueError(
+                f"consulta sin índice declarado: {collection} "
+                f"{tuple(equals)} ORDER BY {order_by}"
+            )
+        docs = self._indexed(collection)
+        if docs is None:
+            return []
+        out: ScanPage = []
+        for doc_id in docs.ordered_ids(declared, equals, before):
+            if len(out) >= limit:
+                break
+            # Mismo criterio que count_jobs: un doc mutado en sitio saltó los
+            # índices, así que cada hit se revalida contra el doc vivo.
+            doc = docs[doc_id]
+            value = doc.get(order_by)
+            if not isinstance(value, datetime) \
+                    or (before is not None and not value < before) \
+                    or any(doc.get(f) not in v for f, v in equals.items()):
+                continue
+            out.append((doc_id, clone_document(doc)))
+        return out
+
+
+async def _get_all(
+    client: Any, refs: list[Any], *, transaction: Any = None,
+) -> list[Optional[Document]]:
+    """Un único ``get_all`` batched; Firestore no garantiza el orden de los
+    snapshots, así que se reordenan por path al de ``refs``."""
+    if not refs:
+        return []
+    found: Dict[str, Optional[Document]] = {}
+    async for snap in client.get_all(refs, transaction=transaction):
+        found[snap.reference.path] = snap.to_dict() if snap.exists else None
+    return [found.get(ref.path) for ref in refs]
 
 
 class FirestoreTicketJobBackend:
@@ -332,6 +709,8 @@ class FirestoreTicketJobBackend:
         project: Optional[str] = None,
         collection_prefix: str = "",
         database: Optional[str] = None,
+        *,
+        snapshot_listeners: bool = False,
     ) -> None:
         import google.cloud.firestore as firestore  # import perezoso
 
@@ -348,6 +727,15 @@ class FirestoreTicketJobBackend:
         )
         self._prefix = collection_prefix
         self.database = database
+        self._project = project or None
+        self._notifier = _DocChangeNotifier()
+        # on_snapshot sólo existe en el cliente síncrono; se crea perezoso.
+        self._snapshot_listeners = snapshot_listeners
+        self._listener_client: Any = None
+        # Un listener por documento, compartido por todos sus waiters:
+        # key -> [unsubscribe, waiters]. Se toca desde hilos (to_thread).
+        self._listeners: dict[Tuple[str, str], list[Any]] = {}
+        self._listeners_lock = threading.Lock()
 
     def _col(self, name: str) -> str:
         return f"{self._prefix}{name}"
@@ -364,6 +752,7 @@ class FirestoreTicketJobBackend:
             def __init__(self, txn: Any) -> None:
                 self._txn = txn
                 self._writes: list[tuple[str, Any, Optional[Document]]] = []
+                self._keys: list[Tuple[str, str]] = []
 
             async def get(
                 self, collection: str, doc_id: str
@@ -373,16 +762,27 @@ class FirestoreTicketJobBackend:
                 raw = snap.to_dict() if snap.exists else None
                 return raw
 
+            async def get_all(
+                self, keys: list[Tuple[str, str]]
+            ) -> list[Optional[Document]]:
+                refs = [
+                    client.collection(f"{prefix}{collection}").document(doc_id)
+                    for collection, doc_id in keys
+                ]
+                return await _get_all(client, refs, transaction=self._txn)
+
             def set(
                 self, collection: str, doc_id: str, value: Document
             ) -> None:
                 validate_durable_document(value)
                 ref = client.collection(f"{prefix}{collection}").document(doc_id)
                 self._writes.append(("set", ref, value))
+                self._keys.append((collection, doc_id))
 
             def delete(self, collection: str, doc_id: str) -> None:
                 ref = client.collection(f"{prefix}{collection}").document(doc_id)
                 self._writes.append(("delete", ref, None))
+                self._keys.append((collection, doc_id))
 
             def flush(self) -> None:
                 for op, ref, value in self._writes:
@@ -391,6 +791,9 @@ class FirestoreTicketJobBackend:
                     else:
                         self._txn.delete(ref)
 
+            def written_keys(self) -> list[Tuple[str, str]]:
+                return list(self._keys)
+
         transaction = client.transaction()
 
         transactional = cast(
@@ -401,14 +804,87 @@ class FirestoreTicketJobBackend:
             firestore.async_transactional,
         )
 
+        committed: list[_FirestoreView] = []
+
         @transactional
         async def _run(txn: Any) -> TxnResult:
             view = _FirestoreView(txn)
             result = await fn(view)
             view.flush()
+            committed[:] = [view]
             return result
 
-        return await _run(transaction)
+        result = await _run(transaction)
+        if committed:
+            self._notifier.notify(committed[0].written_keys())
+        return result
+
+    @contextlib.asynccontextmanager
+    async def watch_doc(
+        self, collection: str, doc_id: str
+    ) -> AsyncIterator[asyncio.Event]:
+        """Commits de esta instancia despiertan vía notifier; los de otras
+        instancias (worker de Cloud Tasks) vía snapshot listener, que sólo
+        cobra una lectura por cambio. Los waiters del mismo job comparten un
+        único listener. Si el listener falla, el caller sigue con su poll de
+        respaldo."""
+        key = (collection, doc_id)
+        with self._notifier.register(collection, doc_id) as event:
+            subscribed = False
+            if self._snapshot_listeners:
+                try:
+                    await asyncio.to_thread(self._acquire_listener, key)
+                    subscribed = True
+                except Exception as exc:  # noqa: BLE001 - poll de respaldo
+                    logger.warning(
+                        "Firestore snapshot listener no disponible "
+                        "(error_type=%s)",
+                        type(exc).__name__,
+                    )
+            try:
+                yield event
+            finally:
+                if subscribed:
+                    await asyncio.to_thread(self._release_listener, key)
+
+    def _acquire_listener(self, key: Tuple[str, str]) -> None:
+        with self._listeners_lock:
+            entry = self._listeners.get(key)
+            if entry is None:
+                entry = [self._listen(*key), 0]
+                self._listeners[key] = entry
+            entry[1] += 1
+
+    def _release_listener(self, key: Tuple[str, str]) -> None:
+        with self._listeners_lock:
+            entry = self._listeners[key]
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+            del self._listeners[key]
+        entry[0]()
+
+    def _listen(self, collection: str, doc_id: str) -> Callable[[], None]:
+        """Abre el listener del documento. El snapshot inicial sólo refleja
+        el estado que el waiter va a leer igualmente: no despierta a nadie."""
+        if self._listener_client is None:
+            self._listener_client = self._firestore.Client(
+                project=self._project,
+                database=None if self.database == "(default)" else self.database,
+            )
+        ref = self._listener_client.collection(
+            self._col(collection)
+        ).document(doc_id)
+        initial = [True]
+
+        def _on_snapshot(*_args: Any) -> None:
+            if initial[0]:
+                initial[0] = False
+                return
+            self._notifier.notify([(collection, doc_id)])
+
+        watch = ref.on_snapshot(_on_snapshot)
+        return cast(Callable[[], None], watch.unsubscribe)
 
     async def get_doc(
         self, collection: str, doc_id: str
@@ -418,6 +894,15 @@ class FirestoreTicketJobBackend:
         raw = snap.to_dict() if snap.exists else None
         return raw
 
+    async def get_docs(
+        self, keys: list[Tuple[str, str]]
+    ) -> list[Optional[Document]]:
+        refs = [
+            self._client.collection(self._col(collection)).document(doc_id)
+            for collection, doc_id in keys
+        ]
+        return await _get_all(self._client, refs)
+
     async def count_jobs(
         self, collection: str, principal_id: str, states: list[str]
     ) -> int:  # pragma: no cover - staging
@@ -471,6 +956,29 @@ class FirestoreTicketJobBackend:
             return count, created_at if isinstance(created_at, datetime) else None
         return count, None
 
+    async def query_ordered(
+        self,
+        collection: str,
+        limit: int,
+        *,
+        equals: Dict[str, list[str]],
+        order_by: str,
+        before: Optional[datetime] = None,
+    ) -> ScanPage:  # pragma: no cover - staging
+        query: Any = self._client.collection(self._col(collection))
+        for field, values in equals.items():
+            if len(values) == 1:
+                query = query.where(filter=FieldFilter(field, "==", values[0]))
+            else:
+                query = query.where(filter=FieldFilter(field, "in", values))
+        if before is not None:
+            query = query.where(filter=FieldFilter(order_by, "<", before))
+        query = query.order_by(order_by).limit(limit)
+        out: ScanPage = []
+        async for snap in query.stream():
+            out.append((snap.id, cast(Document, snap.to_dict())))
+        return out
+
 
 def _plain(value: Any) -> Any:
     """Enums → value; datetimes se PRESERVAN nativos (TTL de Firestore)."""
@@ -539,12 +1047,18 @@ def _validated_external_job_id(value: str) -> str:
     return value
 
 
+def _is_processed(status: Optional[Document]) -> bool:
+    return status is not None and status.get("execution_status") not in (
+        None, "pending", "running",
+    )
+
+
 def build_validated_inquiry_checkpoint(
     record: TicketJobRecord,
     index: int,
     entry: Document,
 ) -> TicketJobRecord:
-    """Build and validate the complete control/payload checkpoint documents."""
+    """Build and validate the control, payload and inquiry checkpoint docs."""
     existing = next(
         (status for status in record.per_inquiry_status
          if status.get("index") == index),
@@ -554,20 +1068,22 @@ def build_validated_inquiry_checkpoint(
         status for status in record.per_inquiry_status
         if status.get("index") != index
     ]
-    statuses.append(_merge_effect_checkpoint(existing, entry, index=index))
+    checkpoint = _merge_effect_checkpoint(existing, entry, index=index)
+    statuses.append(checkpoint)
     statuses.sort(key=lambda status: status.get("index", 0))
-    processed = sum(
-        1 for status in statuses
-        if status.get("execution_status") not in (None, "pending", "running")
-    )
+    processed = sum(1 for status in statuses if _is_processed(status))
     merged = record.model_copy(update={
         "per_inquiry_status": statuses,
         "processed_inquiries": processed,
         "updated_at": utcnow(),
     })
     control, payload = split_record(merged)
+    payload.pop("per_inquiry_status", None)
     validate_durable_document(control)
     validate_durable_document(payload)
+    validate_durable_document(
+        _inquiry_doc(merged.job_id, checkpoint, payload.get("expires_at"))
+    )
     return merged
 
 
@@ -614,6 +1130,133 @@ def _doc_to_record(doc: Document) -> TicketJobRecord:
     return TicketJobRecord.model_validate(doc)
 
 
+def _inquiry_doc_id(job_id: str, index: int) -> str:
+    return f"{job_id}:{index:04d}"
+
+
+def _inquiry_doc(
+    job_id: str, entry: Document, expires_at: Optional[datetime],
+) -> Document:
+    return {
+        "job_id": job_id,
+        "index": entry.get("index"),
+        "entry": entry,
+        # mismo fail-safe de privacidad que el payload del job
+        "expires_at": expires_at,
+    }
+
+
+def _inquiry_indexes(statuses: list[Document]) -> list[int]:
+    indexes: set[int] = set()
+    for status in statuses:
+        index = status.get("index")
+        if not isinstance(index, int) or isinstance(index, bool) \
+                or index < 0 or index in indexes:
+            raise TicketJobError("per_inquiry_status con index inválido")
+        indexes.add(index)
+    return sorted(indexes)
+
+
+async def _read_payload(
+    get_all: Callable[
+        [list[Tuple[str, str]]], Awaitable[list[Optional[Document]]]
+    ],
+    job_id: str,
+    control: Document,
+) -> Optional[Document]:
+    """Payload lógico: doc de payload + un subdocumento por inquiry, leídos
+    en UN solo ``get_all`` (los índices vienen del control ya leído).
+
+    Un control sin ``inquiry_indexes`` es del layout previo y su payload aún
+    embebe ``per_inquiry_status``: se devuelve tal cual. La vigencia la
+    gobierna SÓLO el doc de payload (``_live_payload``). Los documentos
+    comprimidos se decodifican aquí; ``expires_at`` siempre queda plano.
+    """
+    indexes = control.get("inquiry_indexes")
+    docs = await get_all([(PAYLOADS_COLLECTION, job_id)] + [
+        (INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index))
+        for index in indexes or []
+    ])
+    payload = decode_document(docs[0])
+    if payload is None or indexes is None:
+        return payload
+    statuses: list[Document] = []
+    for raw in docs[1:]:
+        doc = decode_document(raw)
+        if doc is not None and isinstance(doc.get("entry"), dict):
+            statuses.append(doc["entry"])
+    assembled = dict(payload)
+    assembled["per_inquiry_status"] = statuses
+    return assembled
+
+
+def _stage_job_docs(
+    view: TransactionView,
+    job_id: str,
+    *,
+    previous: Optional[TicketJobRecord],
+    payload: Optional[Document],
+    new_control: Document,
+    new_payload: Document,
+    codec: str = CODEC_NONE,
+) -> None:
+    """Escribe control + payload tocando sólo los documentos que cambiaron.
+
+    Si cambia la parte pública del payload bumpea ``public_version``.
+
+    ``payload`` es el payload lógico leído en la misma transacción. Un
+    checkpoint reescribe el control y el subdocumento de SU inquiry; el doc
+    de payload sólo cuando cambia su parte fija. Un record del layout previo
+    (``inquiry_indexes`` None) migra completo en su primera escritura.
+    """
+    statuses = list(new_payload.get("per_inquiry_status") or [])
+    indexes = _inquiry_indexes(statuses)
+    base = {k: v for k, v in new_payload.items() if k != "per_inquiry_status"}
+    stored = previous.inquiry_indexes if previous is not None else None
+    rewrite_all = payload is None or stored is None
+    old_entries: Dict[Any, Document] = {}
+    old_base: Document = {}
+    if not rewrite_all and payload is not None:
+        old_entries = {
+            entry.get("index"): entry
+            for entry in payload.get("per_inquiry_status") or []
+        }
+        old_base = {
+            k: v for k, v in payload.items() if k != "per_inquiry_status"
+        }
+    expires_at = base.get("expires_at")
+    same_expiry = old_base.get("expires_at") == expires_at
+    public_changed = set(stored or []) != set(indexes) or any(
+        old_base.get(key) != base.get(key) for key in _PUBLIC_PAYLOAD_FIELDS
+    )
+    for entry in statuses:
+        index = entry["index"]
+        changed = old_entries.get(index) != entry
+        public_changed = public_changed or changed
+        if rewrite_all or not same_expiry or changed:
+            view.set(INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index),
+                     encode_document(_inquiry_doc(job_id, entry, expires_at),
+                                     codec))
+    for index in set(stored or []) - set(indexes):
+        view.delete(INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index))
+    if previous is not None and public_changed:
+        new_control["public_version"] = previous.public_version + 1
+    new_control["payload_expires_at"] = expires_at
+    new_control["inquiry_indexes"] = indexes
+    view.set(JOBS_COLLECTION, job_id, new_control)
+    if rewrite_all or old_base != base:
+        view.set(PAYLOADS_COLLECTION, job_id, encode_document(base, codec))
+
+
+def _delete_payload_docs(
+    view: TransactionView, job_id: str, indexes: Optional[list[int]],
+) -> None:
+    """Borra el payload y TODOS sus subdocumentos de inquiry."""
+    view.delete(PAYLOADS_COLLECTION, job_id)
+    for index in indexes or []:
+        view.delete(INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index))
+
+
 class TicketJobRepository:
     """Operaciones de negocio sobre jobs durables. Stateless: puede haber
     una instancia por proceso/instancia de Cloud Run compartiendo backend."""
@@ -625,16 +1268,27 @@ class TicketJobRepository:
         retention_days: int = 90,
         max_outstanding: int = 25,
         rate_limit_per_minute: int = 0,
+        payload_codec: str = CODEC_NONE,
+        counter_shards: int = 1,
     ) -> None:
+        if payload_codec not in SUPPORTED_CODECS:
+            raise TicketJobError(f"payload_codec inválido: {payload_codec}")
+        if counter_shards < 1:
+            raise TicketJobError("counter_shards debe ser >= 1")
         self.backend = backend
         self._retention = timedelta(days=max(retention_days, 90))
         self._max_outstanding = max_outstanding
         self._rate_limit = rate_limit_per_minute
+        # Codec de escritura de payload/inquiries; la lectura decodifica
+        # cualquier documento según su tag (ver payload_codec).
+        self._payload_codec = payload_codec
+        self._counter_shards = counter_shards
         # Load-shedding local por el documento caliente de cuota/ventana. La
         # transacción Firestore sigue siendo la autoridad entre instancias;
-        # este single-flight evita que hasta 80 requests de una misma instancia
-        # entren juntas a bloquear el mismo counter/receipt y agoten los cinco
-        # reintentos nativos del SDK.
+        # este single-flight (por principal y shard de admisión) evita que
+        # hasta 80 requests de una misma instancia entren juntas a bloquear
+        # el mismo counter/receipt y agoten los cinco reintentos nativos del
+        # SDK.
         self._admission_locks_guard = asyncio.Lock()
         self._admission_locks: dict[str, tuple[asyncio.Lock, int]] = {}
 
@@ -691,7 +1345,14 @@ class TicketJobRepository:
             tenant_id=candidate.tenant_id,
             tenant_id_hash=candidate.tenant_id_hash,
         )
-        candidate = candidate.model_copy(update={"idempotency_key_hash": idem_hash})
+        n_shards = self._counter_shards
+        # Con key, los reintentos de un mismo evento caen en el mismo shard
+        # (y el mismo single-flight) que el original.
+        first_shard = _slot_shard(idem_hash or candidate.job_id, n_shards)
+        probe_order = [(first_shard + i) % n_shards for i in range(n_shards)]
+        candidate = candidate.model_copy(update={
+            "idempotency_key_hash": idem_hash,
+        })
         p_hash = principal_hash(principal_id)
         now = utcnow()
 
@@ -717,41 +1378,63 @@ class TicketJobRepository:
                             # cualquier binding incompatible es CONFLICT y no
                             # consume cuota ni crea/replaya un job.
                             return None, CreateOrGetOutcome.CONFLICT
-                        payload = await view.get(PAYLOADS_COLLECTION,
-                                                 receipt["job_id"])
+                        payload = await _read_payload(
+                            view.get_all, receipt["job_id"], control,
+                        )
                         return (_record_to_doc(_join(control, payload, now)),
                                 CreateOrGetOutcome.REPLAYED)
                     raise IdempotencyReceiptOrphaned(
                         f"receipt huérfano para job {receipt['job_id']}"
                     )
 
-            # 2) cuotas atómicas SOLO para jobs nuevos
+            # 2) cuotas atómicas SOLO para jobs nuevos: el primer shard con
+            # cuota libre; sólo se leen más shards si el propio está lleno.
             if self._rate_limit > 0:
                 window = int(now.timestamp()) // _RATE_WINDOW_S
-                window_id = f"{p_hash}:{window}"
-                rate_doc = await view.get(RATE_WINDOWS_COLLECTION, window_id)
-                count = (rate_doc or {}).get("count", 0)
-                if count >= self._rate_limit:
+                rate_shard: Optional[int] = None
+                rate_count = 0
+                for i in probe_order:
+                    doc = await view.get(RATE_WINDOWS_COLLECTION,
+                                         _window_shard_id(p_hash, window, i))
+                    rate_count = (doc or {}).get("count", 0)
+                    if rate_count < _shard_quota(self._rate_limit, n_shards, i):
+                        rate_shard = i
+                        break
+                if rate_shard is None:
                     remaining = _RATE_WINDOW_S - (int(now.timestamp()) % _RATE_WINDOW_S)
                     raise RateWindowExceeded(max(1, remaining))
-                view.set(RATE_WINDOWS_COLLECTION, window_id, {
-                    "principal_hash": p_hash,
-                    "window": window,
-                    "count": count + 1,
-                    "expires_at": now + _RATE_WINDOW_TTL,
-                })
-
-            counter = await view.get(COUNTERS_COLLECTION, p_hash) or {
-                "principal_hash": p_hash, "active_jobs": 0,
-            }
-            if self._max_outstanding > 0 \
-                    and counter["active_jobs"] >= self._max_outstanding:
-                raise QuotaExceeded(counter["active_jobs"])
+                view.set(RATE_WINDOWS_COLLECTION,
+                         _window_shard_id(p_hash, window, rate_shard), {
+                             "principal_hash": p_hash,
+                             "window": window,
+                             "count": rate_count + 1,
+                             "expires_at": now + _RATE_WINDOW_TTL,
+                         })
+
+            shard: Optional[int] = None
+            counter: Optional[Document] = None
+            full = 0
+            for i in probe_order:
+                counter = await view.get(
+                    COUNTERS_COLLECTION, _counter_shard_id(p_hash, i),
+                )
+                active = (counter or {}).get("active_jobs", 0)
+                if self._max_outstanding <= 0 or active < _shard_quota(
+                        self._max_outstanding, n_shards, i):
+                    shard = i
+                    break
+                full += active
+            if shard is None:
+                raise QuotaExceeded(full)
+            counter = counter or {"principal_hash": p_hash, "active_jobs": 0}
 
             # 3) creación conjunta: control + payload + receipt + contador
-            control, payload = split_record(candidate)
-            view.set(JOBS_COLLECTION, candidate.job_id, control)
-            view.set(PAYLOADS_COLLECTION, candidate.job_id, payload)
+            control, payload = split_record(
+                candidate.model_copy(update={"active_slot_shard": shard})
+            )
+            _stage_job_docs(view, candidate.job_id, previous=None,
+                            payload=None, new_control=control,
+                            new_payload=payload, codec=self._payload_codec)
             if idem_hash is not None:
                 view.set(RECEIPTS_COLLECTION, idem_hash, {
                     "job_id": candidate.job_id,
@@ -765,16 +1448,18 @@ class TicketJobRepository:
                 })
             counter["active_jobs"] += 1
             counter["updated_at"] = now
-            view.set(COUNTERS_COLLECTION, p_hash, counter)
+            view.set(COUNTERS_COLLECTION, _counter_shard_id(p_hash, shard),
+                     counter)
             return (_record_to_doc(_join(control, payload, now)),
                     CreateOrGetOutcome.CREATED)
 
-        admission_lock = await self._retain_admission_lock(p_hash)
+        lock_key = _counter_shard_id(p_hash, first_shard)
+        admission_lock = await self._retain_admission_lock(lock_key)
         try:
             async with admission_lock:
                 doc, outcome = await self.backend.transact(_txn)
         finally:
-            await self._release_admission_lock(p_hash, admission_lock)
+            await self._release_admission_lock(lock_key, admission_lock)
         return (_doc_to_record(doc) if doc is not None else None), outcome
 
     async def peek_idempotent(
@@ -808,8 +1493,9 @@ class TicketJobRepository:
                 tenant_id_hash=None,
             ),
         )
-        payload = await self.backend.get_doc(PAYLOADS_COLLECTION,
-                                             receipt["job_id"])
+        payload = await _read_payload(
+            self.backend.get_docs, receipt["job_id"], control,
+        )
         return "replay", _join(control, payload)
 
     # ------------------------------------------------------------------
@@ -829,7 +1515,7 @@ class TicketJobRepository:
         control = await self.backend.get_doc(JOBS_COLLECTION, job_id)
         if control is None:
             return None, False
-        payload = await self.backend.get_doc(PAYLOADS_COLLECTION, job_id)
+        payload = await _read_payload(self.backend.get_docs, job_id, control)
         observed_at = utcnow()
         live_payload = _live_payload(payload, observed_at)
         return (
@@ -837,6 +1523,13 @@ class TicketJobRepository:
             live_payload is not None,
         )
 
+    async def get_control(self, job_id: str) -> Optional[TicketJobRecord]:
+        """Sólo el control doc: sin payload ni inquiries (``per_inquiry_status``
+        y demás campos de payload quedan en su default). Basta para
+        autorizar, para el ETag del poll y para saber si el payload vive."""
+        control = await self.backend.get_doc(JOBS_COLLECTION, job_id)
+        return _doc_to_record(control) if control is not None else None
+
     async def get_authorized(self, job_id: str,
                              principal_id: str) -> Optional[TicketJobRecord]:
         """None tanto si no existe como si pertenece a otro principal; el
@@ -846,18 +1539,76 @@ class TicketJobRepository:
             return None
         return record
 
+    async def wait_for_terminal(
+        self,
+        job_id: str,
+        budget_s: float,
+        *,
+        fallback_poll_max_s: float = 1.0,
+    ) -> Optional[TicketJobRecord]:
+        """Espera push del terminal (adapter v1). Nunca bloquea más allá del
+        budget; devuelve el último record leído."""
+        return await self.wait_until(
+            job_id,
+            budget_s,
+            lambda record: record is not None
+            and record.state in TERMINAL_STATES,
+            fallback_poll_max_s=fallback_poll_max_s,
+        )
+
+    async def wait_until(
+        self,
+        job_id: str,
+        budget_s: float,
+        predicate: Callable[[Optional[TicketJobRecord]], bool],
+        *,
+        fallback_poll_max_s: float = 1.0,
+        control_only: bool = False,
+    ) -> Optional[TicketJobRecord]:
+        """Espera hasta que ``predicate(record)`` o venza el budget.
+
+        Sólo relee cuando el backend avisa un cambio del control doc. El poll
+        con backoff (100 ms → ``fallback_poll_max_s``) queda como red de
+        seguridad si el listener no está o se cae; el watch se registra ANTES
+        de la primera lectura para no perder un cambio intermedio. Con
+        ``control_only`` cada relectura es ``get_control``.
+        """
+        read = self.get_control if control_only else self.get
+        deadline = time.monotonic() + max(budget_s, 0.0)
+        interval = 0.1
+        async with self.backend.watch_doc(JOBS_COLLECTION, job_id) as changed:
+            while True:
+                changed.clear()
+                record = await read(job_id)
+                if predicate(record):
+                    return record
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return record
+                try:
+                    await asyncio.wait_for(
+                        changed.wait(), timeout=min(remaining, interval)
+                    )
+                except asyncio.TimeoutError:
+                    interval = min(interval * 2, fallback_poll_max_s)
+
     # ------------------------------------------------------------------
     # Actualización con máquina de estados + liberación de cuota
     # ------------------------------------------------------------------
 
     async def update(self, job_id: str, *, state: Optional[TicketJobState] = None,
                      expected_lease_epoch: Optional[int] = None,
+                     renew_lease_s: Optional[float] = None,
                      **changes: Any) -> TicketJobRecord:
+        """Escritura con máquina de estados. Con ``expected_lease_epoch`` +
+        ``renew_lease_s`` la misma transacción renueva el lease (heartbeat
+        coalescido) salvo que el job terminalice."""
+
         async def _txn(view: TransactionView) -> tuple[Document, bool]:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             now = utcnow()
             live_payload = _live_payload(payload, now)
             record = _join(control, live_payload, now)
@@ -926,6 +1677,13 @@ class TicketJobRepository:
                         updates["elapsed_s"] = round(
                             (now - record.created_at).total_seconds(), 2
                         )
+            if renew_lease_s is not None and expected_lease_epoch is not None \
+                    and updates.get("state", record.state) \
+                    not in TERMINAL_STATES \
+                    and "lease_expires_at" not in changes:
+                updates["lease_expires_at"] = now + timedelta(
+                    seconds=renew_lease_s
+                )
             updates["updated_at"] = now
             merged = record.model_copy(update=updates)
 
@@ -945,26 +1703,23 @@ class TicketJobRepository:
                 # liberación exactamente-una-vez del slot de cuota
                 if not record.active_slot_released:
                     new_control["active_slot_released"] = True
-                    p_hash = principal_hash(record.principal_id)
-                    counter = await view.get(COUNTERS_COLLECTION, p_hash)
-                    if counter is not None:
-                        counter["active_jobs"] = max(
-                            0, counter["active_jobs"] - 1)
-                        counter["updated_at"] = now
-                        if counter["active_jobs"] == 0:
-                            view.delete(COUNTERS_COLLECTION, p_hash)
-                        else:
-                            view.set(COUNTERS_COLLECTION, p_hash, counter)
+                    await _release_active_slot(view, record, now)
             elif record.state in TERMINAL_STATES and control.get("expires_at"):
                 new_control["expires_at"] = control["expires_at"]
 
-            view.set(JOBS_COLLECTION, job_id, new_control)
             # Un payload lógica/físicamente expirado NO se recrea, incluso si
             # el caller intentó introducir nuevos cambios de payload.
             if live_payload is not None:
-                view.set(PAYLOADS_COLLECTION, job_id, new_payload)
-            elif payload is not None:
-                view.delete(PAYLOADS_COLLECTION, job_id)
+                _stage_job_docs(view, job_id, previous=record,
+                                payload=live_payload, new_control=new_control,
+                                new_payload=new_payload,
+                                codec=self._payload_codec)
+            else:
+                if payload is not None:
+                    _delete_payload_docs(view, job_id, record.inquiry_indexes)
+                    new_control["inquiry_indexes"] = []
+                new_control["payload_expires_at"] = None
+                view.set(JOBS_COLLECTION, job_id, new_control)
             return _record_to_doc(
                 _join(new_control, new_payload, now)
             ), False
@@ -978,19 +1733,34 @@ class TicketJobRepository:
 
     async def record_inquiry_result(self, job_id: str, index: int,
                                     entry: Dict[str, Any],
-                                    *, lease_epoch: Optional[int] = None
+                                    *, lease_epoch: Optional[int] = None,
+                                    renew_lease_s: Optional[float] = None,
                                     ) -> TicketJobRecord:
         """Checkpoint por inquiry: persiste inmediatamente (HT-08). Con
         ``lease_epoch`` la escritura es condicional: un worker fenced no
-        puede checkpointear (Tarea 6 Paso 4a)."""
+        puede checkpointear (Tarea 6 Paso 4a). ``renew_lease_s`` renueva el
+        lease en la MISMA transacción y ahorra el heartbeat del intervalo.
+
+        O(1) por checkpoint: un único ``get_all`` lee el control, el doc de
+        payload (sólo su parte fija, que gobierna la vigencia) y el
+        subdocumento de ESTA inquiry; se escriben sólo el control y ese
+        subdocumento. El payload lógico nunca se ensambla, así que el record
+        devuelto no trae ``per_inquiry_status`` (usar ``get``). Un job del
+        layout previo migra completo en su primer checkpoint."""
 
         async def _txn(
             view: TransactionView,
         ) -> tuple[Optional[Document], bool]:
-            control = await view.get(JOBS_COLLECTION, job_id)
+            control, raw_payload, raw_inquiry = await view.get_all([
+                (JOBS_COLLECTION, job_id),
+                (PAYLOADS_COLLECTION, job_id),
+                (INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index)),
+            ])
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            # el layout previo embebe sus checkpoints en el doc de payload
+            legacy = control.get("inquiry_indexes") is None
+            payload = decode_document(raw_payload)
             now = utcnow()
             live_payload = _live_payload(payload, now)
             record = _join(control, live_payload, now)
@@ -1026,12 +1796,55 @@ class TicketJobRepository:
                     raise StaleLeaseEpoch(
                         f"job {job_id}: lease vencido o sin owner"
                     )
-            merged = build_validated_inquiry_checkpoint(record, index, entry)
-            new_control, new_payload = split_record(merged)
-            if record.state in TERMINAL_STATES and control.get("expires_at"):
-                new_control["expires_at"] = control["expires_at"]
-            view.set(JOBS_COLLECTION, job_id, new_control)
-            view.set(PAYLOADS_COLLECTION, job_id, new_payload)
+            if legacy:
+                merged = build_validated_inquiry_checkpoint(
+                    record, index, entry,
+                )
+                new_control, new_payload = split_record(merged)
+            else:
+                existing = decode_document(raw_inquiry)
+                previous = existing.get("entry") if existing else None
+                if not isinstance(previous, dict):
+                    previous = None
+                checkpoint = _merge_effect_checkpoint(
+                    previous, entry, index=index,
+                )
+                indexes = _inquiry_indexes(
+                    [{"index": i} for i in control["inquiry_indexes"]
+                     if i != index] + [checkpoint]
+                )
+                merged = record.model_copy(update={
+                    "processed_inquiries": record.processed_inquiries
+                    - _is_processed(previous) + _is_processed(checkpoint),
+                    "public_version": record.public_version
+                    + int(previous != checkpoint),
+                })
+                new_control, new_payload = split_record(merged)
+            # El checkpoint cambia la vista pública: updated_at alimenta el
+            # ETag del poll y despierta a los long-polls.
+            new_control["updated_at"] = now
+            if lease_epoch is not None and renew_lease_s is not None:
+                new_control["lease_expires_at"] = now + timedelta(
+                    seconds=renew_lease_s
+                )
+            if legacy:
+                _stage_job_docs(view, job_id, previous=record,
+                                payload=live_payload, new_control=new_control,
+                                new_payload=new_payload,
+                                codec=self._payload_codec)
+            else:
+                new_control["inquiry_indexes"] = indexes
+                new_control["payload_expires_at"] = live_payload.get("expires_at")
+                view.set(
+                    INQUIRIES_COLLECTION, _inquiry_doc_id(job_id, index),
+                    encode_document(
+                        _inquiry_doc(job_id, checkpoint,
+                                     live_payload.get("expires_at")),
+                        self._payload_codec,
+                    ),
+                )
+                view.set(JOBS_COLLECTION, job_id, new_control)
+            new_payload.pop("per_inquiry_status", None)
             return _record_to_doc(
                 _join(new_control, new_payload, now)
             ), False
@@ -1076,7 +1889,7 @@ class TicketJobRepository:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             now = utcnow()
             live_payload = _live_payload(payload, now)
             if live_payload is None:
@@ -1138,8 +1951,10 @@ class TicketJobRepository:
                     "updated_at": now,
                 })
                 new_control, new_payload = split_record(merged)
-                view.set(JOBS_COLLECTION, job_id, new_control)
-                view.set(PAYLOADS_COLLECTION, job_id, new_payload)
+                _stage_job_docs(view, job_id, previous=record,
+                                payload=live_payload, new_control=new_control,
+                                new_payload=new_payload,
+                                codec=self._payload_codec)
 
             if matching_intent is not None:
                 stored_fingerprint = matching_intent.get("request_fingerprint")
@@ -1228,7 +2043,7 @@ class TicketJobRepository:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             now = utcnow()
             live_payload = _live_payload(payload, now)
             record = _join(control, live_payload, now)
@@ -1306,8 +2121,10 @@ class TicketJobRepository:
                 "updated_at": now,
             })
             new_control, new_payload = split_record(merged)
-            view.set(JOBS_COLLECTION, job_id, new_control)
-            view.set(PAYLOADS_COLLECTION, job_id, new_payload)
+            _stage_job_docs(view, job_id, previous=record,
+                            payload=live_payload, new_control=new_control,
+                            new_payload=new_payload,
+                            codec=self._payload_codec)
             return True, False
 
         reserved, payload_expired = await self.backend.transact(_txn)
@@ -1343,7 +2160,7 @@ class TicketJobRepository:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             now = utcnow()
             live_payload = _live_payload(payload, now)
             if live_payload is None:
@@ -1419,8 +2236,10 @@ class TicketJobRepository:
             new_control, new_payload = split_record(merged)
             if record.state in TERMINAL_STATES and control.get("expires_at"):
                 new_control["expires_at"] = control["expires_at"]
-            view.set(JOBS_COLLECTION, job_id, new_control)
-            view.set(PAYLOADS_COLLECTION, job_id, new_payload)
+            _stage_job_docs(view, job_id, previous=record,
+                            payload=live_payload, new_control=new_control,
+                            new_payload=new_payload,
+                            codec=self._payload_codec)
             return _record_to_doc(_join(new_control, new_payload, now)), False
 
         doc, payload_expired = await self.backend.transact(_txn)
@@ -1475,14 +2294,15 @@ class TicketJobRepository:
         condicional posterior."""
 
         async def _txn(view: TransactionView) -> Optional[int]:
-            control = await view.get(JOBS_COLLECTION, job_id)
+            control, payload = await view.get_all([
+                (JOBS_COLLECTION, job_id), (PAYLOADS_COLLECTION, job_id),
+            ])
             if control is None:
                 return None
             record = _doc_to_record(control)
             now = utcnow()
             if record.state in TERMINAL_STATES:
                 return None
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
             live_payload = _live_payload(payload, now)
             if live_payload is None:
                 await self._stage_terminalization(
@@ -1498,7 +2318,8 @@ class TicketJobRepository:
                     now=now,
                 )
                 if payload is not None:
-                    view.delete(PAYLOADS_COLLECTION, job_id)
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
                 return None
             if expected_generation is not None \
                     and record.enqueue_generation != expected_generation:
@@ -1548,12 +2369,14 @@ class TicketJobRepository:
         """Heartbeat: renueva el lease sólo si owner+epoch siguen vigentes."""
 
         async def _txn(view: TransactionView) -> bool:
-            control = await view.get(JOBS_COLLECTION, job_id)
+            # control + parte fija del payload (vigencia) en un round trip
+            control, payload = await view.get_all([
+                (JOBS_COLLECTION, job_id), (PAYLOADS_COLLECTION, job_id),
+            ])
             if control is None:
                 return False
             record = _doc_to_record(control)
             now = utcnow()
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
             live_payload = _live_payload(payload, now)
             if record.state not in TERMINAL_STATES \
                     and live_payload is None:
@@ -1570,7 +2393,8 @@ class TicketJobRepository:
                     now=now,
                 )
                 if payload is not None:
-                    view.delete(PAYLOADS_COLLECTION, job_id)
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
                 return False
             if record.state in TERMINAL_STATES \
                     or record.lease_epoch != lease_epoch \
@@ -1612,7 +2436,7 @@ class TicketJobRepository:
                 raise JobNotFound(job_id)
             record = _doc_to_record(control)
             now = utcnow()
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             live_payload = _live_payload(payload, now)
             if record.state not in TERMINAL_STATES \
                     and live_payload is None:
@@ -1629,7 +2453,8 @@ class TicketJobRepository:
                     now=now,
                 )
                 if payload is not None:
-                    view.delete(PAYLOADS_COLLECTION, job_id)
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
                 return terminal
             if record.enqueue_generation != expected_generation:
                 raise StaleEnqueueGeneration(
@@ -1688,7 +2513,8 @@ class TicketJobRepository:
                     now=now,
                 )
                 if payload is not None:
-                    view.delete(PAYLOADS_COLLECTION, job_id)
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
                 return None, True
             new_generation = record.enqueue_generation + 1
             control["enqueue_generation"] = new_generation
@@ -1704,6 +2530,116 @@ class TicketJobRepository:
             )
         return generation
 
+    async def park_for_forusbots_callback(
+        self,
+        job_id: str,
+        *,
+        lease_epoch: int,
+        resume_after_s: float,
+    ) -> TicketJobRecord:
+        """Estaciona un job cuyo scrape quedó diferido al callback ForusBots.
+
+        Condicional al epoch (como cualquier escritura del worker): running →
+        queued sin lease ni task vivo. Si el callback llegó durante ESTE
+        intento (antes de estacionar), el job queda vencido de inmediato para
+        que el próximo pase del reconciliador lo despierte sin esperar.
+        """
+
+        async def _txn(view: TransactionView) -> tuple[Optional[Document], bool]:
+            control = await view.get(JOBS_COLLECTION, job_id)
+            if control is None:
+                raise JobNotFound(job_id)
+            record = _doc_to_record(control)
+            now = utcnow()
+            payload = await _read_payload(view.get_all, job_id, control)
+            live_payload = _live_payload(payload, now)
+            if record.state not in TERMINAL_STATES and live_payload is None:
+                await self._stage_terminalization(
+                    view,
+                    job_id,
+                    record,
+                    None,
+                    state=TicketJobState.FAILED,
+                    next_action=NextAction.USE_LEGACY_OR_HUMAN,
+                    public_error_code="EXPIRED_PAYLOAD",
+                    retryable=False,
+                    current_step="done",
+                    now=now,
+                )
+                if payload is not None:
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
+                return None, True
+            if record.state != TicketJobState.RUNNING \
+                    or record.lease_epoch != lease_epoch \
+                    or record.lease_owner is None \
+                    or record.lease_expires_at is None \
+                    or now >= record.lease_expires_at:
+                raise StaleLeaseEpoch(
+                    f"job {job_id}: lease no vigente para estacionar"
+                )
+            callback_seen = (
+                record.forusbots_callback_at is not None
+                and record.claimed_at is not None
+                and record.forusbots_callback_at >= record.claimed_at
+            )
+            control["state"] = TicketJobState.QUEUED.value
+            control["enqueue_state"] = PARKED_ENQUEUE_STATE
+            control["forusbots_resume_at"] = (
+                now if callback_seen
+                else now + timedelta(seconds=resume_after_s)
+            )
+            control["forusbots_callback_at"] = None
+            control["current_step"] = "awaiting_forusbots"
+            control["retryable"] = True
+            for key in ("claimed_by", "claimed_at", "lease_owner",
+                        "lease_expires_at"):
+                control[key] = None
+            control["updated_at"] = now
+            view.set(JOBS_COLLECTION, job_id, control)
+            return _record_to_doc(_join(control, live_payload, now)), False
+
+        doc, payload_expired = await self.backend.transact(_txn)
+        if payload_expired or doc is None:
+            raise StaleLeaseEpoch(f"job {job_id}: payload expirado o ausente")
+        return _doc_to_record(doc)
+
+    async def wake_parked_job(
+        self, job_id: str, *, from_callback: bool = False,
+    ) -> Optional[int]:
+        """Despierta un job estacionado quemando una generación de outbox.
+
+        Devuelve la generación nueva (``pending``) que el caller debe encolar,
+        o None si el job no estaba estacionado. ``from_callback`` anota el
+        callback en un job aún running para que el park posterior no espere
+        al safety net del reconciliador.
+        """
+
+        async def _txn(view: TransactionView) -> Optional[int]:
+            control = await view.get(JOBS_COLLECTION, job_id)
+            if control is None:
+                return None
+            record = _doc_to_record(control)
+            if record.state in TERMINAL_STATES:
+                return None
+            now = utcnow()
+            if record.state != TicketJobState.QUEUED \
+                    or record.enqueue_state != PARKED_ENQUEUE_STATE:
+                if from_callback and record.state == TicketJobState.RUNNING:
+                    control["forusbots_callback_at"] = now
+                    view.set(JOBS_COLLECTION, job_id, control)
+                return None
+            new_generation = record.enqueue_generation + 1
+            control["enqueue_generation"] = new_generation
+            control["enqueue_state"] = "pending"
+            control["forusbots_resume_at"] = None
+            control["forusbots_callback_at"] = None
+            control["updated_at"] = now
+            view.set(JOBS_COLLECTION, job_id, control)
+            return new_generation
+
+        return await self.backend.transact(_txn)
+
     async def acquire_recovery_lock(self, job_id: str, *, owner: str,
                                     lock_s: float = 120.0) -> bool:
         """Lock del RECONCILIADOR, separado del lease de ejecución del worker
@@ -1798,7 +2734,8 @@ class TicketJobRepository:
                     now=now,
                 )
                 if payload is not None:
-                    view.delete(PAYLOADS_COLLECTION, job_id)
+                    _delete_payload_docs(view, job_id,
+                                         record.inquiry_indexes)
                 return None
             control["lease_epoch"] = record.lease_epoch + 1
             control["lease_owner"] = None
@@ -1869,24 +2806,21 @@ class TicketJobRepository:
 
         if not record.active_slot_released:
             new_control["active_slot_released"] = True
-            p_hash = principal_hash(record.principal_id)
-            counter = await view.get(COUNTERS_COLLECTION, p_hash)
-            if counter is not None:
-                counter["active_jobs"] = max(
-                    0, counter["active_jobs"] - 1,
-                )
-                counter["updated_at"] = now
-                if counter["active_jobs"] == 0:
-                    view.delete(COUNTERS_COLLECTION, p_hash)
-                else:
-                    view.set(COUNTERS_COLLECTION, p_hash, counter)
+            await _release_active_slot(view, record, now)
 
-        view.set(JOBS_COLLECTION, job_id, new_control)
         live_payload = _live_payload(payload, now)
         if live_payload is not None:
-            view.set(PAYLOADS_COLLECTION, job_id, new_payload)
-        elif payload is not None:
-            view.delete(PAYLOADS_COLLECTION, job_id)
+            _stage_job_docs(view, job_id, previous=record,
+                            payload=live_payload, new_control=new_control,
+                            new_payload=new_payload,
+                            codec=self._payload_codec)
+        else:
+            # los callers con payload ausente/expirado borran sus documentos
+            new_control["inquiry_indexes"] = []
+            new_control["payload_expires_at"] = None
+            if payload is not None:
+                _delete_payload_docs(view, job_id, record.inquiry_indexes)
+            view.set(JOBS_COLLECTION, job_id, new_control)
         return _record_to_doc(_join(new_control, new_payload, now))
 
     async def terminalize_if_unrecoverable(
@@ -1908,7 +2842,7 @@ class TicketJobRepository:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 return None
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             live_payload = _live_payload(payload, observed_at)
             record = _join(control, live_payload, observed_at)
             if record.state in TERMINAL_STATES:
@@ -1937,7 +2871,7 @@ class TicketJobRepository:
                 now=observed_at,
             )
             if payload is not None and live_payload is None:
-                view.delete(PAYLOADS_COLLECTION, job_id)
+                _delete_payload_docs(view, job_id, record.inquiry_indexes)
             return terminal
 
         doc = await self.backend.transact(_txn)
@@ -1974,7 +2908,7 @@ class TicketJobRepository:
             control = await view.get(JOBS_COLLECTION, job_id)
             if control is None:
                 raise JobNotFound(job_id)
-            payload = await view.get(PAYLOADS_COLLECTION, job_id)
+            payload = await _read_payload(view.get_all, job_id, control)
             live_payload = _live_payload(payload, observed_at)
             record = _join(control, live_payload, observed_at)
             now = utcnow()
@@ -2016,7 +2950,7 @@ class TicketJobRepository:
                 now=now,
             )
             if payload is not None and live_payload is None:
-                view.delete(PAYLOADS_COLLECTION, job_id)
+                _delete_payload_docs(view, job_id, record.inquiry_indexes)
             return terminal
 
         return _doc_to_record(await self.backend.transact(_txn))
@@ -2067,12 +3001,67 @@ class TicketJobRepository:
             await self.backend.transact(_advance_cursor)
         return docs
 
+    async def scan_reconcile_candidates(
+        self,
+        limit: int = 100,
+        *,
+        now: Optional[datetime] = None,
+        sweep: bool = True,
+    ) -> ScanPage:
+        """Página del reconciliador: jobs VENCIDOS primero, luego el cursor.
+
+        Leases vencidos, deadlines absolutos pasados y outbox ``pending``
+        salen de consultas indexadas (``RECONCILE_INDEXES``), así el tiempo
+        hasta la reparación no depende de cuántos jobs sanos hay delante en
+        orden de ID. Al menos un quinto de la página sigue siendo el barrido
+        circular de ``scan_control_docs``: cubre los casos sin índice
+        (estacionados, ``enqueued`` sin task vivo) y nunca queda sin avanzar.
+        Con ``sweep=False`` la página es sólo de vencidos (las páginas
+        siguientes de un mismo tick no vuelven a mover el cursor).
+        """
+        now = now or utcnow()
+        queued = TicketJobState.QUEUED.value
+        running = TicketJobState.RUNNING.value
+        reserve = max(1, limit // 5) if sweep else 0
+        due_limit = max(1, limit - reserve)
+        due: ScanPage = []
+        seen: set[str] = set()
+        for equals, order_by, before in (
+            ({"state": [running]}, "lease_expires_at", now),
+            ({"state": [queued, running]}, "job_deadline_at", now),
+            ({"enqueue_state": ["pending"], "state": [queued]},
+             "created_at", None),
+        ):
+            if len(due) >= due_limit:
+                break
+            page = await self.backend.query_ordered(
+                JOBS_COLLECTION,
+                due_limit - len(due),
+                equals=equals,
+                order_by=order_by,
+                before=before,
+            )
+            for job_id, doc in page:
+                if job_id not in seen:
+                    seen.add(job_id)
+                    due.append((job_id, doc))
+        if not sweep:
+            return due
+        swept = await self.scan_control_docs(
+            limit=max(reserve, limit - len(due)),
+        )
+        return due + [(job_id, doc) for job_id, doc in swept
+                      if job_id not in seen]
+
     async def count_active(self, principal_id: str) -> int:
         """Jobs no-terminales del principal desde el contador transaccional
         (Tarea 5 Paso 2): la verdad durable, no un count() no atómico."""
-        counter = await self.backend.get_doc(
-            COUNTERS_COLLECTION, principal_hash(principal_id))
-        return int((counter or {}).get("active_jobs", 0))
+        p_hash = principal_hash(principal_id)
+        counters = await asyncio.gather(*(
+            self.backend.get_doc(COUNTERS_COLLECTION, _counter_shard_id(p_hash, i))
+            for i in range(self._counter_shards)
+        ))
+        return sum(int((doc or {}).get("active_jobs", 0)) for doc in counters)
 
     async def active_job_stats(self) -> tuple[int, Optional[datetime]]:
         """Exact global active count and oldest creation timestamp.
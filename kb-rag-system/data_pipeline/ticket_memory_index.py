@@ -0,0 +1,99 @@
+"""
+Soporte de los backends in-memory de tickets (tests, carga local, cola inline).
+
+Nada de aquí lo usa un backend Firestore: son las estructuras que evitan que
+``InMemoryTicketJobBackend`` / ``InMemoryTicketReviewBackend`` hagan un full
+scan y un ``copy.deepcopy`` por documento en cada consulta.
+
+- :func:`clone_document` copia ESTRUCTURAL: duplica dicts/listas y comparte
+  hojas inmutables (str, int, datetime, bytes...). Los documentos committed
+  son snapshots que el backend nunca muta en sitio (copy-on-write: cada
+  escritura reemplaza el documento entero), así que basta con clonar lo que
+  se entrega al llamador, que sí puede mutarlo antes de re-escribirlo.
+- :class:`BucketIndex` índice secundario hash (bucket) → entradas ordenadas
+  ``(orden, id)`` con inserción/borrado por bisect; cubre tanto igualdad
+  (``state``, ``principal_id``, ``devrev_display_id``) como rangos ordenados
+  (``updated_at``, ids para cursores ``start_after``).
+"""
+
+from __future__ import annotations
+
+import bisect
+import copy
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Generic, Hashable, List, Tuple, TypeVar, cast
+
+_IMMUTABLE_LEAVES = (
+    str, bytes, int, float, bool, type(None),
+    datetime, date, time, timedelta, Decimal,
+)
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+def clone_document(value: T) -> T:
+    """Copia dicts/listas/tuplas recursivamente; comparte hojas inmutables.
+
+    Equivalente observable a ``copy.deepcopy`` para documentos Firestore
+    (mapas, arrays y escalares) sin el coste de memo/``__reduce_ex__`` por
+    cada datetime. Tipos desconocidos caen a ``copy.deepcopy``.
+    """
+    return cast(T, _clone(value))
+
+
+def _clone(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    if isinstance(value, _IMMUTABLE_LEAVES):
+        return value
+    if isinstance(value, tuple):
+        return tuple(_clone(item) for item in value)
+    return copy.deepcopy(value)
+
+
+class BucketIndex(Generic[K]):
+    """Índice secundario: ``bucket`` hashable → ``[(orden, id), ...]`` ordenado.
+
+    Cada id vive como mucho en un bucket; :meth:`put` lo re-indexa y
+    :meth:`discard` lo saca. Las listas devueltas son vistas internas: el
+    llamador no debe mutarlas ni conservarlas a través de un ``await``.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Hashable, List[Tuple[Any, K]]] = {}
+        self._entries: Dict[K, Tuple[Hashable, Tuple[Any, K]]] = {}
+
+    def put(self, doc_id: K, bucket: Hashable, order: Any = ()) -> None:
+        entry = (order, doc_id)
+        current = self._entries.get(doc_id)
+        if current == (bucket, entry):
+            return
+        self.discard(doc_id)
+        bisect.insort(self._buckets.setdefault(bucket, []), entry)
+        self._entries[doc_id] = (bucket, entry)
+
+    def discard(self, doc_id: K) -> None:
+        current = self._entries.pop(doc_id, None)
+        if current is None:
+            return
+        bucket, entry = current
+        items = self._buckets[bucket]
+        position = bisect.bisect_left(items, entry)
+        if position < len(items) and items[position] == entry:
+            del items[position]
+        if not items:
+            del self._buckets[bucket]
+
+    def entries(self, bucket: Hashable) -> List[Tuple[Any, K]]:
+        return self._buckets.get(bucket, [])
+
+    def count(self, bucket: Hashable) -> int:
+        return len(self._buckets.get(bucket, ()))
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._entries.clear()
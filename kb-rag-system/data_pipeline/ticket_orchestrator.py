@@ -35,6 +35,7 @@ from data_pipeline.retrieval_privacy import (
 )
 from data_pipeline.forusbots_client import (
     ForusBotsCircuitOpen,
+    ForusBotsDeferred,
     ForusBotsError,
     ForusBotsJobFailed,
     ForusBotsPollFailed,
@@ -361,6 +362,7 @@ class TicketOrchestrator:
         self._forusbots_submitted_observer: Optional[
             Callable[[str, str], Awaitable[None]]
         ] = None
+        self._forusbots_callback_url: Optional[str] = None
         # ForusBotsClient es singleton de proceso, pero cada orchestrator
         # pertenece a un ticket job. El scope aleatorio impide que caché o
         # in-flight dedupe crucen tickets/tenants con IDs coincidentes.
@@ -382,11 +384,18 @@ class TicketOrchestrator:
         submitted: Callable[[str, str], Awaitable[None]],
         *,
         dedupe_scope: str,
+        callback_url: Optional[str] = None,
     ) -> None:
-        """Install durable per-operation submit/resume hooks for one inquiry."""
+        """Install durable per-operation submit/resume hooks for one inquiry.
+
+        With ``callback_url`` a fresh submit registers the completion callback
+        and the scrape raises ``ForusBotsDeferred`` once its receipt is
+        durable; resumed operations keep polling via ``resume_job``.
+        """
         self._forusbots_prepare_operation = prepare
         self._forusbots_submitted_observer = submitted
         self._forusbots_dedupe_scope = dedupe_scope
+        self._forusbots_callback_url = callback_url
 
     # ------------------------------------------------------------------
     # Step 1 — extraction
@@ -912,6 +921,8 @@ class TicketOrchestrator:
             }
             if self._forusbots_submitted_observer is not None:
                 kwargs["on_submitted"] = self._forusbots_submitted_observer
+                if self._forusbots_callback_url is not None:
+                    kwargs["callback_url"] = self._forusbots_callback_url
             if operation == "participant":
                 return await self.deps.forusbots.scrape_participant(
                     entity_id, operation_modules, **kwargs,
@@ -944,6 +955,10 @@ class TicketOrchestrator:
                 else:
                     status = "ok"
                 return flat, meta, status
+            except ForusBotsDeferred as e:
+                # Not a degradation: the receipt is durable and the whole
+                # inquiry resumes later. Let sibling submits checkpoint first.
+                return {}, {"job_id": e.job_id}, "deferred"
             except ForusBotsTimeout as e:
                 logger.warning(
                     "ForusBots %s timeout code=%s", coro_label, e.code,
@@ -982,6 +997,14 @@ class TicketOrchestrator:
                 "plan", _run_operation("plan", plan_id, plan_modules),
             ))
         results = await asyncio.gather(*tasks) if tasks else []
+        labels = (["participant"] if p_modules else []) + (
+            ["plan"] if plan_modules else []
+        )
+        for label, (_flat, deferred_meta, deferred_status) in zip(
+            labels, results, strict=True,
+        ):
+            if deferred_status == "deferred":
+                raise ForusBotsDeferred(deferred_meta["job_id"], label)
 
         idx = 0
         ppt_flat: Dict[str, Any] = {}
@@ -16,12 +16,17 @@ ejecución que debe reclamar el worker):
    una vez (lo garantiza el repositorio);
 4. terminalizar ``job_deadline_at`` vencido o payload ausente sin recrear
    efectos (las tasks tardías reciben 2xx del worker por generación stale);
-5. emitir métricas sanitizadas (conteos, jamás payloads).
+5. red de seguridad del callback mode ForusBots: despertar jobs estacionados
+   (``awaiting_callback``) cuyo ``forusbots_resume_at`` venció;
+6. emitir métricas sanitizadas (conteos, jamás payloads).
 
 El exit code es 0 sólo si el lote se completó o no había trabajo. El batch
-size (25) es configuración declarada y probada para ambos entornos; cambiarlo
-exige plan/revisión de capacidad. La CLI (scripts/requeue_ticket_job.py)
-queda reservada para incidentes.
+size (25) es el tamaño de página, configuración declarada y probada para
+ambos entornos; cambiarlo exige plan/revisión de capacidad. Una ejecución
+pide páginas de vencidos hasta agotarlos, las repara con ``--concurrency``
+workers y ``--deadline-s`` corta la toma de jobs nuevos antes del timeout
+del Run Job (los pendientes se cuentan ``deferred``). La CLI
+(scripts/requeue_ticket_job.py) queda reservada para incidentes.
 """
 
 from __future__ import annotations
@@ -37,6 +42,7 @@ from typing import Callable, Dict, Optional, Protocol, Sequence
 from api import metrics as ticket_metrics
 
 from data_pipeline.ticket_job_models import (
+    PARKED_ENQUEUE_STATE,
     TERMINAL_STATES,
     NextAction,
     PublicErrorCode,
@@ -57,6 +63,13 @@ logger = logging.getLogger(__name__)
 _monotonic = time.monotonic
 
 DEFAULT_BATCH_SIZE = 25
+# Reparaciones simultáneas por lote: cada una son ~4 RPCs Firestore/Cloud
+# Tasks secuenciales; 8 drena cientos de leases vencidos por tick sin
+# acercarse a las cuotas de escritura de ninguno de los dos servicios.
+DEFAULT_CONCURRENCY = 8
+# El Run Job tiene timeout de 300s: dejar de tomar jobs nuevos con margen
+# para terminar los que están en vuelo y emitir métricas.
+DEFAULT_DEADLINE_S = 240.0
 ENQUEUED_RECHECK_AFTER_S = 60.0
 
 
@@ -76,12 +89,18 @@ class TicketReconciler:
         queue: ReconcilerQueue,
         *,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline_s: Optional[float] = None,
         owner: Optional[str] = None,
         metrics_hook: Optional[Callable[..., None]] = None,
     ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency debe ser >= 1")
         self.repo = repo
         self.queue = queue
         self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.deadline_s = deadline_s
         self.owner = owner or f"reconciler-{uuid.uuid4().hex[:10]}"
         self._metrics_hook = metrics_hook
 
@@ -122,122 +141,48 @@ class TicketReconciler:
             logger.error("active job gauge collection failed")
 
     async def run_once(self) -> Dict[str, int]:
-        """Un lote acotado. Devuelve conteos sanitizados por categoría."""
+        """Drena el backlog vencido. Devuelve conteos sanitizados por categoría.
+
+        La primera página es la de siempre (vencidos + barrido del cursor);
+        mientras quede plazo se piden más páginas sólo de vencidos hasta que
+        una no traiga jobs nuevos en esta ejecución, así cientos de leases
+        vencidos se reparan en un solo tick. Cada página se repara con hasta
+        ``concurrency`` workers simultáneos; cada job sigue protegido por su
+        recovery lock, así que el orden entre jobs no importa. Con
+        ``deadline_s`` los jobs que todavía no empezaron al vencer el plazo
+        quedan ``deferred`` para el próximo tick y no se piden más páginas.
+        """
         started_at = _monotonic()
         counts = {"scanned": 0, "requeued_outbox": 0, "fenced_leases": 0,
                   "deadline_terminalized": 0, "payload_expired": 0,
-                  "skipped_locked": 0, "errors": 0}
-        docs = await self.repo.scan_control_docs(limit=self.batch_size)
+                  "skipped_locked": 0, "resumed_parked": 0, "deferred": 0,
+                  "errors": 0}
         now = utcnow()
-        for job_id, control in docs:
-            counts["scanned"] += 1
-            try:
-                state = control.get("state")
-                if state in {s.value for s in TERMINAL_STATES}:
-                    continue
-                if not await self.repo.acquire_recovery_lock(
-                        job_id, owner=self.owner):
-                    counts["skipped_locked"] += 1
-                    continue
-
-                # 4a) deadline ABSOLUTO vencido → terminaliza sin efectos
-                deadline = control.get("job_deadline_at")
-                if deadline is not None and now > deadline:
-                    await self._terminalize(
-                        job_id, TicketJobState.TIMEOUT,
-                        PublicErrorCode.TOTAL_JOB_TIMEOUT.value,
-                        control=control,
-                        observed_at=now,
-                        expected_deadline_at=deadline,
-                    )
-                    counts["deadline_terminalized"] += 1
-                    continue
-
-                # 4b) payload ausente no terminal → expired_payload, libera y
-                # NO reejecuta (no queda nada que ejecutar)
-                _record, payload_present = (
-                    await self.repo.get_with_payload_state(job_id)
-                )
-                if not payload_present:
-                    await self._terminalize(
-                        job_id, TicketJobState.FAILED, "EXPIRED_PAYLOAD",
-                        control=control,
-                        observed_at=now,
-                        require_payload_missing=True,
-                    )
-                    counts["payload_expired"] += 1
-                    continue
-
-                # 2) lease vencido → fence + requeue con generación nueva
-                lease_expiry = control.get("lease_expires_at")
-                if state == TicketJobState.RUNNING.value \
-                        and lease_expiry is not None and now > lease_expiry:
-                    generation = await self.repo.fence_and_requeue(
-                        job_id,
-                        recovery_owner=self.owner,
-                        expected_lease_epoch=control.get("lease_epoch", 0),
-                        expected_lease_expires_at=lease_expiry,
-                        observed_at=now,
-                    )
-                    if generation is not None:
-                        name = await self.queue.ensure_enqueued(
-                            job_id, generation)
-                        await self.repo.mark_enqueued(
-                            job_id, name, expected_generation=generation,
-                        )
-                        counts["fenced_leases"] += 1
-                    continue
-
-                # 1) outbox pending → re-enqueue por generación
-                if control.get("enqueue_state") == "pending" \
-                        and state == TicketJobState.QUEUED.value:
-                    generation = control.get("enqueue_generation", 0)
-                    name = await self.queue.ensure_enqueued(job_id, generation)
-                    await self.repo.mark_enqueued(
-                        job_id, name, expected_generation=generation,
-                    )
-                    counts["requeued_outbox"] += 1
-                    continue
-
-                # A task confirmed in the past can later be ACKed/deleted or
-                # exhaust retries before it ever claims the job. Recheck only
-                # stale QUEUED records, bounded by this page. A live task is
-                # read-only; genuine NotFound burns a new generation by CAS.
-                if control.get("enqueue_state") == "enqueued" \
-                        and state == TicketJobState.QUEUED.value:
-                    updated_at = control.get("updated_at")
-                    try:
-                        stale_for_s = (
-                            (now - updated_at).total_seconds()
-                            if isinstance(updated_at, datetime)
-                            else ENQUEUED_RECHECK_AFTER_S
-                        )
-                    except TypeError:
-                        stale_for_s = ENQUEUED_RECHECK_AFTER_S
-                    if stale_for_s < ENQUEUED_RECHECK_AFTER_S:
-                        continue
-                    generation = control.get("enqueue_generation", 0)
-                    if await self.queue.task_exists(job_id, generation):
-                        continue
-                    generation = await self.repo.bump_enqueue_generation(
-                        job_id,
-                        expected_generation=generation,
-                        expected_state=TicketJobState.QUEUED,
-                    )
-                    name = await self.queue.ensure_enqueued(job_id, generation)
-                    await self.repo.mark_enqueued(
-                        job_id, name, expected_generation=generation,
-                    )
-                    counts["requeued_outbox"] += 1
-            except (JobNotFound, InvalidStateTransition, StaleLeaseEpoch,
-                    StaleEnqueueGeneration):
-                # otro reconciliador/worker llegó primero: benigno
-                continue
-            except asyncio.CancelledError:
-                raise
-            except Exception:  # noqa: BLE001
-                counts["errors"] += 1
-                logger.error("reconciler falló reparando un ticket job")
+        docs = await self.repo.scan_reconcile_candidates(
+            limit=self.batch_size, now=now,
+        )
+        stop_at = (
+            started_at + self.deadline_s
+            if self.deadline_s is not None else None
+        )
+        seen: set[str] = set()
+        left_behind: set[str] = set()
+        while docs:
+            seen.update(job_id for job_id, _control in docs)
+            repaired = await self._repair_page(docs, now, stop_at, counts)
+            left_behind.update(
+                job_id for job_id, _control in docs if job_id not in repaired
+            )
+            if counts["deferred"]:
+                break
+            # Un job que falló o estaba bloqueado vuelve a salir vencido: se
+            # deja para el próximo tick en vez de reintentarlo en bucle, y la
+            # página se agranda para ver los vencidos que tiene detrás.
+            page = await self.repo.scan_reconcile_candidates(
+                limit=self.batch_size + len(left_behind), now=now, sweep=False,
+            )
+            docs = [(job_id, control) for job_id, control in page
+                    if job_id not in seen]
         self._metric("ticket_reconciler_run", **counts)
         await self._emit_active_gauges(utcnow())
         try:
@@ -249,6 +194,154 @@ class TicketReconciler:
             logger.error("reconciler duration metric rejected")
         return counts
 
+    async def _repair_page(
+        self,
+        docs: Sequence[tuple[str, Document]],
+        now: datetime,
+        stop_at: Optional[float],
+        counts: Dict[str, int],
+    ) -> set[str]:
+        """Repara una página con hasta ``concurrency`` workers; el plazo se
+        revisa antes de empezar cada job. Devuelve los jobs reparados."""
+        pending = iter(docs)
+        repaired: set[str] = set()
+
+        async def _worker() -> None:
+            # Un iterador compartido: cada worker toma el siguiente job al
+            # terminar el anterior (sin await entre next() y el claim).
+            for job_id, control in pending:
+                counts["scanned"] += 1
+                if stop_at is not None and _monotonic() >= stop_at:
+                    counts["deferred"] += 1
+                    continue
+                try:
+                    outcome = await self._reconcile_one(job_id, control, now)
+                except (JobNotFound, InvalidStateTransition, StaleLeaseEpoch,
+                        StaleEnqueueGeneration):
+                    # otro reconciliador/worker llegó primero: benigno
+                    continue
+                except asyncio.CancelledError:
+                    raise
+                except Exception:  # noqa: BLE001
+                    counts["errors"] += 1
+                    logger.error("reconciler falló reparando un ticket job")
+                    continue
+                if outcome is not None:
+                    counts[outcome] += 1
+                    if outcome != "skipped_locked":
+                        repaired.add(job_id)
+
+        workers = min(self.concurrency, len(docs))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return repaired
+
+    async def _reconcile_one(
+        self, job_id: str, control: Document, now: datetime,
+    ) -> Optional[str]:
+        """Repara UN job; devuelve la categoría contada o None si no hizo
+        nada. Las carreras benignas se propagan como excepción."""
+        state = control.get("state")
+        if state in {s.value for s in TERMINAL_STATES}:
+            return None
+        if not await self.repo.acquire_recovery_lock(job_id, owner=self.owner):
+            return "skipped_locked"
+
+        # 4a) deadline ABSOLUTO vencido → terminaliza sin efectos
+        deadline = control.get("job_deadline_at")
+        if deadline is not None and now > deadline:
+            await self._terminalize(
+                job_id, TicketJobState.TIMEOUT,
+                PublicErrorCode.TOTAL_JOB_TIMEOUT.value,
+                control=control,
+                observed_at=now,
+                expected_deadline_at=deadline,
+            )
+            return "deadline_terminalized"
+
+        # 4b) payload ausente no terminal → expired_payload, libera y
+        # NO reejecuta (no queda nada que ejecutar)
+        _record, payload_present = (
+            await self.repo.get_with_payload_state(job_id)
+        )
+        if not payload_present:
+            await self._terminalize(
+                job_id, TicketJobState.FAILED, "EXPIRED_PAYLOAD",
+                control=control,
+                observed_at=now,
+                require_payload_missing=True,
+            )
+            return "payload_expired"
+
+        # 2) lease vencido → fence + requeue con generación nueva
+        lease_expiry = control.get("lease_expires_at")
+        if state == TicketJobState.RUNNING.value \
+                and lease_expiry is not None and now > lease_expiry:
+            generation = await self.repo.fence_and_requeue(
+                job_id,
+                recovery_owner=self.owner,
+                expected_lease_epoch=control.get("lease_epoch", 0),
+                expected_lease_expires_at=lease_expiry,
+                observed_at=now,
+            )
+            if generation is None:
+                return None
+            await self._enqueue(job_id, generation)
+            return "fenced_leases"
+
+        # 5) job estacionado en callback mode: el callback no llegó
+        # (o llegó antes del park) → reanudar desde el receipt.
+        if control.get("enqueue_state") == PARKED_ENQUEUE_STATE \
+                and state == TicketJobState.QUEUED.value:
+            resume_at = control.get("forusbots_resume_at")
+            if isinstance(resume_at, datetime) and now < resume_at:
+                return None
+            generation = await self.repo.wake_parked_job(job_id)
+            if generation is None:
+                return None
+            await self._enqueue(job_id, generation)
+            return "resumed_parked"
+
+        # 1) outbox pending → re-enqueue por generación
+        if control.get("enqueue_state") == "pending" \
+                and state == TicketJobState.QUEUED.value:
+            await self._enqueue(job_id, control.get("enqueue_generation", 0))
+            return "requeued_outbox"
+
+        # A task confirmed in the past can later be ACKed/deleted or
+        # exhaust retries before it ever claims the job. Recheck only
+        # stale QUEUED records, bounded by this page. A live task is
+        # read-only; genuine NotFound burns a new generation by CAS.
+        if control.get("enqueue_state") == "enqueued" \
+                and state == TicketJobState.QUEUED.value:
+            updated_at = control.get("updated_at")
+            try:
+                stale_for_s = (
+                    (now - updated_at).total_seconds()
+                    if isinstance(updated_at, datetime)
+                    else ENQUEUED_RECHECK_AFTER_S
+                )
+            except TypeError:
+                stale_for_s = ENQUEUED_RECHECK_AFTER_S
+            if stale_for_s < ENQUEUED_RECHECK_AFTER_S:
+                return None
+            generation = control.get("enqueue_generation", 0)
+            if await self.queue.task_exists(job_id, generation):
+                return None
+            generation = await self.repo.bump_enqueue_generation(
+                job_id,
+                expected_generation=generation,
+                expected_state=TicketJobState.QUEUED,
+            )
+            await self._enqueue(job_id, generation)
+            return "requeued_outbox"
+        return None
+
+    async def _enqueue(self, job_id: str, generation: int) -> None:
+        name = await self.queue.ensure_enqueued(job_id, generation)
+        await self.repo.mark_enqueued(
+            job_id, name, expected_generation=generation,
+        )
+
     async def _terminalize(
         self,
         job_id: str,
@@ -310,6 +403,8 @@ def _build_from_settings() -> tuple[TicketJobRepository, ReconcilerQueue]:
         retention_days=settings.TICKET_IDEMPOTENCY_RETENTION_DAYS,
         max_outstanding=settings.TICKET_MAX_OUTSTANDING_JOBS,
         rate_limit_per_minute=settings.RATE_LIMIT_HANDLE_TICKET,
+        payload_codec=settings.TICKET_PAYLOAD_CODEC,
+        counter_shards=settings.TICKET_COUNTER_SHARDS,
     )
     queue = CloudTasksTicketQueue(
         project=settings.GCP_PROJECT,
@@ -331,11 +426,24 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("--once", action="store_true", required=True,
                         help="ejecuta exactamente un lote y termina")
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int,
+                        default=DEFAULT_CONCURRENCY,
+                        help="reparaciones simultáneas dentro del lote")
+    parser.add_argument("--deadline-s", type=float,
+                        default=DEFAULT_DEADLINE_S,
+                        help="no empezar jobs nuevos pasado este plazo")
     args = parser.parse_args(argv)
+    if args.batch_size < 1 or args.concurrency < 1 or args.deadline_s <= 0:
+        parser.error("batch-size, concurrency y deadline-s deben ser > 0")
 
     logging.basicConfig(level=logging.INFO)
     repo, queue = _build_from_settings()
-    reconciler = TicketReconciler(repo, queue, batch_size=args.batch_size)
+    reconciler = TicketReconciler(
+        repo, queue,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        deadline_s=args.deadline_s,
+    )
 
     async def _run() -> int:
         try:
@@ -15,8 +15,9 @@ Storage contract (four separate lifetimes, never conflated):
 * ``ticket_reviews/{review_id}/audit_events/{event_id}`` application
   append-only, hash-chained ledger. 2,555-day retention. The repository
   exposes no update or delete path for these.
-* ``devrev_message_cache`` / ``ticket_console_cache`` / ``ticket_import_staging``
-  / ``idempotency_keys`` disposable documents with a native ``expires_at`` TTL.
+* ``devrev_message_cache`` / ``ticket_console_cache`` / ``devrev_ticket_mirror``
+  / ``ticket_import_staging`` / ``idempotency_keys`` disposable documents with
+  a native ``expires_at`` TTL.
   Firestore TTL deletion is asynchronous and therefore cleanup-only, so an
   elapsed document is already absent at every application boundary here.
 * ``remediation_batches`` / ``ticket_imports`` / ``ticket_exports`` durable
@@ -34,16 +35,39 @@ for stored values.
 from __future__ import annotations
 
 import asyncio
-import copy
+import bisect
+import contextlib
+import csv
 import hashlib
+import heapq
+import hmac
+import io
 import json
+import os
+import time
 import unicodedata
 import uuid
-from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Protocol, TypeVar, Union, cast
 
-from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+)
 
 from api.ticket_review_models import (
     AUDIT_RETENTION_DAYS,
@@ -75,6 +99,7 @@ from api.ticket_review_models import (
     BatchStatus,
     CorrelationTrust,
     CursorError,
+    DevRevTicketSummary,
     EvidenceLink,
     ImportState,
     ImportStatus,
@@ -116,6 +141,8 @@ from api.tickets_console_config import (
     STRICT_ENVIRONMENTS,
     resolve_tickets_firestore_database,
 )
+from api import metrics as ticket_metrics
+from data_pipeline.ticket_memory_index import BucketIndex, clone_document
 
 # =====================================================================
 # Collections (master plan, "Firestore layout"). Frozen names.
@@ -131,8 +158,10 @@ IMPORTS_COLLECTION = "ticket_imports"
 IMPORT_ROWS_SUBCOLLECTION = "rows"
 EXPORTS_COLLECTION = "ticket_exports"
 GLOBAL_AUDIT_EVENTS_COLLECTION = "ticket_console_audit_events"
+AUDIT_CHECKPOINTS_COLLECTION = "ticket_console_audit_checkpoints"
 DEVREV_MESSAGE_CACHE_COLLECTION = "devrev_message_cache"
 CONSOLE_CACHE_COLLECTION = "ticket_console_cache"
+DEVREV_TICKET_MIRROR_COLLECTION = "devrev_ticket_mirror"
 IMPORT_STAGING_COLLECTION = "ticket_import_staging"
 IDEMPOTENCY_KEYS_COLLECTION = "idempotency_keys"
 
@@ -142,6 +171,7 @@ TTL_COLLECTIONS = frozenset(
     {
         CONSOLE_CACHE_COLLECTION,
         DEVREV_MESSAGE_CACHE_COLLECTION,
+        DEVREV_TICKET_MIRROR_COLLECTION,
         IMPORT_STAGING_COLLECTION,
         IDEMPOTENCY_KEYS_COLLECTION,
     }
@@ -179,6 +209,13 @@ DOC_KIND_FIELD = "doc_kind"
 # deleted by retention.
 GLOBAL_CHAIN_HEAD_DOC_ID = "__global_chain_head__"
 
+# Verification checkpoints: one signed document per ledger recording the last
+# event a full pass proved linked back to genesis. Resuming from it hashes only
+# the events appended since; ``full=True`` always re-walks from genesis.
+GLOBAL_LEDGER_CHECKPOINT_ID = "global"
+DEFAULT_CHECKPOINT_EVERY = 1_000
+_CHECKPOINT_KEY_LABEL = b"ticket-console-audit-checkpoint-v1"
+
 PURGED_TOMBSTONE_KIND = "purged_tombstone"
 CHAIN_HEAD_KIND = "chain_head"
 # Exactly the six values the master plan allows in a purged parent, plus the
@@ -215,6 +252,7 @@ BATCH_ITEMS_CURSOR_CONTEXT = "tickets-firestore:batch-items:v1"
 AUDIT_EVENTS_CURSOR_CONTEXT = "tickets-firestore:audit-events:v1"
 EVIDENCE_LINKS_CURSOR_CONTEXT = "tickets-firestore:evidence-links:v1"
 IMPORT_ROWS_CURSOR_CONTEXT = "tickets-firestore:import-rows:v1"
+MIRRORED_TICKETS_CURSOR_CONTEXT = "tickets-firestore:devrev-mirror:v1"
 
 # Firestore platform limits. The document limit is a canonical Stage 1 value;
 # the write-count ceiling is Firestore's documented per-transaction/per-batch
@@ -222,6 +260,47 @@ IMPORT_ROWS_CURSOR_CONTEXT = "tickets-firestore:import-rows:v1"
 FIRESTORE_MAX_WRITES_PER_TRANSACTION = 500
 DEFAULT_RETENTION_MAX_DOCUMENTS = 200
 MAX_RETENTION_MAX_DOCUMENTS = 5_000
+# Per-review transactions a multi-review update keeps in flight at once.
+DEFAULT_PATCH_CONCURRENCY = 16
+# Independent documents one retention phase processes at once.
+DEFAULT_RETENTION_CONCURRENCY = 16
+RETENTION_DURATION_MAX_S = 3_600.0
+
+# The DevRev ticket mirror: live ``works.list`` summaries kept for the console's
+# list views, refreshed incrementally from a modified-date watermark. The
+# watermark is a reserved document in the same collection; it carries no
+# MIRROR_ORDER_FIELD, so the ordered list query never returns it. Rows are
+# ordered newest change first by storing the negated modification time.
+DEVREV_SYNC_WATERMARK_DOC_ID = "__sync_watermark__"
+MIRROR_ORDER_FIELD = "mirror_recency"
+
+# An import chunk's summary transaction writes its row documents plus four:
+# the import parent, the global event, the global chain head, and the
+# idempotency receipt. apply/reverse keep their public 100-row chunk; a
+# streamed import packs each summary transaction to the platform limit.
+MAX_IMPORT_CHUNK_ROWS = 100
+_IMPORT_SUMMARY_WRITES = 4
+MAX_STREAM_CHUNK_ROWS = FIRESTORE_MAX_WRITES_PER_TRANSACTION - _IMPORT_SUMMARY_WRITES
+DEFAULT_IMPORT_CONCURRENCY = 4
+
+# Streamed exports: one keyset page of reviews is the only thing held in
+# memory, and serialized rows leave as chunks of about EXPORT_FLUSH_BYTES.
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_FLUSH_BYTES = 64 * 1024
+EXPORT_COLUMNS: tuple[str, ...] = tuple(TicketReview.model_fields)
+# Cells a spreadsheet would evaluate as a formula get a leading apostrophe.
+_CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# Durable progress marker of a streamed import, kept on the import parent.
+# Chunk ``i`` covers stream positions ``[i * chunk_rows, (i + 1) * chunk_rows)``;
+# every chunk below the watermark, and every chunk listed as done, committed.
+IMPORT_STREAM_CHUNK_ROWS_FIELD = "stream_chunk_rows"
+IMPORT_STREAM_WATERMARK_FIELD = "stream_watermark"
+IMPORT_STREAM_DONE_FIELD = "stream_done_chunks"
+_IMPORT_PROGRESS_FIELDS = (
+    IMPORT_STREAM_CHUNK_ROWS_FIELD,
+    IMPORT_STREAM_WATERMARK_FIELD,
+    IMPORT_STREAM_DONE_FIELD,
+)
 
 Document = dict[str, Any]
 # A document path alternates collection and document ids and therefore always
@@ -230,6 +309,7 @@ Document = dict[str, Any]
 DocPath = tuple[str, ...]
 TxnResult = TypeVar("TxnResult")
 ModelT = TypeVar("ModelT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
 
 
 # =====================================================================
@@ -294,6 +374,13 @@ class NotAuthorized(ReviewRepositoryError):
     """The authenticated actor's role may not perform this mutation."""
 
 
+class CacheEntryTooLarge(ReviewRepositoryError):
+    """A disposable cache entry would exceed the Firestore document limit.
+
+    Raised before any write; the caller serves the value uncached.
+    """
+
+
 class UnsupportedFilterCombination(ReviewRepositoryError):
     """The requested filter is outside the master query grammar.
 
@@ -460,7 +547,7 @@ def review_index_declarations() -> list[dict[str, Any]]:
 
 
 def canonical_ttl_declarations() -> list[dict[str, Any]]:
-    """The four, and only four, TTL field overrides the console declares."""
+    """The five, and only five, TTL field overrides the console declares."""
     return [
         {"collectionGroup": collection, "fieldPath": TTL_FIELD, "ttl": True}
         for collection in sorted(TTL_COLLECTIONS)
@@ -515,6 +602,15 @@ def _is_tombstone(doc: Mapping[str, Any]) -> bool:
     return doc.get(DOC_KIND_FIELD) == PURGED_TOMBSTONE_KIND
 
 
+def _remote_rank(version: Any, modified: Any) -> tuple[int, float]:
+    """Order two snapshots of one DevRev object: version first, then time."""
+    ordinal = int(version) if isinstance(version, int) and not isinstance(
+        version, bool
+    ) else -1
+    stamp = modified.timestamp() if isinstance(modified, datetime) else float("-inf")
+    return ordinal, stamp
+
+
 def _live(doc: Optional[Mapping[str, Any]], now: datetime) -> Optional[Mapping[str, Any]]:
     """Apply logical TTL expiry at the boundary.
 
@@ -646,8 +742,10 @@ class EvidenceCandidate(_RepoBase):
 class DevRevMessageCacheEntry(_RepoBase):
     """One bounded, disposable DevRev timeline snapshot.
 
-    This is the only place a raw message body or a DevRev title may live, and
-    it always carries a TTL.
+    A raw message body or a DevRev title lives only in TTL documents: here,
+    inside a cached DevRev read in :class:`ConsoleCacheEntry`, or (titles
+    only) in a ``devrev_ticket_mirror`` row, which expires with this cache's
+    TTL.
     """
 
     remote_entry_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
@@ -676,13 +774,45 @@ class DevRevMessageCacheEntry(_RepoBase):
 
 
 class ConsoleCacheEntry(_RepoBase):
-    """Disposable list/detail metadata. TTL only, never durable state."""
+    """Disposable list/detail metadata. TTL only, never durable state.
+
+    The DevRev read-through cache also stores whole ticket and timeline
+    snapshots here, message bodies included. That is the same class of data
+    as the message cache under a shorter TTL (``CACHE_TTL_S``), in the same
+    named database, keyed by the client's scope fingerprint, and never copied
+    into durable state. An entry over the document limit is refused
+    (:class:`CacheEntryTooLarge`), not truncated.
+    """
 
     cache_key: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
     title: Optional[str] = Field(default=None, max_length=MAX_TITLE_LENGTH)
     payload: dict[str, str] = Field(default_factory=dict)
 
 
+class DevRevSyncWatermark(_RepoBase):
+    """Where the next incremental DevRev ticket sync resumes.
+
+    Disposable like the mirror it describes. It expires one mirror TTL after
+    its generation began, never later than any row synced under it, so a live
+    watermark always implies a complete mirror; once it lapses the next sync
+    walks the whole scope again.
+    """
+
+    modified_at: AwareDatetime = Field(...)
+    devrev_work_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    generation_started_at: AwareDatetime = Field(...)
+
+
+class DevRevMirrorWrite(_RepoBase):
+    """What one mirrored page changed. Counts only, never ticket content."""
+
+    added: StrictInt = Field(default=0, ge=0)
+    updated: StrictInt = Field(default=0, ge=0)
+    unchanged: StrictInt = Field(default=0, ge=0)
+    skipped: StrictInt = Field(default=0, ge=0)
+    watermark: Optional[DevRevSyncWatermark] = Field(default=None)
+
+
 class TicketExportSummary(_RepoBase):
     """Durable export metadata. Never the CSV body, never a ticket title."""
 
@@ -709,6 +839,151 @@ class ImportRowSpec(_RepoBase):
     created_by_import: bool = Field(default=False)
 
 
+ImportRowSource = Union[
+    Iterable[Union[ImportRowSpec, Mapping[str, Any]]],
+    AsyncIterable[Union[ImportRowSpec, Mapping[str, Any]]],
+]
+
+# ReviewPatch fields whose CSV cell is always plain text, never JSON.
+_TEXT_PATCH_FIELDS = frozenset(
+    name
+    for name, field in ReviewPatch.model_fields.items()
+    if field.annotation == Optional[str]
+)
+CSV_PATCH_PREFIX = "patch."
+
+
+def iter_ndjson_import_rows(lines: Iterable[Union[str, bytes]]) -> Iterator[Mapping[str, Any]]:
+    """Yield one import row per NDJSON line, reading lazily (blank lines skipped)."""
+    for line_number, line in enumerate(lines, start=1):
+        text = line.decode("utf-8") if isinstance(line, bytes) else line
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError:
+            raise ReviewRepositoryError(
+                f"import line {line_number} is not valid JSON"
+            ) from None
+        if not isinstance(row, dict):
+            raise ReviewRepositoryError(f"import line {line_number} is not a JSON object")
+        yield row
+
+
+def iter_csv_import_rows(lines: Iterable[str]) -> Iterator[Mapping[str, Any]]:
+    """Yield import rows from a CSV whose columns are the ImportRowSpec fields.
+
+    ``row_number`` / ``review_id`` / ``expected_review_version`` /
+    ``raw_ticket_id`` / ``created_by_import`` map directly; each
+    ``patch.<field>`` column is one ReviewPatch field. Text patch fields are
+    taken verbatim; any other patch cell is JSON (``3``, ``"resolved"``,
+    ``{...}``). Empty cells are omitted. Rows are read lazily.
+    """
+    for record in csv.DictReader(lines):
+        row: dict[str, Any] = {}
+        patch: dict[str, Any] = {}
+        for column, cell in record.items():
+            if column is None or cell is None or cell == "":
+                continue
+            column = column.strip()
+            if column.startswith(CSV_PATCH_PREFIX):
+                name = column[len(CSV_PATCH_PREFIX):]
+                patch[name] = cell if name in _TEXT_PATCH_FIELDS else _json_cell(cell)
+            elif column in ("row_number", "expected_review_version"):
+                row[column] = int(cell) if cell.strip().isdigit() else cell
+            elif column == "created_by_import":
+                row[column] = cell.strip().lower() == "true"
+            else:
+                row[column] = cell
+        row["patch"] = patch
+        yield row
+
+
+def _json_cell(cell: str) -> Any:
+    try:
+        return json.loads(cell)
+    except ValueError:
+        return cell
+
+
+def _import_row_spec(
+    row: Union[ImportRowSpec, Mapping[str, Any]], position: int
+) -> ImportRowSpec:
+    if isinstance(row, ImportRowSpec):
+        return row
+    try:
+        return ImportRowSpec.model_validate(dict(row))
+    except ValidationError:
+        # The position only: a row may carry free text that must not be echoed.
+        raise ReviewRepositoryError(f"import row at position {position} is not valid") from None
+
+
+async def _aiter_rows(
+    rows: ImportRowSource,
+) -> AsyncIterator[Union[ImportRowSpec, Mapping[str, Any]]]:
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+def _carry_import_progress(source: Mapping[str, Any], target: Document) -> None:
+    for field in _IMPORT_PROGRESS_FIELDS:
+        if field in source:
+            target[field] = source[field]
+
+
+def _advance_import_progress(
+    source: Mapping[str, Any], target: Document, chunk: int, chunk_rows: int
+) -> None:
+    watermark = int(source.get(IMPORT_STREAM_WATERMARK_FIELD) or 0)
+    done = {int(index) for index in source.get(IMPORT_STREAM_DONE_FIELD) or []}
+    done.add(chunk)
+    while watermark in done:
+        done.discard(watermark)
+        watermark += 1
+    target[IMPORT_STREAM_CHUNK_ROWS_FIELD] = chunk_rows
+    target[IMPORT_STREAM_WATERMARK_FIELD] = watermark
+    target[IMPORT_STREAM_DONE_FIELD] = sorted(done)
+
+
+class ExportProgress:
+    """Running totals of one streamed export: rows, bytes, and body digest.
+
+    Pass one to :meth:`TicketReviewRepository.stream_export` and read it after
+    the stream ends to record the :class:`TicketExportSummary`.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.bytes = 0
+        self._sha256 = hashlib.sha256()
+
+    def update(self, chunk: bytes, rows: int) -> None:
+        self.rows += rows
+        self.bytes += len(chunk)
+        self._sha256.update(chunk)
+
+    @property
+    def file_sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def _csv_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+    text = str(value)
+    if isinstance(value, str) and text.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + text
+    return text
+
+
 class BatchClaim(_RepoBase):
     """The claim result. The raw lease token is returned once, never stored."""
 
@@ -718,14 +993,31 @@ class BatchClaim(_RepoBase):
 
 
 class AuditChainReport(_RepoBase):
-    """Whether a ledger still recomputes to one linear chain."""
+    """Whether a ledger still recomputes to one linear chain.
+
+    ``resumed_event_count`` events were covered by a verified checkpoint and
+    not re-hashed; ``event_count`` is the chain length that was proven.
+    """
 
     intact: bool = Field(...)
     event_count: StrictInt = Field(default=0, ge=0)
+    resumed_event_count: StrictInt = Field(default=0, ge=0)
     broken_event_id: Optional[str] = Field(default=None, max_length=MAX_ID_LENGTH)
     reason: Optional[str] = Field(default=None, max_length=MAX_REASON_LENGTH)
 
 
+class AuditChainCheckpoint(_RepoBase):
+    """A signed claim that a ledger verified intact up to one event."""
+
+    ledger: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    event_id: str = Field(..., min_length=1, max_length=MAX_ID_LENGTH)
+    event_hash: Sha256Hex = Field(...)
+    event_count: StrictInt = Field(..., ge=1)
+    occurred_at_unix_us: StrictInt = Field(..., ge=0)
+    verified_at: AwareDatetime = Field(...)
+    signature: Sha256Hex = Field(...)
+
+
 class RetentionPreview(_RepoBase):
     """What a bounded retention run would do. No content, ids only."""
 
@@ -750,6 +1042,26 @@ class RetentionReport(_RepoBase):
     truncated: bool = Field(default=False)
 
 
+class _RetentionBudget:
+    """The document budget one retention run shares across concurrent workers.
+
+    Claims are synchronous, so no two workers can spend the same unit; a
+    worker refunds whatever it claimed but did not delete.
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.remaining = total
+
+    def take(self, wanted: int) -> int:
+        granted = max(0, min(wanted, self.remaining))
+        self.remaining -= granted
+        return granted
+
+    def refund(self, unused: int) -> None:
+        self.remaining += unused
+
+
 class CursorPageOf(_RepoBase):
     """A bounded page of repository records with an opaque forward cursor."""
 
@@ -768,6 +1080,8 @@ class TransactionView(Protocol):
 
     async def get(self, path: DocPath) -> Optional[Document]: ...
 
+    async def get_all(self, paths: Sequence[DocPath]) -> list[Optional[Document]]: ...
+
     def set(self, path: DocPath, value: Document) -> None: ...
 
     def delete(self, path: DocPath) -> None: ...
@@ -808,6 +1122,7 @@ class TicketReviewBackend(Protocol):
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]: ...
 
     async def list_collection(
@@ -817,6 +1132,7 @@ class TicketReviewBackend(Protocol):
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]: ...
 
     async def scan_by_field(
@@ -834,6 +1150,70 @@ class TicketReviewBackend(Protocol):
 # =====================================================================
 
 
+def _recency_key(updated_at: datetime, review_id: str) -> tuple[float, str]:
+    """Newest first, review id as the tie-breaker: the console's page order."""
+    return (-updated_at.timestamp(), review_id)
+
+
+class _MemoryStore(dict[DocPath, Document]):
+    """Committed documents plus the secondary indexes the queries walk.
+
+    Stored documents are immutable snapshots: every write replaces the whole
+    document (copy-on-write), so the indexes are maintained here, on the
+    container, and stay exact for ``force_write`` tampering as well.
+
+    * ``children``   parent path -> child paths (collections, subcollections)
+    * ``by_status``  review status -> ``(recency, path)`` newest first
+    * ``by_display`` DevRev display id -> review paths
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.children: BucketIndex[DocPath] = BucketIndex()
+        self.by_status: BucketIndex[DocPath] = BucketIndex()
+        self.by_display: BucketIndex[DocPath] = BucketIndex()
+
+    def __setitem__(self, path: DocPath, doc: Document) -> None:
+        super().__setitem__(path, doc)
+        self.children.put(path, path[:-1])
+        review = (
+            len(path) == 2 and path[0] == REVIEWS_COLLECTION and not _is_tombstone(doc)
+        )
+        updated_at = doc.get("updated_at")
+        if review and isinstance(updated_at, datetime):
+            self.by_status.put(
+                path, doc.get("status"), _recency_key(updated_at, path[1])
+            )
+        else:
+            self.by_status.discard(path)
+        if review and doc.get("devrev_display_id") is not None:
+            self.by_display.put(path, doc["devrev_display_id"])
+        else:
+            self.by_display.discard(path)
+
+    def __delitem__(self, path: DocPath) -> None:
+        super().__delitem__(path)
+        self._unindex(path)
+
+    def pop(self, path: DocPath, *default: Any) -> Any:
+        if path not in self:
+            if default:
+                return default[0]
+            raise KeyError(path)
+        doc = super().pop(path)
+        self._unindex(path)
+        return doc
+
+    def _unindex(self, path: DocPath) -> None:
+        self.children.discard(path)
+        self.by_status.discard(path)
+        self.by_display.discard(path)
+
+    def child_docs(self, prefix: DocPath) -> list[tuple[str, Document]]:
+        """Direct children of ``prefix`` in document-id order (no copies)."""
+        return [(path[-1], self[path]) for _order, path in self.children.entries(prefix)]
+
+
 class _MemoryTxnView:
     """Reads see the committed snapshot; writes apply only on success."""
 
@@ -844,14 +1224,17 @@ class _MemoryTxnView:
     async def get(self, path: DocPath) -> Optional[Document]:
         if path in self._staged:
             staged = self._staged[path]
-            return copy.deepcopy(staged) if staged is not None else None
+            return clone_document(staged) if staged is not None else None
         doc = self._data.get(path)
-        return copy.deepcopy(doc) if doc is not None else None
+        return clone_document(doc) if doc is not None else None
+
+    async def get_all(self, paths: Sequence[DocPath]) -> list[Optional[Document]]:
+        return [await self.get(path) for path in paths]
 
     def set(self, path: DocPath, value: Document) -> None:
         if len(path) % 2 != 0:
             raise ValueError("a document path must name an exact document")
-        self._staged[path] = copy.deepcopy(value)
+        self._staged[path] = clone_document(value)
 
     def delete(self, path: DocPath) -> None:
         if len(path) % 2 != 0:
@@ -878,13 +1261,14 @@ class InMemoryTicketReviewBackend:
 
     Transactions are serialized, which is the strictest reading of Firestore's
     serializable isolation, so a contract proven here cannot be looser than the
-    emulator's.
+    emulator's. Queries walk the :class:`_MemoryStore` indexes instead of every
+    stored document, and hand out structural clones of committed snapshots.
     """
 
     server_timestamp: Any = None
 
     def __init__(self) -> None:
-        self._data: dict[DocPath, Document] = {}
+        self._data = _MemoryStore()
         self._lock = asyncio.Lock()
         self.deleted_paths: list[DocPath] = []
         self.max_writes_in_one_transaction = 0
@@ -908,7 +1292,7 @@ class InMemoryTicketReviewBackend:
 
     async def get_doc(self, path: DocPath) -> Optional[Document]:
         doc = self._data.get(path)
-        return copy.deepcopy(doc) if doc is not None else None
+        return clone_document(doc) if doc is not None else None
 
     async def query_reviews(
         self,
@@ -921,43 +1305,39 @@ class InMemoryTicketReviewBackend:
         limit: int = DEFAULT_PAGE_SIZE,
         start_after: Optional[tuple[datetime, str]] = None,
     ) -> list[tuple[str, Document]]:
-        wanted = set(statuses)
+        runs = []
+        for status in dict.fromkeys(statuses):
+            entries = self._data.by_status.entries(status)
+            first = 0
+            if updated_before is not None:
+                first = bisect.bisect_left(
+                    entries, (-updated_before.timestamp(),), key=lambda e: e[0]
+                )
+            if start_after is not None:
+                last_at, last_id = start_after
+                first = max(first, bisect.bisect_right(
+                    entries, _recency_key(last_at, last_id), key=lambda e: e[0]
+                ))
+            runs.append(entries[first:])
         rows: list[tuple[str, Document]] = []
-        for path, doc in self._data.items():
-            if len(path) != 2 or path[0] != REVIEWS_COLLECTION or _is_tombstone(doc):
-                continue
-            if doc.get("status") not in wanted:
-                continue
+        for _order, path in heapq.merge(*runs):
+            if len(rows) >= limit:
+                break
+            doc = self._data[path]
+            if updated_after is not None and doc["updated_at"] < updated_after:
+                break
             if facet is not None and _resolve_path(doc, facet) != facet_value:
                 continue
-            updated_at = doc.get("updated_at")
-            if not isinstance(updated_at, datetime):
-                continue
-            if updated_after is not None and updated_at < updated_after:
-                continue
-            if updated_before is not None and updated_at > updated_before:
-                continue
-            if start_after is not None:
-                last_at, last_id = start_after
-                if updated_at > last_at or (updated_at == last_at and path[1] <= last_id):
-                    continue
-            rows.append((path[1], copy.deepcopy(doc)))
-        rows.sort(key=lambda row: (-row[1]["updated_at"].timestamp(), row[0]))
-        return rows[:limit]
+            rows.append((path[1], clone_document(doc)))
+        return rows
 
     async def query_reviews_by_display_id(
         self, display_id: str, *, limit: int = 2
     ) -> list[tuple[str, Document]]:
-        rows = [
-            (path[1], copy.deepcopy(doc))
-            for path, doc in self._data.items()
-            if len(path) == 2
-            and path[0] == REVIEWS_COLLECTION
-            and not _is_tombstone(doc)
-            and doc.get("devrev_display_id") == display_id
+        return [
+            (path[1], clone_document(self._data[path]))
+            for _order, path in self._data.by_display.entries(display_id)[:limit]
         ]
-        rows.sort(key=lambda row: row[0])
-        return rows[:limit]
 
     async def list_subcollection(
         self,
@@ -967,24 +1347,10 @@ class InMemoryTicketReviewBackend:
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]:
-        prefix = (*parent, subcollection)
-        rows = [
-            (path[-1], copy.deepcopy(doc))
-            for path, doc in self._data.items()
-            if len(path) == len(prefix) + 1 and path[:-1] == prefix
-        ]
-        if order_by is None:
-            rows.sort(key=lambda row: row[0])
-        else:
-            # Firestore appends __name__ as the implicit final sort key, so an
-            # ordered query is a total order, and it omits documents that lack
-            # the ordered field. Mirror both exactly.
-            rows = [row for row in rows if row[1].get(order_by) is not None]
-            rows.sort(key=lambda row: (row[1][order_by], row[0]))
-        if start_after_id is not None:
-            rows = [row for row in rows if row[0] > start_after_id]
-        return rows[:limit]
+        rows = self._data.child_docs((*parent, subcollection))
+        return _page_children(rows, limit, order_by, start_after_id, start_after)
 
     async def list_collection(
         self,
@@ -993,22 +1359,10 @@ class InMemoryTicketReviewBackend:
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]:
-        rows = [
-            (path[1], copy.deepcopy(doc))
-            for path, doc in self._data.items()
-            if len(path) == 2 and path[0] == collection
-        ]
-        if order_by is None:
-            rows.sort(key=lambda row: row[0])
-        else:
-            # Firestore omits documents that lack the ordered field entirely;
-            # mirror that rather than inventing an ordering for them.
-            rows = [row for row in rows if row[1].get(order_by) is not None]
-            rows.sort(key=lambda row: (row[1][order_by], row[0]))
-        if start_after_id is not None:
-            rows = [row for row in rows if row[0] > start_after_id]
-        return rows[:limit]
+        rows = self._data.child_docs((collection,))
+        return _page_children(rows, limit, order_by, start_after_id, start_after)
 
     async def scan_by_field(
         self,
@@ -1019,32 +1373,27 @@ class InMemoryTicketReviewBackend:
         limit: int = DEFAULT_RETENTION_MAX_DOCUMENTS,
     ) -> list[tuple[str, Document]]:
         rows: list[tuple[str, Document]] = []
-        for path, doc in self._data.items():
-            if len(path) != 2 or path[0] != collection:
-                continue
+        for doc_id, doc in self._data.child_docs((collection,)):
             value = doc.get(field)
             if isinstance(value, datetime) and value <= before:
-                rows.append((path[1], copy.deepcopy(doc)))
+                rows.append((doc_id, doc))
         rows.sort(key=lambda row: (row[1][field], row[0]))
-        return rows[:limit]
+        return [(doc_id, clone_document(doc)) for doc_id, doc in rows[:limit]]
 
     # -- test/inspection helpers (in-memory only) ----------------------
 
     async def dump_collection(self, collection: str) -> dict[str, Document]:
         return {
-            path[1]: copy.deepcopy(doc)
-            for path, doc in self._data.items()
-            if len(path) == 2 and path[0] == collection
+            doc_id: clone_document(doc)
+            for doc_id, doc in self._data.child_docs((collection,))
         }
 
     async def dump_subcollection(
         self, collection: str, doc_id: str, subcollection: str
     ) -> dict[str, Document]:
-        prefix = (collection, doc_id, subcollection)
         return {
-            path[3]: copy.deepcopy(doc)
-            for path, doc in self._data.items()
-            if len(path) == 4 and path[:3] == prefix
+            child_id: clone_document(doc)
+            for child_id, doc in self._data.child_docs((collection, doc_id, subcollection))
         }
 
     async def force_write(self, path: DocPath, doc: Document) -> None:
@@ -1052,7 +1401,34 @@ class InMemoryTicketReviewBackend:
 
         Only a test may call this: it is how a mutated ledger is simulated.
         """
-        self._data[tuple(path)] = copy.deepcopy(doc)
+        self._data[tuple(path)] = clone_document(doc)
+
+
+def _page_children(
+    rows: list[tuple[str, Document]],
+    limit: int,
+    order_by: Optional[str],
+    start_after_id: Optional[str],
+    start_after: Optional[tuple[Any, str]] = None,
+) -> list[tuple[str, Document]]:
+    """Order/cursor/limit over one parent's children, as Firestore would.
+
+    ``start_after`` is a keyset cursor ``(order_by value, document id)``.
+    """
+    if start_after is not None and order_by is None:
+        raise ValueError("a keyset cursor needs an ordered query")
+    if order_by is not None:
+        # Firestore appends __name__ as the implicit final sort key, so an
+        # ordered query is a total order, and it omits documents that lack
+        # the ordered field. Mirror both exactly.
+        rows = [row for row in rows if row[1].get(order_by) is not None]
+        rows.sort(key=lambda row: (row[1][order_by], row[0]))
+    if start_after_id is not None:
+        rows = [row for row in rows if row[0] > start_after_id]
+    if start_after is not None and order_by is not None:
+        key = order_by
+        rows = [row for row in rows if (row[1][key], row[0]) > start_after]
+    return [(doc_id, clone_document(doc)) for doc_id, doc in rows[:limit]]
 
 
 # =====================================================================
@@ -1060,6 +1436,17 @@ class InMemoryTicketReviewBackend:
 # =====================================================================
 
 
+def _keyset(query: Any, order_by: Optional[str], start_after: tuple[Any, str]) -> Any:
+    """Resume an ordered query strictly after ``(value, document id)``.
+
+    The implicit ``__name__`` tie-breaker is made explicit so the cursor can
+    carry it; the single-field index still serves the query.
+    """
+    if order_by is None:
+        raise ValueError("a keyset cursor needs an ordered query")
+    return query.order_by("__name__").start_after([start_after[0], start_after[1]])
+
+
 class FirestoreTicketReviewBackend:
     """Thin Firestore backend. No business logic lives here.
 
@@ -1114,6 +1501,17 @@ class FirestoreTicketReviewBackend:
                 snapshot = await backend._ref(path).get(transaction=self._txn)
                 return cast(Optional[Document], snapshot.to_dict() if snapshot.exists else None)
 
+            async def get_all(self, paths: Sequence[DocPath]) -> list[Optional[Document]]:
+                # One batched round trip; snapshots come back in any order.
+                refs = [backend._ref(path) for path in paths]
+                found: dict[str, Optional[Document]] = {}
+                if refs:
+                    async for snapshot in backend._client.get_all(refs, transaction=self._txn):
+                        found[snapshot.reference.path] = (
+                            snapshot.to_dict() if snapshot.exists else None
+                        )
+                return [found.get(ref.path) for ref in refs]
+
             def set(self, path: DocPath, value: Document) -> None:
                 self._writes.append(("set", backend._ref(path), value))
 
@@ -1209,6 +1607,7 @@ class FirestoreTicketReviewBackend:
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]:
         collection = self._ref(parent).collection(subcollection)
         query: Any = collection
@@ -1220,6 +1619,8 @@ class FirestoreTicketReviewBackend:
             query = query.order_by("__name__")
         if start_after_id is not None:
             query = query.start_after(collection.document(start_after_id))
+        if start_after is not None:
+            query = _keyset(query, order_by, start_after)
         rows: list[tuple[str, Document]] = []
         async for snapshot in query.limit(limit).stream():
             rows.append((snapshot.id, cast(Document, snapshot.to_dict())))
@@ -1232,6 +1633,7 @@ class FirestoreTicketReviewBackend:
         limit: int = DEFAULT_PAGE_SIZE,
         order_by: Optional[str] = None,
         start_after_id: Optional[str] = None,
+        start_after: Optional[tuple[Any, str]] = None,
     ) -> list[tuple[str, Document]]:
         handle = self._client.collection(collection)
         # An ordered query gets Firestore's implicit trailing __name__ sort key,
@@ -1239,6 +1641,8 @@ class FirestoreTicketReviewBackend:
         query: Any = handle.order_by(order_by) if order_by else handle.order_by("__name__")
         if start_after_id is not None:
             query = query.start_after(handle.document(start_after_id))
+        if start_after is not None:
+            query = _keyset(query, order_by, start_after)
         rows: list[tuple[str, Document]] = []
         async for snapshot in query.limit(limit).stream():
             rows.append((snapshot.id, cast(Document, snapshot.to_dict())))
@@ -1303,7 +1707,13 @@ class TicketReviewRepository:
         max_batch_reviews: int = MAX_BATCH_REVIEWS,
         lease_s: int = REMEDIATION_LEASE_S,
         max_continuous_lease_s: int = REMEDIATION_MAX_CONTINUOUS_LEASE_S,
+        patch_concurrency: int = DEFAULT_PATCH_CONCURRENCY,
+        retention_concurrency: int = DEFAULT_RETENTION_CONCURRENCY,
     ) -> None:
+        if patch_concurrency < 1:
+            raise ValueError("patch_concurrency must be at least 1")
+        if retention_concurrency < 1:
+            raise ValueError("retention_concurrency must be at least 1")
         self.backend = backend
         self._cursor_key = cursor_key
         self._clock = clock
@@ -1321,6 +1731,8 @@ class TicketReviewRepository:
         self._max_batch_reviews = min(max_batch_reviews, MAX_BATCH_REVIEWS)
         self._lease = timedelta(seconds=lease_s)
         self._max_continuous_lease = timedelta(seconds=max_continuous_lease_s)
+        self._patch_concurrency = patch_concurrency
+        self._retention_concurrency = retention_concurrency
 
     @classmethod
     def from_settings(
@@ -1804,38 +2216,65 @@ class TicketReviewRepository:
 
         Each spec gets its own transaction, so a failure or version conflict in
         one can never mark an unaffected review resolved.
+
+        Specs for different reviews run concurrently, at most
+        ``patch_concurrency`` transactions at a time: a review patch extends
+        only that review's own audit chain, so they never contend. Specs that
+        name the same review share one lane and run in spec order, exactly as
+        the serial loop did. Results are reported in spec order.
         """
+        outcomes: list[Union[TicketReview, ReviewPatchFailure, None]] = [None] * len(specs)
+        lanes: dict[str, list[int]] = {}
+        for position, spec in enumerate(specs):
+            lanes.setdefault(spec.review_id, []).append(position)
+        slots = asyncio.Semaphore(self._patch_concurrency)
+
+        async def _lane(positions: list[int]) -> None:
+            for position in positions:
+                async with slots:
+                    outcomes[position] = await self._patch_one(specs[position], context)
+
+        tasks = [asyncio.ensure_future(_lane(positions)) for positions in lanes.values()]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # An unexpected error stops the remaining lanes, as it stopped the loop.
+            for task in tasks:
+                task.cancel()
+
         applied: list[TicketReview] = []
         conflicts: list[ReviewPatchFailure] = []
         failures: list[ReviewPatchFailure] = []
-        for spec in specs:
-            try:
-                applied.append(
-                    await self.patch_review(
-                        spec.review_id,
-                        spec.patch,
-                        expected_version=spec.expected_version,
-                        context=self._derive_context(context, f"review:{spec.review_id}"),
-                        admin_reopen=spec.admin_reopen,
-                    )
-                )
-            except ReviewVersionConflict as conflict:
-                conflicts.append(
-                    ReviewPatchFailure(
-                        review_id=spec.review_id,
-                        code="review_version_conflict",
-                        current_version=conflict.current_version,
-                    )
-                )
-            except ReviewRepositoryError as error:
-                failures.append(
-                    ReviewPatchFailure(
-                        review_id=spec.review_id,
-                        code=type(error).__name__,
-                    )
-                )
+        for outcome in outcomes:
+            if isinstance(outcome, TicketReview):
+                applied.append(outcome)
+            elif isinstance(outcome, ReviewPatchFailure):
+                if outcome.code == "review_version_conflict":
+                    conflicts.append(outcome)
+                else:
+                    failures.append(outcome)
         return MultiPatchResult(applied=applied, conflicts=conflicts, failures=failures)
 
+    async def _patch_one(
+        self, spec: ReviewPatchSpec, context: MutationContext
+    ) -> Union[TicketReview, ReviewPatchFailure]:
+        try:
+            return await self.patch_review(
+                spec.review_id,
+                spec.patch,
+                expected_version=spec.expected_version,
+                context=self._derive_context(context, f"review:{spec.review_id}"),
+                admin_reopen=spec.admin_reopen,
+            )
+        except ReviewVersionConflict as conflict:
+            return ReviewPatchFailure(
+                review_id=spec.review_id,
+                code="review_version_conflict",
+                current_version=conflict.current_version,
+            )
+        except ReviewRepositoryError as error:
+            return ReviewPatchFailure(review_id=spec.review_id, code=type(error).__name__)
+
     async def mark_import_state(
         self,
         review_id: str,
@@ -2127,38 +2566,191 @@ class TicketReviewRepository:
         ]
         return CursorPageOf(items=events[:page_size], page_size=page_size)
 
-    @staticmethod
-    def _verify_chain(events: Sequence[AuditEvent]) -> AuditChainReport:
-        previous = GENESIS_EVENT_HASH
-        for event in events:
-            if event.previous_event_hash != previous:
-                return AuditChainReport(
-                    intact=False,
-                    event_count=len(events),
-                    broken_event_id=event.event_id,
-                    reason="previous_event_hash does not match the chain head",
-                )
-            if event.event_hash != compute_audit_event_hash(event):
-                return AuditChainReport(
-                    intact=False,
-                    event_count=len(events),
-                    broken_event_id=event.event_id,
-                    reason="event_hash does not recompute",
-                )
-            previous = event.event_hash
-        return AuditChainReport(intact=True, event_count=len(events))
+    async def _verify_ledger(
+        self,
+        fetch: Callable[[Optional[tuple[int, str]]], Awaitable[list[tuple[str, Document]]]],
+        *,
+        page_size: int,
+        resume: Optional[AuditChainCheckpoint] = None,
+        on_progress: Optional[Callable[[AuditEvent, int], Awaitable[None]]] = None,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> AuditChainReport:
+        """Stream a ledger page by page and check every link and hash.
+
+        Memory stays at one page whatever the chain length. ``on_progress`` is
+        called with the last proven event every ``checkpoint_every`` events and
+        once more at the end of an intact pass.
+        """
+        previous = resume.event_hash if resume is not None else GENESIS_EVENT_HASH
+        resumed = resume.event_count if resume is not None else 0
+        count = resumed
+        cursor = (resume.occurred_at_unix_us, resume.event_id) if resume is not None else None
+        last: Optional[AuditEvent] = None
+        since_progress = 0
+        while True:
+            rows = await fetch(cursor)
+            for doc_id, doc in rows:
+                if doc_id == GLOBAL_CHAIN_HEAD_DOC_ID:
+                    continue
+                event = _from_doc(AuditEvent, doc)
+                count += 1
+                reason = None
+                if event.previous_event_hash != previous:
+                    reason = "previous_event_hash does not match the chain head"
+                elif event.event_hash != compute_audit_event_hash(event):
+                    reason = "event_hash does not recompute"
+                if reason is not None:
+                    return AuditChainReport(
+                        intact=False,
+                        event_count=count,
+                        resumed_event_count=resumed,
+                        broken_event_id=event.event_id,
+                        reason=reason,
+                    )
+                previous = event.event_hash
+                last = event
+                since_progress += 1
+            if rows:
+                cursor = (rows[-1][1]["occurred_at_unix_us"], rows[-1][0])
+            if on_progress is not None and last is not None and since_progress >= checkpoint_every:
+                await on_progress(last, count)
+                since_progress = 0
+            if len(rows) < page_size:
+                break
+        if on_progress is not None and last is not None and since_progress:
+            await on_progress(last, count)
+        return AuditChainReport(intact=True, event_count=count, resumed_event_count=resumed)
 
     async def verify_audit_chain(
         self, review_id: str, *, page_size: int = MAX_PAGE_SIZE
     ) -> AuditChainReport:
-        page = await self.list_audit_events(review_id, page_size=page_size)
-        return self._verify_chain(page.items)
+        """Walk one review's whole ledger from genesis.
+
+        Review ledgers are short and are purged with their review, so they are
+        not checkpointed.
+        """
+
+        async def _fetch(cursor: Optional[tuple[int, str]]) -> list[tuple[str, Document]]:
+            return await self.backend.list_subcollection(
+                (REVIEWS_COLLECTION, review_id),
+                AUDIT_EVENTS_SUBCOLLECTION,
+                limit=page_size,
+                order_by="occurred_at_unix_us",
+                start_after=cursor,
+            )
+
+        return await self._verify_ledger(_fetch, page_size=page_size)
 
     async def verify_global_audit_chain(
-        self, *, page_size: int = MAX_PAGE_SIZE
+        self,
+        *,
+        page_size: int = MAX_PAGE_SIZE,
+        full: bool = False,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
     ) -> AuditChainReport:
-        page = await self.list_global_audit_events(page_size=page_size)
-        return self._verify_chain(page.items)
+        """Verify the global ledger, resuming from its signed checkpoint.
+
+        Only events appended after the checkpoint are hashed. A checkpoint that
+        fails its signature, or whose anchor event is gone or altered, is
+        ignored and the pass starts from genesis. ``full=True`` always does.
+        Every ``checkpoint_every`` proven events the checkpoint moves forward,
+        so an interrupted pass still saves its progress.
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        resume = None if full else await self._load_checkpoint(GLOBAL_LEDGER_CHECKPOINT_ID)
+
+        async def _fetch(cursor: Optional[tuple[int, str]]) -> list[tuple[str, Document]]:
+            return await self.backend.list_collection(
+                GLOBAL_AUDIT_EVENTS_COLLECTION,
+                limit=page_size,
+                order_by="occurred_at_unix_us",
+                start_after=cursor,
+            )
+
+        async def _progress(event: AuditEvent, count: int) -> None:
+            await self._store_checkpoint(GLOBAL_LEDGER_CHECKPOINT_ID, event, count)
+
+        return await self._verify_ledger(
+            _fetch,
+            page_size=page_size,
+            resume=resume,
+            on_progress=_progress,
+            checkpoint_every=checkpoint_every,
+        )
+
+    def _checkpoint_signature(
+        self, ledger: str, event_id: str, event_hash: str, event_count: int, occurred_at: int
+    ) -> str:
+        key = hmac.new(self._cursor_key, _CHECKPOINT_KEY_LABEL, hashlib.sha256).digest()
+        payload = canonical_json([ledger, event_id, event_hash, event_count, occurred_at])
+        return hmac.new(key, payload.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    async def _load_checkpoint(self, ledger: str) -> Optional[AuditChainCheckpoint]:
+        doc = await self.backend.get_doc((AUDIT_CHECKPOINTS_COLLECTION, ledger))
+        return await self._valid_checkpoint(ledger, doc, self.backend.get_doc)
+
+    async def _valid_checkpoint(
+        self,
+        ledger: str,
+        doc: Optional[Document],
+        get: Callable[[DocPath], Awaitable[Optional[Document]]],
+    ) -> Optional[AuditChainCheckpoint]:
+        """The stored checkpoint if its signature and anchor event hold, else None."""
+        if doc is None:
+            return None
+        try:
+            checkpoint = _from_doc(AuditChainCheckpoint, doc)
+        except ValueError:
+            return None
+        expected = self._checkpoint_signature(
+            ledger,
+            checkpoint.event_id,
+            checkpoint.event_hash,
+            checkpoint.event_count,
+            checkpoint.occurred_at_unix_us,
+        )
+        if checkpoint.ledger != ledger or not hmac.compare_digest(expected, checkpoint.signature):
+            return None
+        anchor_doc = await get((GLOBAL_AUDIT_EVENTS_COLLECTION, checkpoint.event_id))
+        if anchor_doc is None:
+            return None
+        anchor = _from_doc(AuditEvent, anchor_doc)
+        if (
+            anchor.event_hash != checkpoint.event_hash
+            or compute_audit_event_hash(anchor) != checkpoint.event_hash
+            or anchor.occurred_at_unix_us != checkpoint.occurred_at_unix_us
+        ):
+            return None
+        return checkpoint
+
+    async def _store_checkpoint(self, ledger: str, event: AuditEvent, count: int) -> None:
+        # A proven event always carries the hash it was just checked against.
+        event_hash = cast(str, event.event_hash)
+        checkpoint = AuditChainCheckpoint(
+            ledger=ledger,
+            event_id=event.event_id,
+            event_hash=event_hash,
+            event_count=count,
+            occurred_at_unix_us=event.occurred_at_unix_us,
+            verified_at=self._now(),
+            signature=self._checkpoint_signature(
+                ledger, event.event_id, event_hash, count, event.occurred_at_unix_us
+            ),
+        )
+
+        async def _txn(view: TransactionView) -> None:
+            current = await self._valid_checkpoint(
+                ledger, await view.get((AUDIT_CHECKPOINTS_COLLECTION, ledger)), view.get
+            )
+            # Two concurrent verifiers: the further-reaching checkpoint wins.
+            # An invalid one (bad signature, missing or altered anchor) never
+            # does, or a forged event_count would pin every pass to genesis.
+            if current is not None and current.event_count >= count:
+                return
+            view.set((AUDIT_CHECKPOINTS_COLLECTION, ledger), _to_doc(checkpoint))
+
+        await self.backend.transact(_txn)
 
     # ------------------------------------------------------------------
     # Evidence links
@@ -2419,18 +3011,13 @@ class TicketReviewRepository:
         now = self._now()
         path = (DEVREV_MESSAGE_CACHE_COLLECTION, entry.entry_id_hash)
 
-        def _rank(version: Any, modified: Any) -> tuple[int, float]:
-            ordinal = int(version) if isinstance(version, int) and not isinstance(
-                version, bool
-            ) else -1
-            stamp = modified.timestamp() if isinstance(modified, datetime) else float("-inf")
-            return ordinal, stamp
-
         async def _txn(view: TransactionView) -> Document:
             existing = await view.get(path)
             if existing is not None:
-                incoming = _rank(entry.object_version, entry.remote_modified_at)
-                stored = _rank(existing.get("object_version"), existing.get("remote_modified_at"))
+                incoming = _remote_rank(entry.object_version, entry.remote_modified_at)
+                stored = _remote_rank(
+                    existing.get("object_version"), existing.get("remote_modified_at")
+                )
                 if incoming <= stored and _live(existing, now) is not None:
                     return existing
             doc = _to_doc(
@@ -2459,6 +3046,8 @@ class TicketReviewRepository:
     async def put_console_cache_entry(self, entry: ConsoleCacheEntry) -> ConsoleCacheEntry:
         now = self._now()
         doc = _to_doc(entry, **{TTL_FIELD: now + self._cache_ttl, "cached_at": now})
+        if _document_bytes(doc) >= FIRESTORE_MAX_DOCUMENT_BYTES:
+            raise CacheEntryTooLarge("the cache entry would exceed the Firestore document limit")
 
         async def _txn(view: TransactionView) -> Document:
             view.set((CONSOLE_CACHE_COLLECTION, sha256_hex(entry.cache_key)), doc)
@@ -2473,6 +3062,156 @@ class TicketReviewRepository:
         )
         return None if doc is None else _from_doc(ConsoleCacheEntry, doc)
 
+    # ------------------------------------------------------------------
+    # DevRev ticket mirror (incremental sync target, console list views)
+    # ------------------------------------------------------------------
+
+    async def get_devrev_sync_watermark(self) -> Optional[DevRevSyncWatermark]:
+        """The live watermark, or ``None`` when the next sync must be full."""
+        doc = _live(
+            await self.backend.get_doc(
+                (DEVREV_TICKET_MIRROR_COLLECTION, DEVREV_SYNC_WATERMARK_DOC_ID)
+            ),
+            self._now(),
+        )
+        return None if doc is None else _from_doc(DevRevSyncWatermark, doc)
+
+    async def mirror_devrev_tickets(
+        self, tickets: Sequence[DevRevTicketSummary]
+    ) -> DevRevMirrorWrite:
+        """Upsert one synced page and advance the watermark atomically.
+
+        The newer remote snapshot wins per ticket (``object_version``, then
+        ``modified_at``), so replaying an overlapping window only refreshes
+        TTLs. A ticket without ``modified_at`` can be neither ordered nor
+        watermarked and is skipped. The watermark only moves forward and keeps
+        its generation while it is live; a lapsed one starts a new generation.
+        """
+        if len(tickets) > MAX_PAGE_SIZE:
+            raise ValueError(f"a mirrored page holds at most {MAX_PAGE_SIZE} tickets")
+        now = self._now()
+        watermark_path = (DEVREV_TICKET_MIRROR_COLLECTION, DEVREV_SYNC_WATERMARK_DOC_ID)
+
+        # One snapshot per ticket: the newest wins if a page repeats one.
+        latest_by_id: dict[str, tuple[datetime, DevRevTicketSummary]] = {}
+        skipped = 0
+        for ticket in tickets:
+            if ticket.modified_at is None:
+                skipped += 1
+                continue
+            held = latest_by_id.get(ticket.devrev_work_id)
+            if held is None or _remote_rank(
+                ticket.object_version, ticket.modified_at
+            ) > _remote_rank(held[1].object_version, held[0]):
+                latest_by_id[ticket.devrev_work_id] = (ticket.modified_at, ticket)
+
+        async def _txn(view: TransactionView) -> DevRevMirrorWrite:
+            # Every read precedes every write, as a Firestore transaction needs.
+            stored_mark = _live(await view.get(watermark_path), now)
+            existing_by_id = {
+                work_id: _live(
+                    await view.get((DEVREV_TICKET_MIRROR_COLLECTION, sha256_hex(work_id))),
+                    now,
+                )
+                for work_id in latest_by_id
+            }
+            mark = None if stored_mark is None else _from_doc(DevRevSyncWatermark, stored_mark)
+            generation = now if mark is None else mark.generation_started_at
+            # Never earlier than the watermark's own expiry: see DevRevSyncWatermark.
+            row_expiry = max(now, generation) + self._message_cache_ttl
+            counts = {"added": 0, "updated": 0, "unchanged": 0}
+            latest = None if mark is None else (mark.modified_at, mark.devrev_work_id)
+            for work_id, (modified_at, ticket) in latest_by_id.items():
+                path = (DEVREV_TICKET_MIRROR_COLLECTION, sha256_hex(work_id))
+                existing = existing_by_id[work_id]
+                key = (modified_at, work_id)
+                latest = key if latest is None else max(latest, key)
+                if existing is not None and _remote_rank(
+                    ticket.object_version, modified_at
+                ) <= _remote_rank(existing.get("object_version"), existing.get("modified_at")):
+                    counts["unchanged"] += 1
+                    view.set(path, {**existing, TTL_FIELD: row_expiry})
+                    continue
+                counts["added" if existing is None else "updated"] += 1
+                view.set(
+                    path,
+                    _to_doc(
+                        ticket,
+                        **{
+                            MIRROR_ORDER_FIELD: -modified_at.timestamp(),
+                            "synced_at": now,
+                            TTL_FIELD: row_expiry,
+                        },
+                    ),
+                )
+            watermark = None
+            if latest is not None:
+                watermark = DevRevSyncWatermark(
+                    modified_at=latest[0],
+                    devrev_work_id=latest[1],
+                    generation_started_at=generation,
+                )
+                view.set(
+                    watermark_path,
+                    _to_doc(watermark, **{TTL_FIELD: generation + self._message_cache_ttl}),
+                )
+            return DevRevMirrorWrite(**counts, skipped=skipped, watermark=watermark)
+
+        result = await self.backend.transact(_txn)
+        for outcome in ("added", "updated", "unchanged", "skipped"):
+            count = getattr(result, outcome)
+            if count:
+                ticket_metrics.emit("ticket_devrev_sync_tickets", count, outcome=outcome)
+        return result
+
+    async def list_mirrored_tickets(
+        self,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> CursorPageOf:
+        """Page the mirror newest change first, without calling DevRev.
+
+        Elapsed rows are filtered in the application, so, as for evidence
+        links, the cursor advances by rows SCANNED.
+        """
+        start_after: Optional[tuple[Any, str]] = None
+        if cursor is not None:
+            payload = open_cursor(
+                self._cursor_key,
+                cursor,
+                context=MIRRORED_TICKETS_CURSOR_CONTEXT,
+                now=self._now(),
+            )
+            start_after = (float(payload["o"]), str(payload["i"]))
+        rows = await self.backend.list_collection(
+            DEVREV_TICKET_MIRROR_COLLECTION,
+            limit=page_size + 1,
+            order_by=MIRROR_ORDER_FIELD,
+            start_after=start_after,
+        )
+        scanned = rows[:page_size]
+        now = self._now()
+        items = [
+            _from_doc(DevRevTicketSummary, doc)
+            for _id, doc in scanned
+            if _live(doc, now) is not None
+        ]
+        next_cursor = None
+        if len(rows) > page_size and scanned:
+            last_id, last_doc = scanned[-1]
+            next_cursor = seal_cursor(
+                self._cursor_key,
+                {
+                    "v": REVIEW_CURSOR_SCHEMA_VERSION,
+                    "o": last_doc[MIRROR_ORDER_FIELD],
+                    "i": last_id,
+                },
+                context=MIRRORED_TICKETS_CURSOR_CONTEXT,
+                now=now,
+            )
+        return CursorPageOf(items=items, next_cursor=next_cursor, page_size=page_size)
+
     # ------------------------------------------------------------------
     # Remediation batches
     # ------------------------------------------------------------------
@@ -3305,6 +4044,7 @@ class TicketReviewRepository:
                 }
             )
             new_doc["created_at"] = doc["created_at"]
+            _carry_import_progress(doc, new_doc)
             self._stamp_product(new_doc, now)
             view.set(path, new_doc)
             await self._append_global_event(
@@ -3375,11 +4115,13 @@ class TicketReviewRepository:
         *,
         context: MutationContext,
         reversing: bool,
+        max_rows: int = MAX_IMPORT_CHUNK_ROWS,
+        stream_chunk: Optional[tuple[int, int]] = None,
     ) -> TicketImport:
         if context.actor_role is not ReviewerRole.ADMIN:
             raise NotAuthorized("only an admin may apply or reverse an import")
-        if len(specs) > 100:
-            raise ReviewRepositoryError("an import chunk is at most 100 rows")
+        if len(specs) > max_rows:
+            raise ReviewRepositoryError(f"an import chunk is at most {max_rows} rows")
         now = self._now()
         applied = 0
         conflicted = 0
@@ -3478,6 +4220,9 @@ class TicketReviewRepository:
                 }
             )
             new_doc["created_at"] = doc["created_at"]
+            _carry_import_progress(doc, new_doc)
+            if stream_chunk is not None:
+                _advance_import_progress(doc, new_doc, *stream_chunk)
             self._stamp_product(new_doc, now)
             view.set(path, new_doc)
             await self._append_global_event(
@@ -3517,6 +4262,110 @@ class TicketReviewRepository:
             import_id, specs, context=context, reversing=True
         )
 
+    async def stream_import_rows(
+        self,
+        import_id: str,
+        rows: ImportRowSource,
+        *,
+        context: MutationContext,
+        reversing: bool = False,
+        chunk_rows: int = MAX_STREAM_CHUNK_ROWS,
+        concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+    ) -> TicketImport:
+        """Apply (or reverse) an import of any length from a lazy row source.
+
+        ``rows`` is a sync or async iterable of :class:`ImportRowSpec` or plain
+        mappings (see :func:`iter_ndjson_import_rows` /
+        :func:`iter_csv_import_rows`). Rows are validated as they arrive and
+        packed into chunks of ``chunk_rows``; at most ``concurrency`` chunks
+        are in memory or in flight. A chunk that shares a review with an
+        earlier in-flight chunk waits for it, so per-review expected versions
+        still apply in stream order.
+
+        Each committed chunk advances a progress marker on the import inside
+        its own summary transaction. Re-running the same stream with the same
+        idempotency key and ``chunk_rows`` after a crash skips the committed
+        chunks, and replays any half-applied one through its receipts.
+        """
+        if context.actor_role is not ReviewerRole.ADMIN:
+            raise NotAuthorized("only an admin may apply or reverse an import")
+        if not context.idempotency_key:
+            raise ReviewRepositoryError("a streamed import needs an idempotency key to resume")
+        if not 1 <= chunk_rows <= MAX_STREAM_CHUNK_ROWS or concurrency < 1:
+            raise ValueError("chunk_rows or concurrency is out of range")
+        doc = await self.backend.get_doc((IMPORTS_COLLECTION, import_id))
+        if doc is None or _is_tombstone(doc):
+            raise ReviewRepositoryError("no import exists for that id")
+        if doc.get(IMPORT_STREAM_CHUNK_ROWS_FIELD) not in (None, chunk_rows):
+            raise ReviewRepositoryError("resume a streamed import with its original chunk size")
+        committed = set(range(int(doc.get(IMPORT_STREAM_WATERMARK_FIELD) or 0)))
+        committed.update(int(index) for index in doc.get(IMPORT_STREAM_DONE_FIELD) or [])
+
+        slots = asyncio.Semaphore(concurrency)
+        tasks: set[asyncio.Task[None]] = set()
+        last_task_for_review: dict[str, asyncio.Task[None]] = {}
+        seen_rows: set[int] = set()
+
+        async def _chunk(index: int, specs: list[ImportRowSpec], after: list[asyncio.Task[None]]) -> None:
+            try:
+                if after:
+                    await asyncio.gather(*after)
+                await self._write_import_rows(
+                    import_id,
+                    specs,
+                    context=self._derive_context(context, f"chunk:{index}"),
+                    reversing=reversing,
+                    max_rows=chunk_rows,
+                    stream_chunk=(index, chunk_rows),
+                )
+            finally:
+                slots.release()
+
+        async def _launch(index: int, specs: list[ImportRowSpec]) -> None:
+            if index in committed:
+                return
+            await slots.acquire()
+            for task in [task for task in tasks if task.done()]:
+                tasks.discard(task)
+                if task.cancelled() or task.exception() is not None:
+                    slots.release()
+                    task.result()  # a failed chunk stops the stream here
+            for review_id in [key for key, task in last_task_for_review.items() if task.done()]:
+                del last_task_for_review[review_id]
+            after = list({
+                last_task_for_review[spec.review_id]
+                for spec in specs
+                if spec.review_id in last_task_for_review
+            })
+            task = asyncio.ensure_future(_chunk(index, specs, after))
+            tasks.add(task)
+            for spec in specs:
+                last_task_for_review[spec.review_id] = task
+
+        pending: list[ImportRowSpec] = []
+        chunk_index = 0
+        position = 0
+        try:
+            async for raw in _aiter_rows(rows):
+                spec = _import_row_spec(raw, position)
+                position += 1
+                if spec.row_number in seen_rows:
+                    raise ReviewRepositoryError(f"import row {spec.row_number} appears twice")
+                seen_rows.add(spec.row_number)
+                if len(seen_rows) > MAX_CSV_ROWS:
+                    raise ReviewRepositoryError("the import exceeds the canonical row limit")
+                pending.append(spec)
+                if len(pending) == chunk_rows:
+                    await _launch(chunk_index, pending)
+                    pending, chunk_index = [], chunk_index + 1
+            if pending:
+                await _launch(chunk_index, pending)
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return await self.get_import(import_id)
+
     async def list_import_rows(
         self, import_id: str, *, page_size: int = DEFAULT_PAGE_SIZE
     ) -> CursorPageOf:
@@ -3586,6 +4435,138 @@ class TicketReviewRepository:
             raise ReviewRepositoryError("no export exists for that id")
         return _from_doc(TicketExportSummary, doc)
 
+    async def stream_export(
+        self,
+        query: ReviewListQuery,
+        *,
+        context: MutationContext,
+        export_format: str = "csv",
+        page_size: int = MAX_PAGE_SIZE,
+        progress: Optional[ExportProgress] = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield an export of the reviews matching ``query`` as byte chunks.
+
+        The queue grammar applies, minus the exact-id lookup and the sealed
+        cursor: the walk keysets ``query_reviews`` on ``(updated_at,
+        review_id)`` itself, so memory holds one page plus one chunk whatever
+        the export size. The chunks are suitable for a chunked HTTP response
+        or :meth:`export_reviews_to_file`. ``progress`` accumulates the row
+        count and body digest for :meth:`create_export`.
+        """
+        if context.actor_role is not ReviewerRole.ADMIN:
+            raise NotAuthorized("only an admin may export reviews")
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError("export_format must be csv or ndjson")
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError("page_size is out of range")
+        self._assert_supported(query)
+        if query.devrev_display_id is not None or query.cursor is not None:
+            raise UnsupportedFilterCombination("an export walks the whole filtered queue")
+        facet = next(iter(sorted(query.facets)), None)
+        statuses = (
+            [status.value for status in query.statuses]
+            if query.statuses
+            else list(_ALL_REVIEW_STATUS_VALUES)
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if export_format == "csv":
+            writer.writerow(EXPORT_COLUMNS)
+        pending_rows = 0
+        exported = 0
+
+        def _flush() -> bytes:
+            nonlocal pending_rows
+            chunk = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            if progress is not None:
+                progress.update(chunk, pending_rows)
+            if pending_rows:
+                ticket_metrics.emit(
+                    "ticket_export_rows", pending_rows, format=export_format
+                )
+            ticket_metrics.emit("ticket_export_bytes", len(chunk), format=export_format)
+            pending_rows = 0
+            return chunk
+
+        start_after: Optional[tuple[datetime, str]] = None
+        while True:
+            rows = await self.backend.query_reviews(
+                statuses=statuses,
+                facet=facet,
+                facet_value=None if facet is None else query.facets[facet],
+                updated_after=query.updated_after,
+                updated_before=query.updated_before,
+                limit=page_size,
+                start_after=start_after,
+            )
+            for _doc_id, doc in rows:
+                review = _from_doc(TicketReview, doc)
+                if not query.include_reversed and review.import_state is ImportState.REVERSED:
+                    continue
+                exported += 1
+                if exported > MAX_CSV_ROWS:
+                    raise ReviewRepositoryError("the export exceeds the canonical row limit")
+                record = review.model_dump(mode="json")
+                if export_format == "csv":
+                    writer.writerow([_csv_cell(record[column]) for column in EXPORT_COLUMNS])
+                else:
+                    buffer.write(json.dumps(record, sort_keys=True, separators=(",", ":")))
+                    buffer.write("\n")
+                pending_rows += 1
+                if buffer.tell() >= EXPORT_FLUSH_BYTES:
+                    yield _flush()
+            if len(rows) < page_size:
+                break
+            last = _from_doc(TicketReview, rows[-1][1])
+            start_after = (last.updated_at, last.review_id)
+        if buffer.tell():
+            yield _flush()
+
+    async def export_reviews_to_file(
+        self,
+        query: ReviewListQuery,
+        path: Union[str, os.PathLike[str]],
+        *,
+        export_id: str,
+        context: MutationContext,
+        export_format: str = "csv",
+    ) -> TicketExportSummary:
+        """Stream an export into ``path`` and record its summary.
+
+        The body is written to a sibling ``.partial`` file and renamed into
+        place only when complete, so a failed export never leaves a truncated
+        file behind under the final name.
+        """
+        progress = ExportProgress()
+        partial = f"{os.fspath(path)}.partial"
+        sink = await asyncio.to_thread(open, partial, "wb")
+        try:
+            try:
+                async for chunk in self.stream_export(
+                    query, context=context, export_format=export_format, progress=progress
+                ):
+                    await asyncio.to_thread(sink.write, chunk)
+            finally:
+                await asyncio.to_thread(sink.close)
+            await asyncio.to_thread(os.replace, partial, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial)
+            raise
+        return await self.create_export(
+            TicketExportSummary(
+                export_id=export_id,
+                created_by=context.actor,
+                row_count=progress.rows,
+                file_sha256=progress.file_sha256,
+                filter_fingerprint=self._filter_fingerprint(query),
+            ),
+            context=context,
+        )
+
     # ------------------------------------------------------------------
     # Retention: bounded, idempotent, non-cascading
     # ------------------------------------------------------------------
@@ -3724,112 +4705,133 @@ class TicketReviewRepository:
         exact tombstone. There is no recursive delete anywhere in this module,
         and Firestore does not cascade, so a 730-day product purge can never
         shorten the 2,555-day audit contract.
+
+        Each phase finishes before the next starts, so the order holds for
+        every document. Within a phase, independent documents run up to
+        ``retention_concurrency`` at a time against one shared budget, and
+        deletes go in exact-id batches of at most one Firestore transaction.
         """
         if context.actor_role is not ReviewerRole.ADMIN:
             raise NotAuthorized("only an admin may run retention")
-        budget = self._bounded(max_documents)
+        started = time.monotonic()
+        budget = _RetentionBudget(self._bounded(max_documents))
         now = self._now()
         report = RetentionReport()
-        spent = 0
 
-        product, holds, truncated = await self._retention_candidates(now, budget)
+        product, holds, truncated = await self._retention_candidates(now, budget.total)
         report.skipped_legal_hold = holds
 
-        for collection, rows in product.items():
-            for doc_id, doc in rows:
-                if spent >= budget:
-                    truncated = True
-                    break
-                if _is_tombstone(doc):
-                    continue
-                # Product subcollections go BEFORE the parent becomes a
-                # tombstone. A tombstone carries no retention_expires_at and so
-                # is never re-found by this scan; tombstoning first would orphan
-                # any leftover child if the run ran out of budget here.
-                leftover = False
-                for subcollection in self._product_subcollections(collection):
-                    if spent >= budget:
-                        leftover = True
-                        break
-                    deleted, more = await self._delete_subcollection_page(
-                        collection, doc_id, subcollection, now, limit=budget - spent
-                    )
-                    spent += len(deleted)
-                    report.product_documents_deleted.extend(deleted)
-                    leftover = leftover or more
-                if leftover or spent >= budget:
-                    # Leave this parent intact so the next bounded run finds it
-                    # again and finishes the job.
-                    truncated = True
-                    continue
-                if await self._tombstone(collection, doc_id, doc, now):
-                    spent += 1
-                    report.tombstoned.append(doc_id)
+        # Children first, then the tombstone, per parent. Product subcollections
+        # go BEFORE the parent becomes a tombstone: a tombstone carries no
+        # retention_expires_at and so is never re-found by this scan;
+        # tombstoning first would orphan any leftover child if the run ran out
+        # of budget here.
+        parents = [
+            (collection, doc_id, doc)
+            for collection, rows in product.items()
+            for doc_id, doc in rows
+            if not _is_tombstone(doc)
+        ]
+        for deleted, tombstoned, leftover in await self._gather_bounded(
+            [
+                self._purge_product_parent(collection, doc_id, doc, now, budget)
+                for collection, doc_id, doc in parents
+            ]
+        ):
+            report.product_documents_deleted.extend(deleted)
+            if tombstoned is not None:
+                report.tombstoned.append(tombstoned)
+            # A parent left intact is found again by the next bounded run.
+            truncated = truncated or leftover
 
         # Expired ledger events, by exact id, for every parent that has one.
+        ledger_parents: list[tuple[str, str, str]] = []
         for collection in DURABLE_PRODUCT_COLLECTIONS:
-            for subcollection in self._ledger_subcollections(collection):
-                if spent >= budget:
-                    truncated = True
-                    break
-                for doc_id, parent in await self.backend.scan_by_field(
-                    collection, field=TOMBSTONE_LEDGER_EXPIRY_FIELD, before=now, limit=budget
-                ):
-                    if parent.get(LEGAL_HOLD_FIELD) is True:
-                        if doc_id not in report.skipped_legal_hold:
-                            report.skipped_legal_hold.append(doc_id)
-                        continue
-                    if spent >= budget:
-                        truncated = True
-                        break
-                    deleted = await self._delete_expired_events(
-                        collection, doc_id, subcollection, now, limit=budget - spent
-                    )
-                    spent += len(deleted)
-                    report.ledger_events_deleted.extend(deleted)
-
-        # Only now may an exact tombstone go, and only with an empty ledger.
-        for collection in DURABLE_PRODUCT_COLLECTIONS:
-            for doc_id, doc in await self.backend.scan_by_field(
-                collection, field=TOMBSTONE_LEDGER_EXPIRY_FIELD, before=now, limit=budget
+            subcollections = self._ledger_subcollections(collection)
+            if not subcollections:
+                continue
+            if budget.remaining <= 0:
+                truncated = True
+                break
+            for doc_id, parent in await self.backend.scan_by_field(
+                collection,
+                field=TOMBSTONE_LEDGER_EXPIRY_FIELD,
+                before=now,
+                limit=budget.total,
             ):
-                if not _is_tombstone(doc) or doc.get(LEGAL_HOLD_FIELD) is True:
-                    continue
-                if spent >= budget:
-                    truncated = True
-                    break
-                if await self._has_remaining_ledger(collection, doc_id):
+                if parent.get(LEGAL_HOLD_FIELD) is True:
+                    if doc_id not in report.skipped_legal_hold:
+                        report.skipped_legal_hold.append(doc_id)
                     continue
-                if await self._delete_exact_tombstone(collection, doc_id, now):
-                    spent += 1
-                    report.parents_deleted.append(doc_id)
+                ledger_parents.extend(
+                    (collection, doc_id, subcollection) for subcollection in subcollections
+                )
+        for deleted, leftover in await self._gather_bounded(
+            [
+                self._purge_expired_events(collection, doc_id, subcollection, now, budget)
+                for collection, doc_id, subcollection in ledger_parents
+            ]
+        ):
+            report.ledger_events_deleted.extend(deleted)
+            truncated = truncated or leftover
 
-        # Expired global ledger events, by exact id.
-        if spent < budget:
+        # Only now may an exact tombstone go, and only with an empty ledger.
+        tombstones: list[tuple[str, str]] = []
+        for collection in DURABLE_PRODUCT_COLLECTIONS:
             for doc_id, doc in await self.backend.scan_by_field(
-                GLOBAL_AUDIT_EVENTS_COLLECTION,
-                field=RETENTION_FIELD,
-                before=now,
-                limit=budget - spent,
+                collection, field=TOMBSTONE_LEDGER_EXPIRY_FIELD, before=now, limit=budget.total
             ):
-                if doc_id == GLOBAL_CHAIN_HEAD_DOC_ID or not self._ledger_expired(doc, now):
-                    continue
-                await self._delete_document((GLOBAL_AUDIT_EVENTS_COLLECTION, doc_id))
-                spent += 1
-                report.ledger_events_deleted.append(doc_id)
+                if _is_tombstone(doc) and doc.get(LEGAL_HOLD_FIELD) is not True:
+                    tombstones.append((collection, doc_id))
+        for doc_id, leftover in await self._gather_bounded(
+            [
+                self._purge_exact_tombstone(collection, doc_id, now, budget)
+                for collection, doc_id in tombstones
+            ]
+        ):
+            if doc_id is not None:
+                report.parents_deleted.append(doc_id)
+            truncated = truncated or leftover
+
+        # Expired global ledger events, by exact id, in transaction-sized batches.
+        if budget.remaining > 0:
+            expired = [
+                doc_id
+                for doc_id, doc in await self.backend.scan_by_field(
+                    GLOBAL_AUDIT_EVENTS_COLLECTION,
+                    field=RETENTION_FIELD,
+                    before=now,
+                    limit=budget.remaining,
+                )
+                if doc_id != GLOBAL_CHAIN_HEAD_DOC_ID and self._ledger_expired(doc, now)
+            ]
+            report.ledger_events_deleted.extend(
+                await self._delete_exact_batches(
+                    GLOBAL_AUDIT_EVENTS_COLLECTION,
+                    expired,
+                    budget,
+                    lambda doc: self._ledger_expired(doc, now),
+                )
+            )
 
         # Disposable documents. Firestore TTL is cleanup-only and asynchronous,
         # so the facade sweeps elapsed ids explicitly too.
         for collection in sorted(TTL_COLLECTIONS):
-            if spent >= budget:
+            if budget.remaining <= 0:
                 truncated = True
                 break
-            for doc_id, _doc in await self.backend.scan_by_field(
-                collection, field=TTL_FIELD, before=now, limit=budget - spent
-            ):
-                if await self._delete_expired_disposable(collection, doc_id, now):
-                    spent += 1
-                    report.disposable_deleted.append(doc_id)
+            elapsed = [
+                doc_id
+                for doc_id, _doc in await self.backend.scan_by_field(
+                    collection, field=TTL_FIELD, before=now, limit=budget.remaining
+                )
+            ]
+            # Re-checked per document: one refreshed after the scan is live again.
+            report.disposable_deleted.extend(
+                await self._delete_exact_batches(
+                    collection, elapsed, budget, lambda doc: _live(doc, now) is None
+                )
+            )
 
         changed = bool(
             report.tombstoned
@@ -3840,9 +4842,106 @@ class TicketReviewRepository:
         )
         if changed:
             await self._append_retention_event(run_id=run_id, context=context, now=now, report=report)
-        report.truncated = truncated or spent >= budget
+        report.truncated = truncated or budget.remaining <= 0
+        self._emit_retention_metrics(report, time.monotonic() - started)
         return report
 
+    async def _gather_bounded(self, coroutines: Sequence[Awaitable[ResultT]]) -> list[ResultT]:
+        """Await ``coroutines`` with at most ``retention_concurrency`` in flight.
+
+        Results keep the input order, so reports stay deterministic. The first
+        unexpected error cancels whatever has not finished.
+        """
+        slots = asyncio.Semaphore(self._retention_concurrency)
+
+        async def _slot(coroutine: Awaitable[ResultT]) -> ResultT:
+            async with slots:
+                return await coroutine
+
+        tasks = [asyncio.ensure_future(_slot(coroutine)) for coroutine in coroutines]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _emit_retention_metrics(report: RetentionReport, duration_s: float) -> None:
+        for phase, ids in (
+            ("product_documents", report.product_documents_deleted),
+            ("tombstoned", report.tombstoned),
+            ("ledger_events", report.ledger_events_deleted),
+            ("parents", report.parents_deleted),
+            ("disposable", report.disposable_deleted),
+        ):
+            if ids:
+                ticket_metrics.emit("ticket_retention_documents", len(ids), phase=phase)
+        ticket_metrics.emit(
+            "ticket_retention_duration_seconds", min(duration_s, RETENTION_DURATION_MAX_S)
+        )
+
+    async def _purge_product_parent(
+        self,
+        collection: str,
+        doc_id: str,
+        doc: Document,
+        now: datetime,
+        budget: _RetentionBudget,
+    ) -> tuple[list[str], Optional[str], bool]:
+        """Children, then the tombstone, for one parent.
+
+        Returns the deleted child ids, the tombstoned id (if any), and whether
+        the parent was left for a later run.
+        """
+        deleted: list[str] = []
+        for subcollection in self._product_subcollections(collection):
+            more = True
+            while more:
+                page, more = await self._delete_subcollection_page(
+                    collection, doc_id, subcollection, now, budget=budget
+                )
+                deleted.extend(page)
+                if more and not page:
+                    return deleted, None, True
+        if not budget.take(1):
+            return deleted, None, True
+        if await self._tombstone(collection, doc_id, doc, now):
+            return deleted, doc_id, False
+        budget.refund(1)
+        return deleted, None, False
+
+    async def _purge_expired_events(
+        self,
+        collection: str,
+        doc_id: str,
+        subcollection: str,
+        now: datetime,
+        budget: _RetentionBudget,
+    ) -> tuple[list[str], bool]:
+        """Page through one parent's expired ledger events by exact id."""
+        deleted: list[str] = []
+        while True:
+            page, full = await self._delete_expired_events(
+                collection, doc_id, subcollection, now, budget=budget
+            )
+            deleted.extend(page)
+            if not full:
+                return deleted, False
+            if budget.remaining <= 0:
+                return deleted, True
+
+    async def _purge_exact_tombstone(
+        self, collection: str, doc_id: str, now: datetime, budget: _RetentionBudget
+    ) -> tuple[Optional[str], bool]:
+        if await self._has_remaining_ledger(collection, doc_id):
+            return None, False
+        if not budget.take(1):
+            return None, True
+        if await self._delete_exact_tombstone(collection, doc_id, now):
+            return doc_id, False
+        budget.refund(1)
+        return None, False
+
     async def _tombstone(
         self, collection: str, doc_id: str, doc: Document, now: datetime
     ) -> bool:
@@ -3885,15 +4984,27 @@ class TicketReviewRepository:
         return await self.backend.transact(_txn)
 
     async def _delete_subcollection_page(
-        self, collection: str, doc_id: str, subcollection: str, now: datetime, *, limit: int
+        self,
+        collection: str,
+        doc_id: str,
+        subcollection: str,
+        now: datetime,
+        *,
+        budget: _RetentionBudget,
     ) -> tuple[list[str], bool]:
         """Delete one bounded page by exact id; report whether more remain."""
-        bound = max(limit, 1)
+        if budget.remaining <= 0:
+            return [], True
+        bound = min(budget.remaining, FIRESTORE_MAX_WRITES_PER_TRANSACTION)
         rows = await self.backend.list_subcollection(
             (collection, doc_id), subcollection, limit=bound + 1
         )
-        candidates = [row_id for row_id, _doc in rows][:bound]
-        more_remain = len(rows) > bound
+        listed = [row_id for row_id, _doc in rows][:bound]
+        # The budget is claimed after the read: another parent may have spent
+        # part of it meanwhile.
+        granted = budget.take(len(listed))
+        candidates = listed[:granted]
+        more_remain = len(rows) > bound or granted < len(listed)
         if not candidates:
             return [], more_remain
 
@@ -3917,7 +5028,12 @@ class TicketReviewRepository:
                 deleted.append(row_id)
             return deleted
 
-        return await self.backend.transact(_txn), more_remain
+        deleted = await self.backend.transact(_txn)
+        budget.refund(len(candidates) - len(deleted))
+        if not deleted:
+            # Declined (hold, or the parent is live again): stop paging it.
+            return [], False
+        return deleted, more_remain
 
     async def _delete_expired_events(
         self,
@@ -3926,16 +5042,24 @@ class TicketReviewRepository:
         subcollection: str,
         now: datetime,
         *,
-        limit: int,
-    ) -> list[str]:
+        budget: _RetentionBudget,
+    ) -> tuple[list[str], bool]:
+        """Delete one page of expired events; report whether the page was full.
+
+        Only a page that was entirely expired and entirely deleted is worth
+        re-reading; anything else means the rest of the ledger is still young.
+        """
+        if budget.remaining <= 0:
+            return [], False
+        bound = min(budget.remaining, FIRESTORE_MAX_WRITES_PER_TRANSACTION)
         rows = await self.backend.list_subcollection(
-            (collection, doc_id), subcollection, limit=max(limit, 1)
+            (collection, doc_id), subcollection, limit=bound
         )
-        candidates = [
-            row_id for row_id, event in rows if self._ledger_expired(event, now)
-        ][:limit]
+        expired = [row_id for row_id, event in rows if self._ledger_expired(event, now)]
+        granted = budget.take(len(expired))
+        candidates = expired[:granted]
         if not candidates:
-            return []
+            return [], False
 
         async def _txn(view: TransactionView) -> list[str]:
             # Re-decide inside the transaction: a legal hold placed after the
@@ -3954,7 +5078,9 @@ class TicketReviewRepository:
                 deleted.append(row_id)
             return deleted
 
-        return await self.backend.transact(_txn)
+        deleted = await self.backend.transact(_txn)
+        budget.refund(len(candidates) - len(deleted))
+        return deleted, len(rows) == bound and len(deleted) == len(rows)
 
     async def _has_remaining_ledger(self, collection: str, doc_id: str) -> bool:
         for subcollection in self._ledger_subcollections(collection):
@@ -3983,28 +5109,46 @@ class TicketReviewRepository:
 
         return await self.backend.transact(_txn)
 
-    async def _delete_expired_disposable(
-        self, collection: str, doc_id: str, now: datetime
-    ) -> bool:
-        """Sweep one elapsed disposable document, re-checked transactionally."""
+    async def _delete_exact_batches(
+        self,
+        collection: str,
+        doc_ids: Sequence[str],
+        budget: _RetentionBudget,
+        still_expired: Callable[[Mapping[str, Any]], bool],
+    ) -> list[str]:
+        """Delete top-level documents by exact id, one transaction per batch.
 
-        async def _txn(view: TransactionView) -> bool:
-            path = (collection, doc_id)
-            current = await view.get(path)
-            if current is None or _live(current, now) is not None:
-                # It was refreshed after the scan; it is live again.
-                return False
-            view.delete(path)
-            return True
+        Each batch is re-read inside its transaction with one ``get_all``
+        before any write, and a document is deleted only if ``still_expired``
+        holds for the committed state.
+        """
+        granted = budget.take(len(doc_ids))
+        candidates = list(doc_ids[:granted])
+        batches = [
+            candidates[start:start + FIRESTORE_MAX_WRITES_PER_TRANSACTION]
+            for start in range(0, len(candidates), FIRESTORE_MAX_WRITES_PER_TRANSACTION)
+        ]
 
-        return await self.backend.transact(_txn)
+        async def _batch(batch: list[str]) -> list[str]:
+            async def _txn(view: TransactionView) -> list[str]:
+                deleted: list[str] = []
+                docs = await view.get_all([(collection, doc_id) for doc_id in batch])
+                for doc_id, current in zip(batch, docs, strict=True):
+                    if current is None or not still_expired(current):
+                        continue
+                    view.delete((collection, doc_id))
+                    deleted.append(doc_id)
+                return deleted
 
-    async def _delete_document(self, path: DocPath) -> None:
-        async def _txn(view: TransactionView) -> None:
-            if await view.get(path) is not None:
-                view.delete(path)
+            return await self.backend.transact(_txn)
 
-        await self.backend.transact(_txn)
+        deleted = [
+            doc_id
+            for batch in await self._gather_bounded([_batch(batch) for batch in batches])
+            for doc_id in batch
+        ]
+        budget.refund(len(candidates) - len(deleted))
+        return deleted
 
     async def _append_retention_event(
         self, *, run_id: str, context: MutationContext, now: datetime, report: RetentionReport
@@ -4054,8 +5198,12 @@ __all__ = [
     "CHAIN_HEAD_FIELD",
     "CONSOLE_CACHE_COLLECTION",
     "DEVREV_MESSAGE_CACHE_COLLECTION",
+    "DEVREV_SYNC_WATERMARK_DOC_ID",
+    "DEVREV_TICKET_MIRROR_COLLECTION",
     "EVIDENCE_LINKS_SUBCOLLECTION",
     "EXPORTS_COLLECTION",
+    "EXPORT_COLUMNS",
+    "EXPORT_FORMATS",
     "FIRESTORE_MAX_DOCUMENT_BYTES",
     "FIRESTORE_MAX_WRITES_PER_TRANSACTION",
     "GLOBAL_AUDIT_EVENTS_COLLECTION",
@@ -4064,7 +5212,14 @@ __all__ = [
     "IMPORTS_COLLECTION",
     "IMPORT_ROWS_SUBCOLLECTION",
     "IMPORT_STAGING_COLLECTION",
+    "IMPORT_STREAM_CHUNK_ROWS_FIELD",
+    "IMPORT_STREAM_DONE_FIELD",
+    "IMPORT_STREAM_WATERMARK_FIELD",
     "LEGAL_HOLD_FIELD",
+    "MAX_IMPORT_CHUNK_ROWS",
+    "MAX_STREAM_CHUNK_ROWS",
+    "MIRRORED_TICKETS_CURSOR_CONTEXT",
+    "MIRROR_ORDER_FIELD",
     "PURGED_TOMBSTONE_KIND",
     "RETENTION_FIELD",
     "REVIEWS_COLLECTION",
@@ -4080,10 +5235,14 @@ __all__ = [
     "BatchNotFound",
     "BatchReleaseRefused",
     "BatchVersionConflict",
+    "CacheEntryTooLarge",
     "ConsoleCacheEntry",
     "DevRevMessageCacheEntry",
+    "DevRevMirrorWrite",
+    "DevRevSyncWatermark",
     "EvidenceCandidate",
     "EvidenceCandidateRejected",
+    "ExportProgress",
     "FirestoreTicketReviewBackend",
     "IdempotencyConflict",
     "ImportRowSpec",
@@ -4111,6 +5270,8 @@ __all__ = [
     "UnsupportedFilterCombination",
     "canonical_ttl_declarations",
     "item_set_digest",
+    "iter_csv_import_rows",
+    "iter_ndjson_import_rows",
     "normalize_display_id",
     "review_index_declarations",
     "sha256_hex",
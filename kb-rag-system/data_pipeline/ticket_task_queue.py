@@ -19,13 +19,21 @@ Cada task lleva ``dispatch_deadline`` EXPLÍCITO (540s) y un body autenticado
 por OIDC ``{job_id, enqueue_generation}`` que el worker compara antes del
 lease. El rol IAM queda limitado a tasks.create/tasks.get/queues.get: este
 módulo no usa operaciones admin.
+
+La admisión no llama GetQueue por request: ``QueueDelayEstimator`` mantiene
+un snapshot refrescado en background y admisión lo lee en O(1), fallando
+cerrada sólo si el snapshot es más viejo que el bound configurado.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
-from typing import Any, Awaitable, Callable, Optional, cast
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Protocol, cast
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,17 @@ class TicketQueueEstimationError(TicketQueueError):
     """Queue capacity cannot be read safely, so new admission must stop."""
 
 
+@dataclass(frozen=True)
+class QueueStats:
+    """Lectura sanitizada de GetQueue: sólo conteos y tasas."""
+
+    tasks_count: int
+    max_dispatches_per_second: float
+    # Tasa que Cloud Tasks aplica realmente (<= max; baja cuando el worker
+    # responde lento o con errores). 0 = sin dato.
+    effective_execution_rate: float = 0.0
+
+
 def task_name_for_job(project: str, location: str, queue: str, job_id: str,
                       generation: int = 0) -> str:
     return (
@@ -158,18 +177,14 @@ class CloudTasksTicketQueue:
             return False
         return True
 
-    async def estimated_queue_delay_s(self) -> float:
-        """Estimate queued work / dispatch rate, failing closed if unknown."""
+    async def _read_queue_stats(self, paths: list[str]) -> QueueStats:
         try:
             from google.protobuf import field_mask_pb2
 
             request = self._stats_tasks_v2beta3.GetQueueRequest(
                 name=self._stats_client.queue_path(
                     self._project, self._location, self._queue),
-                read_mask=field_mask_pb2.FieldMask(paths=[
-                    "stats.tasks_count",
-                    "rate_limits.max_dispatches_per_second",
-                ]),
+                read_mask=field_mask_pb2.FieldMask(paths=paths),
             )
             queue = await self._stats_client.get_queue(request=request)
             stats = getattr(queue, "stats", None)
@@ -177,10 +192,16 @@ class CloudTasksTicketQueue:
             rate = float(getattr(
                 getattr(queue, "rate_limits", None),
                 "max_dispatches_per_second", 0) or 0)
+            effective = float(
+                getattr(stats, "effective_execution_rate", 0) or 0)
             if rate <= 0:
                 raise TicketQueueEstimationError(
                     "dispatch rate unavailable for queue admission")
-            return max(0, tasks_count) / rate
+            return QueueStats(
+                tasks_count=max(0, tasks_count),
+                max_dispatches_per_second=rate,
+                effective_execution_rate=max(0.0, effective),
+            )
         except TicketQueueEstimationError:
             raise
         except Exception as exc:  # noqa: BLE001 - admission remains fail-closed
@@ -191,6 +212,22 @@ class CloudTasksTicketQueue:
             raise TicketQueueEstimationError(
                 "queue stats unavailable for admission") from exc
 
+    async def estimated_queue_delay_s(self) -> float:
+        """Estimate queued work / dispatch rate, failing closed if unknown."""
+        stats = await self._read_queue_stats([
+            "stats.tasks_count",
+            "rate_limits.max_dispatches_per_second",
+        ])
+        return stats.tasks_count / stats.max_dispatches_per_second
+
+    async def queue_stats(self) -> QueueStats:
+        """Snapshot para ``QueueDelayEstimator`` (incluye la tasa efectiva)."""
+        return await self._read_queue_stats([
+            "stats.tasks_count",
+            "stats.effective_execution_rate",
+            "rate_limits.max_dispatches_per_second",
+        ])
+
     async def aclose(self) -> None:
         for client in (self._client, self._stats_client):
             try:
@@ -202,6 +239,111 @@ class CloudTasksTicketQueue:
                 logger.error("error cerrando CloudTasksAsyncClient")
 
 
+class _QueueStatsSource(Protocol):
+    async def queue_stats(self) -> QueueStats: ...
+
+
+class QueueDelayEstimator:
+    """Demora estimada de la cola, refrescada en background para admisión.
+
+    ``refresh()`` lee GetQueue y suaviza la tasa de despacho con una EWMA:
+    la tasa efectiva de Cloud Tasks fluctúa entre lecturas y, sin suavizar,
+    un solo snapshot bajo rechazaría admisión de golpe. El backlog
+    (``tasks_count``) NO se suaviza: un pico de trabajo encolado se refleja
+    en la siguiente lectura. ``current()`` es O(1) y falla cerrada
+    (``TicketQueueEstimationError``) si nunca hubo lectura exitosa o la
+    última es más vieja que ``max_age_s``; un error transitorio de la API de
+    stats sólo envejece el snapshot.
+    """
+
+    def __init__(
+        self,
+        source: _QueueStatsSource,
+        *,
+        refresh_interval_s: float = 10.0,
+        max_age_s: float = 60.0,
+        smoothing: float = 0.3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing debe estar en (0, 1]")
+        self._source = source
+        self._refresh_interval_s = refresh_interval_s
+        self._max_age_s = max_age_s
+        self._smoothing = smoothing
+        self._clock = clock
+        self._rate: Optional[float] = None
+        self._delay_s: Optional[float] = None
+        self._observed_at: Optional[float] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopped = asyncio.Event()
+
+    def age_s(self) -> Optional[float]:
+        if self._observed_at is None:
+            return None
+        return max(0.0, self._clock() - self._observed_at)
+
+    def current(self) -> float:
+        age = self.age_s()
+        if age is None or self._delay_s is None:
+            raise TicketQueueEstimationError("queue delay not yet observed")
+        if age > self._max_age_s:
+            raise TicketQueueEstimationError("queue delay snapshot is stale")
+        return self._delay_s
+
+    async def refresh(self) -> float:
+        stats = await self._source.queue_stats()
+        observed = stats.max_dispatches_per_second
+        if 0 < stats.effective_execution_rate < observed:
+            observed = stats.effective_execution_rate
+        if not math.isfinite(observed) or observed <= 0:
+            raise TicketQueueEstimationError(
+                "dispatch rate unavailable for queue admission")
+        if self._rate is None:
+            self._rate = observed
+        else:
+            self._rate += self._smoothing * (observed - self._rate)
+        self._delay_s = stats.tasks_count / self._rate
+        self._observed_at = self._clock()
+        return self._delay_s
+
+    async def _run(self, refresh_now: bool) -> None:
+        if not refresh_now:
+            await self._sleep_interval()
+        while not self._stopped.is_set():
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 - el snapshot envejece
+                logger.warning(
+                    "queue delay refresh failed (error_type=%s)",
+                    type(exc).__name__,
+                )
+            await self._sleep_interval()
+
+    async def _sleep_interval(self) -> None:
+        stop = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait({stop}, timeout=self._refresh_interval_s)
+        finally:
+            stop.cancel()
+
+    def start(self, *, refresh_now: bool = True) -> None:
+        """Arranca el refresher. ``refresh_now=False`` cuando el caller ya
+        intentó un refresh: el primero espera un intervalo completo."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(refresh_now))
+
+    async def aclose(self) -> None:
+        self._stopped.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
 class InlineTicketQueue:
     """Dev/tests: ejecuta el worker durable en el mismo proceso.
 
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Script para chunkear todo el corpus de artículos y escribir su manifest.
+
+Este script:
+1. Descubre todos los artículos JSON bajo el directorio del corpus
+2. Los valida y chunkea en un pool de procesos
+3. Escribe un manifest determinista (IDs de chunk, chunk_hash y tokens)
+4. Reporta tiempos por etapa
+
+No toca Pinecone. El manifest sirve para comparar builds (el mismo corpus
+produce el mismo manifest byte a byte); NO es un baseline para
+reindex_corpus.py --baseline-manifest, que sólo acepta el manifest marcado
+"indexed" que escribe --manifest-out.
+
+Uso:
+    python scripts/build_corpus_manifest.py
+
+    # Con opciones
+    python scripts/build_corpus_manifest.py <corpus-dir> --output <path>
+    python scripts/build_corpus_manifest.py --workers 8
+"""
+
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+
+# Agregar parent directory al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_pipeline.corpus_manifest import build_corpus, write_manifest
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parent.parent.parent / "PA"
+DEFAULT_OUTPUT = Path(__file__).resolve().parent.parent / "corpus_build_manifest.json"
+
+
+def build_manifest(corpus_dir: Path, output: Path, workers: int = 0) -> bool:
+    """
+    Chunkea el corpus y escribe el manifest.
+
+    Args:
+        corpus_dir: Directorio raíz del corpus
+        output: Path del manifest a escribir
+        workers: Procesos del pool (0 = uno por CPU)
+
+    Returns:
+        True si todos los artículos fueron válidos
+    """
+    build = build_corpus(corpus_dir, workers=workers or None)
+    if not build.articles:
+        logger.error(f"❌ No se encontraron artículos en {corpus_dir}")
+        return False
+
+    started = time.monotonic()
+    manifest = build.manifest()
+    write_manifest(manifest, output)
+    manifest_s = time.monotonic() - started
+
+    print("\n" + "=" * 80)
+    print("  MANIFEST DEL CORPUS")
+    print("=" * 80 + "\n")
+    print(f"   Artículos: {manifest['article_count']} (inválidos: {len(manifest['invalid'])})")
+    print(f"   Chunks: {manifest['chunk_count']}")
+    print(f"   Tokens: {manifest['token_count']}")
+    print(f"   Corpus sha256: {manifest['corpus_sha256']}")
+    print(f"   Manifest: {output}")
+    print(f"\n⏱️  Tiempos:")
+    print(f"   Descubrimiento: {build.timings['discover_s']:.2f}s")
+    print(f"   Validación + chunking: {build.timings['chunk_s']:.2f}s")
+    print(f"   Manifest: {manifest_s:.2f}s")
+
+    for invalid in manifest['invalid']:
+        print(f"\n⚠️  Inválido ({invalid['error']}): {invalid['path']}")
+
+    return not manifest['invalid']
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description="Chunkear todo el corpus y escribir su manifest (sin tocar Pinecone)"
+    )
+
+    parser.add_argument(
+        "corpus_dir",
+        nargs="?",
+        default=str(DEFAULT_CORPUS_DIR),
+        help=f"Directorio del corpus (default: {DEFAULT_CORPUS_DIR})"
+    )
+
+    parser.add_argument(
+        "--output",
+        default=str(DEFAULT_OUTPUT),
+        help=f"Path del manifest (default: {DEFAULT_OUTPUT})"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Procesos del pool (default: uno por CPU)"
+    )
+
+    args = parser.parse_args()
+
+    success = build_manifest(Path(args.corpus_dir), Path(args.output), workers=args.workers)
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ Script para procesar un solo artículo JSON y subirlo a Pinecone.
 Este script:
 1. Carga el artículo JSON
 2. Genera chunks con metadata
-3. Sube los chunks a Pinecone
+3. Sube a Pinecone sólo los chunks nuevos o cambiados (por chunk_hash) y
+   borra los que ya no existen
 
 Uso:
     python scripts/process_single_article.py <path-to-json>
@@ -13,6 +14,7 @@ Uso:
     # Con opciones
     python scripts/process_single_article.py <path> --dry-run
     python scripts/process_single_article.py <path> --show-chunks
+    python scripts/process_single_article.py <path> --full
 """
 
 import sys
@@ -43,7 +45,8 @@ logger = logging.getLogger(__name__)
 def process_article(
     article_path: str,
     dry_run: bool = False,
-    show_chunks: bool = False
+    show_chunks: bool = False,
+    full: bool = False
 ) -> bool:
     """
     Procesa un artículo y lo sube a Pinecone.
@@ -52,6 +55,7 @@ def process_article(
         article_path: Path al archivo JSON del artículo
         dry_run: Si True, no sube a Pinecone
         show_chunks: Si True, muestra chunks generados
+        full: Si True, re-sube todos los chunks aunque su hash no cambió
     
     Returns:
         True si fue exitoso
@@ -103,10 +107,17 @@ def process_article(
             logger.info("🏜️  Dry-run: No se subirán chunks a Pinecone")
             return True
         
-        logger.info(f"📤 Subiendo chunks a Pinecone...")
         uploader = PineconeUploader()
+        diff = uploader.plan_article_reindex(
+            article['metadata']['article_id'], chunks, force=full
+        )
+        logger.info(
+            f"📊 Nuevos: {diff.added} | Cambiados: {diff.changed} | "
+            f"Sin cambios: {diff.unchanged} | A borrar: {len(diff.delete_ids)}"
+        )
         
-        result = uploader.upload_chunks(chunks, show_progress=True)
+        logger.info(f"📤 Subiendo chunks a Pinecone...")
+        result = uploader.apply_chunk_diff(diff, show_progress=True)
         
         print("\n" + "="*80)
         print("PROCESAMIENTO DE ARTÍCULO")
@@ -162,13 +173,20 @@ def main():
         help="Mostrar chunks generados"
     )
     
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-subir todos los chunks, no sólo los nuevos o cambiados"
+    )
+    
     args = parser.parse_args()
     
     # Procesar artículo
     success = process_article(
         args.article_path,
         dry_run=args.dry_run,
-        show_chunks=args.show_chunks
+        show_chunks=args.show_chunks,
+        full=args.full
     )
     
     # Exit code
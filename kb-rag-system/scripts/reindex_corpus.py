@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Script para re-indexar todo el corpus de artículos (árbol PA/) en Pinecone.
+
+Este script:
+1. Descubre, valida y chunkea todos los artículos del corpus en un pool de
+   procesos (ver data_pipeline/corpus_manifest.py)
+2. Compara cada artículo por chunk_hash con lo indexado (igual que
+   update_article.py), o con un manifest anterior (--baseline-manifest,
+   sólo uno escrito por --manifest-out: lleva la marca "indexed")
+3. Sube TODOS los chunks nuevos o cambiados en un único upload pipelined
+   (varios batches en vuelo, backoff adaptativo ante 429)
+4. Borra los chunks desaparecidos, sólo si todo el upsert salió bien
+5. Opcionalmente escribe el manifest de lo indexado, marcado "indexed"
+   (--manifest-out)
+
+Los artículos que ya no existen en el corpus no se tocan: para eso está
+delete_article.py.
+
+Uso:
+    python scripts/reindex_corpus.py
+
+    # Con opciones
+    python scripts/reindex_corpus.py <corpus-dir>
+    python scripts/reindex_corpus.py --dry-run
+    python scripts/reindex_corpus.py --concurrency 8
+    python scripts/reindex_corpus.py --full
+    python scripts/reindex_corpus.py --workers 8
+    python scripts/reindex_corpus.py --baseline-manifest corpus_manifest.json
+    python scripts/reindex_corpus.py --manifest-out corpus_manifest.json
+"""
+
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+from typing import Optional
+from dotenv import load_dotenv
+
+# Agregar parent directory al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Cargar variables de entorno desde .env
+load_dotenv(Path(__file__).parent.parent / ".env")
+
+from data_pipeline.chunking import merge_chunk_diffs
+from data_pipeline.corpus_manifest import (
+    build_corpus,
+    load_manifest,
+    manifest_chunk_hashes,
+    write_manifest,
+)
+from data_pipeline.pinecone_uploader import PineconeUploader
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parent.parent.parent / "PA"
+
+
+def reindex_corpus(
+    corpus_dir: Path,
+    dry_run: bool = False,
+    full: bool = False,
+    concurrency: int = 4,
+    workers: int = 0,
+    baseline_manifest: Optional[Path] = None,
+    manifest_out: Optional[Path] = None
+) -> bool:
+    """
+    Re-indexa de forma diferencial todos los artículos del corpus.
+
+    Args:
+        corpus_dir: Directorio raíz del corpus (se recorre recursivamente)
+        dry_run: Si True, sólo muestra qué cambiaría
+        full: Si True, re-sube todos los chunks aunque su hash no cambió
+        concurrency: Batches de upsert en vuelo como máximo
+        workers: Procesos del pool de chunking (0 = uno por CPU)
+        baseline_manifest: Manifest de lo ya indexado; si se da, el diff se
+            hace contra él en vez de leer los hashes de Pinecone
+        manifest_out: Dónde escribir el manifest tras un upload sin fallos
+
+    Returns:
+        True si todos los artículos se procesaron y subieron sin fallos
+    """
+    # ====================================================================
+    # PASO 1: Chunking del corpus en paralelo
+    # ====================================================================
+    build = build_corpus(corpus_dir, workers=workers or None)
+    if not build.articles:
+        logger.error(f"❌ No se encontraron artículos en {corpus_dir}")
+        return False
+    for article in build.invalid:
+        logger.error(f"❌ Artículo inválido ({article.error}): {article.path}")
+    baseline = load_manifest(baseline_manifest, baseline=True) if baseline_manifest else None
+
+    uploader = PineconeUploader(max_in_flight=concurrency)
+    try:
+        # ================================================================
+        # PASO 2: Diff por artículo
+        # ================================================================
+        started = time.monotonic()
+        # Los list/fetch de cada artículo van en paralelo (hasta
+        # `concurrency` en vuelo), igual que el upload.
+        diffs = uploader.plan_articles_reindex(
+            [
+                (
+                    article.article_id,
+                    article.chunks,
+                    None if baseline is None
+                    else manifest_chunk_hashes(baseline, article.article_id),
+                )
+                for article in build.valid
+            ],
+            force=full,
+        )
+        diff = merge_chunk_diffs(diffs)
+        plan_s = time.monotonic() - started
+        invalid = len(build.invalid)
+
+        print("\n" + "=" * 80)
+        print("  RE-INDEXADO DEL CORPUS")
+        print("=" * 80 + "\n")
+        print(f"   Artículos: {len(build.valid)} (inválidos: {invalid})")
+        print(f"   Nuevos: {diff.added}")
+        print(f"   Cambiados: {diff.changed}")
+        print(f"   Sin cambios: {diff.unchanged}")
+        print(f"   Desaparecidos (se borrarán): {len(diff.delete_ids)}")
+        print(f"\n⏱️  Tiempos:")
+        print(f"   Descubrimiento: {build.timings['discover_s']:.2f}s")
+        print(f"   Validación + chunking: {build.timings['chunk_s']:.2f}s")
+        print(f"   Diff ({'manifest' if baseline else 'Pinecone'}): {plan_s:.2f}s")
+
+        if dry_run:
+            logger.info("🏜️  Dry-run: No se subirán ni borrarán chunks")
+            return invalid == 0
+        if not diff.has_writes:
+            print("\n✅ El corpus ya está al día en Pinecone (no hay cambios)")
+            if manifest_out:
+                write_manifest(build.manifest(indexed=True), manifest_out)
+            return invalid == 0
+
+        # ================================================================
+        # PASO 3: Upload pipelined y borrado de desaparecidos
+        # ================================================================
+        started = time.monotonic()
+        result = uploader.apply_chunk_diff(diff, show_progress=True)
+        upload_s = time.monotonic() - started
+
+        print(f"\n   Subidos: {len(diff.upsert) - result['failed']}/{len(diff.upsert)}")
+        print(f"   Borrados: {result['deleted']}/{len(diff.delete_ids)}")
+        print(f"   Upload: {upload_s:.2f}s ({concurrency} batches en vuelo)")
+
+        if result['failed'] > 0:
+            logger.warning(f"⚠️  {result['failed']} chunks fallaron (no se borró nada pendiente)")
+            return False
+        if manifest_out:
+            # Sólo tras un upload completo: el manifest describe lo indexado.
+            write_manifest(build.manifest(indexed=True), manifest_out)
+            print(f"   Manifest: {manifest_out}")
+        print("\n✅ RE-INDEXADO COMPLETADO")
+        return invalid == 0
+    finally:
+        uploader.close()
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(
+        description="Re-indexar todo el corpus de artículos en Pinecone (diferencial)"
+    )
+
+    parser.add_argument(
+        "corpus_dir",
+        nargs="?",
+        default=str(DEFAULT_CORPUS_DIR),
+        help=f"Directorio del corpus (default: {DEFAULT_CORPUS_DIR})"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="No hacer cambios en Pinecone (solo mostrar qué haría)"
+    )
+
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-subir todos los chunks, no sólo los nuevos o cambiados"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Batches de upsert en vuelo como máximo (default: 4)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Procesos del pool de chunking (default: uno por CPU)"
+    )
+
+    parser.add_argument(
+        "--baseline-manifest",
+        help="Comparar contra este manifest (escrito por --manifest-out) en vez de "
+             "leer los hashes de Pinecone"
+    )
+
+    parser.add_argument(
+        "--manifest-out",
+        help="Escribir el manifest de lo indexado tras un upload sin fallos"
+    )
+
+    args = parser.parse_args()
+
+    success = reindex_corpus(
+        Path(args.corpus_dir),
+        dry_run=args.dry_run,
+        full=args.full,
+        concurrency=args.concurrency,
+        workers=args.workers,
+        baseline_manifest=Path(args.baseline_manifest) if args.baseline_manifest else None,
+        manifest_out=Path(args.manifest_out) if args.manifest_out else None
+    )
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
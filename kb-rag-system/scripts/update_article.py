@@ -4,9 +4,13 @@ Script para actualizar un artículo en Pinecone.
 
 Este script:
 1. Lee el article_id del archivo JSON
-2. Busca y borra la versión vieja en Pinecone
-3. Procesa el artículo actualizado
-4. Sube los nuevos chunks
+2. Lee los hashes de los chunks ya indexados en Pinecone
+3. Procesa el artículo actualizado y lo compara chunk por chunk
+4. Sube sólo los chunks nuevos o cambiados
+5. Borra sólo los chunks que desaparecieron
+
+El artículo nunca queda sin vectores: los upserts sobreescriben por ID y el
+borrado de IDs desaparecidos ocurre al final, sólo si todo el upsert salió bien.
 
 Uso:
     python scripts/update_article.py <path-to-json>
@@ -15,6 +19,7 @@ Uso:
     python scripts/update_article.py <path> --dry-run
     python scripts/update_article.py <path> --skip-confirmation
     python scripts/update_article.py <path> --show-chunks
+    python scripts/update_article.py <path> --full
 
 Ejemplo:
     python scripts/update_article.py "Participant Advisory/Distributions/LT: How to Request a 401(k) Termination Cash Withdrawal or Rollover.json"
@@ -22,7 +27,6 @@ Ejemplo:
 
 import sys
 import os
-import json
 import argparse
 import logging
 from pathlib import Path
@@ -35,7 +39,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 from data_pipeline.article_processor import load_article_from_path
-from data_pipeline.chunking import generate_chunks_from_article
+from data_pipeline.chunking import ChunkDiff, generate_chunks_from_article
 from data_pipeline.pinecone_uploader import PineconeUploader
 
 # Configurar logging
@@ -46,22 +50,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def confirm_update(article_id: str, old_chunk_count: int) -> bool:
+def confirm_update(article_id: str, diff: ChunkDiff) -> bool:
     """
     Pide confirmación al usuario antes de actualizar.
     
     Args:
         article_id: ID del artículo a actualizar
-        old_chunk_count: Número de chunks viejos que se borrarán
+        diff: Cambios que se aplicarán
     
     Returns:
         True si el usuario confirma, False si no
     """
     print(f"\n⚠️  CONFIRMACIÓN DE ACTUALIZACIÓN:")
     print(f"   Article ID: {article_id}")
-    print(f"   Chunks viejos a borrar: {old_chunk_count}")
-    print(f"   Se procesará y subirá la versión actualizada")
-    print(f"\n   Esta acción borrará la versión vieja.\n")
+    print(f"   Chunks a subir: {len(diff.upsert)} ({diff.added} nuevos, {diff.changed} cambiados)")
+    print(f"   Chunks a borrar: {len(diff.delete_ids)}")
+    print(f"\n   Los chunks intactos ({diff.unchanged}) no se tocan.\n")
     
     response = input("¿Continuar? (escribe 'si' para confirmar): ").strip().lower()
     return response in ['si', 'sí', 'yes', 'y']
@@ -71,16 +75,18 @@ def update_article(
     article_path: str,
     dry_run: bool = False,
     skip_confirmation: bool = False,
-    show_chunks: bool = False
+    show_chunks: bool = False,
+    full: bool = False
 ) -> bool:
     """
-    Actualiza un artículo en Pinecone (borra viejo y sube nuevo).
+    Actualiza un artículo en Pinecone de forma diferencial.
     
     Args:
         article_path: Path al archivo JSON del artículo actualizado
         dry_run: Si True, no hace cambios en Pinecone
         skip_confirmation: Si True, no pide confirmación
         show_chunks: Si True, muestra chunks generados
+        full: Si True, re-sube todos los chunks aunque su hash no cambió
     
     Returns:
         True si fue exitoso
@@ -111,38 +117,35 @@ def update_article(
         print(f"   Plan type: {article['metadata']['plan_type']}")
         
         # ====================================================================
-        # PASO 2: Buscar versión vieja en Pinecone
+        # PASO 2: Leer hashes de la versión indexada
         # ====================================================================
         print("\n" + "=" * 80)
-        print("  PASO 2: BUSCAR VERSIÓN VIEJA EN PINECONE")
+        print("  PASO 2: LEER VERSIÓN INDEXADA EN PINECONE")
         print("=" * 80 + "\n")
         
-        logger.info(f"🔍 Buscando versión vieja en Pinecone...")
+        logger.info(f"🔍 Leyendo hashes de chunks en Pinecone...")
         uploader = PineconeUploader()
         
-        old_chunks = uploader.get_article_chunks(article_id)
+        stored_hashes = uploader.list_chunk_hashes(
+            uploader.article_chunk_prefix(article_id)
+        )
+        has_old_version = bool(stored_hashes)
         
-        if not old_chunks:
+        if not has_old_version:
             logger.warning(f"⚠️  No se encontró versión vieja del artículo en Pinecone")
             logger.info(f"   El artículo se procesará como nuevo")
-            has_old_version = False
         else:
-            print(f"✅ Versión vieja encontrada:")
-            print(f"   Chunks existentes: {len(old_chunks)}")
-            
-            # Mostrar info de la versión vieja
-            if old_chunks:
-                first_chunk = old_chunks[0]
-                old_metadata = first_chunk.get('metadata', {})
-                print(f"   Título: {old_metadata.get('article_title', 'N/A')}")
-            
-            has_old_version = True
+            print(f"✅ Versión indexada encontrada:")
+            print(f"   Chunks existentes: {len(stored_hashes)}")
+            unhashed = sum(1 for value in stored_hashes.values() if value is None)
+            if unhashed:
+                print(f"   Sin hash (se re-subirán): {unhashed}")
         
         # ====================================================================
-        # PASO 3: Generar nuevos chunks
+        # PASO 3: Generar nuevos chunks y comparar
         # ====================================================================
         print("\n" + "=" * 80)
-        print("  PASO 3: GENERAR NUEVOS CHUNKS")
+        print("  PASO 3: GENERAR Y COMPARAR CHUNKS")
         print("=" * 80 + "\n")
         
         logger.info(f"🔨 Generando chunks desde artículo actualizado...")
@@ -161,116 +164,88 @@ def update_article(
             if count > 0:
                 print(f"     {tier.upper()}: {count} chunks")
         
-        # Mostrar comparación
-        if has_old_version:
-            print(f"\n📊 Comparación:")
-            print(f"   Chunks viejos: {len(old_chunks)}")
-            print(f"   Chunks nuevos: {len(new_chunks)}")
-            delta = len(new_chunks) - len(old_chunks)
-            if delta > 0:
-                print(f"   Cambio: +{delta} chunks")
-            elif delta < 0:
-                print(f"   Cambio: {delta} chunks")
-            else:
-                print(f"   Cambio: mismo número de chunks")
+        diff = uploader.plan_article_reindex(
+            article_id, new_chunks, stored_hashes=stored_hashes, force=full
+        )
+        
+        print(f"\n📊 Comparación:")
+        print(f"   Nuevos: {diff.added}")
+        print(f"   Cambiados: {diff.changed}")
+        print(f"   Sin cambios: {diff.unchanged}")
+        print(f"   Desaparecidos (se borrarán): {len(diff.delete_ids)}")
         
         # Mostrar chunks si se solicita
         if show_chunks:
             print("\n" + "=" * 80)
-            print("NUEVOS CHUNKS GENERADOS")
+            print("CHUNKS A SUBIR")
             print("=" * 80 + "\n")
             
-            for i, chunk in enumerate(new_chunks, 1):
-                print(f"\n--- Chunk {i}/{len(new_chunks)} ---")
+            for i, chunk in enumerate(diff.upsert, 1):
+                print(f"\n--- Chunk {i}/{len(diff.upsert)} ---")
                 print(f"ID: {chunk['id']}")
                 print(f"Tier: {chunk['metadata']['chunk_tier']}")
                 print(f"Type: {chunk['metadata']['chunk_type']}")
                 print(f"Content preview: {chunk['content'][:150]}...")
         
+        if not diff.has_writes:
+            print("\n✅ El artículo ya está al día en Pinecone (no hay cambios)")
+            return True
+        
         # ====================================================================
         # PASO 4: Pedir confirmación (si no se saltó)
         # ====================================================================
         if has_old_version and not skip_confirmation and not dry_run:
-            if not confirm_update(article_id, len(old_chunks)):
+            if not confirm_update(article_id, diff):
                 logger.info("❌ Operación cancelada por el usuario")
                 return False
         
         # ====================================================================
-        # PASO 5: Borrar versión vieja (si existe)
-        # ====================================================================
-        if has_old_version:
-            print("\n" + "=" * 80)
-            print("  PASO 4: BORRAR VERSIÓN VIEJA")
-            print("=" * 80 + "\n")
-            
-            if dry_run:
-                logger.info("🏜️  Dry-run: No se borrará la versión vieja")
-            else:
-                logger.info(f"🗑️  Borrando {len(old_chunks)} chunks viejos...")
-                
-                success = uploader.delete_chunks(
-                    filter_dict={"article_id": {"$eq": article_id}}
-                )
-                
-                if not success:
-                    logger.error(f"❌ Error al borrar versión vieja")
-                    return False
-                
-                # Verificar que se borró
-                verification = uploader.get_article_chunks(article_id)
-                if len(verification) == 0:
-                    logger.info(f"✅ Versión vieja borrada exitosamente")
-                else:
-                    logger.warning(f"⚠️  Algunos chunks no se borraron ({len(verification)} restantes)")
-        
-        # ====================================================================
-        # PASO 6: Subir nueva versión
+        # PASO 5: Subir cambios y borrar desaparecidos
         # ====================================================================
         print("\n" + "=" * 80)
-        print(f"  PASO {'5' if has_old_version else '4'}: SUBIR NUEVA VERSIÓN")
+        print("  PASO 4: APLICAR CAMBIOS")
         print("=" * 80 + "\n")
         
         if dry_run:
-            logger.info("🏜️  Dry-run: No se subirán los chunks nuevos")
+            logger.info("🏜️  Dry-run: No se subirán ni borrarán chunks")
             print("\n✅ Dry-run completado (no se hicieron cambios en Pinecone)")
             return True
         
-        logger.info(f"📤 Subiendo {len(new_chunks)} chunks nuevos a Pinecone...")
+        logger.info(
+            f"📤 Subiendo {len(diff.upsert)} chunks y borrando {len(diff.delete_ids)}..."
+        )
         
-        result = uploader.upload_chunks(new_chunks, show_progress=True)
+        result = uploader.apply_chunk_diff(diff, show_progress=True)
         
         if result['failed'] > 0:
-            logger.warning(f"⚠️  {result['failed']} chunks fallaron al subir")
+            logger.warning(f"⚠️  {result['failed']} chunks fallaron (no se borró nada pendiente)")
             return False
         
         # ====================================================================
-        # PASO 7: Verificar y mostrar resumen
+        # PASO 6: Verificar y mostrar resumen
         # ====================================================================
         print("\n" + "=" * 80)
         print("  VERIFICACIÓN FINAL")
         print("=" * 80 + "\n")
         
         logger.info(f"🔍 Verificando artículo en Pinecone...")
-        final_chunks = uploader.get_article_chunks(article_id)
+        final_hashes = uploader.list_chunk_hashes(uploader.article_chunk_prefix(article_id))
         
         print(f"✅ Artículo actualizado exitosamente:")
         print(f"   Article ID: {article_id}")
-        print(f"   Chunks en Pinecone: {len(final_chunks)}")
+        print(f"   Chunks en Pinecone: {len(final_hashes)}")
         
         # Resumen final
         print("\n" + "=" * 80)
         print("  ✅ ACTUALIZACIÓN COMPLETADA")
         print("=" * 80 + "\n")
         
-        if has_old_version:
-            print(f"Resumen:")
-            print(f"  • Chunks viejos borrados: {len(old_chunks)}")
-            print(f"  • Chunks nuevos subidos: {len(new_chunks)}")
-            print(f"  • Chunks actuales: {len(final_chunks)}")
-        else:
-            print(f"Resumen:")
-            print(f"  • Artículo procesado como nuevo")
-            print(f"  • Chunks subidos: {len(new_chunks)}")
+        print(f"Resumen:")
+        print(f"  • Chunks nuevos: {result['added']}")
+        print(f"  • Chunks cambiados: {result['changed']}")
+        print(f"  • Chunks sin cambios (no re-embebidos): {result['unchanged']}")
+        print(f"  • Chunks borrados: {result['deleted']}")
+        print("  (Pinecone usa consistencia eventual: el conteo puede tardar ~10-15 s)")
         
         print(f"\nPróximos pasos:")
         print(f'  Verificar: python scripts/verify_article.py "{article_id}"')
@@ -294,7 +269,7 @@ def update_article(
 def main():
     """Función principal."""
     parser = argparse.ArgumentParser(
-        description="Actualizar un artículo en Pinecone (borra viejo y sube nuevo)",
+        description="Actualizar un artículo en Pinecone (sólo chunks nuevos o cambiados)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Ejemplos:
@@ -307,8 +282,11 @@ Ejemplos:
   # Ver qué haría sin hacer cambios
   python scripts/update_article.py <path> --dry-run
   
-  # Ver chunks generados
+  # Ver chunks a subir
   python scripts/update_article.py <path> --show-chunks
+  
+  # Re-subir todos los chunks aunque no hayan cambiado
+  python scripts/update_article.py <path> --full
         """
     )
     
@@ -329,10 +307,16 @@ Ejemplos:
         help="No pedir confirmación antes de borrar"
     )
     
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-subir todos los chunks, no sólo los nuevos o cambiados"
+    )
+    
     parser.add_argument(
         "--show-chunks",
         action="store_true",
-        help="Mostrar chunks generados"
+        help="Mostrar chunks que se subirán"
     )
     
     args = parser.parse_args()
@@ -347,7 +331,8 @@ Ejemplos:
         article_path=args.article_path,
         dry_run=args.dry_run,
         skip_confirmation=args.skip_confirmation,
-        show_chunks=args.show_chunks
+        show_chunks=args.show_chunks,
+        full=args.full
     )
     
     # Exit code
@@ -53,6 +53,9 @@ def _development_baseline(monkeypatch, **overrides) -> None:
         ({"FORUSBOTS_HTTP_READ_TIMEOUT_S": 201.0}, "read timeout"),
         ({"FORUSBOTS_MAX_WAIT_S": 301.0}, "max wait"),
         ({"FORUSBOTS_POLL_BACKOFF": 0.9}, "poll backoff"),
+        ({"FORUSBOTS_MAX_INFLIGHT_CEILING": 1}, "inflight ceiling"),
+        ({"TICKET_PAYLOAD_CODEC": "lz4"}, "TICKET_PAYLOAD_CODEC"),
+        ({"TICKET_COUNTER_SHARDS": 0}, "TICKET_COUNTER_SHARDS"),
     ),
 )
 def test_runtime_timing_invariants_fail_closed(monkeypatch, overrides, message):
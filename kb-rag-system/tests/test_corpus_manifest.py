@@ -0,0 +1,102 @@
+"""Chunking en bloque del corpus y manifest determinista."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from data_pipeline.chunking import plan_chunk_diff
+from data_pipeline.corpus_manifest import (
+    ERROR_DUPLICATE_ARTICLE_ID,
+    ERROR_INVALID_ARTICLE,
+    ERROR_INVALID_JSON,
+    build_corpus,
+    load_manifest,
+    manifest_chunk_hashes,
+    write_manifest,
+)
+
+
+def _article(article_id: str, must_not: str) -> dict:
+    return {
+        "metadata": {
+            "article_id": article_id,
+            "title": f"Title {article_id}",
+            "record_keeper": None,
+            "plan_type": "401(k)",
+            "scope": "global",
+        },
+        "details": {"guardrails": {"must_not": [must_not]}},
+    }
+
+
+def _write(path, payload) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(payload if isinstance(payload, str) else json.dumps(payload), "utf-8")
+
+
+def _corpus(tmp_path):
+    _write(tmp_path / "Distributions" / "b.json", _article("b", "Rollover."))
+    _write(tmp_path / "Loans" / "a.json", _article("a", "Loans."))
+    _write(tmp_path / "Loans" / "copy.json", _article("a", "Other."))
+    _write(tmp_path / "broken.json", "{not json")
+    _write(tmp_path / "z.json", {"metadata": {}})
+    return tmp_path
+
+
+def test_pool_and_in_process_builds_write_the_same_manifest(tmp_path):
+    corpus = _corpus(tmp_path / "PA")
+
+    pooled = build_corpus(corpus, workers=2, token_counter=len)
+    serial = build_corpus(corpus, workers=1, token_counter=len)
+
+    manifest = pooled.manifest()
+    assert manifest == serial.manifest()
+    assert [article["path"] for article in manifest["articles"]] == [
+        "Distributions/b.json", "Loans/a.json",
+    ]
+    assert manifest["invalid"] == [
+        {"path": "Loans/copy.json", "error": ERROR_DUPLICATE_ARTICLE_ID},
+        {"path": "broken.json", "error": ERROR_INVALID_JSON},
+        {"path": "z.json", "error": ERROR_INVALID_ARTICLE},
+    ]
+    assert manifest["chunk_count"] == 2
+    assert set(pooled.timings) == {"discover_s", "chunk_s"}
+
+    out = tmp_path / "manifest.json"
+    write_manifest(manifest, out)
+    first = out.read_bytes()
+    write_manifest(serial.manifest(), out)
+    assert out.read_bytes() == first
+
+
+def test_a_manifest_is_a_baseline_for_a_differential_reindex(tmp_path):
+    corpus = _corpus(tmp_path / "PA")
+    out = tmp_path / "manifest.json"
+    built = build_corpus(corpus, workers=1, token_counter=len)
+    write_manifest(built.manifest(indexed=True), out)
+
+    _write(corpus / "Loans" / "a.json", _article("a", "Loans, revised."))
+    rebuilt = build_corpus(corpus, workers=1, token_counter=len)
+    baseline = load_manifest(out, baseline=True)
+
+    diffs = {
+        article.article_id: plan_chunk_diff(
+            article.chunks, manifest_chunk_hashes(baseline, article.article_id)
+        )
+        for article in rebuilt.valid
+    }
+    assert diffs["b"].has_writes is False
+    assert [chunk["id"] for chunk in diffs["a"].upsert] == ["a_chunk_1"]
+    assert rebuilt.manifest()["corpus_sha256"] != baseline["corpus_sha256"]
+
+
+def test_a_build_only_manifest_is_not_a_baseline(tmp_path):
+    out = tmp_path / "manifest.json"
+    built = build_corpus(_corpus(tmp_path / "PA"), workers=1, token_counter=len)
+    write_manifest(built.manifest(), out)
+
+    assert load_manifest(out)["indexed"] is False
+    with pytest.raises(ValueError, match="indexed"):
+        load_manifest(out, baseline=True)
@@ -0,0 +1,184 @@
+"""Read-through DevRev cache: freshness, stale-while-revalidate, coalescing.
+
+DevRev is ``httpx.MockTransport`` and the console cache is the in-memory
+review backend: no live request and no Firestore write can happen here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from api import metrics
+from data_pipeline.devrev_cache import CachingDevRevClient
+from data_pipeline.devrev_client import DevRevClient
+from data_pipeline.ticket_review_repository import (
+    InMemoryTicketReviewBackend,
+    TicketReviewRepository,
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "devrev"
+SYNTHETIC_TOKEN = "SYNTHETIC-PAT-DO-NOT-LOG-0123456789"  # noqa: S105 - fake
+SYNTHETIC_TICKET_DON = "don:core:dvrv-us-1:devo/SYNTHETIC00:ticket/1234"
+SYNTHETIC_PART = "don:core:dvrv-us-1:devo/SYNTHETIC00:product/1"
+SYNTHETIC_PART_2 = "don:core:dvrv-us-1:devo/SYNTHETIC00:product/2"
+TEST_CURSOR_KEY = base64.b64decode("MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY=")
+T0 = datetime(2026, 5, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _response(name: str) -> dict[str, Any]:
+    return json.loads((FIXTURE_DIR / f"{name}.json").read_text(encoding="utf-8"))["response"]
+
+
+WORK_GET = _response("work_get_ticket")
+TIMELINE_FINAL = _response("timeline_page_final")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = T0
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _DevRev:
+    """Replays payloads by path and counts what DevRev was asked."""
+
+    def __init__(self) -> None:
+        self.work = copy.deepcopy(WORK_GET)
+        self.timeline = copy.deepcopy(TIMELINE_FINAL)
+        self.calls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.url.path)
+        if request.url.path == "/works.get":
+            return httpx.Response(200, json=self.work)
+        return httpx.Response(200, json=self.timeline)
+
+
+class _FailingCacheBackend(InMemoryTicketReviewBackend):
+    """Every cache write fails; reads see an empty cache."""
+
+    async def transact(self, fn: Any) -> Any:
+        raise RuntimeError("firestore unavailable")
+
+
+def _cached(
+    devrev: _DevRev,
+    clock: _Clock,
+    backend: InMemoryTicketReviewBackend,
+    **client_overrides: Any,
+) -> CachingDevRevClient:
+    kwargs: dict[str, Any] = {
+        "token": SYNTHETIC_TOKEN,
+        "allowed_part_dons": [SYNTHETIC_PART, SYNTHETIC_PART_2],
+        "allowed_ticket_visibility_ids": [1, 2],
+        "allowed_timeline_visibilities": ["internal", "external"],
+        "transport": httpx.MockTransport(devrev),
+        "jitter": lambda: 0.0,
+        "clock": clock,
+    }
+    kwargs.update(client_overrides)
+    repository = TicketReviewRepository(backend, cursor_key=TEST_CURSOR_KEY, clock=clock)
+    return CachingDevRevClient(DevRevClient(**kwargs), repository, fresh_s=30, clock=clock)
+
+
+def _counter_delta(before: dict[str, int], name: str) -> int:
+    return metrics.snapshot().get(name, 0) - before.get(name, 0)
+
+
+async def test_fresh_hits_skip_devrev_and_stale_hits_revalidate_in_the_background():
+    devrev, clock, backend = _DevRev(), _Clock(), InMemoryTicketReviewBackend()
+    before = metrics.snapshot()
+    async with _cached(devrev, clock, backend) as client:
+        first = await client.get_ticket(SYNTHETIC_TICKET_DON)
+        clock.now += timedelta(seconds=10)
+        assert await client.get_ticket(SYNTHETIC_TICKET_DON) == first
+        assert devrev.calls == ["/works.get"]
+
+        clock.now += timedelta(minutes=1)
+        devrev.work["work"]["object_version"] = 5
+        # Served from cache at once; the refresh happens behind the caller.
+        stale = await client.get_ticket(SYNTHETIC_TICKET_DON)
+        assert stale.object_version == first.object_version
+        await client.drain()
+        assert devrev.calls == ["/works.get", "/works.get"]
+        assert (await client.get_ticket(SYNTHETIC_TICKET_DON)).object_version == 5
+
+    lookups = "ticket_devrev_cache_lookups{kind=ticket,outcome=%s}"
+    assert _counter_delta(before, lookups % "miss") == 1
+    assert _counter_delta(before, lookups % "fresh") == 2
+    assert _counter_delta(before, lookups % "stale") == 1
+    assert _counter_delta(before, "ticket_devrev_cache_revalidations{outcome=changed}") == 1
+
+
+async def test_concurrent_misses_for_one_work_id_share_one_devrev_call():
+    devrev, clock, backend = _DevRev(), _Clock(), InMemoryTicketReviewBackend()
+    before = metrics.snapshot()
+    async with _cached(devrev, clock, backend) as client:
+        details = await asyncio.gather(
+            *(client.get_ticket(SYNTHETIC_TICKET_DON) for _ in range(5))
+        )
+
+    assert devrev.calls == ["/works.get"]
+    assert len({detail.devrev_work_id for detail in details}) == 1
+    lookups = "ticket_devrev_cache_lookups{kind=ticket,outcome=%s}"
+    assert _counter_delta(before, lookups % "miss") == 1
+    assert _counter_delta(before, lookups % "coalesced") == 4
+
+
+async def test_a_changed_ticket_validator_or_scope_invalidates_cached_timelines():
+    devrev, clock, backend = _DevRev(), _Clock(), InMemoryTicketReviewBackend()
+    async with _cached(devrev, clock, backend) as client:
+        await client.get_ticket(SYNTHETIC_TICKET_DON)
+        await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+        await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+        assert devrev.calls == ["/works.get", "/timeline-entries.list"]
+
+        clock.now += timedelta(minutes=1)
+        devrev.work["work"]["object_version"] = 9
+        await client.get_ticket(SYNTHETIC_TICKET_DON)
+        await client.drain()
+        # The ticket moved on, so its cached conversation is not served.
+        await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+        assert devrev.calls.count("/timeline-entries.list") == 2
+
+    narrowed = _cached(devrev, clock, backend, allowed_timeline_visibilities=["external"])
+    async with narrowed as client:
+        await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+    assert devrev.calls.count("/timeline-entries.list") == 3
+
+
+async def test_a_page_over_the_document_limit_is_served_but_not_cached():
+    devrev, clock, backend = _DevRev(), _Clock(), InMemoryTicketReviewBackend()
+    comment = devrev.timeline["timeline_entries"][0]
+    devrev.timeline["timeline_entries"] = [
+        {**comment, "id": f"{comment['id']}-{index}", "body": "x" * 50_000}
+        for index in range(25)
+    ]
+    before = metrics.snapshot()
+    async with _cached(devrev, clock, backend) as client:
+        first = await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+        second = await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+
+    assert len(first.items) == len(second.items) == 25
+    assert devrev.calls.count("/timeline-entries.list") == 2
+    assert _counter_delta(before, "ticket_devrev_cache_writes{outcome=oversize}") == 2
+
+
+async def test_a_failed_cache_write_still_returns_what_devrev_sent():
+    devrev, clock = _DevRev(), _Clock()
+    before = metrics.snapshot()
+    async with _cached(devrev, clock, _FailingCacheBackend()) as client:
+        detail = await client.get_ticket(SYNTHETIC_TICKET_DON)
+
+    assert detail.devrev_work_id
+    assert _counter_delta(before, "ticket_devrev_cache_writes{outcome=failed}") >= 1
@@ -88,6 +88,7 @@ from data_pipeline.devrev_client import (
     DevRevResourceLimitError,
     DevRevScopeError,
     DevRevTimelineHydration,
+    DevRevTimelineOutcome,
     DevRevTransientError,
     cursor_digest,
     sort_timeline_entries,
@@ -2395,6 +2396,146 @@ class TestNormalization:
 # =====================================================================
 
 
+def _timeline_for(object_id: str) -> dict[str, Any]:
+    """The final-page fixture re-pointed at another ticket."""
+    return json.loads(json.dumps(TIMELINE_FINAL).replace(SYNTHETIC_TICKET_DON, object_id))
+
+
+class TestConcurrentTimelines:
+    async def test_tickets_hydrate_concurrently_with_their_own_diagnostics(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            object_id = request.url.params["object"]
+            if object_id == SYNTHETIC_TICKET_DON_3:
+                return httpx.Response(404, json={"message": "gone"})
+            return _json_response(_timeline_for(object_id))
+
+        client = _client(None, transport=httpx.MockTransport(handler))
+        try:
+            outcomes = [
+                outcome
+                async for outcome in client.load_timelines(
+                    [
+                        SYNTHETIC_TICKET_DON,
+                        SYNTHETIC_TICKET_DON_2,
+                        SYNTHETIC_TICKET_DON,
+                        SYNTHETIC_TICKET_DON_3,
+                    ],
+                    concurrency=3,
+                )
+            ]
+        finally:
+            await client.aclose()
+
+        assert peak > 1
+        by_id = {outcome.work_id: outcome for outcome in outcomes}
+        assert len(outcomes) == len(by_id) == 3
+        for work_id in (SYNTHETIC_TICKET_DON, SYNTHETIC_TICKET_DON_2):
+            hydration = by_id[work_id].hydration
+            assert hydration is not None and by_id[work_id].error is None
+            assert {entry.object_id for entry in hydration.entries} == {work_id}
+            assert hydration.diagnostics.pages == 1
+            assert hydration.partial is False
+        failed = by_id[SYNTHETIC_TICKET_DON_3]
+        assert isinstance(failed, DevRevTimelineOutcome)
+        assert failed.hydration is None
+        assert isinstance(failed.error, DevRevNotFoundError)
+
+    async def test_the_shared_bucket_paces_requests_across_tickets(self) -> None:
+        sleeper = _Sleeper()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return _json_response(_timeline_for(request.url.params["object"]))
+
+        client = _client(
+            handler,
+            sleep=sleeper,
+            requests_per_second=2.0,
+            monotonic=lambda: 0.0,
+        )
+        try:
+            outcomes = [
+                outcome
+                async for outcome in client.load_timelines(
+                    [SYNTHETIC_TICKET_DON, SYNTHETIC_TICKET_DON_2, SYNTHETIC_TICKET_DON_3]
+                )
+            ]
+        finally:
+            await client.aclose()
+
+        assert all(outcome.hydration is not None for outcome in outcomes)
+        # A one-second burst of two goes out at once; the third waits its turn.
+        assert sleeper.delays == [0.5]
+
+    async def test_a_retry_after_pauses_every_other_ticket(self) -> None:
+        released = asyncio.Event()
+        delays: list[float] = []
+
+        async def gated_sleep(delay: float) -> None:
+            delays.append(delay)
+            await released.wait()
+
+        throttled = False
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal throttled
+            object_id = request.url.params["object"]
+            requested.append(object_id)
+            if object_id == SYNTHETIC_TICKET_DON and not throttled:
+                throttled = True
+                return httpx.Response(429, headers={"Retry-After": "7"}, json={})
+            return _json_response(_timeline_for(object_id))
+
+        client = _client(handler, sleep=gated_sleep)
+
+        async def _drain() -> list[DevRevTimelineOutcome]:
+            return [
+                outcome
+                async for outcome in client.load_timelines(
+                    [SYNTHETIC_TICKET_DON, SYNTHETIC_TICKET_DON_2, SYNTHETIC_TICKET_DON_3],
+                    concurrency=2,
+                )
+            ]
+
+        try:
+            drain = asyncio.ensure_future(_drain())
+            for _ in range(50):
+                await asyncio.sleep(0)
+            assert delays == [7.0]
+            assert SYNTHETIC_TICKET_DON_3 not in requested
+            released.set()
+            outcomes = await drain
+        finally:
+            await client.aclose()
+
+        assert delays == [7.0]
+        assert requested.count(SYNTHETIC_TICKET_DON) == 2
+        assert all(outcome.error is None for outcome in outcomes)
+
+    async def test_every_identifier_is_validated_before_any_request(self) -> None:
+        recorder = _Recorder()
+        client = _client(recorder)
+        try:
+            with pytest.raises(DevRevRequestError):
+                async for _outcome in client.load_timelines(
+                    [SYNTHETIC_TICKET_DON, "not an id"]
+                ):
+                    pass
+            with pytest.raises(DevRevConfigurationError):
+                _client(recorder, requests_per_second=DEVREV_RETRY_AFTER_CAP_S)
+        finally:
+            await client.aclose()
+        assert recorder.count == 0
+
+
 class TestHydrationSorting:
     async def test_hydration_preserves_remote_order_by_default(self) -> None:
         payload = json.loads(json.dumps(TIMELINE_FINAL))
@@ -2605,6 +2746,53 @@ class TestResponseByteCaps:
         assert "client.stream" in source or "self._client.stream" in source
 
 
+class TestStreamedParsing:
+    async def test_elements_split_across_chunks_normalize_like_a_whole_body(self) -> None:
+        body = json.dumps(WORKS_PAGE_1, indent=2, ensure_ascii=False).encode()
+        chunks = [body[index : index + 3] for index in range(0, len(body), 3)]
+        recorder = _Recorder(
+            _json_response(WORKS_PAGE_1),
+            httpx.Response(200, content=_CountingStream(chunks)),
+        )
+        client = _client(recorder)
+        try:
+            whole = await client.list_tickets(DevRevTicketFilters())
+            streamed = await client.list_tickets(DevRevTicketFilters())
+        finally:
+            await client.aclose()
+        assert streamed == whole
+        assert len(streamed.items) == 2
+
+    async def test_an_over_limit_array_aborts_before_the_rest_is_read(self) -> None:
+        element = json.dumps({"id": SYNTHETIC_TICKET_DON}).encode()
+        chunks = [b'{"works": [', element] + [b"," + element] * (3 * MAX_PAGE_SIZE) + [b"]}"]
+        stream = _CountingStream(chunks)
+        recorder = _Recorder(httpx.Response(200, content=stream))
+        client = _client(recorder)
+        try:
+            with pytest.raises(DevRevResourceLimitError):
+                await client.list_tickets(DevRevTicketFilters())
+        finally:
+            await client.aclose()
+        assert stream.pulled == MAX_PAGE_SIZE + 2
+        assert recorder.count == 1
+
+    async def test_malformed_json_mid_stream_is_a_protocol_error(self) -> None:
+        valid = json.dumps(TIMELINE_FINAL["timeline_entries"][0]).encode()
+        stream = _CountingStream(
+            [b'{"timeline_entries": [', valid, b", " + FIXTURE_PII[0].encode(), valid, b"]}"]
+        )
+        recorder = _Recorder(httpx.Response(200, content=stream))
+        client = _client(recorder)
+        try:
+            with pytest.raises(DevRevProtocolError) as excinfo:
+                await client.list_timeline_page(SYNTHETIC_TICKET_DON)
+        finally:
+            await client.aclose()
+        assert stream.pulled == 3
+        _assert_no_secrets(str(excinfo.value), repr(excinfo.value))
+
+
 # =====================================================================
 # Base URL and configuration hardening
 # =====================================================================
@@ -0,0 +1,118 @@
+"""Incremental DevRev ticket sync into the console mirror.
+
+DevRev is ``httpx.MockTransport`` and the mirror is the in-memory review
+backend: no live request and no Firestore write can happen here.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from data_pipeline.devrev_client import SYNC_SORT_BY, DevRevClient
+from data_pipeline.devrev_ticket_sync import DEVREV_SYNC_OVERLAP_S, sync_devrev_tickets
+from data_pipeline.ticket_review_repository import (
+    InMemoryTicketReviewBackend,
+    TicketReviewRepository,
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "devrev"
+SYNTHETIC_TOKEN = "SYNTHETIC-PAT-DO-NOT-LOG-0123456789"  # noqa: S105 - fake
+SYNTHETIC_PART = "don:core:dvrv-us-1:devo/SYNTHETIC00:product/1"
+SYNTHETIC_PART_2 = "don:core:dvrv-us-1:devo/SYNTHETIC00:product/2"
+TEST_CURSOR_KEY = base64.b64decode("MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY=")
+NOW = datetime(2026, 5, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _works(name: str) -> dict[str, Any]:
+    return json.loads((FIXTURE_DIR / f"{name}.json").read_text(encoding="utf-8"))["response"]
+
+
+class _DevRev:
+    def __init__(self, *pages: dict[str, Any]) -> None:
+        self._pages = list(pages)
+        self.bodies: list[dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(json.loads(request.content))
+        return httpx.Response(200, json=self._pages.pop(0))
+
+
+def _client(devrev: _DevRev) -> DevRevClient:
+    return DevRevClient(
+        token=SYNTHETIC_TOKEN,
+        allowed_part_dons=[SYNTHETIC_PART, SYNTHETIC_PART_2],
+        allowed_ticket_visibility_ids=[1, 2],
+        allowed_timeline_visibilities=["internal", "external"],
+        transport=httpx.MockTransport(devrev),
+        jitter=lambda: 0.0,
+        clock=lambda: NOW,
+    )
+
+
+def _repo() -> TicketReviewRepository:
+    return TicketReviewRepository(
+        InMemoryTicketReviewBackend(), cursor_key=TEST_CURSOR_KEY, clock=lambda: NOW
+    )
+
+
+async def test_a_first_sync_walks_the_whole_scope_oldest_change_first():
+    devrev = _DevRev(_works("works_list_page_1"), _works("works_list_page_2"))
+    client = _client(devrev)
+    repo = _repo()
+    try:
+        report = await sync_devrev_tickets(client, repo)
+    finally:
+        await client.aclose()
+
+    assert (report.added, report.updated, report.pages) == (3, 0, 2)
+    assert report.full and report.complete
+    assert report.watermark is not None
+    assert report.watermark.devrev_work_id.endswith("ticket/1235")
+    assert "modified_date" not in devrev.bodies[0]
+    assert devrev.bodies[0]["sort_by"] == list(SYNC_SORT_BY)
+    assert devrev.bodies[1]["cursor"] == "cursor-works-page-2"
+    # The console list view reads the mirror, newest change first.
+    page = await repo.list_mirrored_tickets()
+    assert [ticket.devrev_display_id for ticket in page.items] == [
+        "TKT-1235", "TKT-1234", "TKT-1236",
+    ]
+
+
+async def test_a_later_sync_fetches_only_the_window_after_the_watermark():
+    repo = _repo()
+    first = _DevRev(_works("works_list_page_1"))
+    client = _client(first)
+    try:
+        resumable = await sync_devrev_tickets(client, repo, max_pages=1)
+    finally:
+        await client.aclose()
+    assert resumable.complete is False
+
+    changed = _works("works_list_page_1")
+    changed["next_cursor"] = None
+    changed["works"][0]["object_version"] = 5
+    changed["works"][0]["modified_date"] = "2026-05-09T08:00:00.000Z"
+    second = _DevRev(changed)
+    client = _client(second)
+    try:
+        report = await sync_devrev_tickets(client, repo)
+    finally:
+        await client.aclose()
+
+    watermark_at = datetime(2026, 5, 7, 16, 2, 55, tzinfo=timezone.utc)
+    window = second.bodies[0]["modified_date"]
+    assert window == {
+        "type": "range",
+        "after": (watermark_at - timedelta(seconds=DEVREV_SYNC_OVERLAP_S))
+        .isoformat()
+        .replace("+00:00", "Z"),
+    }
+    assert (report.added, report.updated, report.unchanged) == (0, 1, 1)
+    assert report.full is False and report.complete is True
+    assert report.watermark.modified_at == datetime(2026, 5, 9, 8, tzinfo=timezone.utc)
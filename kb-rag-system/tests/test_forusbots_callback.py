@@ -0,0 +1,376 @@
+"""
+Tests del callback mode ForusBots (``FORUSBOTS_COMPLETION_MODE=callback``).
+
+Un servidor ForusBots stub en proceso (mismo contrato HTTP: 202 + jobId,
+``GET /forusbot/jobs/:id``) registra el ``callbackUrl`` del submit. El flujo
+completo se ejercita sin red: submit → receipt durable → job estacionado y
+task liberado → callback firmado (o reconciliador) → resume_job desde el
+receipt sin un segundo POST.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import data_pipeline.forusbots_client as fb
+from api.config import settings as app_settings
+from api.forusbots_callback import (
+    build_callback_url,
+    forusbots_completion_callback,
+    sign_callback,
+)
+from api.ticket_worker import run_ticket_job
+from data_pipeline.forusbots_client import (
+    ForusBotsClient,
+    ForusBotsDeferred,
+    ForusBotsError,
+)
+from data_pipeline.ticket_job_models import (
+    PARKED_ENQUEUE_STATE,
+    TicketJobState,
+    fingerprint_request,
+    new_job_record,
+    utcnow,
+)
+from data_pipeline.ticket_job_repository import (
+    JOBS_COLLECTION,
+    InMemoryTicketJobBackend,
+    TicketJobRepository,
+)
+from data_pipeline.ticket_orchestrator import ExtractedInquiry, InquiryOutcome
+from data_pipeline.ticket_reconciler import TicketReconciler
+
+_SECRET = "s" * 48
+
+
+class StubForusBotsServer:
+    """Servidor ForusBots stub: jobs en memoria + callbacks registrados."""
+
+    def __init__(self) -> None:
+        self.jobs: dict[str, dict] = {}
+        self.callbacks: dict[str, str] = {}
+        self.submits = 0
+        self.polls = 0
+
+    async def request(self, method, url, headers=None, json=None):
+        path = urlsplit(url).path
+        if method == "POST" and path.startswith("/forusbot/scrape-"):
+            self.submits += 1
+            job_id = f"fb-job-{self.submits}"
+            self.jobs[job_id] = {"state": "running"}
+            if json and json.get("callbackUrl"):
+                self.callbacks[job_id] = json["callbackUrl"]
+            return httpx.Response(
+                202, json={"jobId": job_id, "queuePosition": 3, "estimate": {}}
+            )
+        if method == "GET" and path.startswith("/forusbot/jobs/"):
+            self.polls += 1
+            job_id = path.rsplit("/", 1)[1]
+            return httpx.Response(200, json=self.jobs[job_id])
+        raise AssertionError(f"unexpected stub call: {method} {path}")
+
+    def complete(self, job_id: str) -> str:
+        self.jobs[job_id] = {
+            "state": "succeeded",
+            "data": {"census": {"status": "Active"}},
+        }
+        return self.callbacks[job_id]
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RecordingQueue:
+    def __init__(self) -> None:
+        self.enqueued: list[tuple[str, int]] = []
+
+    async def ensure_enqueued(self, job_id, generation=0):
+        self.enqueued.append((job_id, generation))
+        return f"inline/ticket-{job_id}-g{generation}"
+
+    async def task_exists(self, job_id, generation=0):
+        return True
+
+    async def aclose(self):
+        pass
+
+
+class _ScrapingOrchestrator:
+    """Doble mínimo que enruta la inquiry GR por el cliente ForusBots real."""
+
+    def __init__(self, client: ForusBotsClient) -> None:
+        self.client = client
+        self.callback_url = None
+
+    def set_forusbots_operation_hooks(
+        self, prepare, submitted, *, dedupe_scope, callback_url=None
+    ):
+        self.prepare = prepare
+        self.submitted = submitted
+        self.dedupe_scope = dedupe_scope
+        self.callback_url = callback_url
+
+    async def extract_inquiries(self, req):
+        return [ExtractedInquiry("cash out", "LT Trust", "401(k)", "rollover")]
+
+    async def classify(self, inquiry):
+        return SimpleNamespace(
+            route="generate_response", confidence=0.9, reasoning="synthetic",
+            user_message=None, metadata={},
+        )
+
+    async def handle_inquiry(
+        self, ext, req, *, total_inquiries, classification=None
+    ):
+        decision = await self.prepare("participant")
+        if decision.action == "resume":
+            scrape = await self.client.resume_job(
+                decision.external_job_id, operation="participant",
+            )
+        else:
+            scrape = await self.client.scrape_participant(
+                "158948",
+                [{"key": "census"}],
+                dedupe_scope=self.dedupe_scope,
+                on_submitted=self.submitted,
+                callback_url=self.callback_url,
+            )
+        return InquiryOutcome(
+            inquiry=ext.inquiry,
+            topic=ext.topic,
+            route="generate_response",
+            record_keeper=ext.record_keeper,
+            plan_type=ext.plan_type,
+            scrape_status="ok" if scrape.state == "succeeded" else "failed",
+            generate_result=SimpleNamespace(
+                decision="can_proceed",
+                confidence=0.9,
+                response={"response_to_participant": "Safe response"},
+                source_articles=[],
+                used_chunks=[],
+                coverage_gaps=[],
+                metadata={},
+            ),
+            diagnostics={"forusbots_job_id": scrape.job_id},
+        )
+
+
+@pytest.fixture(autouse=True)
+def _callback_mode(monkeypatch):
+    monkeypatch.setattr(fb.asyncio, "sleep", AsyncMock())
+    monkeypatch.setattr(app_settings, "FORUSBOTS_COMPLETION_MODE", "callback")
+    monkeypatch.setattr(
+        app_settings, "FORUSBOTS_CALLBACK_BASE_URL", "https://api.example.test"
+    )
+    monkeypatch.setattr(app_settings, "FORUSBOTS_CALLBACK_SECRET", _SECRET)
+
+
+def _client(stub: StubForusBotsServer) -> ForusBotsClient:
+    return ForusBotsClient(
+        base_url="https://forusbots.example.test",
+        auth_token="t0ken",
+        poll_interval_s=0.0,
+        poll_max_interval_s=0.0,
+        max_wait_s=60.0,
+        client=stub,
+    )
+
+
+async def _seed(repo: TicketJobRepository):
+    payload = dict(
+        participant_id="158948", plan_id="580", company_name="StarWars Inc.",
+        company_status="Ongoing",
+        ticket={"username": "Ivan", "user_email": "i@f.com",
+                "email_subject": "401k", "email_body": "quiero retirar mi 401k"},
+        record_keeper="LT Trust",
+    )
+    fp = fingerprint_request(payload)
+    rec, _ = await repo.create_or_get(
+        principal_id="default", idempotency_key=None, request_fingerprint=fp,
+        candidate=new_job_record(principal_id="default", request_fingerprint=fp,
+                                 mode="full", request_payload=payload),
+    )
+    return rec
+
+
+def _callback_request(app, url: str) -> tuple[Request, str, str]:
+    parsed = urlsplit(url)
+    job_id = parsed.path.rsplit("/", 1)[1]
+    sig = parse_qs(parsed.query)["sig"][0]
+    request = Request({
+        "type": "http", "method": "POST", "path": parsed.path,
+        "headers": [], "app": app,
+    })
+    return request, job_id, sig
+
+
+class TestClientCallbackMode:
+
+    async def test_submit_registers_callback_and_defers_without_polling(self):
+        stub = StubForusBotsServer()
+        client = _client(stub)
+        receipts = []
+
+        async def _observer(operation, job_id):
+            receipts.append((operation, job_id))
+
+        with pytest.raises(ForusBotsDeferred) as excinfo:
+            await client.scrape_participant(
+                "158948", [{"key": "census"}],
+                dedupe_scope="scope",
+                on_submitted=_observer,
+                callback_url="https://api.example.test/cb/x?sig=abc",
+            )
+
+        assert excinfo.value.job_id == "fb-job-1"
+        assert receipts == [("participant", "fb-job-1")]
+        assert stub.callbacks == {
+            "fb-job-1": "https://api.example.test/cb/x?sig=abc"
+        }
+        assert stub.polls == 0
+
+    async def test_callback_without_durable_observer_never_submits(self):
+        stub = StubForusBotsServer()
+        client = _client(stub)
+
+        with pytest.raises(ForusBotsError):
+            await client.scrape_participant(
+                "158948", [{"key": "census"}],
+                dedupe_scope="scope",
+                callback_url="https://api.example.test/cb/x",
+            )
+        with pytest.raises(ForusBotsError):
+            await client.scrape_participant(
+                "158948", [{"key": "census"}],
+                dedupe_scope="scope",
+                on_submitted=AsyncMock(),
+                callback_url="http://api.example.test/cb/x",
+            )
+        assert stub.submits == 0
+
+
+class TestParkAndResume:
+
+    async def test_callback_resumes_parked_job_from_receipt(self):
+        stub = StubForusBotsServer()
+        repo = TicketJobRepository(InMemoryTicketJobBackend())
+        queue = RecordingQueue()
+        app = SimpleNamespace(state=SimpleNamespace(
+            ticket_repo=repo,
+            ticket_queue=queue,
+            ticket_orchestrator_factory=lambda: _ScrapingOrchestrator(
+                _client(stub)
+            ),
+            execution_logger=None,
+        ))
+        rec = await _seed(repo)
+
+        parked = await run_ticket_job(app, rec.job_id, worker_id="worker-a")
+
+        assert parked.state == TicketJobState.QUEUED
+        assert parked.enqueue_state == PARKED_ENQUEUE_STATE
+        assert parked.lease_owner is None
+        assert parked.forusbots_job_ids == ["fb-job-1"]
+        assert (stub.submits, stub.polls) == (1, 0)
+
+        callback_url = stub.complete("fb-job-1")
+        assert callback_url == build_callback_url(rec.job_id)
+        request, job_id, sig = _callback_request(app, callback_url)
+        response = await forusbots_completion_callback(job_id, request, sig)
+
+        assert response.status_code == 204
+        [(woken_id, generation)] = queue.enqueued
+        assert woken_id == rec.job_id
+        assert generation == parked.enqueue_generation + 1
+
+        final = await run_ticket_job(
+            app, rec.job_id, worker_id="worker-b",
+            expected_generation=generation,
+        )
+
+        assert final.state == TicketJobState.SUCCEEDED
+        assert (stub.submits, stub.polls) == (1, 1)
+
+    async def test_invalid_signature_is_rejected_without_waking(self):
+        repo = TicketJobRepository(InMemoryTicketJobBackend())
+        queue = RecordingQueue()
+        app = SimpleNamespace(state=SimpleNamespace(
+            ticket_repo=repo, ticket_queue=queue,
+        ))
+        rec = await _seed(repo)
+        request, _job_id, _sig = _callback_request(
+            app, build_callback_url(rec.job_id)
+        )
+
+        with pytest.raises(HTTPException) as excinfo:
+            await forusbots_completion_callback(
+                rec.job_id, request, sign_callback(rec.job_id, "x" * 48),
+            )
+
+        assert excinfo.value.status_code == 403
+        assert queue.enqueued == []
+
+    async def test_callback_endpoint_is_absent_in_poll_mode(self, monkeypatch):
+        monkeypatch.setattr(app_settings, "FORUSBOTS_COMPLETION_MODE", "poll")
+        app = SimpleNamespace(state=SimpleNamespace())
+        request = Request({
+            "type": "http", "method": "POST", "path": "/", "headers": [],
+            "app": app,
+        })
+
+        assert build_callback_url("a" * 32) is None
+        with pytest.raises(HTTPException) as excinfo:
+            await forusbots_completion_callback("a" * 32, request, "sig")
+        assert excinfo.value.status_code == 404
+
+    async def test_callback_racing_ahead_of_park_makes_job_due(self):
+        repo = TicketJobRepository(InMemoryTicketJobBackend())
+        rec = await _seed(repo)
+        epoch = await repo.claim(rec.job_id, worker_id="worker-a")
+
+        assert await repo.wake_parked_job(
+            rec.job_id, from_callback=True
+        ) is None
+        parked = await repo.park_for_forusbots_callback(
+            rec.job_id, lease_epoch=epoch, resume_after_s=300,
+        )
+
+        assert parked.forusbots_resume_at <= utcnow()
+        assert parked.forusbots_callback_at is None
+
+    async def test_reconciler_wakes_parked_job_only_after_resume_at(self):
+        backend = InMemoryTicketJobBackend()
+        repo = TicketJobRepository(backend)
+        queue = RecordingQueue()
+        rec = await _seed(repo)
+        epoch = await repo.claim(rec.job_id, worker_id="worker-a")
+        parked = await repo.park_for_forusbots_callback(
+            rec.job_id, lease_epoch=epoch, resume_after_s=300,
+        )
+        reconciler = TicketReconciler(repo, queue)
+
+        first = await reconciler.run_once()
+        assert first["resumed_parked"] == 0
+        assert first["requeued_outbox"] == 0
+        assert queue.enqueued == []
+
+        control = await backend.get_doc(JOBS_COLLECTION, rec.job_id)
+        control["forusbots_resume_at"] = utcnow() - timedelta(seconds=1)
+        backend._data[JOBS_COLLECTION][rec.job_id] = control
+        second = await reconciler.run_once()
+
+        assert second["resumed_parked"] == 1
+        assert queue.enqueued == [
+            (rec.job_id, parked.enqueue_generation + 1)
+        ]
+        current = await repo.get(rec.job_id)
+        assert current.enqueue_state == "enqueued"
+        assert current.forusbots_resume_at is None
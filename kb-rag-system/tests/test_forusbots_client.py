@@ -876,6 +876,117 @@ class TestSemaphore:
         assert fake.post_count() == 2
 
 
+
+class TestAdaptiveConcurrency:
+
+    def _limiter(self, initial=1, **kwargs):
+        defaults = dict(
+            maximum=4, target_queue_position=1, latency_target_s=5.0
+        )
+        defaults.update(kwargs)
+        return fb._AdaptiveSubmitLimiter(initial, **defaults)
+
+    def test_uncongested_submits_grow_window_additively_up_to_ceiling(self):
+        limiter = self._limiter(initial=1)
+        reasons = [
+            limiter.observe_submit(
+                started_at=0.0, latency_s=0.2, queue_position=0
+            )
+            for _ in range(12)
+        ]
+
+        assert limiter.limit == 4
+        assert reasons.count("increase") == 3
+        assert reasons[0] == "increase"   # 1 -> 2 after one healthy submit
+        assert reasons[1] is None          # 2.0 -> 2.5 keeps two permits
+
+    def test_congestion_halves_once_per_round_trip(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(fb.time, "monotonic", lambda: now[0])
+        limiter = self._limiter(initial=4)
+
+        assert limiter.observe_submit(
+            started_at=99.0, latency_s=0.5, queue_position=3
+        ) == "queue_backlog"
+        assert limiter.limit == 2
+        # Responses to submits started before the decrease are stale.
+        assert limiter.observe_rate_limited(started_at=99.5) is None
+        assert limiter.limit == 2
+
+        now[0] = 101.0
+        assert limiter.observe_submit(
+            started_at=100.5, latency_s=6.0, queue_position=0
+        ) == "slow_submit"
+        assert limiter.limit == 1
+        now[0] = 102.0
+        assert limiter.observe_rate_limited(started_at=101.5) == "rate_limited"
+        assert limiter.limit == 1          # never below the floor
+
+    async def test_growing_window_admits_queued_waiters(self):
+        import asyncio
+
+        limiter = self._limiter(initial=1, maximum=2)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        done, _ = await asyncio.wait({waiter}, timeout=0.01)
+        assert not done
+
+        limiter.observe_submit(started_at=0.0, latency_s=0.1, queue_position=0)
+
+        assert await asyncio.wait_for(waiter, timeout=1.0)
+        assert limiter.inflight == 2
+
+    async def test_rate_limited_submit_shrinks_window_and_exports_state(
+        self, caplog
+    ):
+        client, fake = _client(
+            [
+                _resp(429, {"error": "busy"}),
+                _SUBMIT_OK,
+                _resp(200, {"state": "succeeded", "result": {}}),
+            ],
+            max_inflight=2,
+            max_inflight_ceiling=4,
+        )
+
+        with caplog.at_level("INFO", logger="ticket_metrics"):
+            await client.scrape_participant(
+                "158948",
+                [{"key": "census", "fields": []}],
+                dedupe_scope="ticket-job-aimd",
+            )
+
+        assert fake.count("POST") == 2
+        assert client._semaphore.limit == 1
+        assert '"reason":"rate_limited"' in caplog.text
+        assert '"metric":"ticket_forusbots_concurrency_limit"' in caplog.text
+
+    async def test_queue_position_from_submit_drives_window(self):
+        client, _ = _client(
+            [
+                _resp(202, {"jobId": "j1", "queuePosition": 0, "estimate": {}}),
+                _resp(200, {"state": "succeeded", "result": {}}),
+                _resp(202, {"jobId": "j2", "queuePosition": 5, "estimate": {}}),
+                _resp(200, {"state": "succeeded", "result": {}}),
+            ],
+            max_inflight=2,
+            max_inflight_ceiling=6,
+        )
+        modules = [{"key": "census", "fields": []}]
+
+        await client.scrape_participant("A", modules)
+        assert client._semaphore.limit == 2   # 2.0 -> 2.5
+        await client.scrape_participant("B", modules)
+        assert client._semaphore.limit == 1
+
+    def test_without_ceiling_window_never_exceeds_max_inflight(self):
+        client, _ = _client([], max_inflight=2)
+        for _ in range(10):
+            client._semaphore.observe_submit(
+                started_at=0.0, latency_s=0.1, queue_position=0
+            )
+        assert client._semaphore.limit == 2
+
 # ---------------------------------------------------------------------------
 # HTTP retry / error handling
 # ---------------------------------------------------------------------------
@@ -656,6 +656,128 @@ class SlowOrch(FakeOrch):
         return list(self._extracted)
 
 
+class TestConditionalPoll:
+
+    def _accept_slow_v2(self, client, key):
+        _use_orch(
+            client, SlowOrch([_ext()], _cls("generate_response"), _gr_outcome())
+        )
+        accepted = client.post(
+            "/api/v2/handle-ticket", json=_v2_body(),
+            headers={"Idempotency-Key": key},
+        )
+        assert accepted.status_code == 202
+        return accepted.json()["ticket_job_id"]
+
+    def test_v1_poll_revalidates_with_etag_and_304(self, client):
+        _use_orch(client, FakeOrch([_ext()], _cls("generate_response"),
+                                   _gr_outcome()))
+        job_id = client.post(
+            "/api/v1/handle-ticket", json=_body()
+        ).json()["ticket_job_id"]
+
+        first = client.get(f"/api/v1/tickets/{job_id}")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        again = client.get(
+            f"/api/v1/tickets/{job_id}", headers={"If-None-Match": etag}
+        )
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["ETag"] == etag
+
+        stale = client.get(
+            f"/api/v1/tickets/{job_id}",
+            headers={"If-None-Match": 'W/"stale"'},
+        )
+        assert stale.status_code == 200
+        assert stale.json()["state"] == "succeeded"
+
+    def test_conditional_poll_still_authorizes_before_304(self, client):
+        job_id = self._accept_slow_v2(client, "v2-etag-authz")
+        etag = client.get(f"/api/v2/ticket-jobs/{job_id}").headers["ETag"]
+
+        from api.main import app, verify_api_key
+
+        async def _other_principal(request: Request) -> None:
+            request.state.principal_id = "other-principal"
+            request.state.tenant_id = "test-tenant"
+
+        previous = app.dependency_overrides[verify_api_key]
+        app.dependency_overrides[verify_api_key] = _other_principal
+        try:
+            denied = client.get(
+                f"/api/v2/ticket-jobs/{job_id}",
+                headers={"If-None-Match": etag},
+            )
+        finally:
+            app.dependency_overrides[verify_api_key] = previous
+        assert denied.status_code == 403
+
+    def test_internal_writes_keep_the_etag_and_304_reads_only_control(
+        self, client, monkeypatch
+    ):
+        job_id = self._accept_slow_v2(client, "v2-etag-internal-write")
+        etag = client.get(f"/api/v2/ticket-jobs/{job_id}").headers["ETag"]
+        repo = client.app.state.ticket_repo
+        # heartbeat/mark_enqueued-like write: only internal control fields
+        client.portal.call(lambda: repo.update(job_id, current_step="extract"))
+
+        async def _no_full_read(*_args, **_kwargs):
+            raise AssertionError("a 304 must not read payload or inquiries")
+
+        monkeypatch.setattr(repo, "get_with_payload_state", _no_full_read)
+        again = client.get(
+            f"/api/v2/ticket-jobs/{job_id}",
+            headers={"If-None-Match": etag},
+        )
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+
+    def test_v2_long_poll_times_out_unchanged_as_304(self, client, monkeypatch):
+        from api.config import settings as app_settings
+        monkeypatch.setattr(app_settings, "TICKET_POLL_MAX_WAIT_S", 0.2)
+        job_id = self._accept_slow_v2(client, "v2-long-poll-idle")
+        etag = client.get(f"/api/v2/ticket-jobs/{job_id}").headers["ETag"]
+
+        held = client.get(
+            f"/api/v2/ticket-jobs/{job_id}",
+            params={"wait": 30},
+            headers={"If-None-Match": etag},
+        )
+
+        assert held.status_code == 304
+
+    def test_v2_long_poll_returns_as_soon_as_job_changes(self, client):
+        import asyncio
+        import time as _time
+
+        from data_pipeline.ticket_job_models import TicketJobState
+
+        job_id = self._accept_slow_v2(client, "v2-long-poll-change")
+        etag = client.get(f"/api/v2/ticket-jobs/{job_id}").headers["ETag"]
+        repo = client.app.state.ticket_repo
+
+        async def _terminalize_soon():
+            await asyncio.sleep(0.1)
+            await repo.update(job_id, state=TicketJobState.FAILED)
+
+        client.portal.start_task_soon(_terminalize_soon)
+        started = _time.monotonic()
+        changed = client.get(
+            f"/api/v2/ticket-jobs/{job_id}",
+            params={"wait": 20},
+            headers={"If-None-Match": etag},
+        )
+
+        assert changed.status_code == 200
+        assert changed.json()["state"] == "failed"
+        assert changed.headers["ETag"] != etag
+        assert _time.monotonic() - started < 5.0
+
+
 class TestV2ContractRegressions:
 
     def test_v2_requires_idempotency_key_header(self, client):
@@ -0,0 +1,81 @@
+"""Contratos del codec opcional de documentos de payload."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from data_pipeline.payload_codec import (
+    BLOB_FIELD,
+    CODEC_FIELD,
+    CODEC_NONE,
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    PayloadCodecError,
+    codec_available,
+    decode_document,
+    encode_document,
+)
+
+EXPIRES = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def _large_payload() -> dict:
+    body = "Hello, I would like to request a hardship withdrawal. " * 60
+    return {
+        "job_id": "job-1",
+        "expires_at": EXPIRES,
+        "request_payload": {
+            "ticket": {"email_body": body, "attachments": [b"\x00\x01"]},
+            "received_at": datetime(2029, 5, 4, 3, 2, 1, tzinfo=timezone.utc),
+        },
+    }
+
+
+def test_zlib_round_trip_keeps_ttl_and_typed_values_plain():
+    document = _large_payload()
+
+    encoded = encode_document(document, CODEC_ZLIB)
+
+    assert encoded[CODEC_FIELD] == "zlib-json-v1"
+    assert isinstance(encoded[BLOB_FIELD], bytes)
+    assert encoded["expires_at"] is EXPIRES
+    assert encoded["job_id"] == "job-1"
+    assert "request_payload" not in encoded
+    assert decode_document(encoded) == document
+
+
+def test_small_documents_and_codec_none_stay_plain():
+    small = {"job_id": "job-1", "expires_at": EXPIRES, "fault_plan": None}
+
+    assert encode_document(small, CODEC_ZLIB) is small
+    large = _large_payload()
+    assert encode_document(large, CODEC_NONE) is large
+    assert decode_document(large) is large
+    assert decode_document(None) is None
+
+
+@pytest.mark.parametrize(
+    "document",
+    (
+        {"codec": "lz4-json-v1", "blob": b"x"},
+        {"codec": "zlib-json-v1", "blob": b"not-zlib"},
+        {"codec": "zlib-json-v1", "blob": "not-bytes"},
+    ),
+)
+def test_unreadable_encoded_documents_fail_closed(document):
+    with pytest.raises(PayloadCodecError):
+        decode_document(document)
+
+
+def test_zstd_availability_tracks_optional_dependency():
+    assert codec_available(CODEC_ZLIB)
+    assert not codec_available("lz4")
+    if not codec_available(CODEC_ZSTD):
+        with pytest.raises(PayloadCodecError):
+            encode_document(_large_payload(), CODEC_ZSTD)
+        return
+    encoded = encode_document(_large_payload(), CODEC_ZSTD)
+    assert encoded[CODEC_FIELD] == "zstd-json-v1"
+    assert decode_document(encoded) == _large_payload()
@@ -14,6 +14,7 @@ from concurrent.futures import ThreadPoolExecutor
 import pytest
 
 from api import metrics as ticket_metrics
+from data_pipeline.chunking import CHUNK_HASH_FIELD, chunk_fingerprint, plan_chunk_diff
 import data_pipeline.pinecone_uploader as pinecone_uploader
 
 PineconeUploader = pinecone_uploader.PineconeUploader
@@ -26,6 +27,7 @@ def _uploader_with_index(index: Mock) -> PineconeUploader:
         uploader.index_name = "test-index"
         uploader.namespace = "test-namespace"
         uploader.index = index
+        uploader.max_in_flight = 1
         # resiliencia de query (Tarea 8): el helper bypasea __init__, así que
         # se cablean los atributos que query_chunks usa. Backoff a 0 para no
         # dormir en los tests.
@@ -557,3 +559,130 @@ def test_query_chunks_supports_pinecone_sdk_9_search_signature():
         "score": 0.82,
         "metadata": {"article_id": "article-9"},
     }
+
+
+def _article_chunk(index: int, content: str) -> dict:
+    metadata = {"article_id": "a", "chunk_index": index, "chunk_tier": "high"}
+    metadata[CHUNK_HASH_FIELD] = chunk_fingerprint(content, metadata)
+    return {"id": f"a_chunk_{index}", "content": content, "metadata": metadata}
+
+
+def _index_with_hashes(stored: dict) -> Mock:
+    index = Mock()
+    index.list.return_value = iter([list(stored)])
+    index.fetch.side_effect = lambda ids, namespace: SimpleNamespace(vectors={
+        vec_id: SimpleNamespace(metadata={} if stored[vec_id] is None
+                                else {CHUNK_HASH_FIELD: stored[vec_id]})
+        for vec_id in ids
+    })
+    return index
+
+
+def test_reindex_upserts_only_new_or_changed_chunks_then_deletes_vanished_ids():
+    same, edited = _article_chunk(1, "fees"), _article_chunk(2, "faq v2")
+    index = _index_with_hashes({
+        "a_chunk_1": same["metadata"][CHUNK_HASH_FIELD],
+        "a_chunk_2": _article_chunk(2, "faq v1")["metadata"][CHUNK_HASH_FIELD],
+        "a_chunk_3": None,
+        "a_chunk_4": "legacy",
+    })
+    uploader = _uploader_with_index(index)
+    uploader.batch_size, uploader.max_retries, uploader.retry_delay = 96, 1, 0
+
+    diff = uploader.plan_article_reindex("a", [same, edited, _article_chunk(3, "new")])
+    result = uploader.apply_chunk_diff(diff, show_progress=False)
+
+    index.list.assert_called_once_with(prefix="a_chunk_", namespace="test-namespace")
+    assert [chunk["id"] for chunk in diff.upsert] == ["a_chunk_2", "a_chunk_3"]
+    assert result == {"added": 0, "changed": 2, "unchanged": 1, "deleted": 1, "failed": 0}
+    # Upsert antes que delete: el artículo nunca queda sin vectores.
+    assert [name for name, _args, _kwargs in index.mock_calls][-2:] == [
+        "upsert_records", "delete",
+    ]
+    index.delete.assert_called_once_with(ids=["a_chunk_4"], namespace="test-namespace")
+
+
+def test_reindex_keeps_vanished_ids_when_an_upsert_batch_fails():
+    index = _index_with_hashes({"a_chunk_1": None, "a_chunk_2": None})
+    index.upsert_records.side_effect = _HTTPErr(400)
+    uploader = _uploader_with_index(index)
+    uploader.batch_size, uploader.max_retries, uploader.retry_delay = 96, 1, 0
+
+    diff = uploader.plan_article_reindex("a", [_article_chunk(1, "fees")])
+    result = uploader.apply_chunk_diff(diff, show_progress=False)
+
+    assert result["failed"] == 1 and result["deleted"] == 0
+    index.delete.assert_not_called()
+    # El fingerprint es estable: re-planear lo mismo no deja nada pendiente.
+    assert plan_chunk_diff([_article_chunk(1, "fees")], {
+        "a_chunk_1": _article_chunk(1, "fees")["metadata"][CHUNK_HASH_FIELD],
+    }).has_writes is False
+
+
+def test_planning_many_articles_keeps_reads_in_flight_and_keeps_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _list(prefix, namespace):
+        barrier.wait()  # sólo pasa si 3 artículos se planean a la vez
+        return iter([[f"{prefix}1"]])
+
+    index = Mock()
+    index.list.side_effect = _list
+    index.fetch.side_effect = lambda ids, namespace: SimpleNamespace(
+        vectors={vec_id: SimpleNamespace(metadata={}) for vec_id in ids}
+    )
+    uploader = _uploader_with_index(index)
+    uploader.max_in_flight = 3
+
+    articles = [
+        (article_id, [{**_article_chunk(1, article_id), "id": f"{article_id}_chunk_1"}], None)
+        for article_id in ("a", "b", "c")
+    ]
+    diffs = uploader.plan_articles_reindex(articles)
+
+    assert [diff.upsert[0]["id"] for diff in diffs] == ["a_chunk_1", "b_chunk_1", "c_chunk_1"]
+
+
+def test_upload_chunks_keeps_batches_in_flight_and_counts_in_order():
+    barrier = threading.Barrier(3, timeout=5)
+    seen = []
+
+    def _upsert(namespace, records):
+        seen.append(records[0]["_id"])
+        barrier.wait()  # sólo pasa si 3 batches están en vuelo a la vez
+
+    index = Mock()
+    index.upsert_records.side_effect = _upsert
+    uploader = _uploader_with_index(index)
+    uploader.batch_size, uploader.max_retries, uploader.retry_delay = 1, 1, 0
+    uploader.max_in_flight = 3
+
+    chunks = [{"id": f"c{i}", "content": "x", "metadata": {}} for i in range(6)]
+    assert uploader.upload_chunks(chunks, show_progress=False) == {"success": 6, "failed": 0}
+    assert sorted(seen) == [f"c{i}" for i in range(6)]
+
+
+def test_a_429_during_a_pipelined_upload_is_retried_after_a_shared_pause():
+    index = Mock()
+    index.upsert_records.side_effect = [_HTTPErr(429), None, None]
+    uploader = _uploader_with_index(index)
+    uploader.batch_size, uploader.max_retries, uploader.retry_delay = 1, 3, 0
+    uploader.max_in_flight = 2
+
+    chunks = [{"id": f"c{i}", "content": "x", "metadata": {}} for i in range(2)]
+    assert uploader.upload_chunks(chunks, show_progress=False) == {"success": 2, "failed": 0}
+    assert index.upsert_records.call_count == 3
+
+
+def test_upload_window_halves_on_429_and_regrows_after_a_success_streak():
+    window = pinecone_uploader._UploadWindow(4)
+    window.throttle(0)
+    assert window.limit == 2
+    for _ in range(2):
+        window.acquire()
+    for _ in range(2):
+        window.release(succeeded=True)
+    assert window.limit == 3
+    window.throttle(0)
+    window.throttle(0)
+    assert window.limit == 1
@@ -0,0 +1,91 @@
+"""Contratos del token bucket por principal (api/rate_limit.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from api import metrics
+from api.config import Settings
+from api.rate_limit import FixedWindowRateLimiter, TokenBucketRateLimiter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_window_boundary_does_not_admit_a_double_burst():
+    clock = _Clock()
+    limiter = TokenBucketRateLimiter(window_s=60, clock=clock)
+    key = ("principal-a", "handle_ticket")
+
+    assert all(limiter.check(key, 10)[0] for _ in range(10))
+    allowed, retry_after = limiter.check(key, 10)
+    assert (allowed, retry_after) == (False, 6)
+
+    # Una ventana fija se reiniciaría aquí; el bucket sólo repuso 1 token.
+    clock.now += 6
+    assert limiter.check(key, 10) == (True, 0)
+    assert limiter.check(key, 10)[0] is False
+
+
+def test_principal_overrides_burst_and_sustained_rate():
+    clock = _Clock()
+    limiter = TokenBucketRateLimiter(
+        window_s=60, principal_limits={"batch": (60, 3)}, clock=clock,
+    )
+
+    assert [limiter.check(("batch",), 10)[0] for _ in range(4)] == [
+        True, True, True, False,
+    ]
+    clock.now += 1
+    assert limiter.check(("batch",), 10) == (True, 0)
+
+
+def test_idle_buckets_expire_from_the_head_and_key_count_is_bounded():
+    clock = _Clock()
+    limiter = TokenBucketRateLimiter(window_s=60, max_keys=3, clock=clock)
+    for index in range(5):
+        limiter.check((f"p-{index}",), 1)
+    assert len(limiter._buckets) == 3
+
+    clock.now += 61
+    limiter.check(("fresh",), 1)
+    assert list(limiter._buckets) == [("fresh",)]
+
+
+def test_zero_limit_disables_the_check_and_outcomes_are_counted():
+    before = metrics.snapshot()
+    limiter = TokenBucketRateLimiter(clock=_Clock())
+
+    assert limiter.check(("p",), 0) == (True, 0)
+    assert limiter.check(("q",), 1) == (True, 0)
+    assert limiter.check(("q",), 1)[0] is False
+
+    after = metrics.snapshot()
+    accepted = "ticket_rate_limit_checks{outcome=accepted}"
+    rejected = "ticket_rate_limit_checks{outcome=rejected}"
+    assert after.get(accepted, 0) - before.get(accepted, 0) == 2
+    assert after.get(rejected, 0) - before.get(rejected, 0) == 1
+
+
+def test_historic_name_remains_a_drop_in():
+    assert FixedWindowRateLimiter is TokenBucketRateLimiter
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(principal_limits={"p": (0, 1)})
+
+
+def test_burst_and_principal_limits_come_from_deployed_settings(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_BURST_FACTOR", "2")
+    monkeypatch.setenv("RATE_LIMIT_PRINCIPAL_LIMITS", '{"batch": [60, 3]}')
+    limiter = TokenBucketRateLimiter.from_settings(Settings(_env_file=None))
+
+    assert [limiter.check(("n8n",), 2)[0] for _ in range(5)] == [
+        True, True, True, True, False,
+    ]
+    assert [limiter.check(("batch",), 2)[0] for _ in range(4)] == [
+        True, True, True, False,
+    ]
@@ -271,7 +271,12 @@ def test_firestore_json_mirror_matches_all_terraform_indexes_and_ttls() -> None:
         (("principal_id", "ASCENDING"), ("state", "ASCENDING")),
         (("state", "ASCENDING"), ("lease_expires_at", "ASCENDING")),
         (("state", "ASCENDING"), ("created_at", "ASCENDING")),
-        (("enqueue_state", "ASCENDING"), ("created_at", "ASCENDING")),
+        (("state", "ASCENDING"), ("job_deadline_at", "ASCENDING")),
+        (
+            ("enqueue_state", "ASCENDING"),
+            ("state", "ASCENDING"),
+            ("created_at", "ASCENDING"),
+        ),
     }
     # The ticket handler and the /tickets review console share this canonical
     # file but live in different named databases, and only the handler's
@@ -282,6 +287,7 @@ def test_firestore_json_mirror_matches_all_terraform_indexes_and_ttls() -> None:
     handler_collections = {
         "ticket_jobs",
         "ticket_job_payloads",
+        "ticket_job_inquiries",
         "ticket_idempotency_receipts",
         "ticket_rate_windows",
         "ticket_executions",
@@ -291,6 +297,7 @@ def test_firestore_json_mirror_matches_all_terraform_indexes_and_ttls() -> None:
         "ticket_reviews",
         "ticket_console_cache",
         "devrev_message_cache",
+        "devrev_ticket_mirror",
         "ticket_import_staging",
         "idempotency_keys",
     }
@@ -308,6 +315,7 @@ def test_firestore_json_mirror_matches_all_terraform_indexes_and_ttls() -> None:
 
     expected_ttls = {
         ("ticket_job_payloads", "expires_at"),
+        ("ticket_job_inquiries", "expires_at"),
         ("ticket_jobs", "expires_at"),
         ("ticket_idempotency_receipts", "expires_at"),
         ("ticket_rate_windows", "expires_at"),
@@ -330,6 +338,7 @@ def test_firestore_json_mirror_matches_all_terraform_indexes_and_ttls() -> None:
     assert console_ttls == {
         ("ticket_console_cache", "expires_at"),
         ("devrev_message_cache", "expires_at"),
+        ("devrev_ticket_mirror", "expires_at"),
         ("ticket_import_staging", "expires_at"),
         ("idempotency_keys", "expires_at"),
     }
@@ -11,7 +11,9 @@ localmente es el emulador/servicio Firestore real).
 from __future__ import annotations
 
 import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import pytest
 
@@ -24,14 +26,21 @@ from data_pipeline.ticket_job_models import (
     utcnow,
 )
 from data_pipeline.ticket_job_repository import (
+    COUNTERS_COLLECTION,
+    FirestoreTicketJobBackend,
+    INQUIRIES_COLLECTION,
     JOBS_COLLECTION,
     PAYLOADS_COLLECTION,
+    RATE_WINDOWS_COLLECTION,
     InMemoryTicketJobBackend,
     IdempotencyReceiptOrphaned,
     InvalidStateTransition,
+    QuotaExceeded,
+    RateWindowExceeded,
     StaleLeaseEpoch,
     TicketJobError,
     TicketJobRepository,
+    _DocChangeNotifier,
     _record_to_doc,
     split_record,
 )
@@ -119,6 +128,36 @@ class _TransactionContentionProbe(InMemoryTicketJobBackend):
             self.active_transactions -= 1
 
 
+class _KeyRecordingBackend(InMemoryTicketJobBackend):
+    """Registra los documentos leídos o escritos por cada transacción."""
+
+    def __init__(self):
+        super().__init__()
+        self.touched = []
+
+    async def transact(self, fn):
+        touched = set()
+        self.touched.append(touched)
+
+        class _View:
+            def __init__(self, view):
+                self._view = view
+
+            async def get(self, collection, doc_id):
+                touched.add((collection, doc_id))
+                return await self._view.get(collection, doc_id)
+
+            def set(self, collection, doc_id, value):
+                touched.add((collection, doc_id))
+                self._view.set(collection, doc_id, value)
+
+            def delete(self, collection, doc_id):
+                touched.add((collection, doc_id))
+                self._view.delete(collection, doc_id)
+
+        return await super().transact(lambda view: fn(_View(view)))
+
+
 def _record(principal="n8n", payload=None, **over):
     payload = payload if payload is not None else PAYLOAD_A
     return new_job_record(
@@ -471,6 +510,89 @@ class TestAtomicQuotas:
             "slots; deben consumir exactamente uno"
         )
 
+    async def test_sharded_counters_enforce_the_summed_quota(self, backend):
+        repo = TicketJobRepository(
+            backend, max_outstanding=4, rate_limit_per_minute=6,
+            counter_shards=4,
+        )
+        records = [
+            (await _create(repo, key=f"shard-{index}"))[0]
+            for index in range(4)
+        ]
+        with pytest.raises(QuotaExceeded):
+            await _create(repo, key="shard-over-quota")
+
+        dump = await backend.dump_all()
+        assert sum(
+            doc["active_jobs"] for doc in dump[COUNTERS_COLLECTION].values()
+        ) == 4
+        assert sum(
+            doc["count"] for doc in dump[RATE_WINDOWS_COLLECTION].values()
+        ) == 4
+        assert await repo.count_active("n8n") == 4
+
+        # La liberación decrementa el shard propio del job.
+        target = records[0]
+        await repo.update(target.job_id, state=TicketJobState.RUNNING)
+        await repo.update(target.job_id, state=TicketJobState.SUCCEEDED)
+        assert await repo.count_active("n8n") == 3
+        await _create(repo, key="shard-after-release")
+        await repo.update(records[1].job_id, state=TicketJobState.RUNNING)
+        await repo.update(records[1].job_id, state=TicketJobState.FAILED)
+        await _create(repo, key="shard-after-second-release")
+
+        # 6/min por principal sumando todos los shards de la ventana.
+        await repo.update(records[2].job_id, state=TicketJobState.RUNNING)
+        await repo.update(records[2].job_id, state=TicketJobState.FAILED)
+        with pytest.raises(RateWindowExceeded):
+            await _create(repo, key="shard-rate-window-full")
+
+    async def test_admissions_on_different_shards_touch_disjoint_documents(
+            self):
+        backend = _KeyRecordingBackend()
+        repo = TicketJobRepository(
+            backend, max_outstanding=25, rate_limit_per_minute=60,
+            counter_shards=4,
+        )
+        by_shard = {}
+        for index in range(20):
+            record, _ = await _create(repo, key=f"spread-{index}")
+            by_shard.setdefault(record.active_slot_shard, backend.touched[-1])
+            if len(by_shard) == 2:
+                break
+        first, second = by_shard.values()
+
+        assert first.isdisjoint(second)
+        for touched in (first, second):
+            # Un counter y una ventana: ni los demás shards ni un total.
+            assert sum(c == COUNTERS_COLLECTION for c, _ in touched) == 1
+            assert sum(c == RATE_WINDOWS_COLLECTION for c, _ in touched) == 1
+
+    async def test_a_full_shard_spills_over_until_the_total_cap(self, backend):
+        repo = TicketJobRepository(
+            backend, max_outstanding=3, counter_shards=4,
+        )
+        records = [
+            (await _create(repo, key=f"spill-{index}"))[0]
+            for index in range(3)
+        ]
+        with pytest.raises(QuotaExceeded) as exc:
+            await _create(repo, key="spill-over")
+
+        assert exc.value.outstanding == 3
+        # Cuotas 1/1/1/0: cada slot vivo quedó en un shard distinto.
+        assert sorted(rec.active_slot_shard for rec in records) == [0, 1, 2]
+
+    async def test_single_shard_keeps_the_historic_document_ids(self, repo, backend):
+        from data_pipeline.ticket_job_repository import principal_hash
+
+        rec, _ = await _create(repo, key="legacy-shard")
+        dump = await backend.dump_all()
+        assert list(dump[COUNTERS_COLLECTION]) == [principal_hash("n8n")]
+        assert rec.active_slot_shard == 0
+        with pytest.raises(TicketJobError):
+            TicketJobRepository(backend, counter_shards=0)
+
 
 class TestLeaseFencing:
 
@@ -939,6 +1061,33 @@ class TestLeaseFencing:
         current = await backend.get_doc(JOBS_COLLECTION, rec.job_id)
         assert current["lease_expires_at"] == expired_at
 
+    async def test_fenced_writes_renew_lease_in_same_transaction(
+            self, repo, backend):
+        rec, _ = await _create(repo, key="coalesced-heartbeat")
+        epoch = await repo.claim(rec.job_id, worker_id="w-1", lease_s=5.0)
+        claimed = await repo.get(rec.job_id)
+
+        await repo.record_inquiry_result(
+            rec.job_id, 0, {"execution_status": "succeeded"},
+            lease_epoch=epoch, renew_lease_s=60.0,
+        )
+        checkpointed = await repo.get(rec.job_id)
+        assert checkpointed.lease_expires_at \
+            > claimed.lease_expires_at + timedelta(seconds=50)
+
+        await repo.update(rec.job_id, current_step="processing",
+                          expected_lease_epoch=epoch, renew_lease_s=120.0)
+        updated = await repo.get(rec.job_id)
+        assert updated.lease_expires_at \
+            > checkpointed.lease_expires_at + timedelta(seconds=50)
+
+        final = await repo.update(
+            rec.job_id, state=TicketJobState.SUCCEEDED,
+            expected_lease_epoch=epoch, renew_lease_s=120.0,
+        )
+        assert final.lease_expires_at is None
+        assert final.lease_owner is None
+
     async def test_stale_task_confirmation_cannot_mark_new_generation_enqueued(
             self, repo):
         rec, _ = await _create(repo)
@@ -1085,6 +1234,309 @@ class TestLeaseFencing:
             )
 
 
+class _ReadCountingBackend(InMemoryTicketJobBackend):
+    def __init__(self):
+        super().__init__()
+        self.control_reads = 0
+
+    async def get_doc(self, collection, doc_id):
+        if collection == JOBS_COLLECTION:
+            self.control_reads += 1
+        return await super().get_doc(collection, doc_id)
+
+
+class TestPushTerminalWait:
+
+    async def test_local_commit_wakes_waiter_without_polling(self):
+        backend = _ReadCountingBackend()
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+
+        async def _finish():
+            await asyncio.sleep(0.05)
+            await repo.update(rec.job_id, state=TicketJobState.SUCCEEDED)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        finisher = asyncio.create_task(_finish())
+        record = await repo.wait_for_terminal(rec.job_id, 5.0)
+        await finisher
+
+        assert record.state == TicketJobState.SUCCEEDED
+        assert loop.time() - started < 1.0
+        # Lectura inicial + una por el aviso del commit: nada de 50 ms polls.
+        assert backend.control_reads <= 3
+
+    async def test_unnotified_write_is_found_by_fallback_poll(self, backend):
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+
+        async def _foreign_instance_write():
+            # Otra instancia sin listener: el doc cambia sin aviso local.
+            await asyncio.sleep(0.05)
+            backend._data[JOBS_COLLECTION][rec.job_id]["state"] = (
+                TicketJobState.FAILED.value
+            )
+
+        writer = asyncio.create_task(_foreign_instance_write())
+        record = await repo.wait_for_terminal(rec.job_id, 2.0)
+        await writer
+
+        assert record.state == TicketJobState.FAILED
+
+    async def test_budget_expiry_returns_live_record_and_unregisters(
+        self, backend
+    ):
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+
+        record = await repo.wait_for_terminal(rec.job_id, 0.05)
+
+        assert record.state == TicketJobState.QUEUED
+        assert not backend._notifier._waiters
+
+    async def test_firestore_waiters_share_one_listener_per_job(self):
+        listener = _ListenerClientProbe()
+        backend = object.__new__(FirestoreTicketJobBackend)
+        backend._prefix = ""
+        backend._notifier = _DocChangeNotifier()
+        backend._snapshot_listeners = True
+        backend._listener_client = listener
+        backend._listeners = {}
+        backend._listeners_lock = threading.Lock()
+
+        async with backend.watch_doc(JOBS_COLLECTION, "job-1") as first:
+            async with backend.watch_doc(JOBS_COLLECTION, "job-1") as second:
+                assert listener.opened == [f"{JOBS_COLLECTION}/job-1"]
+                # El snapshot inicial no despierta; el siguiente, a todos.
+                listener.callbacks[0]()
+                await asyncio.sleep(0)
+                assert not first.is_set() and not second.is_set()
+                listener.callbacks[0]()
+                await asyncio.wait_for(
+                    asyncio.gather(first.wait(), second.wait()), 1.0
+                )
+            assert listener.closed == 0
+
+        assert listener.closed == 1
+        assert not backend._listeners
+
+
+class _ListenerClientProbe:
+    """Cliente síncrono falso: registra cada on_snapshot abierto."""
+
+    def __init__(self):
+        self.opened = []
+        self.callbacks = []
+        self.closed = 0
+
+    def collection(self, name):
+        probe = self
+
+        class _Doc:
+            def __init__(self, doc_id):
+                self.path = f"{name}/{doc_id}"
+
+            def on_snapshot(self, callback):
+                probe.opened.append(self.path)
+                probe.callbacks.append(callback)
+                return SimpleNamespace(unsubscribe=probe._close)
+
+        return SimpleNamespace(document=_Doc)
+
+    def _close(self):
+        self.closed += 1
+
+
+class _WriteRecordingBackend(InMemoryTicketJobBackend):
+    """Registra las escrituras y los round trips de lectura de la última tx."""
+
+    def __init__(self):
+        super().__init__()
+        self.last_writes = []
+        self.last_reads = []
+
+    async def transact(self, fn):
+        async def _recording(view):
+            reads = []
+            result = await fn(_ReadRecordingView(view, reads))
+            self.last_writes = view.written_keys()
+            self.last_reads = reads
+            return result
+
+        return await super().transact(_recording)
+
+
+class _ReadRecordingView:
+    def __init__(self, view, reads):
+        self._view = view
+        self._reads = reads
+
+    async def get(self, collection, doc_id):
+        self._reads.append([(collection, doc_id)])
+        return await self._view.get(collection, doc_id)
+
+    async def get_all(self, keys):
+        self._reads.append(list(keys))
+        return await self._view.get_all(keys)
+
+    def set(self, collection, doc_id, value):
+        self._view.set(collection, doc_id, value)
+
+    def delete(self, collection, doc_id):
+        self._view.delete(collection, doc_id)
+
+
+def _inquiry(index, status="succeeded"):
+    return {"index": index, "route": "generate_response",
+            "execution_status": status, "participant_reply_safe": True}
+
+
+class TestInquirySubdocuments:
+
+    async def test_checkpoint_writes_control_and_one_inquiry_only(self):
+        backend = _WriteRecordingBackend()
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        for index in range(3):
+            await repo.record_inquiry_result(
+                rec.job_id, index, _inquiry(index, "running"))
+
+        await repo.record_inquiry_result(rec.job_id, 1, _inquiry(1))
+
+        assert sorted(backend.last_writes) == [
+            (INQUIRIES_COLLECTION, f"{rec.job_id}:0001"),
+            (JOBS_COLLECTION, rec.job_id),
+        ]
+        payload = await backend.get_doc(PAYLOADS_COLLECTION, rec.job_id)
+        assert "per_inquiry_status" not in payload
+        control = await backend.get_doc(JOBS_COLLECTION, rec.job_id)
+        assert control["inquiry_indexes"] == [0, 1, 2]
+        found = await repo.get(rec.job_id)
+        assert [e["index"] for e in found.per_inquiry_status] == [0, 1, 2]
+        assert found.per_inquiry_status[1]["execution_status"] == "succeeded"
+        assert found.processed_inquiries == 1
+
+    async def test_checkpoint_reads_one_batch_and_never_assembles(self):
+        backend = _WriteRecordingBackend()
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        for index in range(3):
+            await repo.record_inquiry_result(rec.job_id, index, _inquiry(index))
+
+        await repo.record_inquiry_result(rec.job_id, 1, _inquiry(1, "failed"))
+
+        assert backend.last_reads == [[
+            (JOBS_COLLECTION, rec.job_id),
+            (PAYLOADS_COLLECTION, rec.job_id),
+            (INQUIRIES_COLLECTION, f"{rec.job_id}:0001"),
+        ]]
+        found = await repo.get(rec.job_id)
+        assert found.processed_inquiries == 3
+        assert found.per_inquiry_status[1]["execution_status"] == "failed"
+
+    async def test_payload_is_assembled_in_one_batched_read(self):
+        backend = _WriteRecordingBackend()
+        repo = TicketJobRepository(backend)
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        for index in range(3):
+            await repo.record_inquiry_result(rec.job_id, index, _inquiry(index))
+
+        await repo.update(rec.job_id, current_step="aggregate")
+
+        assert backend.last_reads[:2] == [
+            [(JOBS_COLLECTION, rec.job_id)],
+            [(PAYLOADS_COLLECTION, rec.job_id)] + [
+                (INQUIRIES_COLLECTION, f"{rec.job_id}:{index:04d}")
+                for index in range(3)
+            ],
+        ]
+
+    async def test_legacy_embedded_checkpoints_read_and_migrate(
+        self, repo, backend
+    ):
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        # layout previo: control sin índices, checkpoints en el payload
+        backend._data[JOBS_COLLECTION][rec.job_id].pop("inquiry_indexes")
+        backend._data[PAYLOADS_COLLECTION][rec.job_id][
+            "per_inquiry_status"] = [_inquiry(0)]
+
+        legacy = await repo.get(rec.job_id)
+        assert legacy.per_inquiry_status == [_inquiry(0)]
+
+        await repo.record_inquiry_result(rec.job_id, 1, _inquiry(1))
+
+        payload = await backend.get_doc(PAYLOADS_COLLECTION, rec.job_id)
+        assert "per_inquiry_status" not in payload
+        assert set(backend._data[INQUIRIES_COLLECTION]) == {
+            f"{rec.job_id}:0000", f"{rec.job_id}:0001",
+        }
+        migrated = await repo.get(rec.job_id)
+        assert [e["index"] for e in migrated.per_inquiry_status] == [0, 1]
+
+    async def test_expired_payload_deletes_inquiry_subdocuments(
+        self, repo, backend
+    ):
+        rec, _ = await _create(repo)
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        await repo.record_inquiry_result(rec.job_id, 0, _inquiry(0))
+        backend._data[PAYLOADS_COLLECTION][rec.job_id]["expires_at"] = (
+            utcnow() - timedelta(seconds=1)
+        )
+
+        terminal = await repo.terminalize_if_unrecoverable(rec.job_id)
+
+        assert terminal.public_error_code == "EXPIRED_PAYLOAD"
+        assert await backend.get_doc(
+            INQUIRIES_COLLECTION, f"{rec.job_id}:0000") is None
+        control = await backend.get_doc(JOBS_COLLECTION, rec.job_id)
+        assert control["inquiry_indexes"] == []
+
+
+class TestPayloadCodec:
+
+    async def test_compressed_payload_round_trips_and_keeps_ttl(self, backend):
+        repo = TicketJobRepository(backend, payload_codec="zlib")
+        payload = {**PAYLOAD_A, "ticket": {
+            "email_subject": "401k", "email_body": "cash out please " * 200,
+        }}
+        rec, _ = await repo.create_or_get(
+            principal_id="n8n",
+            idempotency_key="key-codec",
+            request_fingerprint=fingerprint_request(payload),
+            candidate=_record(payload=payload, request_payload=payload),
+        )
+        await repo.update(rec.job_id, state=TicketJobState.RUNNING)
+        await repo.record_inquiry_result(rec.job_id, 0, {
+            **_inquiry(0), "reply": "Your request was received. " * 80,
+        })
+
+        stored = backend._data[PAYLOADS_COLLECTION][rec.job_id]
+        assert stored["codec"] == "zlib-json-v1"
+        assert isinstance(stored["blob"], bytes)
+        assert isinstance(stored["expires_at"], datetime)
+        assert "request_payload" not in stored
+        inquiry = backend._data[INQUIRIES_COLLECTION][f"{rec.job_id}:0000"]
+        assert inquiry["codec"] == "zlib-json-v1"
+        assert inquiry["index"] == 0
+
+        found = await repo.get(rec.job_id)
+        assert found.request_payload == payload
+        assert found.per_inquiry_status[0]["execution_status"] == "succeeded"
+        # Desactivar el codec no deja datos ilegibles.
+        plain = await TicketJobRepository(backend).get(rec.job_id)
+        assert plain.request_payload == payload
+
+    def test_unknown_codec_is_rejected(self, backend):
+        with pytest.raises(TicketJobError):
+            TicketJobRepository(backend, payload_codec="lz4")
+
+
 class TestAbsoluteDeadline:
 
     async def test_absolute_job_deadline_terminalizes_late_deliveries(self, repo):
@@ -0,0 +1,119 @@
+"""Índices secundarios y clones de los backends in-memory de tickets."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from data_pipeline.ticket_job_repository import (
+    JOBS_COLLECTION,
+    InMemoryTicketJobBackend,
+)
+from data_pipeline.ticket_memory_index import BucketIndex, clone_document
+from data_pipeline.ticket_review_repository import (
+    REVIEWS_COLLECTION,
+    InMemoryTicketReviewBackend,
+)
+
+T0 = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def test_clone_shares_leaves_but_not_containers():
+    document = {"at": T0, "nested": {"items": [1, {"x": "y"}]}, "blob": b"z"}
+
+    clone = clone_document(document)
+    clone["nested"]["items"][1]["x"] = "mutated"
+
+    assert document["nested"]["items"][1]["x"] == "y"
+    assert clone["at"] is document["at"]
+    assert clone["blob"] is document["blob"]
+
+
+def test_bucket_index_moves_ids_between_buckets_in_order():
+    index: BucketIndex[str] = BucketIndex()
+    index.put("b", "queued")
+    index.put("a", "queued")
+    index.put("c", "running")
+    index.put("b", "running")
+
+    assert [doc_id for _order, doc_id in index.entries("queued")] == ["a"]
+    assert [doc_id for _order, doc_id in index.entries("running")] == ["b", "c"]
+    index.discard("a")
+    assert index.count("queued") == 0
+
+
+async def test_job_indexes_follow_direct_storage_writes():
+    backend = InMemoryTicketJobBackend()
+
+    async def _seed(view):
+        for index in range(6):
+            view.set(JOBS_COLLECTION, f"job-{index}", {
+                "principal_id": "p-even" if index % 2 == 0 else "p-odd",
+                "state": "queued",
+                "created_at": T0 + timedelta(minutes=index),
+            })
+
+    await backend.transact(_seed)
+    # Otra "instancia" reescribe el doc completo fuera de transacción.
+    backend._data[JOBS_COLLECTION]["job-0"] = {
+        "principal_id": "p-even", "state": "succeeded", "created_at": T0,
+    }
+    backend._data[JOBS_COLLECTION].pop("job-5")
+
+    assert await backend.count_jobs(JOBS_COLLECTION, "p-even", ["queued"]) == 2
+    assert await backend.active_job_stats(JOBS_COLLECTION, ["queued"]) == (
+        4, T0 + timedelta(minutes=1),
+    )
+    page = await backend.scan_collection(
+        JOBS_COLLECTION, 2, states=["queued", "succeeded"], start_after="job-0",
+    )
+    assert [doc_id for doc_id, _doc in page] == ["job-1", "job-2"]
+    page[0][1]["state"] = "mutated"
+    assert backend._data[JOBS_COLLECTION]["job-1"]["state"] == "queued"
+
+
+async def test_ordered_job_indexes_follow_direct_storage_writes():
+    backend = InMemoryTicketJobBackend()
+
+    async def _seed(view):
+        for index in range(3):
+            view.set(JOBS_COLLECTION, f"job-{index}", {
+                "state": "running",
+                "lease_expires_at": T0 + timedelta(minutes=index),
+            })
+
+    await backend.transact(_seed)
+    # Otra "instancia" renueva un lease y fencea otro fuera de transacción.
+    backend._data[JOBS_COLLECTION]["job-0"] = {
+        "state": "running", "lease_expires_at": T0 + timedelta(hours=1),
+    }
+    backend._data[JOBS_COLLECTION]["job-1"] = {
+        "state": "queued", "lease_expires_at": T0 + timedelta(minutes=1),
+    }
+
+    page = await backend.query_ordered(
+        JOBS_COLLECTION, 10, equals={"state": ["running"]},
+        order_by="lease_expires_at", before=T0 + timedelta(minutes=30),
+    )
+    assert [doc_id for doc_id, _doc in page] == ["job-2"]
+
+
+async def test_review_status_index_pages_newest_first_across_statuses():
+    backend = InMemoryTicketReviewBackend()
+    for index in range(5):
+        await backend.force_write((REVIEWS_COLLECTION, f"r-{index}"), {
+            "status": "open" if index % 2 == 0 else "in_review",
+            "updated_at": T0 + timedelta(minutes=index % 3),
+            "devrev_display_id": f"TKT-{index}",
+        })
+
+    first = await backend.query_reviews(statuses=["open", "in_review"], limit=2)
+    assert [doc_id for doc_id, _doc in first] == ["r-2", "r-1"]
+    last = first[-1]
+    rest = await backend.query_reviews(
+        statuses=["open", "in_review"],
+        start_after=(last[1]["updated_at"], last[0]),
+        updated_after=T0 + timedelta(minutes=1),
+    )
+    assert [doc_id for doc_id, _doc in rest] == ["r-4"]
+    hits = await backend.query_reviews_by_display_id("TKT-3")
+    assert [doc_id for doc_id, _doc in hits] == ["r-3"]
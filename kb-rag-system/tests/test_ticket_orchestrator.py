@@ -17,6 +17,7 @@ from api.models import HandleTicketRequest
 from data_pipeline.forusbots_client import (
     ForusBotsAmbiguousSubmit,
     ForusBotsCircuitOpen,
+    ForusBotsDeferred,
     ForusBotsJobFailed,
     ForusBotsTimeout,
 )
@@ -895,6 +896,40 @@ class TestGenerateBranch:
             "manual_reconciliation_required": True,
         }
 
+    async def test_gr_callback_mode_defers_instead_of_degrading(self):
+        llm = self._gr_llm()
+        deps, rag, _r, forusbots = _deps(
+            llm=llm, classify_route="generate_response"
+        )
+        rag.get_required_data.return_value = SimpleNamespace(required_fields={
+            "participant_data": [
+                {"field": "account_balance", "required": True}
+            ]
+        })
+        forusbots.scrape_participant.side_effect = ForusBotsDeferred(
+            "external-job-deferred", "participant"
+        )
+        orch = TicketOrchestrator(deps, _settings())
+        orch.set_forusbots_operation_hooks(
+            AsyncMock(return_value=ForusBotsOperationDecision("submit", None)),
+            AsyncMock(),
+            dedupe_scope="job-scope",
+            callback_url="https://api.example.test/cb/job?sig=abc",
+        )
+
+        with pytest.raises(ForusBotsDeferred) as excinfo:
+            await orch.handle_inquiry(
+                ExtractedInquiry("cash out", "LT Trust", "401(k)", "rollover"),
+                _req(),
+                total_inquiries=1,
+            )
+
+        assert excinfo.value.job_id == "external-job-deferred"
+        assert forusbots.scrape_participant.await_args.kwargs[
+            "callback_url"
+        ] == "https://api.example.test/cb/job?sig=abc"
+        rag.generate_response.assert_not_awaited()
+
     async def test_gr_ambiguous_submit_requires_manual_reconciliation(self):
         llm = self._gr_llm()
         deps, rag, _r, forusbots = _deps(
@@ -8,7 +8,10 @@ por deadline absoluto y payload ausente, concurrencia de dos reconciliadores
 
 from __future__ import annotations
 
+import asyncio
+import json
 from datetime import timedelta
+from pathlib import Path
 
 import pytest
 
@@ -21,6 +24,7 @@ from data_pipeline.ticket_job_models import (
 from data_pipeline.ticket_job_repository import (
     JOBS_COLLECTION,
     PAYLOADS_COLLECTION,
+    RECONCILE_INDEXES,
     InMemoryTicketJobBackend,
     TicketJobRepository,
 )
@@ -286,16 +290,21 @@ class TestReconcilerRepairs:
                 healthy.job_id, f"inline/ticket-{healthy.job_id}-g0",
             )
             await repo.claim(healthy.job_id, worker_id=f"worker-{job_id}")
-        pending = await _seed(repo, job_id="z-pending")
+        # Un enqueued sin task vivo no tiene índice: sólo el cursor lo alcanza.
+        lost = await _seed(repo, job_id="z-lost-task")
+        await repo.mark_enqueued(lost.job_id, f"inline/ticket-{lost.job_id}-g0")
+        control = await backend.get_doc(JOBS_COLLECTION, lost.job_id)
+        control["updated_at"] = utcnow() - timedelta(minutes=2)
+        backend._data[JOBS_COLLECTION][lost.job_id] = control
 
-        first_queue = FakeQueue()
+        first_queue = FakeQueue(task_alive=False)
         first = await TicketReconciler(
             repo, first_queue, batch_size=2, owner="reconciler-first",
         ).run_once()
         next_process_repo = TicketJobRepository(
             backend, retention_days=90, max_outstanding=25,
         )
-        second_queue = FakeQueue()
+        second_queue = FakeQueue(task_alive=False)
         second = await TicketReconciler(
             next_process_repo, second_queue,
             batch_size=2, owner="reconciler-second",
@@ -303,7 +312,7 @@ class TestReconcilerRepairs:
 
         assert first["requeued_outbox"] == 0
         assert second["requeued_outbox"] == 1
-        assert second_queue.enqueued == [(pending.job_id, 0)]
+        assert second_queue.enqueued == [(lost.job_id, 1)]
 
     async def test_heartbeat_after_scan_prevents_stale_lease_fencing(
             self, repo, backend, monkeypatch):
@@ -388,3 +397,178 @@ class TestReconcilerRepairs:
             }
             and (current.lease_owner is not None or current.claimed_by is not None)
         ), "un worker reclamó el job entre fence y terminalización"
+
+
+class _SlowQueue(FakeQueue):
+    """Cola que mide cuántos enqueues quedan en vuelo a la vez."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ensure_enqueued(self, job_id, generation=0):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().ensure_enqueued(job_id, generation)
+        finally:
+            self.in_flight -= 1
+
+
+class _FailingQueue(FakeQueue):
+    def __init__(self):
+        super().__init__()
+        self.attempts = []
+
+    async def ensure_enqueued(self, job_id, generation=0):
+        self.attempts.append(job_id)
+        raise RuntimeError("cloud tasks unavailable")
+
+
+class TestBoundedConcurrency:
+
+    async def test_page_is_repaired_by_a_bounded_worker_pool(self, repo):
+        seeded = [await _seed(repo) for _ in range(10)]
+        queue = _SlowQueue()
+
+        counts = await TicketReconciler(
+            repo, queue, batch_size=25, concurrency=3,
+        ).run_once()
+
+        assert counts["scanned"] == 10
+        assert counts["requeued_outbox"] == 10
+        assert counts["errors"] == 0
+        assert queue.max_in_flight == 3
+        assert sorted(job for job, _ in queue.enqueued) == sorted(
+            rec.job_id for rec in seeded
+        )
+
+    async def test_deadline_defers_jobs_not_yet_started(
+        self, repo, monkeypatch,
+    ):
+        for _ in range(4):
+            await _seed(repo)
+        clock = iter((100.0, 100.0, 100.0, 131.0, 131.0, 132.0))
+        monkeypatch.setattr(
+            "data_pipeline.ticket_reconciler._monotonic",
+            lambda: next(clock),
+        )
+        queue = FakeQueue()
+
+        counts = await TicketReconciler(
+            repo, queue, concurrency=1, deadline_s=30.0,
+        ).run_once()
+
+        assert counts["scanned"] == 4
+        assert counts["requeued_outbox"] == 2
+        assert counts["deferred"] == 2
+        assert len(queue.enqueued) == 2
+
+    async def test_backlog_larger_than_a_page_drains_in_one_run(self, repo):
+        seeded = [await _seed(repo) for _ in range(12)]
+        queue = FakeQueue()
+
+        counts = await TicketReconciler(
+            repo, queue, batch_size=5, concurrency=2,
+        ).run_once()
+
+        assert counts["requeued_outbox"] == 12
+        assert counts["deferred"] == 0
+        assert sorted(job for job, _ in queue.enqueued) == sorted(
+            rec.job_id for rec in seeded
+        )
+
+    async def test_a_job_that_keeps_failing_does_not_spin_the_drain(
+        self, repo,
+    ):
+        for _ in range(7):
+            await _seed(repo)
+        queue = _FailingQueue()
+
+        counts = await TicketReconciler(
+            repo, queue, batch_size=5,
+        ).run_once()
+
+        # Cada job se intenta una vez por tick aunque siga saliendo vencido.
+        assert counts["errors"] == 7
+        assert len(queue.attempts) == 7
+
+    def test_concurrency_must_be_positive(self, repo):
+        with pytest.raises(ValueError):
+            TicketReconciler(repo, FakeQueue(), concurrency=0)
+
+
+class TestDueFirstScan:
+
+    async def test_due_jobs_are_found_behind_a_page_of_healthy_jobs(
+        self, repo, backend,
+    ):
+        for index in range(6):
+            healthy = await _seed(repo, job_id=f"a-healthy-{index}")
+            await repo.mark_enqueued(
+                healthy.job_id, f"inline/ticket-{healthy.job_id}-g0",
+            )
+            await repo.claim(healthy.job_id, worker_id=f"w-{index}")
+        expired = await _seed(repo, job_id="z-expired-lease")
+        await repo.claim(expired.job_id, worker_id="w-old", lease_s=90)
+        await repo.update(
+            expired.job_id,
+            lease_expires_at=utcnow() - timedelta(seconds=1),
+        )
+        pending = await _seed(repo, job_id="z-pending")
+
+        queue = FakeQueue()
+        counts = await TicketReconciler(repo, queue, batch_size=5).run_once()
+
+        assert counts["fenced_leases"] == 1
+        assert counts["requeued_outbox"] == 1
+        assert {job for job, _ in queue.enqueued} == {
+            expired.job_id, pending.job_id,
+        }
+
+    async def test_in_memory_index_tracks_commits_in_order(self, repo, backend):
+        now = utcnow()
+        late = await _seed(repo, job_id="late",
+                           job_deadline_at=now - timedelta(seconds=5))
+        early = await _seed(repo, job_id="early",
+                            job_deadline_at=now - timedelta(seconds=50))
+        await _seed(repo, job_id="future",
+                    job_deadline_at=now + timedelta(minutes=5))
+
+        page = await backend.query_ordered(
+            JOBS_COLLECTION, 10,
+            equals={"state": ["queued", "running"]},
+            order_by="job_deadline_at", before=now,
+        )
+        assert [job_id for job_id, _ in page] == [early.job_id, late.job_id]
+
+        await repo.update(early.job_id, state=TicketJobState.CANCELLED)
+        page = await backend.query_ordered(
+            JOBS_COLLECTION, 10,
+            equals={"state": ["queued", "running"]},
+            order_by="job_deadline_at", before=now,
+        )
+        assert [job_id for job_id, _ in page] == [late.job_id]
+
+    async def test_undeclared_index_is_rejected(self, backend):
+        with pytest.raises(ValueError, match="índice"):
+            await backend.query_ordered(
+                JOBS_COLLECTION, 10,
+                equals={"principal_id": ["n8n"]}, order_by="created_at",
+            )
+
+
+def test_reconcile_indexes_are_declared_for_firestore():
+    declared = json.loads(
+        (Path(__file__).resolve().parents[1] / "firestore.indexes.json")
+        .read_text(encoding="utf-8")
+    )
+    composite = {
+        tuple(field["fieldPath"] for field in index["fields"])
+        for index in declared["indexes"]
+        if index["collectionGroup"] == JOBS_COLLECTION
+    }
+    for equality, order_by in RECONCILE_INDEXES:
+        assert (*equality, order_by) in composite
@@ -36,6 +36,7 @@ from api.ticket_review_models import (
     BatchStatus,
     CorrelationTrust,
     CursorError,
+    DevRevTicketSummary,
     ImportState,
     ImportStatus,
     RemediationBatchItem,
@@ -59,19 +60,25 @@ from api.tickets_console_config import (
 )
 from data_pipeline.ticket_review_repository import (
     ALLOWED_REVIEW_FACETS,
+    AUDIT_CHECKPOINTS_COLLECTION,
     AUDIT_EVENTS_SUBCOLLECTION,
     BATCH_EVENTS_SUBCOLLECTION,
     BATCH_ITEMS_SUBCOLLECTION,
     BATCHES_COLLECTION,
     CONSOLE_CACHE_COLLECTION,
     DEVREV_MESSAGE_CACHE_COLLECTION,
+    DEVREV_SYNC_WATERMARK_DOC_ID,
+    DEVREV_TICKET_MIRROR_COLLECTION,
     EVIDENCE_LINKS_SUBCOLLECTION,
     EXPORTS_COLLECTION,
     GLOBAL_AUDIT_EVENTS_COLLECTION,
     GLOBAL_CHAIN_HEAD_DOC_ID,
+    GLOBAL_LEDGER_CHECKPOINT_ID,
     IDEMPOTENCY_KEYS_COLLECTION,
     IMPORT_ROWS_SUBCOLLECTION,
     IMPORT_STAGING_COLLECTION,
+    IMPORT_STREAM_DONE_FIELD,
+    IMPORT_STREAM_WATERMARK_FIELD,
     IMPORTS_COLLECTION,
     PURGED_TOMBSTONE_KIND,
     RETENTION_FIELD,
@@ -89,6 +96,7 @@ from data_pipeline.ticket_review_repository import (
     DevRevMessageCacheEntry,
     EvidenceCandidate,
     EvidenceCandidateRejected,
+    ExportProgress,
     FirestoreTicketReviewBackend,
     IdempotencyConflict,
     ImportRowSpec,
@@ -97,6 +105,7 @@ from data_pipeline.ticket_review_repository import (
     InvalidReviewTransition,
     LeaseExtensionRefused,
     MutationContext,
+    NotAuthorized,
     ReviewIdentityConflict,
     ReviewListQuery,
     ReviewNotFound,
@@ -107,6 +116,8 @@ from data_pipeline.ticket_review_repository import (
     TicketReviewRepository,
     UnsupportedFilterCombination,
     canonical_ttl_declarations,
+    iter_csv_import_rows,
+    iter_ndjson_import_rows,
     review_index_declarations,
     sha256_hex,
 )
@@ -1010,6 +1021,80 @@ class TestDevRevMessageCache:
         assert SYNTHETIC_TITLE in cache
 
 
+def _mirrored(work: int, modified_at: datetime, **overrides) -> DevRevTicketSummary:
+    values = {
+        "devrev_work_id": f"don:core:dvrv-us-1:devo/SYNTHETIC00:ticket/{work}",
+        "devrev_display_id": f"TKT-{work}",
+        "title": SYNTHETIC_TITLE,
+        "object_version": 1,
+        "modified_at": modified_at,
+    }
+    values.update(overrides)
+    return DevRevTicketSummary(**values)
+
+
+class TestDevRevTicketMirror:
+    async def test_pages_upsert_newer_snapshots_and_advance_the_watermark(
+        self, repo, backend, clock
+    ):
+        first = await repo.mirror_devrev_tickets(
+            [_mirrored(1, T0), _mirrored(2, T0 + timedelta(minutes=2)), _mirrored(3, T0)]
+        )
+        assert (first.added, first.updated, first.unchanged) == (3, 0, 0)
+        assert first.watermark.devrev_work_id.endswith("ticket/2")
+
+        second = await repo.mirror_devrev_tickets(
+            [
+                # An overlapping replay, an older snapshot, and a real change.
+                _mirrored(2, T0 + timedelta(minutes=2)),
+                _mirrored(3, T0 - timedelta(days=1), title="stale"),
+                _mirrored(1, T0 + timedelta(minutes=5), object_version=2, title="renamed"),
+                _mirrored(4, None),
+            ]
+        )
+        assert (second.added, second.updated, second.unchanged, second.skipped) == (
+            0, 1, 2, 1,
+        )
+        watermark = await repo.get_devrev_sync_watermark()
+        assert watermark == second.watermark
+        assert watermark.modified_at == T0 + timedelta(minutes=5)
+        assert watermark.generation_started_at == T0
+
+        page = await repo.list_mirrored_tickets(page_size=2)
+        assert [t.devrev_display_id for t in page.items] == ["TKT-1", "TKT-2"]
+        assert page.items[0].title == "renamed"
+        rest = await repo.list_mirrored_tickets(page_size=2, cursor=page.next_cursor)
+        # The watermark document has no order field and never lists as a ticket.
+        assert [t.devrev_display_id for t in rest.items] == ["TKT-3"]
+        assert rest.next_cursor is None
+        with pytest.raises(CursorError):
+            await repo.list_evidence_links("r", cursor=page.next_cursor)
+
+        docs = await backend.dump_collection(DEVREV_TICKET_MIRROR_COLLECTION)
+        assert DEVREV_SYNC_WATERMARK_DOC_ID in docs
+        for doc in docs.values():
+            assert isinstance(doc[TTL_FIELD], datetime)
+            assert RETENTION_FIELD not in doc
+
+    async def test_the_watermark_lapses_with_its_generation_before_any_row(
+        self, repo, clock
+    ):
+        await repo.mirror_devrev_tickets([_mirrored(1, T0)])
+        clock.advance(hours=23)
+        await repo.mirror_devrev_tickets([_mirrored(2, clock.now)])
+
+        clock.advance(hours=1, seconds=1)
+        # A lapsed watermark forces the next sync to walk the whole scope...
+        assert await repo.get_devrev_sync_watermark() is None
+        page = await repo.list_mirrored_tickets()
+        # ...while a row refreshed mid-generation is still served until then.
+        assert [t.devrev_display_id for t in page.items] == ["TKT-2"]
+
+        restarted = await repo.mirror_devrev_tickets([_mirrored(1, T0)])
+        assert restarted.added == 1
+        assert restarted.watermark.generation_started_at == clock.now
+
+
 # =====================================================================
 # 12. Manual evidence links
 # =====================================================================
@@ -1922,6 +2007,85 @@ class TestRemediationBatches:
             assert doc[RETENTION_FIELD] == clock.now + timedelta(days=AUDIT_RETENTION_DAYS)
 
 
+class TestAuditChainCheckpoints:
+    @staticmethod
+    async def _export(repo, index):
+        await repo.create_export(
+            TicketExportSummary(
+                export_id=f"exp-{index}",
+                created_by=ADMIN,
+                row_count=1,
+                file_sha256="a" * 64,
+                filter_fingerprint="b" * 64,
+            ),
+            context=ADMIN_CONTEXT,
+        )
+
+    async def test_the_global_chain_is_walked_in_pages_and_resumed(self, repo, backend):
+        for index in range(5):
+            await self._export(repo, index)
+
+        first = await repo.verify_global_audit_chain(page_size=2, checkpoint_every=2)
+        assert (first.intact, first.event_count, first.resumed_event_count) == (True, 5, 0)
+        stored = await backend.dump_collection(AUDIT_CHECKPOINTS_COLLECTION)
+        assert stored[GLOBAL_LEDGER_CHECKPOINT_ID]["event_count"] == 5
+
+        await self._export(repo, 5)
+        second = await repo.verify_global_audit_chain(page_size=2)
+        assert (second.intact, second.event_count, second.resumed_event_count) == (True, 6, 5)
+
+    async def test_a_forged_checkpoint_or_altered_anchor_forces_a_full_pass(
+        self, repo, backend
+    ):
+        for index in range(3):
+            await self._export(repo, index)
+        await repo.verify_global_audit_chain()
+        path = (AUDIT_CHECKPOINTS_COLLECTION, GLOBAL_LEDGER_CHECKPOINT_ID)
+        checkpoint = await backend.get_doc(path)
+
+        await backend.force_write(path, {**checkpoint, "event_count": 1})
+        forged = await repo.verify_global_audit_chain()
+        assert (forged.intact, forged.resumed_event_count) == (True, 0)
+
+        anchor_path = (GLOBAL_AUDIT_EVENTS_COLLECTION, checkpoint["event_id"])
+        anchor = await backend.get_doc(anchor_path)
+        await backend.force_write(anchor_path, {**anchor, "changed_fields": ["forged"]})
+        report = await repo.verify_global_audit_chain()
+        assert report.intact is False
+        assert report.resumed_event_count == 0
+        assert report.broken_event_id == checkpoint["event_id"]
+
+    async def test_a_forged_oversized_checkpoint_is_overwritten(self, repo, backend):
+        for index in range(3):
+            await self._export(repo, index)
+        await repo.verify_global_audit_chain()
+        path = (AUDIT_CHECKPOINTS_COLLECTION, GLOBAL_LEDGER_CHECKPOINT_ID)
+        checkpoint = await backend.get_doc(path)
+        await backend.force_write(path, {**checkpoint, "event_count": 10**9})
+
+        forged = await repo.verify_global_audit_chain()
+        assert (forged.intact, forged.event_count, forged.resumed_event_count) == (True, 3, 0)
+        assert (await backend.get_doc(path))["event_count"] == 3
+
+        await self._export(repo, 3)
+        resumed = await repo.verify_global_audit_chain()
+        assert (resumed.event_count, resumed.resumed_event_count) == (4, 3)
+
+    async def test_a_review_ledger_is_verified_past_one_page(self, repo, backend):
+        review = await _seed(repo)
+        for version in range(1, 5):
+            await repo.patch_review(
+                review.review_id,
+                ReviewPatch(rating=version),
+                expected_version=version,
+                context=_context(),
+            )
+
+        report = await repo.verify_audit_chain(review.review_id, page_size=2)
+        assert (report.intact, report.event_count) == (True, 5)
+        assert await backend.dump_collection(AUDIT_CHECKPOINTS_COLLECTION) == {}
+
+
 # =====================================================================
 # 20. Partial multi-review updates
 # =====================================================================
@@ -1985,6 +2149,107 @@ class TestMultiReviewUpdates:
         assert (await repo.get_review(first.review_id)).rating is None
         assert (await repo.get_review(second.review_id)).rating == 4
 
+    async def test_distinct_reviews_patch_concurrently_in_spec_order(self, clock):
+        backend = _OverlappingBackend()
+        repo = TicketReviewRepository(
+            backend,
+            cursor_key=TEST_CURSOR_KEY,
+            clock=clock,
+            id_factory=_Ids(),
+            patch_concurrency=2,
+        )
+        first = await _seed(repo)
+        second = await _seed(repo, OTHER_DON, devrev_display_id="TKT-9999")
+        backend.peak = 0
+
+        result = await repo.patch_reviews(
+            [
+                ReviewPatchSpec(
+                    review_id=second.review_id,
+                    patch=ReviewPatch(rating=4),
+                    expected_version=second.version,
+                ),
+                ReviewPatchSpec(
+                    review_id=first.review_id,
+                    patch=ReviewPatch(rating=3),
+                    expected_version=first.version,
+                ),
+                # Same review again: it must observe the first spec's write.
+                ReviewPatchSpec(
+                    review_id=second.review_id,
+                    patch=ReviewPatch(rating=5),
+                    expected_version=second.version + 1,
+                ),
+            ],
+            context=_context(),
+        )
+
+        assert backend.peak == 2
+        assert [(item.review_id, item.rating) for item in result.applied] == [
+            (second.review_id, 4),
+            (first.review_id, 3),
+            (second.review_id, 5),
+        ]
+        assert not result.conflicts and not result.failures
+        assert (await repo.verify_audit_chain(second.review_id)).intact
+
+    def test_patch_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            TicketReviewRepository(
+                InMemoryTicketReviewBackend(),
+                cursor_key=TEST_CURSOR_KEY,
+                patch_concurrency=0,
+            )
+
+
+class _OverlappingBackend(InMemoryTicketReviewBackend):
+    """Counts transactions in flight before the backend's own lock."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    async def transact(self, fn):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0)
+            return await super().transact(fn)
+        finally:
+            self.active -= 1
+
+
+class _ReadRecordingBackend(InMemoryTicketReviewBackend):
+    """Records every transactional read, one entry per round trip."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[list[tuple]] = []
+
+    async def transact(self, fn):
+        reads = self.reads
+
+        class _View:
+            def __init__(self, view):
+                self._view = view
+
+            async def get(self, path):
+                reads.append([path])
+                return await self._view.get(path)
+
+            async def get_all(self, paths):
+                reads.append(list(paths))
+                return await self._view.get_all(paths)
+
+            def set(self, path, value):
+                self._view.set(path, value)
+
+            def delete(self, path):
+                self._view.delete(path)
+
+        return await super().transact(lambda view: fn(_View(view)))
+
 
 # =====================================================================
 # 21. Idempotency keys
@@ -2249,6 +2514,187 @@ class TestImportAndExport:
                 context=ADMIN_CONTEXT,
             )
 
+    async def _stream_fixture(self, repo, count: int):
+        reviews = [
+            await _seed(
+                repo,
+                f"don:core:dvrv-us-1:devo/SYNTHETIC00:ticket/{9000 + index}",
+                devrev_display_id=f"TKT-{9000 + index}",
+            )
+            for index in range(count)
+        ]
+        lines = [
+            json.dumps({
+                "row_number": index + 1,
+                "review_id": review.review_id,
+                "expected_review_version": 1,
+                "patch": {"rating": 4},
+            })
+            for index, review in enumerate(reviews)
+        ]
+        # A second row for the first review depends on the first chunk.
+        lines.append(json.dumps({
+            "row_number": count + 1,
+            "review_id": reviews[0].review_id,
+            "expected_review_version": 2,
+            "patch": {"topic": "second pass"},
+        }))
+        record = await repo.create_import(
+            _import(total_rows=count + 1), context=ADMIN_CONTEXT
+        )
+        return reviews, lines, record
+
+    async def test_a_streamed_import_applies_chunks_concurrently_in_review_order(
+        self, repo, backend
+    ):
+        reviews, lines, record = await self._stream_fixture(repo, 5)
+        context = _context(ADMIN, ReviewerRole.ADMIN, idempotency_key="stream-1")
+
+        result = await repo.stream_import_rows(
+            record.import_id,
+            iter_ndjson_import_rows(["", *lines]),
+            context=context,
+            chunk_rows=2,
+            concurrency=3,
+        )
+
+        assert result.applied_rows == 6
+        assert result.conflicted_rows == 0
+        first = await repo.get_review(reviews[0].review_id)
+        assert (first.rating, first.topic, first.version) == (4, "second pass", 3)
+        doc = (await backend.dump_collection(IMPORTS_COLLECTION))[record.import_id]
+        assert doc[IMPORT_STREAM_WATERMARK_FIELD] == 3
+        assert doc[IMPORT_STREAM_DONE_FIELD] == []
+        assert (await repo.verify_global_audit_chain()).intact is True
+
+    async def test_a_crashed_stream_resumes_without_double_counting(
+        self, repo, monkeypatch
+    ):
+        _reviews, lines, record = await self._stream_fixture(repo, 5)
+        context = _context(ADMIN, ReviewerRole.ADMIN, idempotency_key="stream-2")
+        write_rows = repo._write_import_rows
+
+        async def _crash_on_second_chunk(import_id, specs, **kwargs):
+            if kwargs["stream_chunk"][0] == 1:
+                raise RuntimeError("worker lost")
+            return await write_rows(import_id, specs, **kwargs)
+
+        monkeypatch.setattr(repo, "_write_import_rows", _crash_on_second_chunk)
+        with pytest.raises(RuntimeError):
+            await repo.stream_import_rows(
+                record.import_id, iter_ndjson_import_rows(lines),
+                context=context, chunk_rows=2, concurrency=1,
+            )
+        assert (await repo.get_import(record.import_id)).applied_rows == 2
+
+        monkeypatch.setattr(repo, "_write_import_rows", write_rows)
+        with pytest.raises(ReviewRepositoryError):
+            await repo.stream_import_rows(
+                record.import_id, iter_ndjson_import_rows(lines),
+                context=context, chunk_rows=3,
+            )
+        resumed = await repo.stream_import_rows(
+            record.import_id, iter_ndjson_import_rows(lines),
+            context=context, chunk_rows=2,
+        )
+
+        assert resumed.applied_rows == 6
+        assert resumed.conflicted_rows == 0
+
+    async def test_csv_rows_keep_text_cells_verbatim_and_type_the_rest(self, repo):
+        review = await _seed(repo)
+        rows = list(iter_csv_import_rows([
+            "row_number,review_id,expected_review_version,patch.topic,patch.rating,patch.status\n",
+            f"1,{review.review_id},1,42,3,\n",
+        ]))
+
+        assert rows == [{
+            "row_number": 1,
+            "review_id": review.review_id,
+            "expected_review_version": 1,
+            "patch": {"topic": "42", "rating": 3},
+        }]
+        with pytest.raises(ReviewRepositoryError, match="line 2"):
+            list(iter_ndjson_import_rows(['{"row_number": 1}', "{not json"]))
+
+    async def test_a_stream_needs_an_admin_and_an_idempotency_key(self, repo):
+        record = await repo.create_import(_import(), context=ADMIN_CONTEXT)
+
+        with pytest.raises(ReviewRepositoryError, match="idempotency key"):
+            await repo.stream_import_rows(record.import_id, [], context=ADMIN_CONTEXT)
+        with pytest.raises(NotAuthorized):
+            await repo.stream_import_rows(
+                record.import_id, [], context=_context(idempotency_key="k"),
+            )
+        with pytest.raises(ReviewRepositoryError, match="position 0"):
+            await repo.stream_import_rows(
+                record.import_id,
+                [{"row_number": 1, "patch": {"comments": "private text"}}],
+                context=_context(ADMIN, ReviewerRole.ADMIN, idempotency_key="k"),
+            )
+
+    async def test_an_export_streams_keyset_pages_in_bounded_chunks(self, repo, monkeypatch):
+        import csv as csv_module
+
+        import data_pipeline.ticket_review_repository as review_repository
+
+        for index in range(3):
+            await _seed(
+                repo,
+                f"don:core:dvrv-us-1:devo/SYNTHETIC00:ticket/{9100 + index}",
+                devrev_display_id=f"TKT-{9100 + index}",
+                comments="=HYPERLINK(1)" if index == 0 else "plain",
+            )
+        monkeypatch.setattr(review_repository, "EXPORT_FLUSH_BYTES", 1)
+        progress = ExportProgress()
+
+        chunks = [
+            chunk
+            async for chunk in repo.stream_export(
+                ReviewListQuery(), context=ADMIN_CONTEXT, page_size=1, progress=progress
+            )
+        ]
+
+        assert len(chunks) == 3
+        body = b"".join(chunks)
+        rows = list(csv_module.DictReader(body.decode("utf-8").splitlines()))
+        assert len(rows) == progress.rows == 3
+        assert progress.file_sha256 == hashlib.sha256(body).hexdigest()
+        assert sorted(row["comments"] for row in rows) == ["'=HYPERLINK(1)", "plain", "plain"]
+        with pytest.raises(NotAuthorized):
+            async for _chunk in repo.stream_export(ReviewListQuery(), context=_context()):
+                pass
+
+    async def test_a_file_export_records_its_digest_and_leaves_no_partial(
+        self, repo, tmp_path
+    ):
+        review = await _seed(repo)
+        target = tmp_path / "reviews.ndjson"
+
+        summary = await repo.export_reviews_to_file(
+            ReviewListQuery(),
+            target,
+            export_id="exp-stream",
+            context=ADMIN_CONTEXT,
+            export_format="ndjson",
+        )
+
+        body = target.read_bytes()
+        assert [json.loads(line)["review_id"] for line in body.splitlines()] == [
+            review.review_id
+        ]
+        assert summary.row_count == 1
+        assert summary.file_sha256 == hashlib.sha256(body).hexdigest()
+        assert list(tmp_path.iterdir()) == [target]
+        with pytest.raises(UnsupportedFilterCombination):
+            await repo.export_reviews_to_file(
+                ReviewListQuery(devrev_display_id="TKT-1234"),
+                tmp_path / "one.csv",
+                export_id="exp-one",
+                context=ADMIN_CONTEXT,
+            )
+        assert list(tmp_path.iterdir()) == [target]
+
 
 # =====================================================================
 # 23-24. TTL vs retention separation, database selection
@@ -2261,6 +2707,7 @@ class TestStorageSeparation:
             {
                 CONSOLE_CACHE_COLLECTION,
                 DEVREV_MESSAGE_CACHE_COLLECTION,
+                DEVREV_TICKET_MIRROR_COLLECTION,
                 IMPORT_STAGING_COLLECTION,
                 IDEMPOTENCY_KEYS_COLLECTION,
             }
@@ -2340,7 +2787,7 @@ class TestStorageSeparation:
             if index["collectionGroup"] == "ticket_jobs"
         }
         assert (("state", "ASCENDING"), ("lease_expires_at", "ASCENDING")) in handler
-        assert len(handler) == 4
+        assert len(handler) == 5
 
 
 class TestDatabaseSelection:
@@ -2627,6 +3074,55 @@ class TestRetention:
             # Every delete names an exact document, never a collection.
             assert len(path) % 2 == 0
 
+    async def test_independent_parents_purge_concurrently_within_one_budget(self, clock):
+        backend = _OverlappingBackend()
+        repo = TicketReviewRepository(
+            backend,
+            cursor_key=TEST_CURSOR_KEY,
+            clock=clock,
+            id_factory=_Ids(),
+            retention_concurrency=4,
+        )
+        reviews = [
+            await self._aged_review(
+                repo,
+                clock,
+                f"don:core:dvrv-us-1:devo/SYNTHETIC00:ticket/{820 + index}",
+                f"TKT-{820 + index}",
+            )
+            for index in range(4)
+        ]
+        clock.advance(days=REVIEW_RETENTION_DAYS + 1)
+
+        bounded = await repo.purge_expired(
+            max_documents=5, run_id="run-1", context=ADMIN_CONTEXT
+        )
+        assert len(bounded.product_documents_deleted) + len(bounded.tombstoned) <= 5
+        assert bounded.truncated is True
+
+        backend.peak = 0
+        rest = await repo.purge_expired(
+            max_documents=50, run_id="run-2", context=ADMIN_CONTEXT
+        )
+        assert backend.peak > 1
+        assert sorted(bounded.tombstoned + rest.tombstoned) == sorted(
+            review.review_id for review in reviews
+        )
+        for review in reviews:
+            # The ledger is still young: every parent survives as a tombstone.
+            assert await backend.dump_subcollection(
+                REVIEWS_COLLECTION, review.review_id, EVIDENCE_LINKS_SUBCOLLECTION
+            ) == {}
+            assert await backend.dump_subcollection(
+                REVIEWS_COLLECTION, review.review_id, AUDIT_EVENTS_SUBCOLLECTION
+            )
+
+    async def test_retention_concurrency_must_be_positive(self, backend):
+        with pytest.raises(ValueError):
+            TicketReviewRepository(
+                backend, cursor_key=TEST_CURSOR_KEY, retention_concurrency=0
+            )
+
     async def test_disposable_documents_are_swept_by_exact_id(self, repo, backend, clock):
         await repo.upsert_message_cache_entry(_cache_entry())
         review = await _seed(repo)
@@ -2641,3 +3137,26 @@ class TestRetention:
         # A cache sweep never touches the durable review or its ledger.
         assert review.review_id in await backend.dump_collection(REVIEWS_COLLECTION)
         assert (await repo.list_audit_events(review.review_id)).items
+
+    async def test_a_purge_batch_is_read_in_one_round_trip(self, clock):
+        backend = _ReadRecordingBackend()
+        repo = TicketReviewRepository(
+            backend, cursor_key=TEST_CURSOR_KEY, clock=clock, id_factory=_Ids()
+        )
+        for index in range(3):
+            await repo.upsert_message_cache_entry(_cache_entry(
+                remote_entry_id=f"don:core:dvrv-us-1:devo/SYNTHETIC00:timeline_entry/{index}",
+            ))
+        clock.advance(seconds=MESSAGE_CACHE_TTL_S + 1)
+        backend.reads.clear()
+
+        report = await repo.purge_expired(
+            max_documents=10, run_id="run-1", context=ADMIN_CONTEXT
+        )
+
+        assert len(report.disposable_deleted) == 3
+        cache_reads = [
+            read for read in backend.reads
+            if any(path[0] == DEVREV_MESSAGE_CACHE_COLLECTION for path in read)
+        ]
+        assert [len(read) for read in cache_reads] == [3]
@@ -501,6 +501,43 @@ async def test_producer_fails_closed_on_non_finite_queue_delay(monkeypatch) -> N
     ]
 
 
+async def test_producer_admission_reads_the_refreshed_snapshot(
+    monkeypatch,
+) -> None:
+    from api import main as main_module
+    from api.config import settings
+    from data_pipeline.ticket_task_queue import QueueDelayEstimator, QueueStats
+
+    class _Stats:
+        async def queue_stats(self):
+            return QueueStats(tasks_count=50, max_dispatches_per_second=5.0)
+
+    clock = iter((100.0, 100.0, 200.0))
+    monkeypatch.setattr(settings, "TICKET_HANDLER_MODE", "full")
+    repo = TicketJobRepository(InMemoryTicketJobBackend())
+    queue = _QueueWithDelay(error=AssertionError("no GetQueue per request"))
+    estimator = QueueDelayEstimator(
+        _Stats(), max_age_s=60, clock=lambda: next(clock),
+    )
+    await estimator.refresh()
+    request = _producer_request(queue)
+    request.app.state.queue_delay_estimator = estimator
+
+    record, replayed = await main_module._accept_ticket_job(
+        _ticket_body(), request, repo, api_version="v1",
+    )
+    assert replayed is False
+    assert queue.enqueued == [(record.job_id, 0)]
+
+    body = _ticket_body().model_copy(update={"participant_id": "other"})
+    with pytest.raises(HTTPException) as exc:
+        await main_module._accept_ticket_job(
+            body, request, repo, api_version="v1",
+        )
+    assert exc.value.status_code == 503
+    assert exc.value.detail["code"] == "QUEUE_DELAY_ESTIMATE_UNAVAILABLE"
+
+
 async def test_producer_emits_observed_queue_delay_for_accepted_job(
     monkeypatch,
 ) -> None:
@@ -19,6 +19,8 @@ from data_pipeline import ticket_task_queue as ttq_module
 from data_pipeline.ticket_task_queue import (
     CloudTasksTicketQueue,
     InlineTicketQueue,
+    QueueDelayEstimator,
+    QueueStats,
     TicketQueueEstimationError,
     task_name_for_job,
 )
@@ -210,6 +212,19 @@ class TestCloudTasksContract:
             "rate_limits.max_dispatches_per_second",
         }
 
+    async def test_queue_stats_snapshot_reads_effective_rate(self):
+        fake = _FakeQueueStatsClient(tasks_count=30, dispatch_rate=5)
+        queue = _queue_with(fake)
+
+        stats = await queue.queue_stats()
+
+        assert stats == QueueStats(tasks_count=30, max_dispatches_per_second=5)
+        assert set(fake.get_queue_request.read_mask.paths) == {
+            "stats.tasks_count",
+            "stats.effective_execution_rate",
+            "rate_limits.max_dispatches_per_second",
+        }
+
     async def test_queue_delay_estimation_failure_is_not_treated_as_zero(self):
         fake = _FakeQueueStatsClient(error=RuntimeError("stats unavailable"))
         queue = _queue_with(fake)
@@ -300,6 +315,102 @@ class TestCloudTasksContract:
         )
 
 
+class _StatsSequence:
+    def __init__(self, *results):
+        self.results = list(results)
+
+    async def queue_stats(self):
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQueueDelayEstimator:
+
+    async def test_snapshot_is_read_without_calling_the_stats_api(self):
+        source = _StatsSequence(QueueStats(120, 2.0))
+        estimator = QueueDelayEstimator(source, clock=_Clock())
+
+        assert await estimator.refresh() == 60
+        assert estimator.current() == 60
+        assert estimator.current() == 60
+        assert source.results == []
+
+    async def test_effective_rate_is_smoothed_but_backlog_is_not(self):
+        source = _StatsSequence(
+            QueueStats(100, 10.0),
+            QueueStats(100, 10.0, effective_execution_rate=5.0),
+            QueueStats(300, 10.0, effective_execution_rate=5.0),
+        )
+        estimator = QueueDelayEstimator(source, smoothing=0.5, clock=_Clock())
+
+        assert await estimator.refresh() == 10
+        # 10 → 7.5 tasks/s: un snapshot lento no duplica la demora de golpe.
+        assert await estimator.refresh() == pytest.approx(100 / 7.5)
+        assert await estimator.refresh() == pytest.approx(300 / 6.25)
+
+    async def test_fails_closed_only_when_snapshot_exceeds_max_age(self):
+        clock = _Clock()
+        source = _StatsSequence(
+            QueueStats(20, 2.0), RuntimeError("stats hiccup"),
+        )
+        estimator = QueueDelayEstimator(source, max_age_s=60, clock=clock)
+
+        with pytest.raises(TicketQueueEstimationError, match="not yet"):
+            estimator.current()
+        await estimator.refresh()
+        with pytest.raises(RuntimeError):
+            await estimator.refresh()
+        clock.now += 59
+        assert estimator.current() == 10
+        clock.now += 2
+        with pytest.raises(TicketQueueEstimationError, match="stale"):
+            estimator.current()
+
+    async def test_background_refresher_survives_errors_and_stops(self):
+        source = _StatsSequence(
+            RuntimeError("stats hiccup"), QueueStats(8, 4.0),
+            *[QueueStats(8, 4.0)] * 50,
+        )
+        estimator = QueueDelayEstimator(source, refresh_interval_s=0.001)
+
+        estimator.start()
+        for _ in range(100):
+            await asyncio.sleep(0.005)
+            if estimator.age_s() is not None:
+                break
+        await estimator.aclose()
+
+        assert estimator.current() == 2
+
+    async def test_refresher_waits_an_interval_after_a_caller_refresh(self):
+        source = _StatsSequence(QueueStats(8, 4.0), QueueStats(16, 4.0))
+        estimator = QueueDelayEstimator(
+            source, refresh_interval_s=0.05, smoothing=1.0,
+        )
+
+        await estimator.refresh()
+        estimator.start(refresh_now=False)
+        await asyncio.sleep(0.01)
+        assert len(source.results) == 1
+        for _ in range(100):
+            await asyncio.sleep(0.005)
+            if not source.results:
+                break
+        await estimator.aclose()
+
+        assert estimator.current() == 4
+
+
 class TestQueueRoleSurface:
 
     def test_queue_role_allows_create_task_get_and_queue_get_but_not_admin(self):
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import asyncio
 import secrets
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -796,6 +797,42 @@ class TestHeartbeatSupervision:
         assert current.public_error_code == "WORKER_CANCELLED"
 
 
+    async def test_recent_write_renewal_skips_standalone_heartbeat(
+        self, monkeypatch
+    ):
+        from api.config import settings as app_settings
+        from api.ticket_worker import _heartbeat_loop, _LeaseRenewals
+
+        monkeypatch.setattr(app_settings, "TICKET_WORKER_HEARTBEAT_S", 0.03)
+        renew_calls = 0
+
+        class _Repo:
+            async def renew_lease(self, *args, **kwargs):
+                nonlocal renew_calls
+                renew_calls += 1
+                return True
+
+        renewals = _LeaseRenewals()
+        owner = asyncio.create_task(asyncio.Event().wait())
+        heartbeat = asyncio.create_task(_heartbeat_loop(
+            _Repo(), "job", "worker", 1, owner_task=owner,
+            renewals=renewals,
+        ))
+        # checkpoints frecuentes: el lease ya se renueva en sus transacciones
+        for _ in range(6):
+            await asyncio.sleep(0.01)
+            renewals.mark(time.monotonic())
+        assert renew_calls == 0
+
+        # sin escrituras dentro del intervalo el heartbeat vuelve a renovar
+        await asyncio.sleep(0.08)
+        assert renew_calls >= 1
+        assert not owner.done()
+        heartbeat.cancel()
+        owner.cancel()
+        await asyncio.gather(heartbeat, owner, return_exceptions=True)
+
+
 class _ForusBotsLeaseRaceState:
     def __init__(self):
         self.submit_started = asyncio.Event()